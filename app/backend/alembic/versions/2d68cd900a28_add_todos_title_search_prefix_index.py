@@ -0,0 +1,46 @@
+"""add_todos_title_search_prefix_index
+
+Revision ID: 2d68cd900a28
+Revises: 78a79a34d3f3
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d68cd900a28"
+down_revision: str | Sequence[str] | None = "78a79a34d3f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 稼働中のテーブルへの書き込みを止めないよう、トランザクション外で並行して作成する
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_search_prefix",
+            "todos",
+            [sa.text('title_search COLLATE "C"'), "title"],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_title_search_prefix",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,57 @@
+"""add_todos_title_tsv
+
+Revision ID: 373b483433bc
+Revises: 4e20507e1047
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "373b483433bc"
+down_revision: str | Sequence[str] | None = "4e20507e1047"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 生成列の追加はテーブルの書き換えを伴うため、大きなテーブルではメンテナンス時間中に実行する
+    op.add_column(
+        "todos",
+        sa.Column(
+            "title_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', title)", persisted=True),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_tsv",
+            "todos",
+            ["title_tsv"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_title_tsv",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("todos", "title_tsv")
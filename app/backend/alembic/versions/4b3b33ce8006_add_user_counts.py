@@ -0,0 +1,82 @@
+"""add_user_counts
+
+Revision ID: 4b3b33ce8006
+Revises: 2d68cd900a28
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b3b33ce8006"
+down_revision: str | Sequence[str] | None = "2d68cd900a28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TRIGGERS = (
+    ("user_counts_insert", "INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("user_counts_delete", "DELETE", "REFERENCING OLD TABLE AS old_rows"),
+    ("user_counts_truncate", "TRUNCATE", ""),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_counts",
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("shard"),
+    )
+    # 加算先の行数(8)はUserCountModelのUSER_COUNT_SHARDSと一致させる
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION user_counts_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            delta bigint;
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                DELETE FROM user_counts;
+                RETURN NULL;
+            END IF;
+            IF TG_OP = 'INSERT' THEN
+                SELECT count(*) INTO delta FROM new_rows;
+            ELSE
+                SELECT -count(*) INTO delta FROM old_rows;
+            END IF;
+            IF delta <> 0 THEN
+                INSERT INTO user_counts (shard, count)
+                VALUES (floor(random() * 8), delta)
+                ON CONFLICT (shard)
+                    DO UPDATE SET count = user_counts.count + EXCLUDED.count;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # トリガーの設定から集計までの間の書き込みを数え漏らさないよう、
+    # 書き込みを待たせてから既存の行を集計する(読み込みはブロックしない)
+    op.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+    for name, operation, referencing in _TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {operation} ON users {referencing} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION user_counts_apply()"
+        )
+    op.execute("INSERT INTO user_counts (shard, count) SELECT 0, count(*) FROM users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON users")
+    op.execute("DROP FUNCTION IF EXISTS user_counts_apply()")
+    op.drop_table("user_counts")
@@ -0,0 +1,50 @@
+"""add_created_at_id_indexes
+
+Revision ID: 4e20507e1047
+Revises: e6892aa29005
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e20507e1047"
+down_revision: str | Sequence[str] | None = "e6892aa29005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# キーセットページネーション用の(created_at, id)複合インデックス
+_INDEXES = (
+    ("ix_todos_created_at_id", "todos"),
+    ("ix_users_created_at_id", "users"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["created_at", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
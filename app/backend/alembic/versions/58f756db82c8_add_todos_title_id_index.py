@@ -0,0 +1,43 @@
+"""add_todos_title_id_index
+
+Revision ID: 58f756db82c8
+Revises: e356df500c1f
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "58f756db82c8"
+down_revision: str | Sequence[str] | None = "e356df500c1f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # タイトル順の並び替え用の複合インデックス
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_id",
+            "todos",
+            ["title", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_title_id",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
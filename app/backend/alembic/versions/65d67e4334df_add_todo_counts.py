@@ -0,0 +1,107 @@
+"""add_todo_counts
+
+Revision ID: 65d67e4334df
+Revises: 58f756db82c8
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "65d67e4334df"
+down_revision: str | Sequence[str] | None = "58f756db82c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TRIGGERS = (
+    ("todo_counts_insert", "INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    (
+        "todo_counts_update",
+        "UPDATE",
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    ),
+    ("todo_counts_delete", "DELETE", "REFERENCING OLD TABLE AS old_rows"),
+    ("todo_counts_truncate", "TRUNCATE", ""),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "todo_counts",
+        sa.Column("completed", sa.Boolean(), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("completed", "shard"),
+    )
+    # 加算先の行数(8)はTodoCountModelのTODO_COUNT_SHARDSと一致させる
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION todo_counts_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            pending_delta bigint := 0;
+            completed_delta bigint := 0;
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                DELETE FROM todo_counts;
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                SELECT
+                    count(*) FILTER (WHERE NOT completed),
+                    count(*) FILTER (WHERE completed)
+                INTO pending_delta, completed_delta
+                FROM new_rows WHERE deleted_at IS NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                SELECT
+                    pending_delta - count(*) FILTER (WHERE NOT completed),
+                    completed_delta - count(*) FILTER (WHERE completed)
+                INTO pending_delta, completed_delta
+                FROM old_rows WHERE deleted_at IS NULL;
+            END IF;
+            INSERT INTO todo_counts (completed, shard, count)
+            SELECT delta.completed, floor(random() * 8), delta.count
+            FROM (VALUES (false, pending_delta), (true, completed_delta))
+                AS delta (completed, count)
+            WHERE delta.count <> 0
+            ON CONFLICT (completed, shard)
+                DO UPDATE SET count = todo_counts.count + EXCLUDED.count;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # トリガーの設定から集計までの間の書き込みを数え漏らさないよう、
+    # 書き込みを待たせてから既存の行を集計する(読み込みはブロックしない)
+    op.execute("LOCK TABLE todos IN SHARE ROW EXCLUSIVE MODE")
+    for name, operation, referencing in _TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {operation} ON todos {referencing} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION todo_counts_apply()"
+        )
+    op.execute(
+        """
+        INSERT INTO todo_counts (completed, shard, count)
+        SELECT completed, 0, count(*)
+        FROM todos
+        WHERE deleted_at IS NULL
+        GROUP BY completed
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON todos")
+    op.execute("DROP FUNCTION IF EXISTS todo_counts_apply()")
+    op.drop_table("todo_counts")
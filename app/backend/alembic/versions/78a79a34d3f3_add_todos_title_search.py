@@ -0,0 +1,138 @@
+"""add_todos_title_search
+
+Revision ID: 78a79a34d3f3
+Revises: 65d67e4334df
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+import unicodedata
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "78a79a34d3f3"
+down_revision: str | Sequence[str] | None = "65d67e4334df"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 既存の行の正規化したタイトルを一度に更新する行数
+_BACKFILL_BATCH_SIZE = 10_000
+
+# カタカナ(U+30A1〜U+30F6)を対応するひらがな(U+3041〜U+3096)に変換する表
+_KATAKANA_TO_HIRAGANA = str.maketrans(
+    {chr(code): chr(code - 0x60) for code in range(0x30A1, 0x30F6 + 1)},
+)
+
+
+def _normalize_search_text(text: str) -> str:
+    """タイトルを正規化する(src.domain.todo.search_textと同じ処理)。"""
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    return normalized.translate(_KATAKANA_TO_HIRAGANA)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION todo_search_ngrams(value text, n integer)
+        RETURNS text[]
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT ARRAY(
+                SELECT DISTINCT substr(value, i, n)
+                FROM generate_series(1, char_length(value) - n + 1) AS i
+            )
+        $$
+        """
+    )
+    op.add_column("todos", sa.Column("title_search", sa.Text(), nullable=True))
+
+    # 正規化はデータベースの文字コードによらずアプリケーションと同じ結果とするため、
+    # SQLではなくPythonで行い、IDの順に1回のUPDATEで少しずつ更新する
+    bind = op.get_bind()
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, title FROM todos WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": _BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(
+                """
+                UPDATE todos SET title_search = normalized.title_search
+                FROM unnest(CAST(:ids AS text[]), CAST(:title_searches AS text[]))
+                    AS normalized (id, title_search)
+                WHERE todos.id = normalized.id
+                """
+            ),
+            {
+                "ids": [row.id for row in rows],
+                "title_searches": [_normalize_search_text(row.title) for row in rows],
+            },
+        )
+        last_id = rows[-1].id
+    op.alter_column("todos", "title_search", nullable=False)
+
+    # 生成列の追加はテーブルの書き換えを伴うため、大きなテーブルではメンテナンス時間中に実行する
+    op.add_column(
+        "todos",
+        sa.Column(
+            "title_ngrams",
+            postgresql.ARRAY(sa.Text()),
+            sa.Computed(
+                "todo_search_ngrams(title_search, 1) || "
+                "todo_search_ngrams(title_search, 2)",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_ngrams",
+            "todos",
+            ["title_ngrams"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # 部分一致検索はn-gramのインデックスで行うため、タイトルのトライグラムインデックスは不要になる
+        op.drop_index(
+            "ix_todos_title_trgm",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_trgm",
+            "todos",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_todos_title_ngrams",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("todos", "title_ngrams")
+    op.drop_column("todos", "title_search")
+    op.execute("DROP FUNCTION IF EXISTS todo_search_ngrams(text, integer)")
@@ -0,0 +1,51 @@
+"""add_todos_deleted_at
+
+Revision ID: b0556d66c9b1
+Revises: 373b483433bc
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b0556d66c9b1"
+down_revision: str | Sequence[str] | None = "373b483433bc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 既定値のないNULL許可のカラムの追加はテーブルを書き換えないため、件数によらず一瞬で終わる
+    op.add_column(
+        "todos",
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # 差分同期(更新日時順)用の複合インデックス
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_updated_at_id",
+            "todos",
+            ["updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_updated_at_id",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("todos", "deleted_at")
@@ -0,0 +1,46 @@
+"""add_todos_pending_index
+
+Revision ID: e356df500c1f
+Revises: b0556d66c9b1
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e356df500c1f"
+down_revision: str | Sequence[str] | None = "b0556d66c9b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 未完了のTodoの一覧用の部分インデックス(完了済み・削除済みの行を含まない)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_pending_created_at_id",
+            "todos",
+            ["created_at", "id"],
+            postgresql_where=sa.text("NOT completed AND deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_pending_created_at_id",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
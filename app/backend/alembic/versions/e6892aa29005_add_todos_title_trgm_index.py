@@ -0,0 +1,46 @@
+"""add_todos_title_trgm_index
+
+Revision ID: e6892aa29005
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+# pyright: reportAttributeAccessIssue=false
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6892aa29005"
+down_revision: str | Sequence[str] | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # 大きなテーブルへの書き込みをブロックしないようCONCURRENTLYで作成する
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_title_trgm",
+            "todos",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todos_title_trgm",
+            table_name="todos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
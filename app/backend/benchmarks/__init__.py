@@ -0,0 +1,4 @@
+"""ベンチマークパッケージ。
+
+リポジトリやユースケースの性能を計測するスクリプトを格納する。
+"""
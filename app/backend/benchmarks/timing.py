@@ -0,0 +1,92 @@
+"""ベンチマーク用の計測ユーティリティ。
+
+非同期処理のレイテンシを計測し、パーセンタイルを表形式で出力する。
+"""
+
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+# p99を算出するための分位数の分割数
+PERCENTILE_DIVISIONS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyStats:
+    """レイテンシの計測結果(ミリ秒)。"""
+
+    label: str
+    samples: int
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+async def measure(
+    label: str,
+    func: Callable[[], Awaitable[object]],
+    repeat: int,
+    warmup: int = 3,
+) -> LatencyStats:
+    """非同期関数を繰り返し実行してレイテンシを計測する。
+
+    Args:
+        label: 計測結果のラベル
+        func: 計測対象の非同期関数
+        repeat: 計測回数
+        warmup: 計測前の空実行回数(キャッシュを温めるため)
+
+    Returns:
+        レイテンシの計測結果
+
+    """
+    for _ in range(warmup):
+        await func()
+
+    durations: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    # 計測回数が1回の場合はquantilesが使えないため、その値をそのまま使う
+    if len(durations) == 1:
+        p50 = p99 = durations[0]
+    else:
+        quantiles = statistics.quantiles(
+            durations,
+            n=PERCENTILE_DIVISIONS,
+            method="inclusive",
+        )
+        p50 = statistics.median(durations)
+        p99 = quantiles[-1]
+    return LatencyStats(
+        label=label,
+        samples=len(durations),
+        p50_ms=p50,
+        p99_ms=p99,
+        max_ms=max(durations),
+    )
+
+
+def print_table(title: str, rows: Sequence[LatencyStats]) -> None:
+    """計測結果を表形式で標準出力に書き出す。
+
+    Args:
+        title: 表のタイトル
+        rows: 計測結果のリスト
+
+    """
+    width = max((len(row.label) for row in rows), default=0)
+    lines = [
+        f"\n## {title}",
+        f"{'case':<{width}}  {'n':>5}  {'p50(ms)':>10}  {'p99(ms)':>10}  {'max(ms)':>10}",
+    ]
+    lines.extend(
+        f"{row.label:<{width}}  {row.samples:>5}  {row.p50_ms:>10.2f}"
+        f"  {row.p99_ms:>10.2f}  {row.max_ms:>10.2f}"
+        for row in rows
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
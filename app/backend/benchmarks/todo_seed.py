@@ -0,0 +1,95 @@
+"""ベンチマーク用のTodoデータ投入。
+
+generate_seriesを使ってサーバー側で大量のTodoを生成する。
+"""
+
+import hashlib
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.domain.todo.search_text import normalize_search_text
+
+# タイトルの先頭に付与する単語(検索語としても使用する)
+TITLE_WORDS = (
+    "買い物",
+    "掃除",
+    "report",
+    "meeting",
+    "invoice",
+    "deploy",
+    "review",
+    "call",
+)
+
+# 1回のINSERTで投入する最大行数(WALやメモリの急増を避けるため分割する)
+SEED_CHUNK_SIZE = 1_000_000
+
+_INSERT_TODOS_SQL = text(
+    """
+    INSERT INTO todos (id, title, title_search, completed, created_at, updated_at)
+    SELECT
+        gen_random_uuid()::text,
+        words[1 + (i % cardinality(words))] || ' ' || substr(md5(i::text), 1, 12),
+        search_words[1 + (i % cardinality(words))] || ' ' || substr(md5(i::text), 1, 12),
+        i % 3 = 0,
+        now() - make_interval(secs => i),
+        now() - make_interval(secs => i)
+    FROM
+        generate_series(CAST(:start AS bigint), CAST(:stop AS bigint)) AS i,
+        CAST(:words AS text[]) AS words,
+        CAST(:search_words AS text[]) AS search_words
+    """
+)
+
+
+def rare_title_fragment(row_number: int) -> str:
+    """指定した連番の行のタイトルに含まれる、ほぼ一意な断片を返す。
+
+    seed_todosが生成するタイトル末尾のmd5文字列の一部を返す。
+    """
+    digest = hashlib.md5(str(row_number).encode()).hexdigest()  # noqa: S324
+    return digest[2:8]
+
+
+def seeded_title(row_number: int) -> str:
+    """指定した連番の行にseed_todosが生成するタイトルを返す。"""
+    word = TITLE_WORDS[row_number % len(TITLE_WORDS)]
+    digest = hashlib.md5(str(row_number).encode()).hexdigest()  # noqa: S324
+    return f"{word} {digest[:12]}"
+
+
+async def count_todos(engine: AsyncEngine) -> int:
+    """todosテーブルの行数を返す。"""
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT count(*) FROM todos"))).scalar_one()
+
+
+async def seed_todos(engine: AsyncEngine, total: int) -> None:
+    """todosテーブルの行数がtotalになるまでTodoを追加し、統計情報を更新する。
+
+    既存の行は残したまま不足分のみ追加するため、昇順に呼び出せば
+    大きなデータセットを段階的に作成できる。
+
+    Args:
+        engine: 投入先のデータベースエンジン
+        total: 投入後のtodosテーブルの行数
+
+    """
+    current = await count_todos(engine)
+    for start in range(current + 1, total + 1, SEED_CHUNK_SIZE):
+        stop = min(start + SEED_CHUNK_SIZE - 1, total)
+        async with engine.begin() as conn:
+            await conn.execute(
+                _INSERT_TODOS_SQL,
+                {
+                    "words": list(TITLE_WORDS),
+                    # md5の16進数の文字列は正規化しても変わらないため、単語のみを正規化する
+                    "search_words": [normalize_search_text(w) for w in TITLE_WORDS],
+                    "start": start,
+                    "stop": stop,
+                },
+            )
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE todos"))
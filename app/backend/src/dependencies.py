@@ -3,15 +3,196 @@
 アプリケーションで使用する依存性を定義する。
 """
 
-from collections.abc import AsyncGenerator
+import os
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page
+from src.domain.todo.event import TodoEvent
+from src.domain.todo.event_publisher import TodoEventPublisher
+from src.domain.todo.projection import TodoProjection
 from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import TodoSearchMode
+from src.domain.todo.todo import Todo
+from src.domain.user.email_address import EmailAddress
+from src.domain.user.id import UserId
+from src.domain.user.projection import UserProjection
 from src.domain.user.repository import UserRepository
-from src.infrastructure.config.database import AsyncSessionLocal
+from src.domain.user.user import User
+from src.infrastructure.config.database import DATABASE_URL, AsyncSessionLocal
+from src.infrastructure.event.pg_notify_todo_event_publisher import (
+    PgNotifyTodoEventPublisher,
+)
+from src.infrastructure.event.pg_todo_event_listener import PgTodoEventListener
+from src.infrastructure.repository.todo.in_memory_search_todo_repository import (
+    InMemorySearchTodoRepository,
+)
 from src.infrastructure.repository.todo.todo_repository_impl import TodoRepositoryImpl
+from src.infrastructure.repository.user.caching_user_repository import (
+    CachingUserRepository,
+)
 from src.infrastructure.repository.user.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.search.todo_ngram_index import TodoNgramIndex
+from src.infrastructure.search.todo_ngram_index_updater import TodoNgramIndexUpdater
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.ttl_lru_cache import CacheStats, TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.pubsub.broadcaster import Broadcaster
+from src.usecase.todo.search_todos_usecase import (
+    SearchTodoProjectionsCacheKey,
+    SearchTodosCacheKey,
+)
+from src.usecase.todo.suggest_todo_titles_usecase import SuggestTodoTitlesCacheKey
+from src.usecase.user.filter_user_usecase import (
+    FilterUserKey,
+    FilterUserProjectionKey,
+)
+
+
+class TodoSearchBackend(str, Enum):
+    """Todoの部分一致検索を行う場所。"""
+
+    # データベース(正規化したタイトルのn-gramのGINインデックス)
+    DATABASE = "database"
+    # プロセスのメモリ上のn-gram転置インデックス
+    MEMORY = "memory"
+
+
+# Todoの部分一致検索を行う場所
+# memoryは読み込みの多い単一テナントのサーバー向けで、Todoの全件をワーカーごとのメモリに保持する
+TODO_SEARCH_BACKEND = TodoSearchBackend(
+    os.getenv("TODO_SEARCH_BACKEND", TodoSearchBackend.DATABASE),
+)
+
+# IDとメールアドレスによるユーザーの検索結果をプロセス内にキャッシュするか
+# trueの場合、他のプロセスによるユーザーの書き込みは有効期限が切れるまで反映されない
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "false").lower() == "true"
+
+# ユーザーの検索結果のキャッシュの最大エントリ数(IDとメールアドレスのそれぞれ)と有効期限(秒)
+# プロセス内の書き込みは該当するエントリを即座に破棄するため、
+# 有効期限は他のプロセスによる書き込みを反映するまでの最大の遅延となる
+USER_CACHE_MAXSIZE = 1024
+USER_CACHE_TTL_SECONDS = 60.0
+
+# Todo検索結果のキャッシュの最大エントリ数と有効期限(秒)
+# プロセス内の書き込みは世代番号で即座に無効化されるため、
+# 有効期限は他のプロセスによる書き込みを反映するまでの最大の遅延となる
+TODO_SEARCH_CACHE_MAXSIZE = 256
+TODO_SEARCH_CACHE_TTL_SECONDS = 10.0
+
+# Todoのタイトルの候補のキャッシュの最大エントリ数
+# 入力補完は1文字入力するたびに呼び出され、短い文字列ほど多くの利用者に共有されるため、
+# 検索結果より多くのエントリを保持する(有効期限は検索結果と同じ)
+TODO_TITLE_SUGGESTION_CACHE_MAXSIZE = 1024
+
+# データの版(ETagの算出に使用する行数と最終更新日時)のキャッシュの有効期限(秒)
+# 版は集計テーブルとインデックスから求めるため安価だが、それでも1回の往復を要するため、
+# この間隔の間は条件付きGETにデータベースへ問い合わせずに304を返せるようにする
+# プロセス内の書き込みは世代番号で即座に無効化されるため、
+# 有効期限は他のプロセスによる書き込みをETagに反映するまでの最大の遅延となる
+DATA_VERSION_CACHE_TTL_SECONDS = 10.0
+
+# 書き込みのたびに進めるTodo・ユーザーの世代番号(プロセス内で共有する)
+_todo_versions = VersionCounter()
+_user_versions = VersionCounter()
+
+_todo_search_cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]] = TtlLruCache(
+    maxsize=TODO_SEARCH_CACHE_MAXSIZE,
+    ttl=TODO_SEARCH_CACHE_TTL_SECONDS,
+    versions=_todo_versions,
+)
+
+_todo_projection_cache: TtlLruCache[
+    SearchTodoProjectionsCacheKey,
+    Page[TodoProjection],
+] = TtlLruCache(
+    maxsize=TODO_SEARCH_CACHE_MAXSIZE,
+    ttl=TODO_SEARCH_CACHE_TTL_SECONDS,
+    versions=_todo_versions,
+)
+
+_todo_title_suggestion_cache: TtlLruCache[SuggestTodoTitlesCacheKey, list[str]] = (
+    TtlLruCache(
+        maxsize=TODO_TITLE_SUGGESTION_CACHE_MAXSIZE,
+        ttl=TODO_SEARCH_CACHE_TTL_SECONDS,
+        versions=_todo_versions,
+    )
+)
+
+_todo_data_version_cache: TtlLruCache[str, DataVersion] = TtlLruCache(
+    maxsize=1,
+    ttl=DATA_VERSION_CACHE_TTL_SECONDS,
+    versions=_todo_versions,
+)
+
+_user_data_version_cache: TtlLruCache[str, DataVersion] = TtlLruCache(
+    maxsize=1,
+    ttl=DATA_VERSION_CACHE_TTL_SECONDS,
+    versions=_user_versions,
+)
+
+# IDとメールアドレスによるユーザーの検索結果のキャッシュ(USER_CACHE_ENABLEDがtrueの場合のみ使用する)
+# ユーザーの書き込みのたびに全件を無効化しないよう、世代番号ではなく該当するエントリの破棄で無効化する
+_user_by_id_cache: TtlLruCache[UserId, User] = TtlLruCache(
+    maxsize=USER_CACHE_MAXSIZE,
+    ttl=USER_CACHE_TTL_SECONDS,
+)
+_user_by_email_cache: TtlLruCache[EmailAddress, User] = TtlLruCache(
+    maxsize=USER_CACHE_MAXSIZE,
+    ttl=USER_CACHE_TTL_SECONDS,
+)
+
+# 同じ読み込みの同時実行をまとめ、データベースへの問い合わせとコネクションの使用を1回にする
+# (共有されたリストへの同時アクセスで、同じクエリがコネクションプールを使い切らないようにする)
+_todo_search_single_flight: SingleFlight[SearchTodosCacheKey, Page[Todo]] = (
+    SingleFlight(versions=_todo_versions)
+)
+_todo_projection_single_flight: SingleFlight[
+    SearchTodoProjectionsCacheKey,
+    Page[TodoProjection],
+] = SingleFlight(versions=_todo_versions)
+_user_filter_single_flight: SingleFlight[FilterUserKey, Page[User]] = SingleFlight(
+    versions=_user_versions,
+)
+_user_filter_projection_single_flight: SingleFlight[
+    FilterUserProjectionKey,
+    Page[UserProjection],
+] = SingleFlight(versions=_user_versions)
+_user_find_single_flight: SingleFlight[UserId, User] = SingleFlight(
+    versions=_user_versions,
+)
+
+# Todoの変更イベントをプロセス内の購読者(SSEの接続)に配信するBroadcasterと、
+# 他のワーカーを含む全ての書き込みのイベントをNOTIFYで受信してBroadcasterに渡すリスナー
+_todo_event_broadcaster: Broadcaster[TodoEvent] = Broadcaster()
+_todo_event_listener = PgTodoEventListener(
+    database_url=DATABASE_URL,
+    broadcaster=_todo_event_broadcaster,
+)
+
+# 部分一致検索に使用するメモリ上のインデックスと、変更イベントでインデックスを更新する処理
+# (TODO_SEARCH_BACKENDがmemoryの場合のみ使用する)
+_todo_ngram_index = TodoNgramIndex()
+
+
+async def _load_todos() -> AsyncIterator[Todo]:
+    """インデックスに読み込む、論理削除されていない全件のTodoを返す。"""
+    async with AsyncSessionLocal() as session:
+        repository = TodoRepositoryImpl(session=session)
+        async for todo in repository.stream("", TodoSearchMode.SUBSTRING):
+            yield todo
+
+
+_todo_ngram_index_updater = TodoNgramIndexUpdater(
+    index=_todo_ngram_index,
+    broadcaster=_todo_event_broadcaster,
+    load=_load_todos,
+)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession]:
@@ -30,11 +211,48 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
             await session.close()
 
 
-def get_todo_repository(
-    session: AsyncSession,
-) -> TodoRepository:
-    """Todoリポジトリの依存性を提供する。"""
-    return TodoRepositoryImpl(session=session)
+@asynccontextmanager
+async def open_db_session() -> AsyncGenerator[AsyncSession]:
+    """リクエストのスコープ外で使用するデータベースセッションを開く。
+
+    StreamingResponseのように、エンドポイントの関数から戻った後も
+    レスポンスの送信中にセッションを使い続ける処理で使用する。
+
+    Yields:
+        AsyncSession: データベースセッション
+
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@asynccontextmanager
+async def open_todo_repository() -> AsyncGenerator[TodoRepository]:
+    """リクエストのスコープ外で使用するTodoリポジトリを開く。
+
+    キャッシュの有効期限切れの結果をバックグラウンドで読み込み直す処理で使用する。
+
+    Yields:
+        TodoRepository: 専用のセッションを使用するTodoリポジトリ
+
+    """
+    async with open_db_session() as session:
+        yield get_todo_repository(session)
+
+
+@asynccontextmanager
+async def open_user_repository() -> AsyncGenerator[UserRepository]:
+    """リクエストのスコープ外で使用するユーザーリポジトリを開く。
+
+    キャッシュの有効期限切れの結果をバックグラウンドで読み込み直す処理で使用するため、
+    検索結果をキャッシュしないリポジトリを返す。
+
+    Yields:
+        UserRepository: 専用のセッションを使用するユーザーリポジトリ
+
+    """
+    async with open_db_session() as session:
+        yield UserRepositoryImpl(session=session, versions=_user_versions)
 
 
 def get_user_repository(
@@ -42,6 +260,8 @@ def get_user_repository(
 ) -> UserRepository:
     """ユーザーリポジトリの依存性を提供する。
 
+    USER_CACHE_ENABLEDがtrueの場合は、IDとメールアドレスによる検索の結果をキャッシュする。
+
     Args:
         session: データベースセッション
 
@@ -49,11 +269,209 @@ def get_user_repository(
         SQLAlchemy実装のユーザーリポジトリ
 
     """
-    return UserRepositoryImpl(session=session)
+    repository = UserRepositoryImpl(session=session, versions=_user_versions)
+    if USER_CACHE_ENABLED:
+        return CachingUserRepository(
+            repository,
+            by_id=_user_by_id_cache,
+            by_email=_user_by_email_cache,
+            open_repository=open_user_repository,
+        )
+    return repository
 
 
 def get_todo_repository(
     session: AsyncSession,
 ) -> TodoRepository:
-    """Todoリポジトリの依存性を提供する。"""
-    return TodoRepositoryImpl(session=session)
+    """Todoリポジトリの依存性を提供する。
+
+    書き込みの変更イベントは、書き込みと同じトランザクションでNOTIFYする。
+    TODO_SEARCH_BACKENDがmemoryの場合は、部分一致検索をメモリ上のインデックスで行う。
+    """
+    repository = TodoRepositoryImpl(
+        session=session,
+        versions=_todo_versions,
+        event_publisher=get_todo_event_publisher(session),
+    )
+    if TODO_SEARCH_BACKEND == TodoSearchBackend.MEMORY:
+        return InMemorySearchTodoRepository(repository, _todo_ngram_index)
+    return repository
+
+
+def get_todo_search_cache() -> TtlLruCache[SearchTodosCacheKey, Page[Todo]]:
+    """Todo検索結果のキャッシュを提供する。
+
+    Returns:
+        プロセス内で共有する検索結果のキャッシュ
+
+    """
+    return _todo_search_cache
+
+
+def get_todo_projection_cache() -> TtlLruCache[
+    SearchTodoProjectionsCacheKey,
+    Page[TodoProjection],
+]:
+    """Todoの一部の項目のみの検索結果のキャッシュを提供する。
+
+    Returns:
+        プロセス内で共有する検索結果のキャッシュ
+
+    """
+    return _todo_projection_cache
+
+
+def get_todo_title_suggestion_cache() -> TtlLruCache[
+    SuggestTodoTitlesCacheKey,
+    list[str],
+]:
+    """Todoのタイトルの候補のキャッシュを提供する。
+
+    Returns:
+        プロセス内で共有する候補のキャッシュ
+
+    """
+    return _todo_title_suggestion_cache
+
+
+def get_todo_search_single_flight() -> SingleFlight[SearchTodosCacheKey, Page[Todo]]:
+    """同じTodo検索の同時実行をまとめる仕組みを提供する。
+
+    Returns:
+        プロセス内で共有する仕組み
+
+    """
+    return _todo_search_single_flight
+
+
+def get_todo_projection_single_flight() -> SingleFlight[
+    SearchTodoProjectionsCacheKey,
+    Page[TodoProjection],
+]:
+    """一部の項目のみの同じTodo検索の同時実行をまとめる仕組みを提供する。
+
+    Returns:
+        プロセス内で共有する仕組み
+
+    """
+    return _todo_projection_single_flight
+
+
+def get_user_filter_single_flight() -> SingleFlight[FilterUserKey, Page[User]]:
+    """同じユーザー一覧取得の同時実行をまとめる仕組みを提供する。
+
+    Returns:
+        プロセス内で共有する仕組み
+
+    """
+    return _user_filter_single_flight
+
+
+def get_user_filter_projection_single_flight() -> SingleFlight[
+    FilterUserProjectionKey,
+    Page[UserProjection],
+]:
+    """一部の項目のみの同じユーザー一覧取得の同時実行をまとめる仕組みを提供する。
+
+    Returns:
+        プロセス内で共有する仕組み
+
+    """
+    return _user_filter_projection_single_flight
+
+
+def get_user_find_single_flight() -> SingleFlight[UserId, User]:
+    """同じユーザーの検索の同時実行をまとめる仕組みを提供する。
+
+    Returns:
+        プロセス内で共有する仕組み
+
+    """
+    return _user_find_single_flight
+
+
+def get_todo_data_version_cache() -> TtlLruCache[str, DataVersion]:
+    """Todoのデータの版のキャッシュを提供する。
+
+    Returns:
+        プロセス内で共有するデータの版のキャッシュ
+
+    """
+    return _todo_data_version_cache
+
+
+def get_cache_stats() -> dict[str, CacheStats]:
+    """プロセス内のキャッシュごとの利用状況の累計を提供する。
+
+    Returns:
+        キャッシュの名前と利用状況の累計
+        (ユーザーの検索結果のキャッシュはUSER_CACHE_ENABLEDがtrueの場合のみ含む)
+
+    """
+    caches: dict[str, TtlLruCache[Any, Any]] = {
+        "todo_search": _todo_search_cache,
+        "todo_projection": _todo_projection_cache,
+        "todo_title_suggestion": _todo_title_suggestion_cache,
+        "todo_data_version": _todo_data_version_cache,
+        "user_data_version": _user_data_version_cache,
+    }
+    if USER_CACHE_ENABLED:
+        caches["user_by_id"] = _user_by_id_cache
+        caches["user_by_email"] = _user_by_email_cache
+    return {name: cache.stats for name, cache in caches.items()}
+
+
+def get_user_data_version_cache() -> TtlLruCache[str, DataVersion]:
+    """ユーザーのデータの版のキャッシュを提供する。
+
+    Returns:
+        プロセス内で共有するデータの版のキャッシュ
+
+    """
+    return _user_data_version_cache
+
+
+def get_todo_event_publisher(session: AsyncSession) -> TodoEventPublisher:
+    """Todoの変更イベントの配信の依存性を提供する。
+
+    Args:
+        session: データベースセッション
+
+    Returns:
+        NOTIFYで全てのワーカーに配信する実装
+
+    """
+    return PgNotifyTodoEventPublisher(session=session)
+
+
+def get_todo_event_broadcaster() -> Broadcaster[TodoEvent]:
+    """Todoの変更イベントのBroadcasterを提供する。
+
+    Returns:
+        プロセス内で共有するBroadcaster
+
+    """
+    return _todo_event_broadcaster
+
+
+def get_todo_ngram_index_updater() -> TodoNgramIndexUpdater | None:
+    """Todoのn-gram転置インデックスの更新処理を提供する。
+
+    Returns:
+        プロセス内で共有する更新処理(アプリケーションの起動時に開始する)。
+        TODO_SEARCH_BACKENDがmemoryでない場合はNone
+
+    """
+    if TODO_SEARCH_BACKEND != TodoSearchBackend.MEMORY:
+        return None
+    return _todo_ngram_index_updater
+
+
+def get_todo_event_listener() -> PgTodoEventListener:
+    """Todoの変更イベントのリスナーを提供する。
+
+    Returns:
+        プロセス内で共有するリスナー(アプリケーションの起動時に開始する)
+
+    """
+    return _todo_event_listener
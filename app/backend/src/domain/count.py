@@ -0,0 +1,12 @@
+"""件数を表現するドメインオブジェクト。"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Count:
+    """件数を表現する値オブジェクト。"""
+
+    value: int
+    # 統計情報から推定した概算の件数の場合はTrue
+    approximate: bool
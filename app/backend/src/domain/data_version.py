@@ -0,0 +1,19 @@
+"""データの版を表現するドメインオブジェクト。
+
+条件付き取得(ETag)で、前回の取得からデータが変化したかを判定するために使用する。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class DataVersion:
+    """テーブル全体のデータの版を表現する値オブジェクト。
+
+    行数と最終更新日時の組で表し、行の追加・更新・削除があれば変化する。
+    """
+
+    count: int
+    # 最も新しい更新日時(行がない場合はNone)
+    last_modified_at: datetime | None
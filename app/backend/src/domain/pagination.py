@@ -0,0 +1,65 @@
+"""ページネーションを表現するドメインオブジェクト。
+
+キーセット(カーソル)方式のページネーションで使用するカーソルとページを定義する。
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+# 1ページあたりのデフォルト件数と最大件数
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class SortDirection(str, Enum):
+    """並び順の向きを定義する列挙型。
+
+    Attributes:
+        ASC: 昇順
+        DESC: 降順
+
+    """
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+def sort_order(key: str, direction: SortDirection = SortDirection.ASC) -> str:
+    """カーソルに記録する並び順を、並び替えキーの名前と向きから求める。
+
+    Args:
+        key: 並び替えキーの名前
+        direction: 並び順の向き
+
+    Returns:
+        並び順を表す文字列
+
+    """
+    return f"{key}:{direction.value}"
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """キーセットページネーションのカーソルを表現する値オブジェクト。
+
+    直前のページの最後の要素の並び替えキーとIDを保持し、
+    次のページはこの位置より後ろの要素から取得する。
+    キーの型が同じ別の並び順に使用されないよう、発行した並び順も保持する。
+    """
+
+    key: datetime | float | str
+    id: str
+    # カーソルを発行した並び順(sort_orderで求めた並び替えキーと向き)
+    order: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """ページネーションされた取得結果。
+
+    次のページが存在しない場合、next_cursorはNoneとなる。
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: PageCursor | None = None
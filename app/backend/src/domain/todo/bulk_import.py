@@ -0,0 +1,60 @@
+"""Todoの一括取り込みを表現するドメインオブジェクト。
+
+取り込むデータの形式と、行ごとのエラーを含む取り込み結果、一括追加の結果を定義する。
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from src.domain.todo.id import TodoId
+from src.domain.todo.todo import Todo
+
+# 結果に含める行ごとのエラーの最大件数(入力の大きさによらず結果のサイズを一定に保つ)
+MAX_REPORTED_IMPORT_ERRORS = 1000
+
+
+class TodoImportFormat(str, Enum):
+    """Todoの一括取り込みのデータ形式を定義する列挙型。
+
+    Attributes:
+        NDJSON: 1行に1件のJSONオブジェクト
+        CSV: 1行目をヘッダーとするCSV
+
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+@dataclass(frozen=True, slots=True)
+class TodoImportError:
+    """取り込めなかった行とその理由。"""
+
+    # 入力の行番号(1始まり)
+    line: int
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class TodoImportResult:
+    """Todoの一括取り込みの結果。
+
+    errorsには先頭からMAX_REPORTED_IMPORT_ERRORS件までのエラーのみを含み、
+    取り込めなかった行の総数はfailedで表す。
+    """
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[TodoImportError] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class TodoBulkInsertResult:
+    """Todoの一括追加の結果。
+
+    insertedは保存した更新日時を持つ追加したTodoで、IDが既に存在したため
+    追加しなかったTodoのIDはconflicted_idsに含まれる。
+    """
+
+    inserted: list[Todo] = field(default_factory=list)
+    conflicted_ids: list[TodoId] = field(default_factory=list)
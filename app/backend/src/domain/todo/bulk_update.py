@@ -0,0 +1,39 @@
+"""Todoの一括更新を表現するドメインオブジェクト。
+
+一括更新の操作と、その結果を定義する。
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from src.domain.todo.id import TodoId
+from src.domain.todo.todo import Todo
+
+# 1回の一括更新で指定できるTodoIDの最大件数
+MAX_BULK_UPDATE_SIZE = 5000
+
+
+class TodoBulkAction(str, Enum):
+    """Todoの一括更新の操作を定義する列挙型。
+
+    Attributes:
+        COMPLETE: 完了にする
+        UNCOMPLETE: 未完了にする
+        TOGGLE: 完了フラグを反転する
+
+    """
+
+    COMPLETE = "complete"
+    UNCOMPLETE = "uncomplete"
+    TOGGLE = "toggle"
+
+
+@dataclass(frozen=True, slots=True)
+class TodoBulkUpdateResult:
+    """Todoの一括更新の結果。
+
+    指定したIDのうち、存在しなかったものはnot_found_idsに含まれる。
+    """
+
+    updated: list[Todo] = field(default_factory=list)
+    not_found_ids: list[TodoId] = field(default_factory=list)
@@ -0,0 +1,28 @@
+"""Todoの変更イベント。
+
+Todoへの書き込みを、接続中のクライアントへ通知するために使用する。
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from src.domain.todo.todo import Todo
+
+
+class TodoEventType(str, Enum):
+    """Todoの変更の種類。"""
+
+    UPDATED = "updated"
+    TOGGLED = "toggled"
+    DELETED = "deleted"
+    # 一括取り込みでTodoが追加された(個々のTodoは通知しない)
+    IMPORTED = "imported"
+
+
+@dataclass(frozen=True, slots=True)
+class TodoEvent:
+    """Todoの変更イベントを表現する値オブジェクト。"""
+
+    type: TodoEventType
+    # 変更後のTodo(一括取り込みのように個々のTodoを通知しない場合はNone)
+    todo: Todo | None = None
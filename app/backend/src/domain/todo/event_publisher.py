@@ -0,0 +1,22 @@
+"""Todoの変更イベントの配信のインターフェース。
+
+書き込みのトランザクションの中で、変更イベントを購読者へ配信する操作を定義する。
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.todo.event import TodoEvent
+
+
+class TodoEventPublisher(ABC):
+    """Todoの変更イベントの配信のインターフェース。"""
+
+    @abstractmethod
+    async def publish(self, events: Sequence[TodoEvent]) -> None:
+        """変更イベントを購読者に配信する。
+
+        書き込みのコミットの前に呼び出し、コミットされた書き込みのイベントのみを配信する。
+        通知はベストエフォートの処理であり、配信に失敗しても書き込みを失敗させないよう、
+        例外は送出しない。
+        """
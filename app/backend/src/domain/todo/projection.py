@@ -0,0 +1,43 @@
+"""Todoの一部の項目を表現するドメインオブジェクト。
+
+一覧の取得で、必要な項目のみを読み込むために使用する。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from src.domain.todo.id import TodoId
+
+
+class TodoField(str, Enum):
+    """Todoの項目を定義する列挙型。
+
+    Attributes:
+        ID: TodoID
+        TITLE: タイトル
+        COMPLETED: 完了フラグ
+        CREATED_AT: 作成日時
+        UPDATED_AT: 更新日時
+
+    """
+
+    ID = "id"
+    TITLE = "title"
+    COMPLETED = "completed"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
+@dataclass(frozen=True, slots=True)
+class TodoProjection:
+    """Todoの一部の項目のみを保持する値オブジェクト。
+
+    IDは常に保持し、読み込まなかった項目はNoneとなる。
+    """
+
+    id: TodoId
+    title: str | None = None
+    completed: bool | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
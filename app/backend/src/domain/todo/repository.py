@@ -4,8 +4,21 @@ Todoの永続化操作を定義する。
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page, PageCursor, SortDirection
+from src.domain.todo.bulk_import import TodoBulkInsertResult
+from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
 from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.summary import TodoSummary
 from src.domain.todo.todo import Todo
 
 
@@ -13,8 +26,73 @@ class TodoRepository(ABC):
     """Todoリポジトリのインターフェース。"""
 
     @abstractmethod
-    async def search(self, query: str) -> list[Todo]:
-        """タイトルでTodoを検索する。"""
+    async def search(self, condition: TodoSearchCondition) -> Page[Todo]:
+        """条件に一致するTodoを1ページ分検索する。
+
+        クエリがある場合は一致度の高い順に、ない場合は作成日時順に並べる。
+        """
+
+    @abstractmethod
+    async def search_projection(
+        self,
+        condition: TodoSearchCondition,
+        fields: frozenset[TodoField],
+    ) -> Page[TodoProjection]:
+        """条件に一致するTodoを、searchと同じ順で1ページ分検索する。
+
+        fieldsの項目とIDのみを読み込む。
+        """
+
+    @abstractmethod
+    async def suggest_titles(self, prefix: str, limit: int) -> list[str]:
+        """タイトルがprefixで始まるTodoのタイトルを、タイトル順にlimit件返す。
+
+        部分一致検索と同じく表記の揺れを区別せずに比較し、正規化すると同じになる
+        タイトルは1件にまとめる。論理削除されたTodoは含めない。
+        """
+
+    @abstractmethod
+    def stream(
+        self,
+        query: str,
+        mode: TodoSearchMode,
+        completed: bool | None = None,
+        sort: TodoSortKey | None = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> AsyncIterator[Todo]:
+        """条件に一致するTodoを、searchと同じ順で全件1件ずつ返す。
+
+        件数によらずメモリ使用量が一定となるよう、読み込んだ順に返す。
+        """
+
+    @abstractmethod
+    async def changes(self, after: PageCursor, limit: int) -> Page[Todo]:
+        """(updated_at, id)がafterより後のTodoを、(updated_at, id)順に1ページ分返す。
+
+        差分同期に使用するため、削除済みのTodoも含めて返す。
+        """
+
+    @abstractmethod
+    async def data_version(self) -> DataVersion:
+        """Todo全体のデータの版を返す。"""
+
+    @abstractmethod
+    async def count(self, completed: bool | None = None) -> int:
+        """論理削除されていないTodoの件数を返す。
+
+        completedを指定した場合は、完了フラグが一致するTodoのみを数える。
+        """
+
+    @abstractmethod
+    async def summarize(self) -> TodoSummary:
+        """論理削除されていないTodoの、完了・未完了ごとの件数を返す。"""
+
+    @abstractmethod
+    async def estimate_count(self) -> int | None:
+        """Todoの件数を統計情報から推定する(推定できない場合はNone)。
+
+        論理削除済みの行も含めた概算のため、正確な件数はcountで求める。
+        """
 
     @abstractmethod
     async def find_by_id(self, todo_id: TodoId) -> Todo:
@@ -23,3 +101,42 @@ class TodoRepository(ABC):
     @abstractmethod
     async def save(self, todo: Todo) -> Todo:
         """Todoを保存(更新)する。"""
+
+    @abstractmethod
+    async def delete(self, todo_id: TodoId) -> Todo:
+        """Todoを論理削除し、削除後のTodoを返す。
+
+        差分同期で削除を伝えられるよう、行は残して削除日時を記録する。
+        """
+
+    @abstractmethod
+    async def toggle(self, todo_id: TodoId) -> Todo:
+        """Todoの完了フラグを反転し、反転後のTodoを返す。
+
+        同時に実行されても更新が失われないよう、読み込みと更新を不可分に行う。
+        """
+
+    @abstractmethod
+    async def bulk_update(
+        self,
+        todo_ids: list[TodoId],
+        action: TodoBulkAction,
+    ) -> TodoBulkUpdateResult:
+        """指定したIDのTodoの完了フラグを一括で更新する。
+
+        存在しないIDは更新せず、結果のnot_found_idsとして返す。
+        """
+
+    @abstractmethod
+    async def bulk_insert(self, todos: Sequence[Todo]) -> TodoBulkInsertResult:
+        """Todoをまとめて追加し、追加したTodoと追加しなかったTodoのIDを返す。
+
+        todosのIDは互いに重複しないこと。作成日時はtodosの値を保つが、
+        差分同期で取得されるよう、更新日時は追加した時刻とする。
+        追加したTodoは、保存した更新日時で返す。
+        """
+
+
+# リクエストのスコープ外で使用するリポジトリを開く関数
+# (キャッシュのバックグラウンドでの再読み込みなど、リクエストの終了後も続く処理で使用する)
+type TodoRepositoryOpener = Callable[[], AbstractAsyncContextManager[TodoRepository]]
@@ -0,0 +1,71 @@
+"""Todoの検索条件を表現する値オブジェクト。
+
+検索クエリとページネーションの条件をまとめて保持する。
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from src.domain.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    SortDirection,
+    sort_order,
+)
+
+
+class TodoSearchMode(str, Enum):
+    """Todoの検索方式を定義する列挙型。
+
+    Attributes:
+        SUBSTRING: タイトルの部分一致検索(類似度順)
+        FTS: 全文検索(単語単位で一致し、関連度順)
+
+    """
+
+    SUBSTRING = "substring"
+    FTS = "fts"
+
+
+class TodoSortKey(str, Enum):
+    """Todoの並び替えキーを定義する列挙型。
+
+    Attributes:
+        CREATED_AT: 作成日時
+        UPDATED_AT: 更新日時
+        TITLE: タイトル
+
+    """
+
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    TITLE = "title"
+
+
+@dataclass(frozen=True, slots=True)
+class TodoSearchCondition:
+    """Todoの検索条件を表現する値オブジェクト。
+
+    sortを指定した場合はsortのキーでdirectionの向きに並べる。
+    sortを省略した場合、queryが空であれば全件を作成日時順に、
+    queryがあればmodeの検索方式で一致度の高い順に並べる(directionは使用しない)。
+    completedを指定した場合は、完了フラグが一致するTodoのみに絞り込む。
+    """
+
+    query: str = ""
+    mode: TodoSearchMode = TodoSearchMode.SUBSTRING
+    completed: bool | None = None
+    sort: TodoSortKey | None = None
+    direction: SortDirection = SortDirection.ASC
+    limit: int = DEFAULT_PAGE_SIZE
+    after: PageCursor | None = None
+
+    @property
+    def order(self) -> str:
+        """カーソルに記録する、この条件の並び順。
+
+        一致度順の場合は、検索方式ごとに一致度の尺度が異なるため検索方式を含める。
+        """
+        if self.sort is None and self.query:
+            return sort_order(f"relevance_{self.mode.value}", SortDirection.DESC)
+        return sort_order((self.sort or TodoSortKey.CREATED_AT).value, self.direction)
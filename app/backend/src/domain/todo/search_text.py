@@ -0,0 +1,28 @@
+"""Todoの検索で使用するテキストの正規化。
+
+タイトルとクエリを同じ方法で正規化して比較することで、表記の揺れによらず一致させる。
+"""
+
+import unicodedata
+
+# カタカナ(U+30A1〜U+30F6)を対応するひらがな(U+3041〜U+3096)に変換する表
+_KATAKANA_TO_HIRAGANA = str.maketrans(
+    {chr(code): chr(code - 0x60) for code in range(0x30A1, 0x30F6 + 1)},
+)
+
+
+def normalize_search_text(text: str) -> str:
+    """検索で一致を判定するためにテキストを正規化する。
+
+    NFKCで全角英数字・半角カナなどの互換文字を通常の文字に揃え、大文字と小文字を
+    同一視したうえで、カタカナをひらがなに揃える。
+
+    Args:
+        text: 正規化するテキスト(タイトルまたはクエリ)
+
+    Returns:
+        正規化したテキスト
+
+    """
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    return normalized.translate(_KATAKANA_TO_HIRAGANA)
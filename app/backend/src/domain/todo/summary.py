@@ -0,0 +1,23 @@
+"""Todoの件数の集計を表現するドメインオブジェクト。"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TodoSummary:
+    """論理削除されていないTodoの、完了・未完了ごとの件数を表現する値オブジェクト。"""
+
+    completed: int
+    pending: int
+
+    @property
+    def total(self) -> int:
+        """Todoの件数。"""
+        return self.completed + self.pending
+
+    @property
+    def completion_rate(self) -> float:
+        """完了済みのTodoの割合(0.0〜1.0。Todoがない場合は0.0)。"""
+        if self.total == 0:
+            return 0.0
+        return self.completed / self.total
@@ -0,0 +1,32 @@
+"""Todoの差分同期を表現するドメインオブジェクト。
+
+前回の同期以降に追加・更新・削除されたTodoのみを取得するために使用する。
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from src.domain.pagination import PageCursor, sort_order
+from src.domain.todo.todo import Todo
+
+# 更新日時がこの時間より新しい変更は、同期の再開位置を進めずに次回も返す
+# 更新日時はトランザクション内で決まるため、コミットが遅れた変更は
+# 後から古い更新日時で現れることがあり、その取りこぼしを防ぐ
+SYNC_SETTLE_INTERVAL = timedelta(seconds=5)
+
+# 差分同期のカーソルに記録する並び順(更新日時順の検索のカーソルとは区別する)
+SYNC_ORDER = sort_order("changes")
+
+
+@dataclass(frozen=True, slots=True)
+class TodoChanges:
+    """差分同期で取得した変更。
+
+    itemsは(updated_at, id)順に並び、削除済みのTodo(deleted_atあり)も含む。
+    """
+
+    items: list[Todo]
+    # 次回の同期を再開する位置
+    resume_cursor: PageCursor
+    # 続きの変更がまだある場合はTrue
+    has_more: bool
@@ -0,0 +1,11 @@
+"""Todoのタイトルの入力補完の条件。
+
+入力中の文字列から始まるタイトルの候補を返す際の件数と長さの上限を定義する。
+"""
+
+# 返す候補の件数の既定値と最大値
+DEFAULT_TITLE_SUGGESTION_LIMIT = 10
+MAX_TITLE_SUGGESTION_LIMIT = 50
+
+# 入力中の文字列の最大長(タイトルの最大長と同じ)
+MAX_TITLE_SUGGESTION_PREFIX_LENGTH = 255
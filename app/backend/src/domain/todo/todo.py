@@ -11,6 +11,10 @@ from datetime import UTC, datetime
 
 from src.domain.todo.id import TodoId
 
+# タイトルの長さ制限定数
+MIN_TODO_TITLE_LENGTH = 1
+MAX_TODO_TITLE_LENGTH = 255
+
 
 @dataclass(eq=False, slots=True)
 class Todo:
@@ -21,12 +25,41 @@ class Todo:
     completed: bool = field(default=False)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # 削除日時(削除されていない場合はNone)
+    # 削除したTodoは差分同期で削除を伝えるため、行を残して削除日時を記録する
+    deleted_at: datetime | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        """タイトルの長さと有効性を検証する。
+
+        Raises:
+            ValueError: タイトルが1文字未満、255文字を超える、またはnull文字を含む場合
+
+        """
+        # null文字はデータベースに保存できないためエラー
+        if "\x00" in self.title:
+            raise ValueError(
+                f"todo title contains null character, title: {self.title!r}"
+            )
+        if len(self.title) < MIN_TODO_TITLE_LENGTH:
+            raise ValueError(
+                f"todo title is less than {MIN_TODO_TITLE_LENGTH} character, title: {self.title}"
+            )
+        if len(self.title) > MAX_TODO_TITLE_LENGTH:
+            raise ValueError(
+                f"todo title is more than {MAX_TODO_TITLE_LENGTH} characters, title: {self.title}",
+            )
 
     def toggle(self) -> None:
         """completedフラグをトグルする。"""
         self.completed = not self.completed
         self.updated_at = datetime.now(UTC)
 
+    @property
+    def is_deleted(self) -> bool:
+        """削除済みの場合はTrueを返す。"""
+        return self.deleted_at is not None
+
     def __eq__(self, other: object) -> bool:
         """Todoの同一性を比較する。"""
         if self is other:
@@ -0,0 +1,46 @@
+"""ユーザーの一括作成を表現するドメインオブジェクト。
+
+作成したユーザーと、作成できなかった入力ごとのエラーを含む結果を定義する。
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from src.domain.user.user import User
+
+# 1回の一括作成で指定できるユーザーの最大件数
+MAX_BULK_CREATE_SIZE = 5000
+
+
+class UserBulkCreateErrorReason(str, Enum):
+    """ユーザーを作成できなかった理由を定義する列挙型。
+
+    Attributes:
+        INVALID_VALUE: メールアドレスまたはユーザー名が不正
+        EMAIL_ALREADY_EXISTS: メールアドレスが既に登録されている
+
+    """
+
+    INVALID_VALUE = "invalid_value"
+    EMAIL_ALREADY_EXISTS = "email_already_exists"
+
+
+@dataclass(frozen=True, slots=True)
+class UserBulkCreateError:
+    """作成できなかった入力とその理由。"""
+
+    # 入力の位置(0始まり)
+    index: int
+    reason: UserBulkCreateErrorReason
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class UserBulkCreateResult:
+    """ユーザーの一括作成の結果。
+
+    created・errorsはいずれも入力の順に並ぶ。
+    """
+
+    created: list[User] = field(default_factory=list)
+    errors: list[UserBulkCreateError] = field(default_factory=list)
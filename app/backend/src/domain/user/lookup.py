@@ -0,0 +1,24 @@
+"""IDを指定したユーザーの一括取得を表現するドメインオブジェクト。
+
+取得の結果を定義する。
+"""
+
+from dataclasses import dataclass, field
+
+from src.domain.user.id import UserId
+from src.domain.user.user import User
+
+# 1回の一括取得で指定できるユーザーIDの最大件数
+MAX_USER_LOOKUP_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class UserLookupResult:
+    """IDを指定したユーザーの一括取得の結果。
+
+    指定したIDのうち、存在しなかったものはnot_found_idsに含まれる。
+    found・not_found_idsはいずれも指定したIDの順(重複は除く)に並ぶ。
+    """
+
+    found: list[User] = field(default_factory=list)
+    not_found_ids: list[UserId] = field(default_factory=list)
@@ -0,0 +1,46 @@
+"""ユーザーの一部の項目を表現するドメインオブジェクト。
+
+一覧の取得で、必要な項目のみを読み込むために使用する。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from src.domain.user.email_address import EmailAddress
+from src.domain.user.id import UserId
+from src.domain.user.name import UserName
+from src.domain.user.role import Role
+
+
+class UserField(str, Enum):
+    """ユーザーの項目を定義する列挙型。
+
+    Attributes:
+        ID: ユーザーID
+        EMAIL: メールアドレス
+        NAME: ユーザー名
+        ROLE: ロール
+        CREATED_AT: 作成日時
+
+    """
+
+    ID = "id"
+    EMAIL = "email"
+    NAME = "name"
+    ROLE = "role"
+    CREATED_AT = "created_at"
+
+
+@dataclass(frozen=True, slots=True)
+class UserProjection:
+    """ユーザーの一部の項目のみを保持する値オブジェクト。
+
+    IDは常に保持し、読み込まなかった項目はNoneとなる。
+    """
+
+    id: UserId
+    email: EmailAddress | None = None
+    name: UserName | None = None
+    role: Role | None = None
+    created_at: datetime | None = None
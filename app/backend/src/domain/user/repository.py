@@ -4,9 +4,15 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page, PageCursor
 from src.domain.user.email_address import EmailAddress
 from src.domain.user.id import UserId
+from src.domain.user.lookup import UserLookupResult
+from src.domain.user.projection import UserField, UserProjection
 from src.domain.user.user import User
 
 
@@ -17,11 +23,67 @@ class UserRepository(ABC):
     """
 
     @abstractmethod
-    async def filter(self) -> list[User]:
-        """すべてのユーザーを取得する。
+    async def filter(self, limit: int, after: PageCursor | None = None) -> Page[User]:
+        """ユーザーを作成日時順に1ページ分取得する。
+
+        Args:
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
+
+        Returns:
+            ユーザーのページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが不正な場合
+
+        """
+
+    @abstractmethod
+    async def filter_projection(
+        self,
+        fields: frozenset[UserField],
+        limit: int,
+        after: PageCursor | None = None,
+    ) -> Page[UserProjection]:
+        """ユーザーを作成日時順に1ページ分取得し、fieldsの項目とIDのみを返す。
+
+        Args:
+            fields: 読み込む項目
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
+
+        Returns:
+            ユーザーの一部の項目のページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが不正な場合
+
+        """
+
+    @abstractmethod
+    async def data_version(self) -> DataVersion:
+        """ユーザー全体のデータの版を返す。
+
+        Returns:
+            ユーザー全体のデータの版
+
+        """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """ユーザーの件数を返す。
+
+        Returns:
+            ユーザーの件数
+
+        """
+
+    @abstractmethod
+    async def estimate_count(self) -> int | None:
+        """ユーザーの件数を統計情報から推定する。
 
         Returns:
-            ユーザーのリスト
+            推定した件数(統計情報から推定できない場合はNone)
 
         """
 
@@ -40,6 +102,18 @@ class UserRepository(ABC):
 
         """
 
+    @abstractmethod
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> UserLookupResult:
+        """IDを指定してユーザーをまとめて取得する。
+
+        Args:
+            user_ids: 取得するユーザーID
+
+        Returns:
+            見つかったユーザーと、存在しなかったユーザーのID
+
+        """
+
     @abstractmethod
     async def find_by_email(self, email: EmailAddress) -> User:
         """メールアドレスでユーザーを検索する。
@@ -70,6 +144,14 @@ class UserRepository(ABC):
 
         """
 
+    @abstractmethod
+    async def bulk_insert(self, users: Sequence[User]) -> list[UserId]:
+        """ユーザーをまとめて追加し、メールアドレスが既に存在したため追加しなかったユーザーのIDを返す。
+
+        usersのIDは互いに重複しないこと。
+        users内でメールアドレスが重複する場合は、先のユーザーのみを追加する。
+        """
+
     @abstractmethod
     async def delete(self, user_id: UserId) -> UserId:
         """ユーザーを削除する。
@@ -84,3 +166,8 @@ class UserRepository(ABC):
             ExpectedBusinessError: ユーザーが見つからない場合
 
         """
+
+
+# リクエストのスコープ外で使用するリポジトリを開く関数
+# (キャッシュのバックグラウンドでの再読み込みなど、リクエストの終了後も続く処理で使用する)
+type UserRepositoryOpener = Callable[[], AbstractAsyncContextManager[UserRepository]]
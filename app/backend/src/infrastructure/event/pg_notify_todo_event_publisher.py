@@ -0,0 +1,67 @@
+"""PostgreSQLのNOTIFYを使用したTodoの変更イベントの配信。
+
+イベントをNOTIFYで全てのワーカーに送り、各ワーカーのPgTodoEventListenerが
+プロセス内の購読者へ配信する。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.domain.todo.event_publisher import TodoEventPublisher
+from src.infrastructure.event.todo_event_payload import TODO_EVENTS_CHANNEL, to_payload
+from src.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.domain.todo.event import TodoEvent
+
+# 複数のイベントを1回の往復で通知する
+_NOTIFY_ALL = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+class PgNotifyTodoEventPublisher(TodoEventPublisher):
+    """PostgreSQLのNOTIFYを使用したTodoの変更イベントの配信。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """配信を初期化する。
+
+        Args:
+            session: データベースセッション
+
+        """
+        self.session = session
+
+    async def publish(self, events: Sequence[TodoEvent]) -> None:
+        """変更イベントを書き込みと同じトランザクションでNOTIFYする。
+
+        NOTIFYは書き込みのコミット時に送られるため、コミットされなかった書き込みの
+        イベントは送られず、イベントの数によらず往復は1回で済む。コミットは呼び出し側が
+        行う。送信に失敗した場合はセーブポイントまで戻して警告を記録し、書き込みの
+        トランザクションは続けられるよう例外は送出しない。
+
+        Args:
+            events: 配信する変更イベント
+
+        """
+        if not events:
+            return
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(
+                    _NOTIFY_ALL,
+                    {
+                        "channel": TODO_EVENTS_CHANNEL,
+                        "payloads": [to_payload(event) for event in events],
+                    },
+                )
+        except SQLAlchemyError as e:
+            logger.warning("todo_event_publish_failed", error=str(e))
@@ -0,0 +1,116 @@
+"""PostgreSQLのLISTENを使用したTodoの変更イベントの受信。
+
+ワーカーごとに1つの接続でNOTIFYを受信し、プロセス内の購読者へ配信する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.infrastructure.event.todo_event_payload import (
+    TODO_EVENTS_CHANNEL,
+    from_payload,
+)
+from src.log.logger import logger
+
+if TYPE_CHECKING:
+    from src.domain.todo.event import TodoEvent
+    from src.shared.pubsub.broadcaster import Broadcaster
+
+# 接続が切れた場合に再接続するまでの待ち時間(秒)
+DEFAULT_RECONNECT_INTERVAL_SECONDS = 1.0
+
+
+class PgTodoEventListener:
+    """PostgreSQLのLISTENでTodoの変更イベントを受信し、プロセス内に配信する。
+
+    書き込んだワーカー自身も含め、全てのワーカーがNOTIFYを1回ずつ受信するため、
+    1回の書き込みはワーカーごとに1回だけ受信され、そのワーカーの全ての購読者に配信される。
+    接続が切れている間のイベントは失われるため、クライアントは再接続時に差分同期で補う。
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        broadcaster: Broadcaster[TodoEvent],
+        reconnect_interval: float = DEFAULT_RECONNECT_INTERVAL_SECONDS,
+    ) -> None:
+        """受信を初期化する。
+
+        Args:
+            database_url: SQLAlchemy形式のデータベースURL
+            broadcaster: 受信したイベントを配信するBroadcaster
+            reconnect_interval: 接続が切れた場合に再接続するまでの待ち時間(秒)
+
+        """
+        # asyncpgはSQLAlchemyのドライバー指定(+asyncpg)を含むURLを解釈できない
+        self._dsn = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._broadcaster = broadcaster
+        self._reconnect_interval = reconnect_interval
+        self._task: asyncio.Task[None] | None = None
+        self._listening = asyncio.Event()
+
+    async def start(self) -> None:
+        """バックグラウンドで受信を開始する。接続の完了は待たない。"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """受信を停止し、接続を閉じる。"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def wait_until_listening(self) -> None:
+        """LISTENが開始されるまで待つ。"""
+        await self._listening.wait()
+
+    async def _run(self) -> None:
+        """接続とLISTENを行い、接続が切れた場合は再接続する。"""
+        while True:
+            try:
+                await self._listen()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning("todo_event_listener_disconnected", error=str(e))
+            await asyncio.sleep(self._reconnect_interval)
+
+    async def _listen(self) -> None:
+        """接続が切れるまでNOTIFYを受信する。"""
+        connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        try:
+            connection.add_termination_listener(lambda _: closed.set())
+            await connection.add_listener(TODO_EVENTS_CHANNEL, self._on_notification)
+            self._listening.set()
+            await closed.wait()
+            logger.warning("todo_event_listener_disconnected")
+        finally:
+            self._listening.clear()
+            await connection.close()
+
+    def _on_notification(
+        self,
+        _connection: object,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        """受信したNOTIFYをイベントに変換して配信する。"""
+        try:
+            event = from_payload(payload)
+        except ValueError as e:
+            logger.warning("todo_event_payload_invalid", error=str(e))
+            return
+        self._broadcaster.publish(event)
@@ -0,0 +1,69 @@
+"""Todoの変更イベントのNOTIFYペイロード。
+
+プロセス間でイベントを受け渡すため、イベントとJSON文字列の変換を行う。
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+from src.domain.todo.event import TodoEvent, TodoEventType
+from src.domain.todo.id import TodoId
+from src.domain.todo.todo import Todo
+
+# Todoの変更イベントを通知するLISTEN/NOTIFYのチャネル
+TODO_EVENTS_CHANNEL = "todo_events"
+
+
+def _todo_to_dict(todo: Todo) -> dict[str, Any]:
+    return {
+        "id": todo.id.value,
+        "title": todo.title,
+        "completed": todo.completed,
+        "created_at": todo.created_at.isoformat(),
+        "updated_at": todo.updated_at.isoformat(),
+        "deleted_at": todo.deleted_at.isoformat() if todo.deleted_at else None,
+    }
+
+
+def _todo_from_dict(data: dict[str, Any]) -> Todo:
+    deleted_at = data["deleted_at"]
+    return Todo(
+        id=TodoId(value=data["id"]),
+        title=data["title"],
+        completed=data["completed"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        deleted_at=datetime.fromisoformat(deleted_at) if deleted_at else None,
+    )
+
+
+def to_payload(event: TodoEvent) -> str:
+    """イベントをNOTIFYのペイロードに変換する。
+
+    タイトルは255文字までのため、ペイロードの上限(8000バイト)を超えることはない。
+    """
+    todo = _todo_to_dict(event.todo) if event.todo is not None else None
+    return json.dumps(
+        {"type": event.type.value, "todo": todo},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def from_payload(payload: str) -> TodoEvent:
+    """NOTIFYのペイロードをイベントに変換する。
+
+    Raises:
+        ValueError: ペイロードの形式が不正な場合
+
+    """
+    try:
+        data = json.loads(payload)
+        todo = data["todo"]
+        return TodoEvent(
+            type=TodoEventType(data["type"]),
+            todo=_todo_from_dict(todo) if todo is not None else None,
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"invalid todo event payload: {payload}") from e
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Any
 
 from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoProjection
 from src.domain.todo.todo import Todo
 
 
@@ -23,6 +24,18 @@ class TodoMapper:
             completed=record["completed"],
             created_at=record["created_at"],
             updated_at=record["updated_at"],
+            deleted_at=record.get("deleted_at"),
+        )
+
+    @staticmethod
+    def to_projection(record: dict[str, Any]) -> TodoProjection:
+        """一部のカラムのみのデータベースレコードをドメインモデルに変換する。"""
+        return TodoProjection(
+            id=TodoId(value=record["id"]),
+            title=record.get("title"),
+            completed=record.get("completed"),
+            created_at=record.get("created_at"),
+            updated_at=record.get("updated_at"),
         )
 
     @staticmethod
@@ -34,6 +47,7 @@ class TodoMapper:
             "completed": entity.completed,
             "created_at": entity.created_at,
             "updated_at": entity.updated_at,
+            "deleted_at": entity.deleted_at,
         }
 
     @staticmethod
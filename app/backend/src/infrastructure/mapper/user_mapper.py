@@ -10,6 +10,7 @@ from typing import Any
 from src.domain.user.email_address import EmailAddress
 from src.domain.user.id import UserId
 from src.domain.user.name import UserName
+from src.domain.user.projection import UserProjection
 from src.domain.user.role import Role, RoleEnum
 from src.domain.user.user import User
 
@@ -36,6 +37,26 @@ class UserMapper:
             created_at=record["created_at"],
         )
 
+    @staticmethod
+    def to_projection(record: dict[str, Any]) -> UserProjection:
+        """一部のカラムのみのデータベースレコードをドメインモデルに変換する。
+
+        Args:
+            record: データベースレコード(IDと読み込んだカラムのみを含む)
+
+        Returns:
+            読み込まなかった項目がNoneのドメインモデル
+
+        """
+        email, name, role = record.get("email"), record.get("name"), record.get("role")
+        return UserProjection(
+            id=UserId(value=record["id"]),
+            email=EmailAddress(value=email) if email is not None else None,
+            name=UserName(value=name) if name is not None else None,
+            role=Role(value=RoleEnum(role)) if role is not None else None,
+            created_at=record.get("created_at"),
+        )
+
     @staticmethod
     def to_db(entity: User) -> dict[str, Any]:
         """ドメインモデルをデータベース用辞書に変換する。
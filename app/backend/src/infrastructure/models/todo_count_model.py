@@ -0,0 +1,108 @@
+"""Todoの件数の集計テーブルの定義。
+
+todosテーブルへの書き込みのたびにトリガーで件数を増減させ、
+完了・未完了ごとの件数をtodosテーブルを走査せずに求められるようにする。
+"""
+
+from sqlalchemy import DDL, BigInteger, Boolean, SmallInteger, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.config.database import Base
+from src.infrastructure.models.todo_model import TodoModel
+
+# 完了フラグごとの件数を分けて持つ行数
+# 同時に書き込むトランザクションが同じ行の更新を待ち合わせないよう、書き込みごとに
+# ランダムな行へ加算する(件数は完了フラグごとの全行の合計となる)
+TODO_COUNT_SHARDS = 8
+
+
+class TodoCountModel(Base):
+    """Todoの件数の集計テーブル。
+
+    論理削除されていないTodoの件数を、完了フラグとshardの組ごとに保持する。
+    """
+
+    __tablename__ = "todo_counts"
+
+    completed: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    def __repr__(self) -> str:
+        """モデルの文字列表現。"""
+        return (
+            f"<TodoCountModel(completed={self.completed}, shard={self.shard}, "
+            f"count={self.count})>"
+        )
+
+
+# 文ごとに変更前後の行(遷移テーブル)から完了フラグごとの増減を求め、集計テーブルに加算する
+# 行ごとのトリガーと異なり、一括更新・COPYによる取り込みでも1文につき1回の加算で済む
+# 増減を未完了・完了の順に加算し、同時に実行されるトリガー間で行ロックの順序を揃える
+TODO_COUNTS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION todo_counts_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    pending_delta bigint := 0;
+    completed_delta bigint := 0;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM todo_counts;
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT count(*) FILTER (WHERE NOT completed), count(*) FILTER (WHERE completed)
+        INTO pending_delta, completed_delta
+        FROM new_rows WHERE deleted_at IS NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT
+            pending_delta - count(*) FILTER (WHERE NOT completed),
+            completed_delta - count(*) FILTER (WHERE completed)
+        INTO pending_delta, completed_delta
+        FROM old_rows WHERE deleted_at IS NULL;
+    END IF;
+    INSERT INTO todo_counts (completed, shard, count)
+    SELECT delta.completed, floor(random() * %(shards)s), delta.count
+    FROM (VALUES (false, pending_delta), (true, completed_delta))
+        AS delta (completed, count)
+    WHERE delta.count <> 0
+    ON CONFLICT (completed, shard)
+        DO UPDATE SET count = todo_counts.count + EXCLUDED.count;
+    RETURN NULL;
+END
+$$
+"""
+
+# todosテーブルに設定するトリガー(テーブルの削除とともに削除される)
+TODO_COUNTS_TRIGGER_SQLS = (
+    (
+        "CREATE TRIGGER todo_counts_insert AFTER INSERT ON todos "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_counts_apply()"
+    ),
+    (
+        "CREATE TRIGGER todo_counts_update AFTER UPDATE ON todos "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_counts_apply()"
+    ),
+    (
+        "CREATE TRIGGER todo_counts_delete AFTER DELETE ON todos "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_counts_apply()"
+    ),
+    (
+        "CREATE TRIGGER todo_counts_truncate AFTER TRUNCATE ON todos "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_counts_apply()"
+    ),
+)
+
+# create_all(ローカル環境・テスト)でも件数を集計できるよう、
+# todosテーブルの作成後にトリガーを設定する(本番はAlembicマイグレーションで作成)
+event.listen(
+    TodoModel.__table__,
+    "after_create",
+    DDL(TODO_COUNTS_FUNCTION_SQL, context={"shards": TODO_COUNT_SHARDS}),
+)
+for _sql in TODO_COUNTS_TRIGGER_SQLS:
+    event.listen(TodoModel.__table__, "after_create", DDL(_sql))
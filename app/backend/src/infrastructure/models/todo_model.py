@@ -5,19 +5,96 @@ SQLAlchemyを使用したデータベースのTodoテーブル構造を定義す
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Computed,
+    DateTime,
+    Index,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
+from src.domain.todo.search_text import normalize_search_text
 from src.infrastructure.config.database import Base
 
+# 文字列に含まれるn文字の部分文字列(n-gram)の配列を返す関数
+# 検索用のn-gramの生成列と、クエリのn-gramの両方で使用する。
+# データベースの文字コードがUTF-8でない場合は、文字ではなくバイト単位のn-gramとなるが、
+# 生成列とクエリで同じ関数を使うため、部分文字列のn-gramが含まれるという関係は変わらない
+TODO_SEARCH_NGRAMS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION todo_search_ngrams(value text, n integer) RETURNS text[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT ARRAY(
+        SELECT DISTINCT substr(value, i, n)
+        FROM generate_series(1, char_length(value) - n + 1) AS i
+    )
+$$
+"""
+
 
 class TodoModel(Base):
     """Todoテーブル。"""
 
     __tablename__ = "todos"
+    __table_args__ = (
+        # タイトルの部分一致検索用のn-gramのGINインデックス
+        Index("ix_todos_title_ngrams", "title_ngrams", postgresql_using="gin"),
+        # 作成日時順のキーセットページネーション用の複合インデックス
+        Index("ix_todos_created_at_id", "created_at", "id"),
+        # 未完了のTodoの一覧用の部分インデックス(完了済み・削除済みの行を含まない)
+        Index(
+            "ix_todos_pending_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT completed AND deleted_at IS NULL"),
+        ),
+        # 更新日時順の差分同期・並び替え用の複合インデックス
+        Index("ix_todos_updated_at_id", "updated_at", "id"),
+        # タイトル順の並び替え用の複合インデックス
+        Index("ix_todos_title_id", "title", "id"),
+        # 全文検索用のGINインデックス
+        Index("ix_todos_title_tsv", "title_tsv", postgresql_using="gin"),
+        # タイトルの入力補完(前方一致)用の部分インデックス
+        # バイト順のC照合順序とすることで、データベースの照合順序によらずLIKEの前方一致を
+        # 範囲検索にでき(text_pattern_opsと同じ)、同じ順で候補を並べられる。
+        # タイトルも含め、重複を除いた候補をインデックスのみで返す
+        Index(
+            "ix_todos_title_search_prefix",
+            text('title_search COLLATE "C"'),
+            "title",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+    # 生成列は検索条件でのみ使用するため、INSERT時にRETURNINGで読み込まない
+    __mapper_args__ = {"eager_defaults": False}  # noqa: RUF012
 
     id: Mapped[str] = mapped_column(String(255), primary_key=True)
     title: Mapped[str] = mapped_column(String(255))
+    # 全文検索用にtitleから生成するtsvector(日本語を含むため言語依存の処理をしないsimple構成)
+    # 検索条件でのみ使用するため、通常の取得では読み込まない
+    title_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', title)", persisted=True),
+        deferred=True,
+    )
+    # 部分一致検索用に正規化したタイトル(タイトルの設定時にアプリケーションで求める)
+    # NFKCの正規化で長くなる場合があるため、長さを制限しない
+    title_search: Mapped[str] = mapped_column(Text, deferred=True)
+    # 部分一致検索用に正規化したタイトルの1文字と2文字のn-gram
+    # 日本語は語の区切りがなく短い語で検索されるため、トライグラムではなく2文字までとする
+    title_ngrams: Mapped[list[str]] = mapped_column(
+        ARRAY(Text),
+        Computed(
+            "todo_search_ngrams(title_search, 1) || todo_search_ngrams(title_search, 2)",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     completed: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -27,9 +104,35 @@ class TodoModel(Base):
         DateTime(timezone=True),
         default=datetime.utcnow,
     )
+    # 論理削除した日時(削除されていない場合はNULL)
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        default=None,
+    )
+
+    @validates("title")
+    def _set_title_search(self, _key: str, title: str) -> str:
+        """タイトルの設定時に、部分一致検索用に正規化したタイトルも設定する。"""
+        self.title_search = normalize_search_text(title)
+        return title
 
     def __repr__(self) -> str:
         """モデルの文字列表現。"""
         return (
             f"<TodoModel(id={self.id}, title={self.title}, completed={self.completed})>"
         )
+
+
+# create_all(ローカル環境・テスト)でも類似度の関数とn-gramの生成列を使えるよう、
+# テーブル作成前にpg_trgm拡張とn-gramの関数を作成する(本番はAlembicマイグレーションで作成)
+event.listen(
+    TodoModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+event.listen(
+    TodoModel.__table__,
+    "before_create",
+    DDL(TODO_SEARCH_NGRAMS_FUNCTION_SQL),
+)
@@ -0,0 +1,88 @@
+"""ユーザーの件数の集計テーブルの定義。
+
+usersテーブルへの書き込みのたびにトリガーで件数を増減させ、
+ユーザーの件数をusersテーブルを走査せずに求められるようにする。
+"""
+
+from sqlalchemy import DDL, BigInteger, SmallInteger, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.config.database import Base
+from src.infrastructure.models.user_model import UserModel
+
+# 件数を分けて持つ行数
+# 同時に書き込むトランザクションが同じ行の更新を待ち合わせないよう、書き込みごとに
+# ランダムな行へ加算する(件数は全行の合計となる)
+USER_COUNT_SHARDS = 8
+
+
+class UserCountModel(Base):
+    """ユーザーの件数の集計テーブル。
+
+    ユーザーの件数をshardごとに保持する。
+    """
+
+    __tablename__ = "user_counts"
+
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    def __repr__(self) -> str:
+        """モデルの文字列表現。"""
+        return f"<UserCountModel(shard={self.shard}, count={self.count})>"
+
+
+# 文ごとに追加・削除した行(遷移テーブル)の数を求め、集計テーブルに加算する
+# ユーザーは更新されないため、UPDATEのトリガーは設定しない
+USER_COUNTS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION user_counts_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta bigint;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM user_counts;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'INSERT' THEN
+        SELECT count(*) INTO delta FROM new_rows;
+    ELSE
+        SELECT -count(*) INTO delta FROM old_rows;
+    END IF;
+    IF delta <> 0 THEN
+        INSERT INTO user_counts (shard, count)
+        VALUES (floor(random() * %(shards)s), delta)
+        ON CONFLICT (shard) DO UPDATE SET count = user_counts.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+# usersテーブルに設定するトリガー(テーブルの削除とともに削除される)
+USER_COUNTS_TRIGGER_SQLS = (
+    (
+        "CREATE TRIGGER user_counts_insert AFTER INSERT ON users "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION user_counts_apply()"
+    ),
+    (
+        "CREATE TRIGGER user_counts_delete AFTER DELETE ON users "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION user_counts_apply()"
+    ),
+    (
+        "CREATE TRIGGER user_counts_truncate AFTER TRUNCATE ON users "
+        "FOR EACH STATEMENT EXECUTE FUNCTION user_counts_apply()"
+    ),
+)
+
+# create_all(ローカル環境・テスト)でも件数を集計できるよう、
+# usersテーブルの作成後にトリガーを設定する(本番はAlembicマイグレーションで作成)
+event.listen(
+    UserModel.__table__,
+    "after_create",
+    DDL(USER_COUNTS_FUNCTION_SQL, context={"shards": USER_COUNT_SHARDS}),
+)
+for _sql in USER_COUNTS_TRIGGER_SQLS:
+    event.listen(UserModel.__table__, "after_create", DDL(_sql))
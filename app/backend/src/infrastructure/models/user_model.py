@@ -5,7 +5,7 @@ SQLAlchemyを使用したデータベースのユーザーテーブル構造を
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.config.database import Base
@@ -19,6 +19,10 @@ class UserModel(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # 作成日時順のキーセットページネーション用の複合インデックス
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     # 主キー(UUID文字列)
     id: Mapped[str] = mapped_column(String(255), primary_key=True)
@@ -0,0 +1,97 @@
+"""キーセットページネーションの共通処理。
+
+(並び替えキー, ID)の組で位置を特定し、何ページ目でも
+インデックスの範囲スキャンだけで取得できるクエリを組み立てる。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import literal, tuple_
+
+from src.domain.pagination import PageCursor
+from src.shared.errors.codes import CommonErrorCode
+from src.shared.errors.errors import ExpectedBusinessError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from datetime import datetime
+
+    from sqlalchemy import ColumnElement, Row, Select
+
+
+def paginate(  # noqa: PLR0913
+    stmt: Select[Any],
+    *,
+    sort_key: ColumnElement[Any],
+    id_column: ColumnElement[str],
+    key_type: type,
+    order: str,
+    limit: int,
+    after: PageCursor | None,
+    descending: bool = False,
+) -> Select[Any]:
+    """キーセットページネーションの条件・並び順・件数をクエリに付与する。
+
+    次のページの有無を判定するため、limit + 1件を取得する。
+
+    Args:
+        stmt: 対象のクエリ
+        sort_key: 並び替えキーの式
+        id_column: 同じキーの要素を一意に並べるためのIDカラム
+        key_type: カーソルのキーとして受け付ける型
+        order: 並び順(カーソルに記録された並び順と一致する場合のみ受け付ける)
+        limit: 1ページの件数
+        after: 直前のページのカーソル(Noneの場合は先頭ページ)
+        descending: 降順に並べる場合はTrue
+
+    Returns:
+        ページネーション条件を付与したクエリ
+
+    Raises:
+        ExpectedBusinessError: カーソルの並び順またはキーの型が並び順と一致しない場合
+
+    """
+    if after is not None:
+        # 別の並び順で発行されたカーソルは位置を特定できないため受け付けない
+        if after.order != order or not isinstance(after.key, key_type):
+            raise ExpectedBusinessError(
+                code=CommonErrorCode.InvalidValue,
+                details={"after": "cursor does not match the sort order"},
+            )
+        position = tuple_(sort_key, id_column)
+        boundary = tuple_(literal(after.key), literal(after.id))
+        stmt = stmt.where(position < boundary if descending else position > boundary)
+
+    if descending:
+        stmt = stmt.order_by(sort_key.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(sort_key.asc(), id_column.asc())
+    return stmt.limit(limit + 1)
+
+
+def next_cursor(
+    rows: Sequence[Row[Any]],
+    limit: int,
+    key_of: Callable[[Row[Any]], datetime | float | str],
+    id_of: Callable[[Row[Any]], str],
+    order: str,
+) -> PageCursor | None:
+    """paginateで取得したlimit + 1件の結果から次のページのカーソルを求める。
+
+    Args:
+        rows: paginateを付与したクエリの取得結果
+        limit: 1ページの件数
+        key_of: 行から並び替えキーを取り出す関数
+        id_of: 行からIDを取り出す関数
+        order: カーソルに記録する並び順
+
+    Returns:
+        次のページのカーソル(次のページがない場合はNone)
+
+    """
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return PageCursor(key=key_of(last), id=id_of(last), order=order)
@@ -0,0 +1,47 @@
+"""テーブルの統計情報の共通処理。
+
+プランナーと同じ方法で、統計情報からテーブルの行数を定数時間で推定する。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# 直近のVACUUM・ANALYZEで求めた1ページあたりの行数に、現在のページ数を掛けて推定する
+# (統計情報の更新後に行が増減していても、テーブルの大きさの変化に追従させる)
+# 一度も集計されていない(reltuplesが負)か、集計時に空だった(relpagesが0)場合は
+# 1ページあたりの行数が分からないため、推定できないとしてNULLを返す
+_ESTIMATE_ROW_COUNT = text(
+    """
+    SELECT CASE
+        WHEN reltuples < 0 OR relpages = 0 THEN NULL
+        ELSE reltuples / relpages
+            * (pg_relation_size(oid) / current_setting('block_size')::integer)
+    END
+    FROM pg_class
+    WHERE oid = CAST(:table_name AS regclass)
+    """
+)
+
+
+async def estimate_row_count(session: AsyncSession, table_name: str) -> int | None:
+    """pg_classの統計情報からテーブルの行数を推定する。
+
+    テーブルを走査しないため、行数によらず一定の時間で返る。
+
+    Args:
+        session: データベースセッション
+        table_name: 対象のテーブル名
+
+    Returns:
+        推定した行数(統計情報から推定できない場合はNone)
+
+    """
+    result = await session.execute(_ESTIMATE_ROW_COUNT, {"table_name": table_name})
+    estimate = result.scalar_one()
+    return None if estimate is None else round(estimate)
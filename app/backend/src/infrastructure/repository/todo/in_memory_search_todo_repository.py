@@ -0,0 +1,163 @@
+"""メモリ上のn-gram転置インデックスで検索するTodoリポジトリ。
+
+部分一致検索をプロセス内のインデックスで行い、それ以外の操作はデータベースの
+リポジトリに委譲する。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.pagination import Page, SortDirection
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import TodoSearchMode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from src.domain.data_version import DataVersion
+    from src.domain.pagination import PageCursor
+    from src.domain.todo.bulk_import import TodoBulkInsertResult
+    from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
+    from src.domain.todo.id import TodoId
+    from src.domain.todo.search_condition import TodoSearchCondition, TodoSortKey
+    from src.domain.todo.summary import TodoSummary
+    from src.domain.todo.todo import Todo
+    from src.infrastructure.search.todo_ngram_index import TodoNgramIndex
+
+
+def _to_projection(todo: Todo, fields: frozenset[TodoField]) -> TodoProjection:
+    """Todoからfieldsの項目とIDのみを持つ値オブジェクトを作成する。"""
+    return TodoProjection(
+        id=todo.id,
+        title=todo.title if TodoField.TITLE in fields else None,
+        completed=todo.completed if TodoField.COMPLETED in fields else None,
+        created_at=todo.created_at if TodoField.CREATED_AT in fields else None,
+        updated_at=todo.updated_at if TodoField.UPDATED_AT in fields else None,
+    )
+
+
+class InMemorySearchTodoRepository(TodoRepository):
+    """メモリ上のn-gram転置インデックスで部分一致検索を行うTodoリポジトリ。
+
+    インデックスの読み込みが完了した後の、クエリを指定した部分一致検索のみを
+    インデックスで行い、全文検索・クエリのない一覧・書き込みはデータベースの
+    リポジトリに委譲する。このリポジトリを通した書き込みは、結果をすぐに
+    インデックスにも反映するため、同じプロセスでは書き込んだ内容がすぐに検索される。
+    他のプロセスの書き込みは、変更イベントを受信したTodoNgramIndexUpdaterが反映する。
+    """
+
+    def __init__(self, repository: TodoRepository, index: TodoNgramIndex) -> None:
+        """リポジトリを初期化する。
+
+        Args:
+            repository: 検索以外の操作を委譲するリポジトリ
+            index: 部分一致検索に使用するインデックス
+
+        """
+        self.repository = repository
+        self.index = index
+
+    def _use_index(self, condition: TodoSearchCondition) -> bool:
+        """検索をインデックスで行う場合はTrueを返す。"""
+        return (
+            self.index.loaded
+            and condition.mode == TodoSearchMode.SUBSTRING
+            and bool(condition.query)
+        )
+
+    async def search(self, condition: TodoSearchCondition) -> Page[Todo]:
+        """条件に一致するTodoを1ページ分検索する。"""
+        if self._use_index(condition):
+            return self.index.search(condition)
+        return await self.repository.search(condition)
+
+    async def search_projection(
+        self,
+        condition: TodoSearchCondition,
+        fields: frozenset[TodoField],
+    ) -> Page[TodoProjection]:
+        """条件に一致するTodoを、searchと同じ順で1ページ分検索する。"""
+        if not self._use_index(condition):
+            return await self.repository.search_projection(condition, fields)
+        page = self.index.search(condition)
+        return Page(
+            items=[_to_projection(todo, fields) for todo in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def suggest_titles(self, prefix: str, limit: int) -> list[str]:
+        """タイトルがprefixで始まるTodoのタイトルを返す(データベースで検索する)。"""
+        return await self.repository.suggest_titles(prefix, limit)
+
+    def stream(
+        self,
+        query: str,
+        mode: TodoSearchMode,
+        completed: bool | None = None,
+        sort: TodoSortKey | None = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> AsyncIterator[Todo]:
+        """条件に一致するTodoを全件1件ずつ返す(データベースから読み込む)。"""
+        return self.repository.stream(query, mode, completed, sort, direction)
+
+    async def changes(self, after: PageCursor, limit: int) -> Page[Todo]:
+        """(updated_at, id)がafterより後のTodoを1ページ分返す。"""
+        return await self.repository.changes(after, limit)
+
+    async def data_version(self) -> DataVersion:
+        """Todo全体のデータの版を返す。"""
+        return await self.repository.data_version()
+
+    async def count(self, completed: bool | None = None) -> int:
+        """論理削除されていないTodoの件数を返す。"""
+        return await self.repository.count(completed)
+
+    async def summarize(self) -> TodoSummary:
+        """論理削除されていないTodoの、完了・未完了ごとの件数を返す。"""
+        return await self.repository.summarize()
+
+    async def estimate_count(self) -> int | None:
+        """Todoの件数を統計情報から推定する(推定できない場合はNone)。"""
+        return await self.repository.estimate_count()
+
+    async def find_by_id(self, todo_id: TodoId) -> Todo:
+        """IDでTodoを検索する。"""
+        return await self.repository.find_by_id(todo_id)
+
+    async def save(self, todo: Todo) -> Todo:
+        """Todoを保存(更新)し、インデックスに反映する。"""
+        saved = await self.repository.save(todo)
+        self.index.apply(saved)
+        return saved
+
+    async def delete(self, todo_id: TodoId) -> Todo:
+        """Todoを論理削除し、インデックスから取り除く。"""
+        deleted = await self.repository.delete(todo_id)
+        self.index.apply(deleted)
+        return deleted
+
+    async def toggle(self, todo_id: TodoId) -> Todo:
+        """Todoの完了フラグを反転し、インデックスに反映する。"""
+        toggled = await self.repository.toggle(todo_id)
+        self.index.apply(toggled)
+        return toggled
+
+    async def bulk_update(
+        self,
+        todo_ids: list[TodoId],
+        action: TodoBulkAction,
+    ) -> TodoBulkUpdateResult:
+        """Todoの完了フラグを一括で更新し、インデックスに反映する。"""
+        result = await self.repository.bulk_update(todo_ids, action)
+        for todo in result.updated:
+            self.index.apply(todo)
+        return result
+
+    async def bulk_insert(self, todos: Sequence[Todo]) -> TodoBulkInsertResult:
+        """Todoをまとめて追加し、保存した更新日時で追加したTodoをインデックスに反映する。"""
+        result = await self.repository.bulk_insert(todos)
+        for todo in result.inserted:
+            self.index.apply(todo)
+        return result
@@ -5,39 +5,294 @@ SQLAlchemy 2.0を使用してTodoの永続化を行う。
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from dataclasses import replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    String,
+    and_,
+    any_,
+    asc,
+    bindparam,
+    column,
+    desc,
+    false,
+    func,
+    not_,
+    select,
+    table,
+    text,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from sqlalchemy import ColumnElement, Row
     from sqlalchemy.ext.asyncio import AsyncSession
 
-    from src.domain.todo.id import TodoId
+    from src.domain.todo.event_publisher import TodoEventPublisher
+    from src.domain.todo.search_condition import TodoSearchCondition
     from src.domain.todo.todo import Todo
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page, PageCursor, SortDirection
+from src.domain.todo.bulk_import import TodoBulkInsertResult
+from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
+from src.domain.todo.event import TodoEvent, TodoEventType
+from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
 from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import TodoSearchMode, TodoSortKey
+from src.domain.todo.search_text import normalize_search_text
+from src.domain.todo.summary import TodoSummary
+from src.domain.todo.sync import SYNC_ORDER
 from src.infrastructure.mapper.todo_mapper import TodoMapper
+from src.infrastructure.models.todo_count_model import TodoCountModel
 from src.infrastructure.models.todo_model import TodoModel
+from src.infrastructure.repository.pagination import next_cursor, paginate
+from src.infrastructure.repository.statistics import estimate_row_count
+from src.shared.cache.version_counter import VersionCounter
 from src.shared.errors.codes import TodoErrorCode
 from src.shared.errors.errors import ExpectedBusinessError
 
+# 全文検索で使用するテキスト検索構成(生成列title_tsvの定義と一致させる)
+_TS_CONFIG = "simple"
+
+# サロゲートのコードポイントの範囲(文字列として送信できないため、前方一致の上限で飛ばす)
+_SURROGATE_START = 0xD800
+_SURROGATE_END = 0xDFFF
+
+# 部分一致検索でクエリから求めるn-gramの最大の文字数(生成列title_ngramsの定義と一致させる)
+_MAX_NGRAM_SIZE = 2
+
+# ストリーミング時にサーバーサイドカーソルから一度に読み込む行数
+_STREAM_BATCH_SIZE = 1000
+
+# ドメインモデルへの変換に必要なカラム
+_TODO_COLUMNS = (
+    TodoModel.id,
+    TodoModel.title,
+    TodoModel.completed,
+    TodoModel.created_at,
+    TodoModel.updated_at,
+)
+
+# 項目ごとのカラム(一部の項目のみを読み込む場合に使用する)
+_FIELD_COLUMNS = {
+    TodoField.ID: TodoModel.id,
+    TodoField.TITLE: TodoModel.title,
+    TodoField.COMPLETED: TodoModel.completed,
+    TodoField.CREATED_AT: TodoModel.created_at,
+    TodoField.UPDATED_AT: TodoModel.updated_at,
+}
+
+# 論理削除されていないTodoの条件(差分同期以外の取得・更新はこの条件で絞り込む)
+_NOT_DELETED = TodoModel.deleted_at.is_(None)
+
+# 一括取り込み時にCOPYで書き込む一時テーブル
+# トランザクションのコミット時に行が削除され、同じ接続で再利用される
+_IMPORT_STAGING_TABLE = "todo_import_staging"
+# 更新日時は取り込んだ時刻とするため、一時テーブルには持たない
+_IMPORT_COLUMNS = (
+    "id",
+    "title",
+    "title_search",
+    "completed",
+    "created_at",
+)
+_CREATE_IMPORT_STAGING_TABLE = text(
+    f"""
+    CREATE TEMPORARY TABLE IF NOT EXISTS {_IMPORT_STAGING_TABLE} (
+        id varchar(255) NOT NULL,
+        title varchar(255) NOT NULL,
+        title_search text NOT NULL,
+        completed boolean NOT NULL,
+        created_at timestamptz NOT NULL
+    ) ON COMMIT DELETE ROWS
+    """
+)
+_import_staging = table(
+    _IMPORT_STAGING_TABLE, *(column(name) for name in _IMPORT_COLUMNS)
+)
+
+
+def _escape_like(value: str) -> str:
+    """LIKEパターンのワイルドカード文字をエスケープする。"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _substring_criterion(normalized_query: str) -> ColumnElement[bool]:
+    """正規化したクエリを正規化したタイトルに含むTodoの条件を返す。
+
+    クエリのn-gramを全て含む行をn-gramのGINインデックスで絞り込み、
+    LIKEで部分文字列として含むかを確かめる。クエリのn-gramは生成列と同じ関数で求めるため、
+    1文字のクエリは1文字のn-gram、2文字以上のクエリは2文字のn-gramで絞り込む。
+    """
+    criterion = TodoModel.title_search.like(
+        f"%{_escape_like(normalized_query)}%",
+        escape="\\",
+    )
+    if not normalized_query:
+        return criterion
+    query_ngrams = func.todo_search_ngrams(
+        normalized_query,
+        min(len(normalized_query), _MAX_NGRAM_SIZE),
+    )
+    return and_(TodoModel.title_ngrams.contains(query_ngrams), criterion)
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """C照合順序でprefixで始まる全ての文字列より大きい、最小の文字列を返す。
+
+    UTF-8のバイト順はコードポイント順と一致するため、末尾の文字を次のコードポイントに
+    置き換える。末尾がU+10FFFFの場合はその文字を除いて繰り返し、上限がない場合はNoneを返す。
+    """
+    chars = list(prefix)
+    while chars:
+        code = ord(chars.pop()) + 1
+        if code == _SURROGATE_START:
+            code = _SURROGATE_END + 1
+        if code <= sys.maxunicode:
+            return "".join(chars) + chr(code)
+    return None
+
+
+def _completed_criterion(completed: bool | None) -> ColumnElement[bool] | None:
+    """完了フラグによる絞り込み条件を返す(Noneの場合は絞り込まない)。
+
+    未完了のTodoの部分インデックス(WHERE NOT completed)を使えるよう、
+    パラメーターではなくカラムそのものを条件とする。パラメーターの場合、
+    プリペアドステートメントの汎用プランでは部分インデックスの条件を満たすと判断できない。
+    """
+    if completed is None:
+        return None
+    return TodoModel.completed if completed else not_(TodoModel.completed)
+
+
+class _SearchOrder(NamedTuple):
+    """検索の絞り込み条件と並び順。"""
+
+    # 絞り込み条件(Noneの場合は全件)
+    criterion: ColumnElement[bool] | None
+    # 並び替えキー(同じキーの要素はIDで並べる)
+    sort_key: ColumnElement[Any]
+    # 並び替えキーの型(カーソルの検証に使用する)
+    key_type: type
+    # 降順に並べる場合はTrue
+    descending: bool
+
+
+# 並び替えキーごとのカラムとその型
+# いずれも(カラム, id)の複合インデックスがあり、降順はインデックスを逆向きに辿る
+_SORT_COLUMNS: dict[TodoSortKey, tuple[ColumnElement[Any], type]] = {
+    TodoSortKey.CREATED_AT: (TodoModel.created_at, datetime),
+    TodoSortKey.UPDATED_AT: (TodoModel.updated_at, datetime),
+    TodoSortKey.TITLE: (TodoModel.title, str),
+}
+
+
+def _search_order(
+    query: str,
+    mode: TodoSearchMode,
+    sort: TodoSortKey | None = None,
+    direction: SortDirection = SortDirection.ASC,
+) -> _SearchOrder:
+    """検索条件から、絞り込み条件と並び順を決める。
+
+    並び替えキーの指定がなくクエリがある場合は、一致度の高い順に並べる。
+    """
+    criterion: ColumnElement[bool] | None = None
+    relevance: ColumnElement[Any] | None = None
+    if query and mode == TodoSearchMode.FTS:
+        # websearch_to_tsqueryは利用者の入力をそのまま渡しても構文エラーにならない
+        ts_query = func.websearch_to_tsquery(_TS_CONFIG, query)
+        criterion = TodoModel.title_tsv.bool_op("@@")(ts_query)
+        relevance = func.ts_rank(TodoModel.title_tsv, ts_query)
+    elif query:
+        # 全角・半角、大文字・小文字、ひらがな・カタカナを区別しないよう、
+        # タイトルと同じ方法で正規化したクエリで検索する
+        normalized_query = normalize_search_text(query)
+        criterion = _substring_criterion(normalized_query)
+        relevance = func.similarity(TodoModel.title_search, normalized_query)
+
+    if sort is None and relevance is not None:
+        return _SearchOrder(
+            criterion=criterion,
+            sort_key=relevance,
+            key_type=float,
+            descending=True,
+        )
+    sort_key, key_type = _SORT_COLUMNS[sort or TodoSortKey.CREATED_AT]
+    return _SearchOrder(
+        criterion=criterion,
+        sort_key=sort_key,
+        key_type=key_type,
+        descending=direction == SortDirection.DESC,
+    )
+
 
 class TodoRepositoryImpl(TodoRepository):
     """PostgreSQLを使用したTodoリポジトリの実装。"""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """リポジトリを初期化する。"""
+    def __init__(
+        self,
+        session: AsyncSession,
+        versions: VersionCounter | None = None,
+        event_publisher: TodoEventPublisher | None = None,
+    ) -> None:
+        """リポジトリを初期化する。
+
+        Args:
+            session: データベースセッション
+            versions: 書き込みのたびに進めるTodoの世代番号(検索結果のキャッシュの無効化に使用する)
+            event_publisher: 書き込みと同じトランザクションで変更イベントを配信する仕組み
+                (Noneの場合は配信しない)
+
+        """
         self.session = session
+        self.versions = versions or VersionCounter()
+        self.event_publisher = event_publisher
 
-    async def search(self, query: str) -> list[Todo]:
-        """タイトルでTodoを検索する。"""
-        if query:
-            stmt = select(TodoModel).where(TodoModel.title.ilike(f"%{query}%"))
-        else:
-            stmt = select(TodoModel)
-        result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        return TodoMapper.to_domain_list(
+    async def _publish(self, events: Sequence[TodoEvent]) -> None:
+        """変更イベントをコミット前の書き込みのトランザクションで配信する。"""
+        if self.event_publisher is not None and events:
+            await self.event_publisher.publish(events)
+
+    async def search(self, condition: TodoSearchCondition) -> Page[Todo]:
+        """条件に一致するTodoを1ページ分検索する。
+
+        クエリがある場合は検索方式に応じて次のように検索する。
+
+        - SUBSTRING: 正規化したタイトルのn-gramのGINインデックスを使った部分一致検索を行い、
+          pg_trgmによるクエリとの類似度が高い順に並べる。全角・半角、大文字・小文字、
+          ひらがな・カタカナの違いは区別しない。
+        - FTS: 生成列title_tsvのGINインデックスを使った全文検索を行い、
+          ts_rankによる関連度が高い順に並べる。
+
+        並び替えキーを指定した場合は、クエリがあっても一致度ではなくそのキーの順に並べる。
+        クエリがない場合は並び替えキー(省略時は作成日時)の順に並べ、
+        (並び替えキー, id)の複合インデックスでページを辿るため、全件の並び替えは行わない。
+        未完了のTodoのみを作成日時順に並べる場合は、未完了かつ削除されていない行だけを持つ
+        部分インデックスを辿るため、完了済みのTodoがどれだけ多くても読み込む量は増えない。
+
+        Args:
+            condition: 検索条件
+
+        Returns:
+            検索条件に一致したTodoのページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが検索条件の並び順と一致しない場合
+
+        """
+        rows, cursor = await self._search_rows(condition, _TODO_COLUMNS)
+        todos = TodoMapper.to_domain_list(
             [
                 {
                     "id": row.id,
@@ -49,10 +304,266 @@ class TodoRepositoryImpl(TodoRepository):
                 for row in rows
             ]
         )
+        return Page(items=todos, next_cursor=cursor)
+
+    async def search_projection(
+        self,
+        condition: TodoSearchCondition,
+        fields: frozenset[TodoField],
+    ) -> Page[TodoProjection]:
+        """条件に一致するTodoを、searchと同じ順で1ページ分検索する。
+
+        SELECTするカラムをfieldsの項目とIDに絞るため、一覧に必要な項目のみを返す場合に
+        データベースからの転送量とドメインモデルへの変換の処理を減らせる。
+
+        Args:
+            condition: 検索条件
+            fields: 読み込む項目
+
+        Returns:
+            検索条件に一致したTodoの一部の項目のページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが検索条件の並び順と一致しない場合
+
+        """
+        columns = [
+            column
+            for field, column in _FIELD_COLUMNS.items()
+            if field == TodoField.ID or field in fields
+        ]
+        rows, cursor = await self._search_rows(condition, columns)
+        return Page(
+            items=[
+                TodoMapper.to_projection(
+                    {column.key: getattr(row, column.key) for column in columns},
+                )
+                for row in rows
+            ],
+            next_cursor=cursor,
+        )
+
+    async def _search_rows(
+        self,
+        condition: TodoSearchCondition,
+        columns: Sequence[ColumnElement[Any]],
+    ) -> tuple[Sequence[Row[Any]], PageCursor | None]:
+        """条件に一致する行のうちcolumnsのカラムを1ページ分取得し、次のページのカーソルとともに返す。"""
+        order = _search_order(
+            condition.query,
+            condition.mode,
+            condition.sort,
+            condition.direction,
+        )
+        # ORMのモデルではなくカラムを読み込み、モデルの生成とセッションへの登録を省く
+        stmt = select(*columns, order.sort_key.label("sort_key")).where(_NOT_DELETED)
+        for criterion in (order.criterion, _completed_criterion(condition.completed)):
+            if criterion is not None:
+                stmt = stmt.where(criterion)
+        stmt = paginate(
+            stmt,
+            sort_key=order.sort_key,
+            id_column=TodoModel.id,
+            key_type=order.key_type,
+            order=condition.order,
+            limit=condition.limit,
+            after=condition.after,
+            descending=order.descending,
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        cursor = next_cursor(
+            rows,
+            condition.limit,
+            key_of=lambda row: row.sort_key,
+            id_of=lambda row: row.id,
+            order=condition.order,
+        )
+        return rows[: condition.limit], cursor
+
+    async def suggest_titles(self, prefix: str, limit: int) -> list[str]:
+        """タイトルがprefixで始まるTodoのタイトルを、タイトル順にlimit件返す。
+
+        正規化したタイトルをC照合順序(バイト順)で比較し、前方一致を範囲の条件として
+        部分インデックスを先頭から読み込む。LIKEの前方一致はパラメーターの値が
+        決まらない汎用プランでは範囲検索にならないため、範囲の上限を求めて指定する。
+        正規化したタイトルが同じ行はGROUP BYで1件にまとめ、その中でタイトル順に
+        最初のもの(min)を返す。インデックスが正規化したタイトル・タイトルの順のため、
+        集約はインデックスを読む順に行われ、limit件に達した時点で読み込みを終える。
+        """
+        normalized_prefix = normalize_search_text(prefix)
+        prefix_key = TodoModel.title_search.collate("C")
+        stmt = select(func.min(TodoModel.title)).where(
+            _NOT_DELETED,
+            prefix_key >= normalized_prefix,
+        )
+        upper_bound = _prefix_upper_bound(normalized_prefix)
+        if upper_bound is not None:
+            stmt = stmt.where(prefix_key < upper_bound)
+        stmt = stmt.group_by(prefix_key).order_by(prefix_key).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
+    async def stream(
+        self,
+        query: str,
+        mode: TodoSearchMode,
+        completed: bool | None = None,
+        sort: TodoSortKey | None = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> AsyncIterator[Todo]:
+        """条件に一致するTodoを、searchと同じ順で全件1件ずつ返す。
+
+        サーバーサイドカーソルで_STREAM_BATCH_SIZE件ずつ読み込むため、
+        一致する件数によらずメモリ使用量は一定に保たれる。
+
+        Args:
+            query: 検索クエリ(空の場合は全件)
+            mode: 検索方式
+            completed: 完了フラグによる絞り込み(Noneの場合は絞り込まない)
+            sort: 並び替えキー(Noneの場合はsearchと同じ既定の並び順)
+            direction: 並び替えの向き
+
+        Yields:
+            条件に一致したTodo
+
+        """
+        order = _search_order(query, mode, sort, direction)
+        order_fn = desc if order.descending else asc
+        stmt = (
+            select(*_TODO_COLUMNS)
+            .where(_NOT_DELETED)
+            .order_by(
+                order_fn(order.sort_key),
+                order_fn(TodoModel.id),
+            )
+        )
+        for criterion in (order.criterion, _completed_criterion(completed)):
+            if criterion is not None:
+                stmt = stmt.where(criterion)
+        # カラムのみを読み込むためORMの処理は不要であり、セッションの接続で直接実行する
+        connection = await self.session.connection()
+        result = await connection.stream(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE),
+        )
+        # 1行ずつではなくバッチ単位で受け取り、非同期処理の切り替えを減らす
+        async for rows in result.partitions():
+            for row in rows:
+                yield TodoMapper.to_domain(
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "completed": row.completed,
+                        "created_at": row.created_at,
+                        "updated_at": row.updated_at,
+                    }
+                )
+
+    async def changes(self, after: PageCursor, limit: int) -> Page[Todo]:
+        """(updated_at, id)がafterより後のTodoを、(updated_at, id)順に1ページ分返す。
+
+        (updated_at, id)の複合インデックスの範囲スキャンで取得するため、
+        コストは全件数ではなく変更の件数に比例する。削除済みのTodoも含めて返す。
+
+        Args:
+            after: 前回の同期の再開位置
+            limit: 1ページの件数
+
+        Returns:
+            変更されたTodoのページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが差分同期のものでない場合
+
+        """
+        stmt = paginate(
+            select(*_TODO_COLUMNS, TodoModel.deleted_at),
+            sort_key=TodoModel.updated_at,
+            id_column=TodoModel.id,
+            key_type=datetime,
+            order=SYNC_ORDER,
+            limit=limit,
+            after=after,
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        todos = TodoMapper.to_domain_list(
+            [
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "completed": row.completed,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                    "deleted_at": row.deleted_at,
+                }
+                for row in rows[:limit]
+            ]
+        )
+        return Page(
+            items=todos,
+            next_cursor=next_cursor(
+                rows,
+                limit,
+                key_of=lambda row: row.updated_at,
+                id_of=lambda row: row.id,
+                order=SYNC_ORDER,
+            ),
+        )
+
+    async def data_version(self) -> DataVersion:
+        """Todo全体のデータの版を返す。
+
+        論理削除されていないTodoの件数と、更新日時の最大値の組とする。
+        todosテーブルは走査せず、件数はcountと同じく集計テーブルの行を合計し、
+        更新日時の最大値は更新日時のインデックスの末尾の1件から求める。
+        論理削除でも更新日時が進むため、更新日時は削除済みの行も含めて求める。
+        """
+        # 同じ問い合わせで集計すると最大値にインデックスを使えないため、スカラー副問い合わせに分ける
+        stmt = select(
+            select(func.coalesce(func.sum(TodoCountModel.count), 0)).scalar_subquery(),
+            select(func.max(TodoModel.updated_at)).scalar_subquery(),
+        )
+        result = await self.session.execute(stmt)
+        count, last_modified_at = result.one()
+        return DataVersion(count=int(count), last_modified_at=last_modified_at)
+
+    async def count(self, completed: bool | None = None) -> int:
+        """論理削除されていないTodoの件数を返す。
+
+        todosテーブルは走査せず、トリガーで増減させている集計テーブルの行を合計する。
+        """
+        stmt = select(func.coalesce(func.sum(TodoCountModel.count), 0))
+        if completed is not None:
+            stmt = stmt.where(TodoCountModel.completed == completed)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+
+    async def summarize(self) -> TodoSummary:
+        """論理削除されていないTodoの、完了・未完了ごとの件数を返す。
+
+        countと同じく、集計テーブルの行を完了フラグごとに合計する1回の問い合わせで求める。
+        集計テーブルはtodosテーブルへの書き込みと同じトランザクションでトリガーが
+        更新するため、コミット済みの書き込みと常に一致する。
+        """
+        stmt = select(
+            TodoCountModel.completed,
+            func.sum(TodoCountModel.count),
+        ).group_by(TodoCountModel.completed)
+        result = await self.session.execute(stmt)
+        counts = {completed: int(count) for completed, count in result.all()}
+        return TodoSummary(
+            completed=counts.get(True, 0),
+            pending=counts.get(False, 0),
+        )
+
+    async def estimate_count(self) -> int | None:
+        """Todoの件数を統計情報から推定する(推定できない場合はNone)。"""
+        return await estimate_row_count(self.session, TodoModel.__tablename__)
 
     async def find_by_id(self, todo_id: TodoId) -> Todo:
         """IDでTodoを検索する。"""
-        stmt = select(TodoModel).where(TodoModel.id == todo_id.value)
+        stmt = select(TodoModel).where(TodoModel.id == todo_id.value, _NOT_DELETED)
         result = await self.session.execute(stmt)
         todo = result.scalar_one_or_none()
 
@@ -74,7 +585,7 @@ class TodoRepositoryImpl(TodoRepository):
 
     async def save(self, todo: Todo) -> Todo:
         """Todoを保存(更新)する。"""
-        stmt = select(TodoModel).where(TodoModel.id == todo.id.value)
+        stmt = select(TodoModel).where(TodoModel.id == todo.id.value, _NOT_DELETED)
         result = await self.session.execute(stmt)
         todo_model = result.scalar_one_or_none()
 
@@ -90,6 +601,230 @@ class TodoRepositoryImpl(TodoRepository):
         todo_model.updated_at = db_data["updated_at"]
 
         await self.session.commit()
+        self.versions.bump()
         await self.session.refresh(todo_model)
 
         return todo
+
+    async def delete(self, todo_id: TodoId) -> Todo:
+        """Todoを論理削除し、削除後のTodoを返す。
+
+        削除日時と更新日時を同じ時刻で記録するため、削除は差分同期で
+        更新日時順の変更として返される。
+
+        Args:
+            todo_id: 削除するTodoのID
+
+        Returns:
+            削除後のTodo
+
+        Raises:
+            ExpectedBusinessError: Todoが見つからない(削除済みを含む)場合
+
+        """
+        stmt = (
+            update(TodoModel)
+            .where(TodoModel.id == todo_id.value, _NOT_DELETED)
+            .values(deleted_at=func.now(), updated_at=func.now())
+            .returning(*_TODO_COLUMNS, TodoModel.deleted_at)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            await self.session.commit()
+            raise ExpectedBusinessError(
+                code=TodoErrorCode.NotFound,
+                details={"todo_id": todo_id.value},
+            )
+
+        todo = TodoMapper.to_domain(
+            {
+                "id": row.id,
+                "title": row.title,
+                "completed": row.completed,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "deleted_at": row.deleted_at,
+            }
+        )
+        await self._publish([TodoEvent(type=TodoEventType.DELETED, todo=todo)])
+        await self.session.commit()
+        self.versions.bump()
+        return todo
+
+    async def toggle(self, todo_id: TodoId) -> Todo:
+        """Todoの完了フラグを反転し、反転後のTodoを返す。
+
+        UPDATE ... RETURNINGの1文で反転と取得を行うため、往復は1回で済み、
+        同時に実行されても行ロックにより更新が失われない。
+
+        Args:
+            todo_id: 反転するTodoのID
+
+        Returns:
+            反転後のTodo
+
+        Raises:
+            ExpectedBusinessError: Todoが見つからない場合
+
+        """
+        stmt = (
+            update(TodoModel)
+            .where(TodoModel.id == todo_id.value, _NOT_DELETED)
+            .values(completed=not_(TodoModel.completed), updated_at=func.now())
+            .returning(*_TODO_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            await self.session.commit()
+            raise ExpectedBusinessError(
+                code=TodoErrorCode.NotFound,
+                details={"todo_id": todo_id.value},
+            )
+
+        todo = TodoMapper.to_domain(
+            {
+                "id": row.id,
+                "title": row.title,
+                "completed": row.completed,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            }
+        )
+        await self._publish([TodoEvent(type=TodoEventType.TOGGLED, todo=todo)])
+        await self.session.commit()
+        self.versions.bump()
+        return todo
+
+    async def bulk_update(
+        self,
+        todo_ids: list[TodoId],
+        action: TodoBulkAction,
+    ) -> TodoBulkUpdateResult:
+        """指定したIDのTodoの完了フラグを一括で更新する。
+
+        IDの配列を1つのパラメータとして渡し、= ANY($1)で一致する行を
+        1文のUPDATE ... RETURNINGで更新する。
+
+        Args:
+            todo_ids: 更新するTodoのID
+            action: 更新の操作
+
+        Returns:
+            更新したTodoと、存在しなかったTodoのID
+
+        """
+        ids = list(dict.fromkeys(todo_id.value for todo_id in todo_ids))
+        completed = {
+            TodoBulkAction.COMPLETE: true(),
+            TodoBulkAction.UNCOMPLETE: false(),
+            TodoBulkAction.TOGGLE: not_(TodoModel.completed),
+        }[action]
+        stmt = (
+            update(TodoModel)
+            .where(
+                TodoModel.id == any_(bindparam("ids", ids, type_=ARRAY(String))),
+                _NOT_DELETED,
+            )
+            .values(completed=completed, updated_at=func.now())
+            .returning(*_TODO_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        updated = TodoMapper.to_domain_list(
+            [
+                {
+                    "id": row.id,
+                    "title": row.title,
+                    "completed": row.completed,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                }
+                for row in rows
+            ]
+        )
+        event_type = (
+            TodoEventType.TOGGLED
+            if action == TodoBulkAction.TOGGLE
+            else TodoEventType.UPDATED
+        )
+        await self._publish([TodoEvent(type=event_type, todo=todo) for todo in updated])
+        await self.session.commit()
+
+        if rows:
+            self.versions.bump()
+        updated_ids = {row.id for row in rows}
+        return TodoBulkUpdateResult(
+            updated=updated,
+            not_found_ids=[
+                TodoId(value=todo_id) for todo_id in ids if todo_id not in updated_ids
+            ],
+        )
+
+    async def bulk_insert(self, todos: Sequence[Todo]) -> TodoBulkInsertResult:
+        """Todoをまとめて追加し、追加したTodoと追加しなかったTodoのIDを返す。
+
+        COPYで一時テーブルに書き込んだ後、INSERT ... SELECT ... ON CONFLICT DO NOTHINGで
+        todosへ移すため、件数によらず往復は数回で済み、既存のIDと衝突した行があっても
+        他の行の追加は中断されない。
+        作成日時はtodosの値を保つが、更新日時は他の書き込みと同じく現在時刻とする。
+        更新日時を過去にすると、前回の同期より後に追加した行が差分同期で取得されないため。
+        1件以上追加した場合は、個々のTodoではなく取り込みのイベントを1件配信する。
+
+        Args:
+            todos: 追加するTodo(IDは互いに重複しないこと)
+
+        Returns:
+            保存した更新日時を持つ追加したTodoと、IDが既に存在したため
+            追加しなかったTodoのID(いずれもtodosの順)
+
+        """
+        if not todos:
+            return TodoBulkInsertResult()
+        connection = await self.session.connection()
+        await connection.execute(_CREATE_IMPORT_STAGING_TABLE)
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _IMPORT_STAGING_TABLE,
+            records=(
+                (
+                    todo.id.value,
+                    todo.title,
+                    normalize_search_text(todo.title),
+                    todo.completed,
+                    todo.created_at,
+                )
+                for todo in todos
+            ),
+            columns=_IMPORT_COLUMNS,
+        )
+        stmt = (
+            insert(TodoModel)
+            .from_select(
+                [*_IMPORT_COLUMNS, "updated_at"],
+                select(_import_staging, func.now()),
+            )
+            .on_conflict_do_nothing(index_elements=[TodoModel.id])
+            .returning(TodoModel.id, TodoModel.updated_at)
+        )
+        result = await connection.execute(stmt)
+        updated_at_by_id = {row.id: row.updated_at for row in result}
+        if updated_at_by_id:
+            await self._publish([TodoEvent(type=TodoEventType.IMPORTED)])
+        await self.session.commit()
+
+        if updated_at_by_id:
+            self.versions.bump()
+        return TodoBulkInsertResult(
+            inserted=[
+                replace(todo, updated_at=updated_at_by_id[todo.id.value])
+                for todo in todos
+                if todo.id.value in updated_at_by_id
+            ],
+            conflicted_ids=[
+                todo.id for todo in todos if todo.id.value not in updated_at_by_id
+            ],
+        )
@@ -0,0 +1,140 @@
+"""ユーザーの検索結果をキャッシュするユーザーリポジトリ。
+
+IDとメールアドレスによる検索の結果をプロセス内にキャッシュし、
+それ以外の操作はデータベースのリポジトリに委譲する。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.user.repository import UserRepository, UserRepositoryOpener
+from src.shared.cache.ttl_lru_cache import detached_refresh
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.domain.data_version import DataVersion
+    from src.domain.pagination import Page, PageCursor
+    from src.domain.user.email_address import EmailAddress
+    from src.domain.user.id import UserId
+    from src.domain.user.lookup import UserLookupResult
+    from src.domain.user.projection import UserField, UserProjection
+    from src.domain.user.user import User
+    from src.shared.cache.ttl_lru_cache import TtlLruCache
+
+
+class CachingUserRepository(UserRepository):
+    """IDとメールアドレスによる検索の結果をキャッシュするユーザーリポジトリ。
+
+    ユーザーはほとんど変更されないため、検索のたびにデータベースに問い合わせず、
+    IDとメールアドレスのそれぞれをキーとするキャッシュから返す(read-through)。
+    見つからなかった結果はキャッシュしない。
+    このリポジトリを通した保存・削除は対応するエントリをすぐに破棄するが、
+    他のプロセスの書き込みはキャッシュの有効期限が切れるまで反映されない。
+    リポジトリを開く関数を指定した場合は、有効期限切れの結果を返しつつ
+    バックグラウンドで読み込み直す。
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        by_id: TtlLruCache[UserId, User],
+        by_email: TtlLruCache[EmailAddress, User],
+        open_repository: UserRepositoryOpener | None = None,
+    ) -> None:
+        """リポジトリを初期化する。
+
+        Args:
+            repository: 検索結果の読み込みと、その他の操作を委譲するリポジトリ
+            by_id: IDをキーとする検索結果のキャッシュ
+            by_email: メールアドレスをキーとする検索結果のキャッシュ
+            open_repository: 有効期限切れの検索結果をバックグラウンドで読み込み直すための
+                リポジトリを開く関数(Noneの場合は呼び出しの中で読み込み直す)
+
+        """
+        self.repository = repository
+        self.by_id = by_id
+        self.by_email = by_email
+        self.open_repository = open_repository
+
+    async def filter(self, limit: int, after: PageCursor | None = None) -> Page[User]:
+        """ユーザーを作成日時順に1ページ分取得する(キャッシュしない)。"""
+        return await self.repository.filter(limit, after)
+
+    async def filter_projection(
+        self,
+        fields: frozenset[UserField],
+        limit: int,
+        after: PageCursor | None = None,
+    ) -> Page[UserProjection]:
+        """ユーザーを作成日時順に1ページ分取得し、fieldsの項目とIDのみを返す。"""
+        return await self.repository.filter_projection(fields, limit, after)
+
+    async def data_version(self) -> DataVersion:
+        """ユーザー全体のデータの版を返す。"""
+        return await self.repository.data_version()
+
+    async def count(self) -> int:
+        """ユーザーの件数を返す。"""
+        return await self.repository.count()
+
+    async def estimate_count(self) -> int | None:
+        """ユーザーの件数を統計情報から推定する。"""
+        return await self.repository.estimate_count()
+
+    async def find_by_id(self, user_id: UserId) -> User:
+        """IDでユーザーを検索する(キャッシュにない場合のみデータベースから読み込む)。"""
+        return await self.by_id.get_or_load(
+            user_id,
+            lambda: self.repository.find_by_id(user_id),
+            refresh=detached_refresh(
+                self.open_repository,
+                lambda repository: repository.find_by_id(user_id),
+            ),
+        )
+
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> UserLookupResult:
+        """IDを指定してユーザーをまとめて取得する(キャッシュしない)。"""
+        return await self.repository.find_by_ids(user_ids)
+
+    async def find_by_email(self, email: EmailAddress) -> User:
+        """メールアドレスでユーザーを検索する(キャッシュにない場合のみデータベースから読み込む)。"""
+        return await self.by_email.get_or_load(
+            email,
+            lambda: self.repository.find_by_email(email),
+            refresh=detached_refresh(
+                self.open_repository,
+                lambda repository: repository.find_by_email(email),
+            ),
+        )
+
+    async def save(self, user: User) -> User:
+        """ユーザーを保存し、そのユーザーのキャッシュを破棄する。"""
+        try:
+            return await self.repository.save(user)
+        finally:
+            # 失敗した場合もコミット済みの可能性があるため、結果によらず破棄する
+            self.by_id.invalidate(user.id)
+            self.by_email.invalidate(user.email)
+
+    async def bulk_insert(self, users: Sequence[User]) -> list[UserId]:
+        """ユーザーをまとめて追加し、追加したユーザーのキャッシュを破棄する。"""
+        try:
+            return await self.repository.bulk_insert(users)
+        finally:
+            for user in users:
+                self.by_id.invalidate(user.id)
+                self.by_email.invalidate(user.email)
+
+    async def delete(self, user_id: UserId) -> UserId:
+        """ユーザーを削除し、そのユーザーのキャッシュを破棄する。
+
+        メールアドレスのキャッシュはユーザーIDから引けないため、削除が稀なことを前提に
+        エントリを走査し、削除したユーザーのエントリのみを破棄する。
+        """
+        try:
+            return await self.repository.delete(user_id)
+        finally:
+            self.by_id.invalidate(user_id)
+            self.by_email.invalidate_if(lambda _, user: user.id == user_id)
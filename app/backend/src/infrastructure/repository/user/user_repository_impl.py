@@ -5,24 +5,59 @@ SQLAlchemy 2.0を使用してユーザーの永続化を行う。
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import ARRAY, String, any_, bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import ColumnElement, Row
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from src.domain.pagination import PageCursor
     from src.domain.user.email_address import EmailAddress
     from src.domain.user.user import User
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page, sort_order
 from src.domain.user.id import UserId
+from src.domain.user.lookup import UserLookupResult
+from src.domain.user.projection import UserField, UserProjection
 from src.domain.user.repository import UserRepository
 from src.infrastructure.mapper.user_mapper import UserMapper
+from src.infrastructure.models.user_count_model import UserCountModel
 from src.infrastructure.models.user_model import UserModel
+from src.infrastructure.repository.pagination import next_cursor, paginate
+from src.infrastructure.repository.statistics import estimate_row_count
+from src.shared.cache.version_counter import VersionCounter
 from src.shared.errors.codes import TechnicalErrorCode, UserErrorCode
 from src.shared.errors.errors import ExpectedBusinessError, ExpectedTechnicalError
 
+# ドメインモデルへの変換に必要なカラム
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.name,
+    UserModel.role,
+    UserModel.created_at,
+)
+
+# 項目ごとのカラム(一部の項目のみを読み込む場合に使用する)
+_FIELD_COLUMNS = {
+    UserField.ID: UserModel.id,
+    UserField.EMAIL: UserModel.email,
+    UserField.NAME: UserModel.name,
+    UserField.ROLE: UserModel.role,
+    UserField.CREATED_AT: UserModel.created_at,
+}
+
+# 一覧の並び順(作成日時の昇順)
+_ORDER = sort_order("created_at")
+
 
 class UserRepositoryImpl(UserRepository):
     """PostgreSQLを使用したユーザーリポジトリの実装。
@@ -30,40 +65,160 @@ class UserRepositoryImpl(UserRepository):
     SQLAlchemy 2.0を使用してユーザーの永続化操作を行う。
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        versions: VersionCounter | None = None,
+    ) -> None:
         """リポジトリを初期化する。
 
         Args:
             session: データベースセッション
+            versions: 書き込みのたびに進めるユーザーの世代番号(キャッシュの無効化に使用する)
 
         """
         self.session = session
+        self.versions = versions or VersionCounter()
 
-    async def filter(self) -> list[User]:
-        """すべてのユーザーを取得する。
+    async def filter(self, limit: int, after: PageCursor | None = None) -> Page[User]:
+        """ユーザーを作成日時順に1ページ分取得する。
+
+        (created_at, id)の複合インデックスを使い、OFFSETを使わずにページを辿る。
+
+        Args:
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
 
         Returns:
-            ユーザーのリスト
+            ユーザーのページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが不正な場合
 
         """
-        # SQLAlchemy 2.0の型安全なクエリ
-        stmt = select(UserModel)
+        rows, cursor = await self._filter_rows(_USER_COLUMNS, limit, after)
+
+        # 行をdict形式に変換してMapperに渡す
+        return Page(
+            items=UserMapper.to_domain_list(
+                [
+                    {
+                        "id": row.id,
+                        "email": row.email,
+                        "name": row.name,
+                        "role": row.role,
+                        "created_at": row.created_at,
+                    }
+                    for row in rows
+                ]
+            ),
+            next_cursor=cursor,
+        )
+
+    async def filter_projection(
+        self,
+        fields: frozenset[UserField],
+        limit: int,
+        after: PageCursor | None = None,
+    ) -> Page[UserProjection]:
+        """ユーザーを作成日時順に1ページ分取得し、fieldsの項目とIDのみを返す。
+
+        SELECTするカラムをfieldsの項目とIDに絞り、データベースからの転送量を減らす。
+
+        Args:
+            fields: 読み込む項目
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
+
+        Returns:
+            ユーザーの一部の項目のページ
+
+        Raises:
+            ExpectedBusinessError: カーソルが不正な場合
+
+        """
+        columns = [
+            column
+            for field, column in _FIELD_COLUMNS.items()
+            if field == UserField.ID or field in fields
+        ]
+        rows, cursor = await self._filter_rows(columns, limit, after)
+        return Page(
+            items=[
+                UserMapper.to_projection(
+                    {column.key: getattr(row, column.key) for column in columns},
+                )
+                for row in rows
+            ],
+            next_cursor=cursor,
+        )
+
+    async def _filter_rows(
+        self,
+        columns: Sequence[ColumnElement[Any]],
+        limit: int,
+        after: PageCursor | None,
+    ) -> tuple[Sequence[Row[Any]], PageCursor | None]:
+        """columnsのカラムを作成日時順に1ページ分取得し、次のページのカーソルとともに返す。"""
+        # カーソルの算出に使用する作成日時は、columnsに含まれなくても読み込む
+        stmt = paginate(
+            select(*columns, UserModel.created_at.label("sort_key")),
+            sort_key=UserModel.created_at,
+            id_column=UserModel.id,
+            key_type=datetime,
+            order=_ORDER,
+            limit=limit,
+            after=after,
+        )
         result = await self.session.execute(stmt)
-        users = result.scalars().all()
-
-        # UserModelをdict形式に変換してMapperに渡す
-        return UserMapper.to_domain_list(
-            [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "role": user.role,
-                    "created_at": user.created_at,
-                }
-                for user in users
-            ]
+        rows = result.all()
+        cursor = next_cursor(
+            rows,
+            limit,
+            key_of=lambda row: row.sort_key,
+            id_of=lambda row: row.id,
+            order=_ORDER,
         )
+        return rows[:limit], cursor
+
+    async def data_version(self) -> DataVersion:
+        """ユーザー全体のデータの版を返す。
+
+        ユーザーは更新されないため、件数と作成日時の最大値の組とする。
+        usersテーブルは走査せず、件数はトリガーで増減させている集計テーブルの行を合計し、
+        作成日時の最大値は作成日時のインデックスの末尾の1件から求める。
+
+        Returns:
+            ユーザー全体のデータの版
+
+        """
+        # 同じ問い合わせで集計すると最大値にインデックスを使えないため、スカラー副問い合わせに分ける
+        stmt = select(
+            select(func.coalesce(func.sum(UserCountModel.count), 0)).scalar_subquery(),
+            select(func.max(UserModel.created_at)).scalar_subquery(),
+        )
+        result = await self.session.execute(stmt)
+        count, last_modified_at = result.one()
+        return DataVersion(count=int(count), last_modified_at=last_modified_at)
+
+    async def count(self) -> int:
+        """ユーザーの件数を返す。
+
+        Returns:
+            ユーザーの件数
+
+        """
+        result = await self.session.execute(select(func.count()).select_from(UserModel))
+        return result.scalar_one()
+
+    async def estimate_count(self) -> int | None:
+        """ユーザーの件数を統計情報から推定する。
+
+        Returns:
+            推定した件数(統計情報から推定できない場合はNone)
+
+        """
+        return await estimate_row_count(self.session, UserModel.__tablename__)
 
     async def find_by_id(self, user_id: UserId) -> User:
         """IDでユーザーを検索する。
@@ -98,6 +253,46 @@ class UserRepositoryImpl(UserRepository):
             }
         )
 
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> UserLookupResult:
+        """IDを指定してユーザーをまとめて取得する。
+
+        IDの配列を1つのパラメータとして渡し、= ANY($1)の1回の問い合わせで取得する。
+
+        Args:
+            user_ids: 取得するユーザーID
+
+        Returns:
+            見つかったユーザーと、存在しなかったユーザーのID(いずれもuser_idsの順)
+
+        """
+        ids = list(dict.fromkeys(user_id.value for user_id in user_ids))
+        if not ids:
+            return UserLookupResult()
+        stmt = select(*_USER_COLUMNS).where(
+            UserModel.id == any_(bindparam("ids", ids, type_=ARRAY(String))),
+        )
+        result = await self.session.execute(stmt)
+        rows = {row.id: row for row in result.all()}
+
+        return UserLookupResult(
+            found=UserMapper.to_domain_list(
+                [
+                    {
+                        "id": row.id,
+                        "email": row.email,
+                        "name": row.name,
+                        "role": row.role,
+                        "created_at": row.created_at,
+                    }
+                    for user_id in ids
+                    if (row := rows.get(user_id)) is not None
+                ]
+            ),
+            not_found_ids=[
+                UserId(value=user_id) for user_id in ids if user_id not in rows
+            ],
+        )
+
     async def find_by_email(self, email: EmailAddress) -> User:
         """メールアドレスでユーザーを検索する。
 
@@ -134,6 +329,9 @@ class UserRepositoryImpl(UserRepository):
     async def save(self, user: User) -> User:
         """ユーザーを保存する。
 
+        メールアドレスの重複は一意制約違反の例外ではなく、追加されなかったこととして
+        1回の問い合わせで判定する(登録の集中時に例外とロールバックを繰り返さない)。
+
         Args:
             user: 保存するユーザー
 
@@ -145,30 +343,76 @@ class UserRepositoryImpl(UserRepository):
             ExpectedTechnicalError: データベース操作に失敗した場合
 
         """
+        stmt = (
+            insert(UserModel)
+            .values(UserMapper.to_db(user))
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.id)
+        )
         try:
-            db_data = UserMapper.to_db(user)
-            user_model = UserModel(
-                id=db_data["id"],
-                email=db_data["email"],
-                role=db_data["role"],
-                name=db_data["name"],
-                created_at=db_data["created_at"],
-            )
-            self.session.add(user_model)
+            result = await self.session.execute(stmt)
+            inserted_id = result.scalar_one_or_none()
             await self.session.commit()
-            await self.session.refresh(user_model)
-        except IntegrityError as e:
+        except Exception as e:
             await self.session.rollback()
-            # メールアドレスの一意制約違反をチェック
-            if "email" in str(e).lower() or "unique" in str(e).lower():
-                raise ExpectedBusinessError(
-                    code=UserErrorCode.EmailAlreadyExists,
-                    details={"email": user.email.value},
-                ) from e
             raise ExpectedTechnicalError(
                 code=TechnicalErrorCode.DatabaseOperationFailed,
                 details={"message": str(e)},
             ) from e
+
+        if inserted_id is None:
+            raise ExpectedBusinessError(
+                code=UserErrorCode.EmailAlreadyExists,
+                details={"email": user.email.value},
+            )
+        self.versions.bump()
+        return user
+
+    async def bulk_insert(self, users: Sequence[User]) -> list[UserId]:
+        """ユーザーをまとめて追加する。
+
+        カラムごとの配列をunnestで行に展開するINSERT ... SELECT ... ON CONFLICT DO NOTHING
+        RETURNINGの1回の問い合わせで追加し、追加されなかった行をメールアドレスの重複として返す。
+        バインドパラメータはカラム数のみで件数によらないため、
+        件数が多くてもパラメータ数の上限に達せず、SQL文も件数によらず同じになる。
+
+        Args:
+            users: 追加するユーザー(IDは互いに重複しないこと)
+
+        Returns:
+            メールアドレスが既に存在したため追加しなかったユーザーのID(usersの順)
+
+        Raises:
+            ExpectedTechnicalError: データベース操作に失敗した場合
+
+        """
+        if not users:
+            return []
+        records = [UserMapper.to_db(user) for user in users]
+        rows = (
+            func.unnest(
+                *(
+                    bindparam(
+                        column.key,
+                        [record[column.key] for record in records],
+                        type_=ARRAY(column.type),
+                    )
+                    for column in _USER_COLUMNS
+                ),
+            )
+            .table_valued(*(column.key for column in _USER_COLUMNS))
+            .render_derived()
+        )
+        stmt = (
+            insert(UserModel)
+            .from_select(list(_USER_COLUMNS), select(rows))
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            inserted_ids = set(result.scalars())
+            await self.session.commit()
         except Exception as e:
             await self.session.rollback()
             raise ExpectedTechnicalError(
@@ -176,7 +420,9 @@ class UserRepositoryImpl(UserRepository):
                 details={"message": str(e)},
             ) from e
 
-        return user
+        if inserted_ids:
+            self.versions.bump()
+        return [user.id for user in users if user.id.value not in inserted_ids]
 
     async def delete(self, user_id: UserId) -> UserId:
         """ユーザーを削除する。
@@ -188,20 +434,42 @@ class UserRepositoryImpl(UserRepository):
             削除されたユーザーID
 
         Raises:
-            ExpectedBusinessError: ユーザーが見つからない場合
+            ExpectedBusinessError: ユーザーが見つからない場合、
+                またはユーザーを参照するデータがあり削除できない場合
+            ExpectedTechnicalError: データベース操作に失敗した場合
 
         """
-        stmt = select(UserModel).where(UserModel.id == user_id.value)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        # 存在の確認と削除を1回の問い合わせで行う
+        stmt = (
+            delete(UserModel)
+            .where(UserModel.id == user_id.value)
+            .returning(UserModel.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            deleted_id = result.scalar_one_or_none()
+        except IntegrityError as e:
+            # 外部キーで参照されているユーザーは削除できない
+            await self.session.rollback()
+            raise ExpectedBusinessError(
+                code=UserErrorCode.UserDeleteError,
+                details={"user_id": user_id.value},
+            ) from e
+        except Exception as e:
+            await self.session.rollback()
+            raise ExpectedTechnicalError(
+                code=TechnicalErrorCode.DatabaseOperationFailed,
+                details={"message": str(e)},
+            ) from e
 
-        if user is None:
+        if deleted_id is None:
+            await self.session.rollback()
             raise ExpectedBusinessError(
                 code=UserErrorCode.NotFound,
                 details={"user_id": user_id.value},
             )
 
-        await self.session.delete(user)
         await self.session.commit()
+        self.versions.bump()
 
-        return UserId(value=user_id.value)
+        return UserId(value=deleted_id)
@@ -0,0 +1,449 @@
+"""Todoのタイトルのn-gram転置インデックス。
+
+データベースの部分一致検索と同じ正規化・条件・並び順の検索を、プロセスのメモリ上で行う。
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from array import array
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from src.domain.pagination import Page, PageCursor, SortDirection
+from src.domain.todo.id import TodoId
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.search_text import normalize_search_text
+from src.domain.todo.todo import Todo
+from src.shared.errors.codes import CommonErrorCode
+from src.shared.errors.errors import ExpectedBusinessError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Iterable
+
+# 転置インデックスのキーとする文字数
+# 日本語のタイトルは2文字の語で検索されることが多いため、2文字(bigram)とする
+NGRAM_SIZE = 2
+
+# 削除・タイトルの変更で使われなくなったスロットが、有効なスロットの数を超え、
+# かつこの数を超えた場合にインデックスを作り直す
+COMPACTION_MIN_DEAD_SLOTS = 1024
+
+# インデックスを作り直す際に、削除したTodoの削除時の更新日時を保持する期間
+# 最も新しい削除からこの期間より前に削除したTodoは、それより古い変更が届くことはないとみなす
+TOMBSTONE_RETENTION = timedelta(seconds=60)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# pg_trgmが語として扱う文字(UTF-8のロケールでの英数字)の並び
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _to_micros(value: datetime) -> int:
+    """日時をUNIXエポックからのマイクロ秒に変換する。"""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    """UNIXエポックからのマイクロ秒を日時(UTC)に変換する。"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _ngrams(text: str) -> set[str]:
+    """正規化済みの文字列に含まれるNGRAM_SIZE文字の部分文字列を返す。"""
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _trigrams(text: str) -> set[str]:
+    """pg_trgmと同じ方法で、正規化済みの文字列のトライグラムを求める。
+
+    英数字の並びを語とし、語の前に空白2文字、後ろに空白1文字を補って3文字ずつに分ける。
+    """
+    trigrams: set[str] = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def _padded_words(text: str) -> str:
+    """トライグラムを含むかを部分文字列の検索で判定できる文字列を作成する。
+
+    pg_trgmと同じく空白を補った語を、トライグラムに現れないNUL文字で区切って連結する。
+    """
+    return "\0".join(f"  {word} " for word in _WORD.findall(text))
+
+
+def _similarity(query_trigram_count: int, trigram_count: int, common: int) -> float:
+    """pg_trgmのsimilarityと同じ類似度を、トライグラムの数から求める。
+
+    pg_trgmは類似度を単精度浮動小数点数で返すため、同じ精度に丸めて並び順を揃える。
+    共通するトライグラムは少ない方の数を超えないため、common=min(両者の数)とした値が
+    類似度の上限となる。
+    """
+    if not query_trigram_count or not trigram_count:
+        return 0.0
+    return _to_float4(common / (query_trigram_count + trigram_count - common))
+
+
+def _to_float4(value: float) -> float:
+    """値を単精度浮動小数点数の精度に丸める。"""
+    return array("f", [value])[0]
+
+
+class _IndexState:
+    """転置インデックスの内容。
+
+    Todoごとに割り当てたスロット番号の位置に各項目を格納し、
+    n-gramごとにそのn-gramを含むスロット番号の配列(ポスティングリスト)を持つ。
+    スロットは追加のみ行い、削除・タイトルの変更では古いスロットを無効にするため、
+    ポスティングリストは常にスロット番号の昇順となり、追加の時間は件数によらない。
+    """
+
+    def __init__(self) -> None:
+        """空のインデックスを作成する。"""
+        # スロットごとの項目(無効なスロットのIDはNone)
+        self.ids: list[str | None] = []
+        self.titles: list[str] = []
+        # 部分一致の判定に使用する正規化したタイトル
+        self.folded_titles: list[str] = []
+        # 類似度の計算に使用する空白を補った語と、タイトルのトライグラムの数
+        self.padded_words: list[str] = []
+        self.trigram_counts = array("H")
+        self.completed = bytearray()
+        self.created_at = array("q")
+        self.updated_at = array("q")
+        self.postings: dict[str, array[int]] = {}
+        # TodoIDと有効なスロットの対応
+        self.slots: dict[str, int] = {}
+        # 削除したTodoの削除時の更新日時(削除より古い変更で復活させないために使用する)
+        self.deleted: dict[str, int] = {}
+        self.dead_slots = 0
+
+    def last_updated_at(self, todo_id: str) -> int | None:
+        """最後に反映したTodoの更新日時を返す(反映していない場合はNone)。"""
+        slot = self.slots.get(todo_id)
+        if slot is not None:
+            return self.updated_at[slot]
+        return self.deleted.get(todo_id)
+
+    def add(self, todo: Todo) -> None:
+        """Todoに新しいスロットを割り当てて追加する。"""
+        slot = len(self.ids)
+        folded = normalize_search_text(todo.title)
+        self.ids.append(todo.id.value)
+        self.titles.append(todo.title)
+        self.folded_titles.append(folded)
+        self.padded_words.append(_padded_words(folded))
+        self.trigram_counts.append(len(_trigrams(folded)))
+        self.completed.append(todo.completed)
+        self.created_at.append(_to_micros(todo.created_at))
+        self.updated_at.append(_to_micros(todo.updated_at))
+        for gram in _ngrams(folded):
+            posting = self.postings.get(gram)
+            if posting is None:
+                self.postings[gram] = array("I", [slot])
+            else:
+                posting.append(slot)
+        self.slots[todo.id.value] = slot
+        self.deleted.pop(todo.id.value, None)
+
+    def discard(self, slot: int) -> None:
+        """スロットを無効にする。ポスティングリストの要素は作り直すまで残す。"""
+        todo_id = self.ids[slot]
+        if todo_id is not None:
+            del self.slots[todo_id]
+        self.ids[slot] = None
+        self.titles[slot] = self.folded_titles[slot] = self.padded_words[slot] = ""
+        self.dead_slots += 1
+
+    def to_todo(self, slot: int) -> Todo:
+        """スロットの項目からTodoを作成する。"""
+        return Todo(
+            id=TodoId(value=self.ids[slot] or ""),
+            title=self.titles[slot],
+            completed=bool(self.completed[slot]),
+            created_at=_from_micros(self.created_at[slot]),
+            updated_at=_from_micros(self.updated_at[slot]),
+        )
+
+    def live_todos(self) -> Iterable[Todo]:
+        """有効な全てのスロットのTodoを返す。"""
+        return (
+            self.to_todo(slot)
+            for slot in range(len(self.ids))
+            if self.ids[slot] is not None
+        )
+
+
+class TodoNgramIndex:
+    """Todoのタイトルのn-gram転置インデックス。
+
+    論理削除されていないTodoをメモリ上に保持し、タイトルの部分一致検索を
+    データベースに問い合わせずに行う。クエリに含まれるn-gramのうち、
+    ポスティングリストが最も短いものの候補だけを部分一致で確かめるため、
+    検索の時間はTodoの総数ではなく候補の数に比例する。
+    イベントループ上の単一スレッドで使用するため、排他制御は行わない。
+    """
+
+    def __init__(self) -> None:
+        """読み込み前の空のインデックスを作成する。"""
+        self._state = _IndexState()
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """全件の読み込みが1回以上完了している場合はTrueを返す。"""
+        return self._loaded
+
+    def __len__(self) -> int:
+        """保持しているTodoの件数を返す。"""
+        return len(self._state.slots)
+
+    @property
+    def tombstone_count(self) -> int:
+        """削除より古い変更を無視するために保持している、削除したTodoの件数を返す。"""
+        return len(self._state.deleted)
+
+    async def load(self, todos: AsyncIterable[Todo]) -> None:
+        """全件のTodoを読み込み、インデックスの内容を置き換える。
+
+        読み込みが終わるまでは、それまでの内容で検索・更新を続ける。
+        """
+        state = _IndexState()
+        async for todo in todos:
+            if not todo.is_deleted:
+                state.add(todo)
+        self._state = state
+        self._loaded = True
+
+    def apply(self, todo: Todo) -> None:
+        """Todoの追加・更新・削除を反映する。
+
+        変更は複数の経路から順不同で届くため、反映済みの変更より古い変更は無視する。
+        """
+        state = self._state
+        updated_at = _to_micros(todo.updated_at)
+        last_updated_at = state.last_updated_at(todo.id.value)
+        if last_updated_at is not None and updated_at < last_updated_at:
+            return
+        slot = state.slots.get(todo.id.value)
+        if todo.is_deleted:
+            if slot is not None:
+                state.discard(slot)
+            state.deleted[todo.id.value] = updated_at
+            self._compact_if_needed()
+            return
+        if slot is not None and state.titles[slot] == todo.title:
+            # タイトルが変わらない場合はn-gramも変わらないため、項目のみを更新する
+            state.completed[slot] = todo.completed
+            state.updated_at[slot] = updated_at
+            return
+        if slot is not None:
+            state.discard(slot)
+        state.add(todo)
+        self._compact_if_needed()
+
+    def search(self, condition: TodoSearchCondition) -> Page[Todo]:
+        """条件に一致するTodoを、データベースの部分一致検索と同じ順で1ページ分検索する。
+
+        クエリがある場合はpg_trgmと同じ方法で求めた類似度の高い順に、
+        並び替えキーを指定した場合はそのキーの順に並べる。
+        文字列はコードポイント順(Cロケールの照合順序)で比較するため、データベースの
+        照合順序が異なる場合は、タイトル順やIDによる同順位の並びがデータベースと異なりうる。
+        また、トライグラムはUTF-8のロケール(PostgreSQLの公式イメージの既定)と同じく
+        ASCII以外の英数字も語として求めるため、データベースのLC_CTYPEがCの場合は、
+        ASCII以外の文字を含むクエリの類似度順がデータベースと異なりうる。
+
+        Raises:
+            ValueError: 部分一致検索以外の検索方式が指定された場合
+            ExpectedBusinessError: カーソルが検索条件の並び順と一致しない場合
+
+        """
+        if condition.mode != TodoSearchMode.SUBSTRING:
+            raise ValueError(f"unsupported search mode, mode: {condition.mode.value}")
+        state = self._state
+        query = normalize_search_text(condition.query)
+        slots = (
+            slot
+            for slot in self._candidates(query)
+            if state.ids[slot] is not None and query in state.folded_titles[slot]
+        )
+        if condition.completed is not None:
+            slots = (
+                slot
+                for slot in slots
+                if bool(state.completed[slot]) == condition.completed
+            )
+
+        boundary = (
+            None
+            if condition.after is None
+            else self._boundary(condition, condition.after)
+        )
+        if condition.sort is None and query:
+            page = self._most_similar(query, slots, condition.limit + 1, boundary)
+        else:
+            page = self._first_sorted(condition, slots, condition.limit + 1, boundary)
+
+        cursor = None
+        if len(page) > condition.limit:
+            (key, todo_id), _ = page[condition.limit - 1]
+            cursor = PageCursor(
+                key=_from_micros(key) if isinstance(key, int) else key,
+                id=todo_id,
+                order=condition.order,
+            )
+        return Page(
+            items=[state.to_todo(slot) for _, slot in page[: condition.limit]],
+            next_cursor=cursor,
+        )
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """クエリを含む可能性のあるスロットを返す。
+
+        クエリのn-gramのうち、ポスティングリストが最も短いものを候補とする。
+        クエリがNGRAM_SIZEより短い場合は全てのスロットを候補とする。
+        """
+        state = self._state
+        if len(query) < NGRAM_SIZE:
+            return range(len(state.ids))
+        postings: list[array[int]] = []
+        for gram in _ngrams(query):
+            posting = state.postings.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        return min(postings, key=len)
+
+    def _most_similar(
+        self,
+        query: str,
+        slots: Iterable[int],
+        count: int,
+        boundary: tuple[Any, str] | None,
+    ) -> list[tuple[tuple[Any, str], int]]:
+        """類似度の高い順(同じ類似度はIDの降順)に、boundaryより後のcount件を返す。
+
+        類似度の計算は候補の中で最も重いため、トライグラムの数から求めた類似度の上限が
+        高い候補から計算し、上限がcount件目の類似度を下回った時点で打ち切る。
+        """
+        state = self._state
+        query_trigrams = _trigrams(query)
+        groups: dict[int, list[int]] = {}
+        for slot in slots:
+            groups.setdefault(state.trigram_counts[slot], []).append(slot)
+
+        def bound(trigram_count: int) -> float:
+            return _similarity(
+                len(query_trigrams),
+                trigram_count,
+                min(len(query_trigrams), trigram_count),
+            )
+
+        # (類似度, ID)の組の昇順のヒープで、上位count件を保持する
+        heap: list[tuple[tuple[Any, str], int]] = []
+        for trigram_count in sorted(groups, key=bound, reverse=True):
+            if len(heap) == count and bound(trigram_count) < heap[0][0][0]:
+                break
+            # トライグラムの数が同じタイトルの類似度は、共通するトライグラムの数で決まる
+            similarities = [
+                _similarity(len(query_trigrams), trigram_count, common)
+                for common in range(len(query_trigrams) + 1)
+            ]
+            for slot in groups[trigram_count]:
+                # 空白を補った語にクエリのトライグラムが含まれるかで、共通する数を数える
+                common = sum(map(state.padded_words[slot].__contains__, query_trigrams))
+                position = ((similarities[common], state.ids[slot] or ""), slot)
+                if boundary is not None and not position[0] < boundary:
+                    continue
+                if len(heap) < count:
+                    heapq.heappush(heap, position)
+                elif position > heap[0]:
+                    heapq.heapreplace(heap, position)
+        return sorted(heap, reverse=True)
+
+    def _first_sorted(
+        self,
+        condition: TodoSearchCondition,
+        slots: Iterable[int],
+        count: int,
+        boundary: tuple[Any, str] | None,
+    ) -> list[tuple[tuple[Any, str], int]]:
+        """並び替えキーの順(同じキーはIDの順)に、boundaryより後のcount件を返す。"""
+        state = self._state
+        descending = condition.direction == SortDirection.DESC
+        sort_key: Callable[[int], Any]
+        match condition.sort or TodoSortKey.CREATED_AT:
+            case TodoSortKey.CREATED_AT:
+                sort_key = state.created_at.__getitem__
+            case TodoSortKey.UPDATED_AT:
+                sort_key = state.updated_at.__getitem__
+            case TodoSortKey.TITLE:
+                sort_key = state.titles.__getitem__
+        # (並び替えキー, ID)の組で並べる。IDは一意のため、組が等しくなることはない
+        positions = (((sort_key(slot), state.ids[slot] or ""), slot) for slot in slots)
+        if boundary is not None:
+            positions = (
+                (position, slot)
+                for position, slot in positions
+                if (position < boundary if descending else position > boundary)
+            )
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(count, positions)
+
+    def _boundary(
+        self,
+        condition: TodoSearchCondition,
+        after: PageCursor,
+    ) -> tuple[Any, str]:
+        """カーソルを並び替えキーと同じ型の位置に変換する。
+
+        Raises:
+            ExpectedBusinessError: カーソルが検索条件の並び順と一致しない場合
+
+        """
+        if condition.sort is None and condition.query:
+            key_type: type = float
+        elif condition.sort == TodoSortKey.TITLE:
+            key_type = str
+        else:
+            key_type = datetime
+        # 別の並び順で発行されたカーソルは位置を特定できないため受け付けない
+        if after.order != condition.order or not isinstance(after.key, key_type):
+            raise ExpectedBusinessError(
+                code=CommonErrorCode.InvalidValue,
+                details={"after": "cursor does not match the sort order"},
+            )
+        key = _to_micros(after.key) if isinstance(after.key, datetime) else after.key
+        return key, after.id
+
+    def _compact_if_needed(self) -> None:
+        """無効なスロットが増えた場合に、有効なTodoのみでインデックスを作り直す。
+
+        削除したTodoの更新日時は、最も新しい削除からTOMBSTONE_RETENTION以内のもののみ残し、
+        全件の読み込みまでの間に削除が続いても際限なく増えないようにする。
+        """
+        state = self._state
+        if state.dead_slots < COMPACTION_MIN_DEAD_SLOTS or state.dead_slots < len(
+            state.slots
+        ):
+            return
+        compacted = _IndexState()
+        for todo in state.live_todos():
+            compacted.add(todo)
+        if state.deleted:
+            retained_since = max(state.deleted.values()) - (
+                TOMBSTONE_RETENTION // timedelta(microseconds=1)
+            )
+            compacted.deleted = {
+                todo_id: updated_at
+                for todo_id, updated_at in state.deleted.items()
+                if updated_at >= retained_since
+            }
+        self._state = compacted
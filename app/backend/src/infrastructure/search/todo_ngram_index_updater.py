@@ -0,0 +1,130 @@
+"""Todoのn-gram転置インデックスの更新。
+
+起動時に全件を読み込み、以降はTodoの変更イベントを受信してインデックスに反映する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.domain.todo.event import TodoEventType
+from src.log.logger import logger
+from src.shared.pubsub.broadcaster import SubscriptionOverflowError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from src.domain.todo.event import TodoEvent
+    from src.domain.todo.todo import Todo
+    from src.infrastructure.search.todo_ngram_index import TodoNgramIndex
+    from src.shared.pubsub.broadcaster import Broadcaster, Subscription
+
+# 全件を読み込み直す間隔(秒)
+# 変更イベントの受信が途切れていた間の変更は届かないため、この間隔で読み込み直して補う
+DEFAULT_RELOAD_INTERVAL_SECONDS = 300.0
+
+# 読み込みに失敗した場合に再試行するまでの待ち時間(秒)
+DEFAULT_RETRY_INTERVAL_SECONDS = 5.0
+
+
+class TodoNgramIndexUpdater:
+    """Todoのn-gram転置インデックスを、全件の読み込みと変更イベントで最新に保つ。
+
+    読み込みより前に変更イベントの購読を始めるため、読み込み中の変更も読み込み後に反映される。
+    一括取り込みのように個々のTodoを通知しない変更と、購読の打ち切りでイベントを
+    取りこぼした場合は、全件を読み込み直す。
+    """
+
+    def __init__(
+        self,
+        index: TodoNgramIndex,
+        broadcaster: Broadcaster[TodoEvent],
+        load: Callable[[], AsyncIterator[Todo]],
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL_SECONDS,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+    ) -> None:
+        """更新を初期化する。
+
+        Args:
+            index: 更新するインデックス
+            broadcaster: Todoの変更イベントのBroadcaster
+            load: 論理削除されていない全件のTodoを返す関数
+            reload_interval: 全件を読み込み直す間隔(秒)
+            retry_interval: 読み込みに失敗した場合に再試行するまでの待ち時間(秒)
+
+        """
+        self._index = index
+        self._broadcaster = broadcaster
+        self._load = load
+        self._reload_interval = reload_interval
+        self._retry_interval = retry_interval
+        self._task: asyncio.Task[None] | None = None
+        self._loaded = asyncio.Event()
+
+    async def start(self) -> None:
+        """バックグラウンドで読み込みと更新を開始する。読み込みの完了は待たない。"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """更新を停止する。"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def wait_until_loaded(self) -> None:
+        """最初の全件の読み込みが完了するまで待つ。"""
+        await self._loaded.wait()
+
+    async def _run(self) -> None:
+        """購読と全件の読み込みを行い、購読が打ち切られた場合は購読し直す。"""
+        while True:
+            with self._broadcaster.subscribe() as subscription:
+                await self._follow(subscription)
+            logger.warning("todo_ngram_index_subscription_overflowed")
+
+    async def _follow(self, subscription: Subscription[TodoEvent]) -> None:
+        """全件を読み込み、購読が打ち切られるまで変更イベントを反映する。"""
+        reload_at = await self._reload()
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(),
+                    timeout=max(reload_at - time.monotonic(), 0.0),
+                )
+            except TimeoutError:
+                reload_at = await self._reload()
+                continue
+            except SubscriptionOverflowError:
+                return
+            if event.type == TodoEventType.IMPORTED:
+                reload_at = await self._reload()
+            elif event.todo is not None:
+                self._index.apply(event.todo)
+
+    async def _reload(self) -> float:
+        """全件を読み込み直し、次に読み込み直す時刻を返す。
+
+        読み込みに失敗した場合は、それまでの内容を残してretry_interval後に再試行する。
+        """
+        started_at = time.monotonic()
+        try:
+            await self._index.load(self._load())
+        except (OSError, SQLAlchemyError) as e:
+            logger.warning("todo_ngram_index_load_failed", error=str(e))
+            return time.monotonic() + self._retry_interval
+        self._loaded.set()
+        logger.info(
+            "todo_ngram_index_loaded",
+            todos=len(self._index),
+            elapsed_ms=round((time.monotonic() - started_at) * 1000),
+        )
+        return time.monotonic() + self._reload_interval
@@ -16,6 +16,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
 
+from src.dependencies import get_todo_event_listener, get_todo_ngram_index_updater
 from src.environment import Environment
 from src.infrastructure.config.database import close_db, init_db
 from src.log.logger import logger
@@ -68,6 +69,11 @@ async def startup_event() -> None:
     if Environment.is_local():
         await init_db()
         logger.info("Database tables initialized")
+    # 他のワーカーを含むTodoの書き込みを受信し、SSEの接続に配信する
+    await get_todo_event_listener().start()
+    # 部分一致検索をメモリ上で行う場合は、インデックスの読み込みと更新を開始する
+    if (index_updater := get_todo_ngram_index_updater()) is not None:
+        await index_updater.start()
 
 
 # アプリケーション終了時のイベント
@@ -78,6 +84,9 @@ async def shutdown_event() -> None:
     データベース接続のクローズなどを行う。
     """
     logger.info("Application shutdown")
+    if (index_updater := get_todo_ngram_index_updater()) is not None:
+        await index_updater.stop()
+    await get_todo_event_listener().stop()
     await close_db()
 
 
@@ -0,0 +1,78 @@
+"""条件付き取得(ETag / If-None-Match)の処理。
+
+データの版とリクエストの内容からETagを求め、クライアントが保持している
+表現が最新であれば、検索やシリアライズを行わずに304を返せるようにする。
+"""
+
+import hashlib
+import json
+
+from fastapi import Response, status
+
+from src.domain.data_version import DataVersion
+
+
+def make_etag(version: DataVersion, *parts: object) -> str:
+    """データの版と、表現を決めるリクエストの内容からETagを求める。
+
+    Args:
+        version: 表現の元となるデータの版
+        parts: パスやクエリパラメーターなど、同じ版でも表現を変える値
+
+    Returns:
+        引用符で囲んだETag
+
+    """
+    last_modified_at = (
+        version.last_modified_at.isoformat() if version.last_modified_at else None
+    )
+    return _digest([version.count, last_modified_at, *(str(part) for part in parts)])
+
+
+def make_entity_etag(*parts: object) -> str:
+    """1件のデータの表現を決める値(IDと各項目など)からETagを求める。
+
+    テーブル全体の版を使わないため、他の行の書き込みではETagが変化しない。
+
+    Args:
+        parts: 表現を決める値
+
+    Returns:
+        引用符で囲んだETag
+
+    """
+    return _digest([str(part) for part in parts])
+
+
+def _digest(values: list[object]) -> str:
+    """値の並びのハッシュを、引用符で囲んだETagとして返す。"""
+    payload = json.dumps(values, separators=(",", ":"))
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """If-None-MatchヘッダーがETagに一致するかを判定する。
+
+    GETの判定は弱い比較で行うため、W/の接頭辞は無視する。
+
+    Args:
+        if_none_match: リクエストのIf-None-Matchヘッダー
+        etag: 現在の表現のETag
+
+    Returns:
+        クライアントが保持している表現が最新の場合はTrue
+
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """本文を持たない304レスポンスを返す。"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
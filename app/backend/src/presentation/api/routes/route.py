@@ -1,12 +1,17 @@
 """APIルートの定義。
 
-ヘルスチェックとユーザー関連のエンドポイントを提供する。
+ヘルスチェック・キャッシュの利用状況とTodo・ユーザー関連のエンドポイントを提供する。
 """
 
 from fastapi import APIRouter
 
+from src.dependencies import get_cache_stats
 from src.presentation.api.routes.todo import todo_router
 from src.presentation.api.routes.user import user_router
+from src.presentation.api.schema.healthz.check_caches import (
+    CacheStats as CacheStatsSchema,
+)
+from src.presentation.api.schema.healthz.check_caches import CheckCachesResponse
 from src.presentation.api.schema.healthz.check_healthz import CheckHealthResponse
 
 router = APIRouter()
@@ -26,5 +31,29 @@ async def check_health() -> CheckHealthResponse:
     return CheckHealthResponse(status="OK")
 
 
+@router.get(
+    "/healthz/caches",
+    summary="Check Caches",
+    description="プロセス内のキャッシュごとのヒット・ミス・破棄の回数の累計を返す",
+    responses={200: {"model": CheckCachesResponse}},
+)
+async def check_caches() -> CheckCachesResponse:
+    """プロセス内のキャッシュの利用状況を返す。
+
+    キャッシュの大きさや有効期限を調整するための診断に使用する。
+    """
+    return CheckCachesResponse(
+        caches={
+            name: CacheStatsSchema(
+                hits=stats.hits,
+                misses=stats.misses,
+                evictions=stats.evictions,
+                invalidations=stats.invalidations,
+            )
+            for name, stats in get_cache_stats().items()
+        },
+    )
+
+
 router.include_router(todo_router)
 router.include_router(user_router)
@@ -1,55 +1,388 @@
 """Todo関連のAPIエンドポイント。
 
-Todoの検索と完了フラグ切り替え機能を提供する。
+Todoの検索、タイトルの入力補完、差分同期、変更イベントの配信(SSE)、件数・集計の取得、
+完了フラグ切り替え(一括更新を含む)、削除と一括取り込み機能を提供する。
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.dependencies import get_db_session, get_todo_repository
+from src.dependencies import (
+    get_db_session,
+    get_todo_data_version_cache,
+    get_todo_event_broadcaster,
+    get_todo_projection_cache,
+    get_todo_projection_single_flight,
+    get_todo_repository,
+    get_todo_search_cache,
+    get_todo_search_single_flight,
+    get_todo_title_suggestion_cache,
+    open_db_session,
+    open_todo_repository,
+)
+from src.domain.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, SortDirection
+from src.domain.todo.bulk_import import MAX_REPORTED_IMPORT_ERRORS, TodoImportFormat
+from src.domain.todo.bulk_update import MAX_BULK_UPDATE_SIZE
+from src.domain.todo.event import TodoEvent
 from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.title_suggestion import (
+    DEFAULT_TITLE_SUGGESTION_LIMIT,
+    MAX_TITLE_SUGGESTION_LIMIT,
+    MAX_TITLE_SUGGESTION_PREFIX_LENGTH,
+)
+from src.presentation.api.etag import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from src.presentation.api.schema.cursor import decode_cursor, encode_cursor
 from src.presentation.api.schema.error_response import (
     ErrorResponse,
     ValidationErrorResponse,
 )
+from src.presentation.api.schema.fields import fields_key, parse_fields
 from src.presentation.api.schema.safe_str import SafeStr
+from src.presentation.api.schema.todo.bulk_update_todos_request import (
+    BulkUpdateTodosRequest,
+)
+from src.presentation.api.schema.todo.bulk_update_todos_response import (
+    BulkUpdateTodosResponse,
+)
+from src.presentation.api.schema.todo.count_todos_response import (
+    CountTodosResponse,
+)
+from src.presentation.api.schema.todo.delete_todo_response import DeleteTodoResponse
+from src.presentation.api.schema.todo.import_todos_response import (
+    ImportTodosError,
+    ImportTodosResponse,
+)
+from src.presentation.api.schema.todo.partial_search_todos_response import (
+    PartialSearchTodosResponse,
+    PartialTodo,
+)
 from src.presentation.api.schema.todo.search_todos_response import SearchTodosResponse
+from src.presentation.api.schema.todo.suggest_todo_titles_response import (
+    SuggestTodoTitlesResponse,
+)
+from src.presentation.api.schema.todo.sync_todos_response import (
+    DeletedTodo,
+    SyncTodosResponse,
+)
 from src.presentation.api.schema.todo.todo import Todo as TodoSchema
+from src.presentation.api.schema.todo.todo_event import TodoEvent as TodoEventSchema
+from src.presentation.api.schema.todo.todo_summary_response import (
+    TodoSummaryResponse,
+)
 from src.presentation.api.schema.todo.toggle_todo_response import ToggleTodoResponse
-from src.shared.errors.codes import TodoErrorCode
+from src.shared.errors.codes import CommonErrorCode, TodoErrorCode
 from src.shared.errors.errors import ExpectedUseCaseError
+from src.shared.pubsub.broadcaster import Broadcaster, SubscriptionOverflowError
+from src.usecase.todo.bulk_update_todos_usecase import BulkUpdateTodosUseCase
+from src.usecase.todo.count_todos_usecase import CountTodosUseCase
+from src.usecase.todo.delete_todo_usecase import DeleteTodoUseCase
+from src.usecase.todo.get_todo_summary_usecase import GetTodoSummaryUseCase
+from src.usecase.todo.get_todos_data_version_usecase import (
+    GetTodosDataVersionUseCase,
+)
+from src.usecase.todo.import_todos_usecase import ImportTodosUseCase
 from src.usecase.todo.search_todos_usecase import SearchTodosUseCase
+from src.usecase.todo.stream_todos_usecase import StreamTodosUseCase
+from src.usecase.todo.suggest_todo_titles_usecase import SuggestTodoTitlesUseCase
+from src.usecase.todo.sync_todos_usecase import SyncTodosUseCase, since_cursor
 from src.usecase.todo.toggle_todo_usecase import ToggleTodoUseCase
 
 todo_router = APIRouter(
     tags=["todos"],
 )
 
+# 1行に1件のTodoをJSONで書き出すストリーミングレスポンスのメディアタイプ
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+CSV_MEDIA_TYPE = "text/csv"
+
+# 一括取り込みで受け付けるメディアタイプとデータ形式の対応
+_IMPORT_FORMATS = {
+    NDJSON_MEDIA_TYPE: TodoImportFormat.NDJSON,
+    CSV_MEDIA_TYPE: TodoImportFormat.CSV,
+}
+
+# ストリーミング時に1回の書き込みにまとめるTodoの件数
+_STREAM_CHUNK_SIZE = 100
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+# イベントがない間も接続を維持するため、SSEのコメントを送る間隔(秒)
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 @todo_router.get(
     "/todos",
     summary="Todoを検索する",
-    description="タイトルでTodoを検索する。クエリなしの場合は全件を返す。",
+    description=(
+        "タイトルでTodoを検索する。クエリなしの場合は全件を作成日時順に、"
+        "クエリありの場合は一致度の高い順に返す。"
+        "mode=substringは部分一致、mode=ftsは単語単位の全文検索で検索する。"
+        "completedを指定すると、完了済み(true)または未完了(false)のTodoのみを返す。"
+        "sortを指定すると、クエリの有無によらずsortのキーでdirectionの向き(asc/desc)に並べる。"
+        "fieldsに項目名をカンマ区切りで指定すると、その項目とidのみを返す。"
+        "結果はlimit件ずつページ分割され、next_cursorをafterに指定すると次のページを取得できる。"
+        f"Acceptヘッダーに{NDJSON_MEDIA_TYPE}を指定すると、一致する全件を"
+        "1行1件のJSONで逐次返す(limit・afterは適用しない)。"
+        "レスポンスのETagをIf-None-Matchに指定すると、変化がない場合は304を返す。"
+        "updated_sinceを指定すると、その日時以降に追加・更新・削除されたTodoのみを"
+        "更新日時順に返す(差分同期)。2回目以降はupdated_sinceに加えて前回のnext_cursorを"
+        "afterに指定し、has_moreがfalseになるまで続けて取得する。"
+    ),
     status_code=status.HTTP_200_OK,
+    response_model=SearchTodosResponse | PartialSearchTodosResponse | SyncTodosResponse,
     responses={
-        status.HTTP_200_OK: {"model": SearchTodosResponse},
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
     },
 )
-async def search_todos(
+async def search_todos(  # noqa: PLR0913, PLR0917
     session: Annotated[AsyncSession, Depends(get_db_session)],
+    response: Response,
     q: Annotated[str, Query(description="検索クエリ")] = "",
-) -> SearchTodosResponse:
+    mode: Annotated[
+        TodoSearchMode,
+        Query(description="検索方式(substring: 部分一致, fts: 全文検索)"),
+    ] = TodoSearchMode.SUBSTRING,
+    completed: Annotated[
+        bool | None,
+        Query(description="完了フラグによる絞り込み(省略時は絞り込まない)"),
+    ] = None,
+    sort: Annotated[
+        TodoSortKey | None,
+        Query(description="並び替えキー(省略時は作成日時順または一致度順)"),
+    ] = None,
+    direction: Annotated[
+        SortDirection,
+        Query(description="sortで並べる向き(asc: 昇順, desc: 降順)"),
+    ] = SortDirection.ASC,
+    fields: Annotated[
+        SafeStr | None,
+        Query(
+            description=(
+                "返す項目のカンマ区切り(title,completed,created_at,updated_at。"
+                "idは常に返す。省略時はすべての項目)"
+            ),
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(description="1ページの件数", ge=1, le=MAX_PAGE_SIZE),
+    ] = DEFAULT_PAGE_SIZE,
+    after: Annotated[
+        SafeStr | None,
+        Query(description="前のページのnext_cursor"),
+    ] = None,
+    updated_since: Annotated[
+        datetime | None,
+        Query(description="この日時以降の変更のみを返す(タイムゾーン省略時はUTC)"),
+    ] = None,
+    accept: Annotated[
+        str | None,
+        Header(description=f"{NDJSON_MEDIA_TYPE}を含む場合はストリーミングで返す"),
+    ] = None,
+    if_none_match: Annotated[
+        str | None,
+        Header(description="以前のレスポンスのETag"),
+    ] = None,
+) -> SearchTodosResponse | SyncTodosResponse | Response:
     """Todoを検索する。
 
-    タイトルに対して部分一致検索を行う。
-    クエリが空の場合は全件を返す。
+    タイトルに対してmodeの方式で検索を行い、一致度の高い順にlimit件ずつ返す。
+    クエリが空の場合は全件を作成日時順に返す。sortを指定した場合はそのキーの順に返す。
+    fieldsを指定した場合は、その項目のみをデータベースから読み込んで返す。
+    カーソルまたはfieldsが不正な場合は400エラーを返す。
+    NDJSONが要求された場合は、全件をサーバーサイドカーソルから読み込みながら返す。
+    If-None-MatchがETagに一致する場合は、検索を行わずに304を返す。
+    updated_sinceが指定された場合は、検索の代わりに差分同期を行う。
     """
-    todo_repository = get_todo_repository(session)
-    usecase = SearchTodosUseCase(todo_repository)
-    todos = await usecase.execute(q)
-    return SearchTodosResponse(
+    if updated_since is not None:
+        # 差分同期は完了フラグの変化も伝え更新日時順に返すため、検索条件・並び順とは併用できない
+        if q or completed is not None or sort is not None or fields is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=CommonErrorCode.InvalidValue.value,
+            )
+        return await _sync_todos(session, updated_since, limit, after)
+
+    if accept is not None and NDJSON_MEDIA_TYPE in accept:
+        # NDJSONは全項目を逐次返すため、項目の指定には対応しない
+        if fields is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=CommonErrorCode.InvalidValue.value,
+            )
+        return StreamingResponse(
+            _stream_todos(q, mode, completed, sort, direction),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    try:
+        cursor = decode_cursor(after)
+        field_set = parse_fields(fields, TodoField)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=CommonErrorCode.InvalidValue.value,
+        ) from e
+
+    try:
+        todo_repository = get_todo_repository(session)
+        # 検索より前に版を取得し、検索中の書き込みは次回のETagの変化として反映させる
+        version = await GetTodosDataVersionUseCase(
+            todo_repository,
+            cache=get_todo_data_version_cache(),
+            open_repository=open_todo_repository,
+        ).execute()
+        etag = make_etag(
+            version,
+            "todos",
+            q,
+            mode.value,
+            completed,
+            sort.value if sort else None,
+            direction.value,
+            fields_key(field_set),
+            limit,
+            after,
+        )
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+
+        condition = TodoSearchCondition(
+            query=q,
+            mode=mode,
+            completed=completed,
+            sort=sort,
+            direction=direction,
+            limit=limit,
+            after=cursor,
+        )
+        usecase = SearchTodosUseCase(
+            todo_repository,
+            cache=get_todo_search_cache(),
+            projection_cache=get_todo_projection_cache(),
+            single_flight=get_todo_search_single_flight(),
+            projection_single_flight=get_todo_projection_single_flight(),
+            open_repository=open_todo_repository,
+        )
+        if field_set is not None:
+            projections = await usecase.execute_projection(
+                condition,
+                field_set,
+                version,
+            )
+            body = PartialSearchTodosResponse(
+                todos=[_partial_todo(todo) for todo in projections.items],
+                next_cursor=encode_cursor(projections.next_cursor),
+            )
+            return Response(
+                content=body.model_dump_json(exclude_unset=True),
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+        page = await usecase.execute(condition, version)
+        response.headers["ETag"] = etag
+        return SearchTodosResponse(
+            todos=[
+                TodoSchema(
+                    id=todo.id.value,
+                    title=todo.title,
+                    completed=todo.completed,
+                    created_at=todo.created_at,
+                    updated_at=todo.updated_at,
+                )
+                for todo in page.items
+            ],
+            next_cursor=encode_cursor(page.next_cursor),
+        )
+    except ExpectedUseCaseError as e:
+        if e.code == CommonErrorCode.InvalidValue:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=e.code.value,
+            ) from e
+        raise
+
+
+def _partial_todo(todo: TodoProjection) -> PartialTodo:
+    """読み込んだ項目のみを設定したTodoのスキーマを返す。"""
+    values = {
+        "title": todo.title,
+        "completed": todo.completed,
+        "created_at": todo.created_at,
+        "updated_at": todo.updated_at,
+    }
+    # 読み込まなかった項目は未設定のままとし、レスポンスに含めない
+    return PartialTodo(
+        id=todo.id.value,
+        **{name: value for name, value in values.items() if value is not None},
+    )
+
+
+async def _sync_todos(
+    session: AsyncSession,
+    updated_since: datetime,
+    limit: int,
+    after: str | None,
+) -> SyncTodosResponse:
+    """updated_since(afterの指定がある場合はafter)より後の変更を返す。
+
+    変更の件数に比例するコストで取得でき、削除されたTodoはdeletedとして返す。
+    カーソルが不正な場合は400エラーを返す。
+    """
+    try:
+        cursor = decode_cursor(after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=CommonErrorCode.InvalidValue.value,
+        ) from e
+    # タイムゾーンのない日時はUTCとみなす
+    if updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=UTC)
+
+    try:
+        usecase = SyncTodosUseCase(get_todo_repository(session))
+        changes = await usecase.execute(cursor or since_cursor(updated_since), limit)
+    except ExpectedUseCaseError as e:
+        if e.code == CommonErrorCode.InvalidValue:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=e.code.value,
+            ) from e
+        raise
+    return SyncTodosResponse(
         todos=[
             TodoSchema(
                 id=todo.id.value,
@@ -58,11 +391,242 @@ async def search_todos(
                 created_at=todo.created_at,
                 updated_at=todo.updated_at,
             )
-            for todo in todos
+            for todo in changes.items
+            if todo.deleted_at is None
+        ],
+        deleted=[
+            DeletedTodo(id=todo.id.value, deleted_at=todo.deleted_at)
+            for todo in changes.items
+            if todo.deleted_at is not None
         ],
+        next_cursor=encode_cursor(changes.resume_cursor),
+        has_more=changes.has_more,
+    )
+
+
+async def _stream_todos(
+    query: str,
+    mode: TodoSearchMode,
+    completed: bool | None,
+    sort: TodoSortKey | None,
+    direction: SortDirection,
+) -> AsyncIterator[str]:
+    """検索結果をNDJSONの行として逐次生成する。
+
+    レスポンスの送信はエンドポイントの関数から戻った後に行われ、
+    依存性注入のセッションは使えないため、送信中に使用するセッションを自前で開く。
+    """
+    async with open_db_session() as session:
+        usecase = StreamTodosUseCase(get_todo_repository(session))
+        lines: list[str] = []
+        async for todo in usecase.execute(query, mode, completed, sort, direction):
+            schema = TodoSchema(
+                id=todo.id.value,
+                title=todo.title,
+                completed=todo.completed,
+                created_at=todo.created_at,
+                updated_at=todo.updated_at,
+            )
+            lines.append(schema.model_dump_json() + "\n")
+            if len(lines) >= _STREAM_CHUNK_SIZE:
+                yield "".join(lines)
+                lines.clear()
+        if lines:
+            yield "".join(lines)
+
+
+@todo_router.get(
+    "/todos/events",
+    summary="Todoの変更イベントを受信する",
+    description=(
+        "Todoの更新・完了フラグの切り替え・削除・一括取り込みを、"
+        "Server-Sent Eventsで発生したときに送る。eventは変更の種類、dataは変更後のTodoである。"
+        "接続が切れている間のイベントは送られないため、再接続したときは"
+        "updated_sinceによる差分同期で補う。"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                EVENT_STREAM_MEDIA_TYPE: {
+                    "schema": TodoEventSchema.model_json_schema(),
+                },
+            },
+        },
+    },
+)
+async def stream_todo_events() -> StreamingResponse:
+    """Todoの変更イベントを受信する。
+
+    書き込みはワーカーごとに1回だけ受信され、プロセス内のBroadcasterから
+    全ての接続に配信されるため、接続数によらずデータベースへの問い合わせは発生しない。
+    """
+    return StreamingResponse(
+        _todo_event_stream(get_todo_event_broadcaster()),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        # プロキシでバッファリング・キャッシュされるとイベントが遅れて届くため無効にする
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _format_event(event: TodoEvent) -> str:
+    """変更イベントをSSEのメッセージに変換する。"""
+    todo = event.todo
+    schema = TodoEventSchema(
+        type=event.type,
+        todo=TodoSchema(
+            id=todo.id.value,
+            title=todo.title,
+            completed=todo.completed,
+            created_at=todo.created_at,
+            updated_at=todo.updated_at,
+        )
+        if todo is not None
+        else None,
+    )
+    return f"event: {event.type.value}\ndata: {schema.model_dump_json()}\n\n"
+
+
+async def _todo_event_stream(
+    broadcaster: Broadcaster[TodoEvent],
+) -> AsyncIterator[str]:
+    """購読を開始し、受信した変更イベントをSSEのメッセージとして逐次生成する。
+
+    クライアントが切断するとジェネレーターが閉じられ、購読も終了する。
+    受信が追いつかず購読が打ち切られた場合は、接続を閉じて再接続させる。
+    """
+    with broadcaster.subscribe() as subscription:
+        # 購読の開始後すぐに送り、クライアントとプロキシにレスポンスの開始を伝える
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(),
+                    timeout=SSE_KEEPALIVE_SECONDS,
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            except SubscriptionOverflowError:
+                return
+            yield _format_event(event)
+
+
+@todo_router.get(
+    "/todos/count",
+    summary="Todoの件数を取得する",
+    description=(
+        "論理削除されていないTodoの件数を返す。completedを指定すると完了フラグで絞り込む。"
+        "approximate=trueの場合は、統計情報から推定した概算値を行数によらず一定の時間で返す"
+        "(概算値は削除済みのTodoを含み、completedを指定した場合は正確な件数を返す)。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CountTodosResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def count_todos(
+    *,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    completed: Annotated[
+        bool | None,
+        Query(description="完了フラグ(未指定の場合は絞り込まない)"),
+    ] = None,
+    approximate: Annotated[
+        bool,
+        Query(description="統計情報から推定した概算値でよい場合はtrue"),
+    ] = False,
+) -> CountTodosResponse:
+    """Todoの件数を取得する。
+
+    正確な件数もtodosテーブルを走査せず、書き込みのたびにトリガーで増減させている
+    完了フラグごとの件数から求める。
+    """
+    usecase = CountTodosUseCase(get_todo_repository(session))
+    count = await usecase.execute(completed=completed, approximate=approximate)
+    return CountTodosResponse(count=count.value, approximate=count.approximate)
+
+
+@todo_router.get(
+    "/todos/summary",
+    summary="Todoの件数の集計を取得する",
+    description=(
+        "論理削除されていないTodoの件数(total)、完了済み(completed)・未完了(pending)の件数と、"
+        "完了率(completion_rate)を返す。todosテーブルは走査せず、書き込みのたびに"
+        "更新している集計テーブルから求めるため、行数によらず一定の時間で返る。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": TodoSummaryResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def get_todo_summary(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> TodoSummaryResponse:
+    """Todoの件数の集計を取得する。
+
+    件数はtodosテーブルへの書き込みと同じトランザクションでトリガーが増減させている
+    集計テーブルから求めるため、コミット済みの書き込みと常に一致する。
+    """
+    usecase = GetTodoSummaryUseCase(get_todo_repository(session))
+    summary = await usecase.execute()
+    return TodoSummaryResponse(
+        total=summary.total,
+        completed=summary.completed,
+        pending=summary.pending,
+        completion_rate=summary.completion_rate,
     )
 
 
+@todo_router.get(
+    "/todos/suggest",
+    summary="Todoのタイトルの候補を取得する",
+    description=(
+        "タイトルがprefixで始まるTodoのタイトルを、タイトル順にlimit件返す(入力補完用)。"
+        "部分一致検索と同じく全角・半角、大文字・小文字、ひらがな・カタカナを区別せず、"
+        "区別しない場合に同じになるタイトルは1件にまとめる。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": SuggestTodoTitlesResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def suggest_todo_titles(
+    *,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    prefix: Annotated[
+        str,
+        Query(
+            description="入力中の文字列",
+            min_length=1,
+            max_length=MAX_TITLE_SUGGESTION_PREFIX_LENGTH,
+        ),
+    ],
+    limit: Annotated[
+        int,
+        Query(description="候補の件数", ge=1, le=MAX_TITLE_SUGGESTION_LIMIT),
+    ] = DEFAULT_TITLE_SUGGESTION_LIMIT,
+) -> SuggestTodoTitlesResponse:
+    """Todoのタイトルの候補を取得する。
+
+    入力のたびに呼び出されるため、部分一致検索ではなく前方一致のインデックスの
+    範囲検索で求め、よく入力される文字列の候補はプロセス内にキャッシュする。
+    """
+    usecase = SuggestTodoTitlesUseCase(
+        get_todo_repository(session),
+        cache=get_todo_title_suggestion_cache(),
+        open_repository=open_todo_repository,
+    )
+    titles = await usecase.execute(prefix, limit)
+    return SuggestTodoTitlesResponse(titles=titles)
+
+
 @todo_router.patch(
     "/todos/{todo_id}/toggle",
     summary="Todoの完了フラグを切り替える",
@@ -108,3 +672,157 @@ async def toggle_todo(
                 detail=e.code.value,
             ) from e
         raise
+
+
+@todo_router.delete(
+    "/todos/{todo_id}",
+    summary="Todoを削除する",
+    description=(
+        "指定IDのTodoを削除する。削除したTodoは差分同期(updated_since)で"
+        "deletedとして返される。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": DeleteTodoResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def delete_todo(
+    todo_id: Annotated[
+        SafeStr,
+        Path(description="TodoID", min_length=1, max_length=255),
+    ],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> DeleteTodoResponse:
+    """Todoを削除する。
+
+    指定したTodoIDのTodoを論理削除する。
+    Todoが存在しない(削除済みを含む)場合は404エラーを返す。
+    """
+    try:
+        todo_repository = get_todo_repository(session)
+        usecase = DeleteTodoUseCase(todo_repository)
+        todo = await usecase.execute(TodoId(value=todo_id))
+        return DeleteTodoResponse(
+            todo=TodoSchema(
+                id=todo.id.value,
+                title=todo.title,
+                completed=todo.completed,
+                created_at=todo.created_at,
+                updated_at=todo.updated_at,
+            ),
+        )
+    except ExpectedUseCaseError as e:
+        if e.code == TodoErrorCode.NotFound:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=e.code.value,
+            ) from e
+        raise
+
+
+@todo_router.patch(
+    "/todos/bulk",
+    summary="Todoの完了フラグを一括で更新する",
+    description=(
+        f"指定した最大{MAX_BULK_UPDATE_SIZE}件のTodoの完了フラグを1回の更新で変更する。"
+        "存在しないIDはnot_found_idsとして返す。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": BulkUpdateTodosResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def bulk_update_todos(
+    request: BulkUpdateTodosRequest,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> BulkUpdateTodosResponse:
+    """Todoの完了フラグを一括で更新する。
+
+    指定したIDのTodoを、actionに応じて完了・未完了・反転のいずれかに更新する。
+    """
+    todo_repository = get_todo_repository(session)
+    usecase = BulkUpdateTodosUseCase(todo_repository)
+    result = await usecase.execute(
+        [TodoId(value=todo_id) for todo_id in request.ids],
+        request.action,
+    )
+    return BulkUpdateTodosResponse(
+        todos=[
+            TodoSchema(
+                id=todo.id.value,
+                title=todo.title,
+                completed=todo.completed,
+                created_at=todo.created_at,
+                updated_at=todo.updated_at,
+            )
+            for todo in result.updated
+        ],
+        not_found_ids=[todo_id.value for todo_id in result.not_found_ids],
+    )
+
+
+@todo_router.post(
+    "/todos/import",
+    summary="Todoを一括で取り込む",
+    description=(
+        f"リクエストボディのNDJSON({NDJSON_MEDIA_TYPE})またはCSV({CSV_MEDIA_TYPE})を"
+        "読み込みながらTodoとして追加する。1行が1件のTodoで、titleは必須、"
+        "id・completed・created_atは省略できる。updated_atは指定しても無視し、"
+        "差分同期で取得されるよう取り込んだ時刻とする。CSVは1行目をヘッダーとする。"
+        "不正な行やIDが既に存在する行は取り込まず、行番号とともに"
+        f"先頭から最大{MAX_REPORTED_IMPORT_ERRORS}件をerrorsとして返す。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": ImportTodosResponse},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": ErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}},
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}},
+            },
+        },
+    },
+)
+async def import_todos(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    content_type: Annotated[
+        str | None,
+        Header(description=f"{NDJSON_MEDIA_TYPE}または{CSV_MEDIA_TYPE}"),
+    ] = None,
+) -> ImportTodosResponse:
+    """Todoを一括で取り込む。
+
+    リクエストボディを全て読み込まずに受信しながら取り込むため、
+    ボディの大きさによらずメモリ使用量は一定となる。
+    対応していないContent-Typeの場合は415エラーを返す。
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    import_format = _IMPORT_FORMATS.get(media_type)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=CommonErrorCode.InvalidValue.value,
+        )
+
+    todo_repository = get_todo_repository(session)
+    usecase = ImportTodosUseCase(todo_repository)
+    result = await usecase.execute(request.stream(), import_format)
+    return ImportTodosResponse(
+        imported=result.imported,
+        failed=result.failed,
+        errors=[
+            ImportTodosError(line=error.line, message=error.message)
+            for error in result.errors
+        ],
+    )
@@ -1,25 +1,77 @@
 """ユーザー関連のAPIエンドポイント。
 
-ユーザーの一覧取得、検索、削除機能を提供する。
+ユーザーの作成、一括作成、一覧取得、件数取得、検索、一括検索、削除機能を提供する。
 """
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.dependencies import get_db_session, get_user_repository
+from src.dependencies import (
+    get_db_session,
+    get_user_data_version_cache,
+    get_user_filter_projection_single_flight,
+    get_user_filter_single_flight,
+    get_user_find_single_flight,
+    get_user_repository,
+    open_user_repository,
+)
+from src.domain.data_version import DataVersion
+from src.domain.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.domain.user.bulk_create import (
+    MAX_BULK_CREATE_SIZE,
+    UserBulkCreateErrorReason,
+)
 from src.domain.user.id import UserId
+from src.domain.user.lookup import MAX_USER_LOOKUP_SIZE
+from src.domain.user.projection import UserField, UserProjection
+from src.domain.user.repository import UserRepository
+from src.presentation.api.etag import (
+    is_not_modified,
+    make_entity_etag,
+    make_etag,
+    not_modified_response,
+)
+from src.presentation.api.schema.cursor import decode_cursor, encode_cursor
 from src.presentation.api.schema.error_response import (
     ErrorResponse,
     ValidationErrorResponse,
 )
+from src.presentation.api.schema.fields import fields_key, parse_fields
 from src.presentation.api.schema.safe_str import SafeStr
+from src.presentation.api.schema.user.bulk_create_users_request import (
+    BulkCreateUsersRequest,
+)
+from src.presentation.api.schema.user.bulk_create_users_response import (
+    BulkCreateUsersError,
+    BulkCreateUsersResponse,
+)
+from src.presentation.api.schema.user.count_users_response import (
+    CountUsersResponse,
+)
 from src.presentation.api.schema.user.create_user_request import CreateUserRequest
 from src.presentation.api.schema.user.create_user_response import CreateUserResponse
 from src.presentation.api.schema.user.delete_user_response import DeleteUserResponse
 from src.presentation.api.schema.user.filter_user_response import FilterUserResponse
 from src.presentation.api.schema.user.find_user_response import FindUserResponse
+from src.presentation.api.schema.user.find_users_request import FindUsersRequest
+from src.presentation.api.schema.user.find_users_response import (
+    FindUsersResponse,
+)
+from src.presentation.api.schema.user.partial_filter_user_response import (
+    PartialFilterUserResponse,
+    PartialUser,
+)
 from src.presentation.api.schema.user.user import User as UserSchema
 from src.shared.errors.codes import (
     CommonErrorCode,
@@ -28,15 +80,55 @@ from src.shared.errors.codes import (
 from src.shared.errors.errors import (
     ExpectedUseCaseError,
 )
+from src.usecase.user.bulk_create_users_usecase import BulkCreateUsersUseCase
+from src.usecase.user.count_users_usecase import CountUsersUseCase
 from src.usecase.user.create_user_usecase import CreateUserUseCase
 from src.usecase.user.delete_user_usecase import DeleteUserUseCase
 from src.usecase.user.filter_user_usecase import FilterUserUseCase
 from src.usecase.user.find_user_usecase import FindUserUseCase
+from src.usecase.user.find_users_usecase import FindUsersUseCase
+from src.usecase.user.get_users_data_version_usecase import (
+    GetUsersDataVersionUseCase,
+)
 
 user_router = APIRouter(
     tags=["users"],
 )
 
+# 一括作成で作成できなかった理由ごとに返すエラーコード(1件ずつ作成する場合と同じ)
+_BULK_CREATE_ERROR_CODES = {
+    UserBulkCreateErrorReason.INVALID_VALUE: CommonErrorCode.InvalidValue,
+    UserBulkCreateErrorReason.EMAIL_ALREADY_EXISTS: UserErrorCode.EmailAlreadyExists,
+}
+
+
+async def _users_data_version(user_repository: UserRepository) -> DataVersion:
+    """ETagの算出に使用するユーザー全体のデータの版を取得する。
+
+    取得より前に版を求めることで、取得中の書き込みは次回のETagの変化として反映させる。
+    """
+    usecase = GetUsersDataVersionUseCase(
+        user_repository,
+        cache=get_user_data_version_cache(),
+        open_repository=open_user_repository,
+    )
+    return await usecase.execute()
+
+
+def _partial_user(user: UserProjection) -> PartialUser:
+    """読み込んだ項目のみを設定したユーザーのスキーマを返す。"""
+    values = {
+        "email": user.email.value if user.email is not None else None,
+        "name": user.name.value if user.name is not None else None,
+        "role": user.role.value.value if user.role is not None else None,
+        "created_at": user.created_at,
+    }
+    # 読み込まなかった項目は未設定のままとし、レスポンスに含めない
+    return PartialUser(
+        id=user.id.value,
+        **{name: value for name, value in values.items() if value is not None},
+    )
+
 
 @user_router.post(
     "/users",
@@ -83,30 +175,237 @@ async def create_user(
         raise
 
 
+@user_router.post(
+    "/users/bulk",
+    summary="ユーザーを一括で作成する",
+    description=(
+        f"最大{MAX_BULK_CREATE_SIZE}件のユーザーを1回の追加で作成する。"
+        "メールアドレス・ユーザー名が不正な入力(INVALID_VALUE)と、"
+        "メールアドレスが既に登録されている入力(USER_EMAIL_ALREADY_EXISTS)は作成せず、"
+        "usersでの位置とともにerrorsとして返す。usersとerrorsはいずれもリクエストの順に並ぶ。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": BulkCreateUsersResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def bulk_create_users(
+    request: BulkCreateUsersRequest,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> BulkCreateUsersResponse:
+    """ユーザーを一括で作成する。
+
+    1件ずつ作成する場合と異なり、一部のユーザーを作成できなくても他のユーザーは作成する。
+    """
+    user_repository = get_user_repository(session)
+    usecase = BulkCreateUsersUseCase(user_repository)
+    result = await usecase.execute(request.users)
+    return BulkCreateUsersResponse(
+        users=[
+            UserSchema(
+                id=user.id.value,
+                email=user.email.value,
+                name=user.name.value,
+                role=user.role.value.value,
+                created_at=user.created_at,
+            )
+            for user in result.created
+        ],
+        errors=[
+            BulkCreateUsersError(
+                index=error.index,
+                code=_BULK_CREATE_ERROR_CODES[error.reason].value,
+                message=error.message,
+            )
+            for error in result.errors
+        ],
+    )
+
+
 @user_router.get(
     "/users",
     summary="ユーザ一覧を取得する",
-    description="全てのユーザを取得する",
+    description=(
+        "ユーザを作成日時順に取得する。"
+        "結果はlimit件ずつページ分割され、next_cursorをafterに指定すると次のページを取得できる。"
+        "fieldsに項目名をカンマ区切りで指定すると、その項目とidのみを返す。"
+        "レスポンスのETagをIf-None-Matchに指定すると、変化がない場合は304を返す。"
+    ),
     status_code=status.HTTP_200_OK,
+    response_model=FilterUserResponse | PartialFilterUserResponse,
     responses={
-        status.HTTP_200_OK: {"model": FilterUserResponse},
+        status.HTTP_200_OK: {"model": FilterUserResponse | PartialFilterUserResponse},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
     },
 )
-async def filter_user(
+async def filter_user(  # noqa: PLR0913, PLR0917
     session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> FilterUserResponse:
-    """すべてのユーザーを取得する。
+    response: Response,
+    limit: Annotated[
+        int,
+        Query(description="1ページの件数", ge=1, le=MAX_PAGE_SIZE),
+    ] = DEFAULT_PAGE_SIZE,
+    after: Annotated[
+        SafeStr | None,
+        Query(description="前のページのnext_cursor"),
+    ] = None,
+    fields: Annotated[
+        SafeStr | None,
+        Query(
+            description=(
+                "返す項目のカンマ区切り(email,name,role,created_at。"
+                "idは常に返す。省略時はすべての項目)"
+            ),
+        ),
+    ] = None,
+    if_none_match: Annotated[
+        str | None,
+        Header(description="以前のレスポンスのETag"),
+    ] = None,
+) -> FilterUserResponse | Response:
+    """ユーザーを作成日時順に取得する。
 
-    システムに登録されているすべてのユーザーの一覧を返す。
+    システムに登録されているユーザーをlimit件ずつ返す。
+    fieldsを指定した場合は、その項目のみをデータベースから読み込んで返す。
+    カーソルまたはfieldsが不正な場合は400エラーを返す。
+    If-None-MatchがETagに一致する場合は、取得を行わずに304を返す。
+    """
+    try:
+        cursor = decode_cursor(after)
+        field_set = parse_fields(fields, UserField)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=CommonErrorCode.InvalidValue.value,
+        ) from e
+
+    try:
+        user_repository = get_user_repository(session)
+        etag = make_etag(
+            await _users_data_version(user_repository),
+            "users",
+            fields_key(field_set),
+            limit,
+            after,
+        )
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+
+        usecase = FilterUserUseCase(
+            user_repository,
+            single_flight=get_user_filter_single_flight(),
+            projection_single_flight=get_user_filter_projection_single_flight(),
+        )
+        if field_set is not None:
+            projections = await usecase.execute_projection(
+                field_set,
+                limit=limit,
+                after=cursor,
+            )
+            body = PartialFilterUserResponse(
+                users=[_partial_user(user) for user in projections.items],
+                next_cursor=encode_cursor(projections.next_cursor),
+            )
+            return Response(
+                content=body.model_dump_json(exclude_unset=True),
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+        page = await usecase.execute(limit=limit, after=cursor)
+        response.headers["ETag"] = etag
+        return FilterUserResponse(
+            users=[
+                UserSchema(
+                    id=user.id.value,
+                    email=user.email.value,
+                    name=user.name.value,
+                    role=user.role.value.value,
+                    created_at=user.created_at,
+                )
+                for user in page.items
+            ],
+            next_cursor=encode_cursor(page.next_cursor),
+        )
+    except ExpectedUseCaseError as e:
+        if e.code == CommonErrorCode.InvalidValue:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=e.code.value,
+            ) from e
+        raise
+
+
+@user_router.get(
+    "/users/count",
+    summary="ユーザの件数を取得する",
+    description=(
+        "ユーザの件数を返す。approximate=trueの場合は、統計情報から推定した概算値を"
+        "行数によらず一定の時間で返す。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CountUsersResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def count_users(
+    *,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    approximate: Annotated[
+        bool,
+        Query(description="統計情報から推定した概算値でよい場合はtrue"),
+    ] = False,
+) -> CountUsersResponse:
+    """ユーザーの件数を取得する。
+
+    /users/{user_id}より前に定義し、countがユーザーIDとして扱われないようにする。
+    """
+    usecase = CountUsersUseCase(get_user_repository(session))
+    count = await usecase.execute(approximate=approximate)
+    return CountUsersResponse(count=count.value, approximate=count.approximate)
+
+
+@user_router.post(
+    "/users/lookup",
+    summary="指定したユーザをまとめて取得する",
+    description=(
+        f"最大{MAX_USER_LOOKUP_SIZE}件のユーザIDを指定し、1回の検索でまとめて取得する。"
+        "ユーザは指定したIDの順に返し、存在しないIDはnot_found_idsとして返す。"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": FindUsersResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ValidationErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    },
+)
+async def find_users(
+    request: FindUsersRequest,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> FindUsersResponse:
+    """指定したユーザーをまとめて取得する。
+
+    ユーザーIDごとに取得する場合と異なり、存在しないユーザーがあっても404エラーとせず、
+    見つかったユーザーのみを返す。
     """
     user_repository = get_user_repository(session)
-    usecase = FilterUserUseCase(user_repository)
-    users = await usecase.execute()
-    return FilterUserResponse(
+    usecase = FindUsersUseCase(user_repository)
+    result = await usecase.execute(
+        [UserId(value=user_id) for user_id in request.ids],
+    )
+    return FindUsersResponse(
         users=[
             UserSchema(
                 id=user.id.value,
@@ -115,18 +414,24 @@ async def filter_user(
                 role=user.role.value.value,
                 created_at=user.created_at,
             )
-            for user in users
+            for user in result.found
         ],
+        not_found_ids=[user_id.value for user_id in result.not_found_ids],
     )
 
 
 @user_router.get(
     "/users/{user_id}",
     summary="指定したユーザを取得する",
-    description="ユーザIDを指定して単一のユーザを取得する",
+    description=(
+        "ユーザIDを指定して単一のユーザを取得する。"
+        "レスポンスのETagをIf-None-Matchに指定すると、変化がない場合は304を返す。"
+    ),
     status_code=status.HTTP_200_OK,
+    response_model=FindUserResponse,
     responses={
         status.HTTP_200_OK: {"model": FindUserResponse},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
@@ -140,18 +445,38 @@ async def find_user(
         Path(description="ユーザID", min_length=1, max_length=128),
     ],
     session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> FindUserResponse:
+    response: Response,
+    if_none_match: Annotated[
+        str | None,
+        Header(description="以前のレスポンスのETag"),
+    ] = None,
+) -> FindUserResponse | Response:
     """指定したユーザーを取得する。
 
     ユーザーIDを指定して単一のユーザー情報を取得する。
     ユーザーが存在しない場合は404エラーを返す。
+    ETagはそのユーザーの行の各項目から求めるため、他のユーザーの書き込みでは変化しない。
+    If-None-MatchがETagに一致する場合は、本文を返さずに304を返す。
     """
     try:
-        user_repository = get_user_repository(session)
         # Presentation層でドメイン型に変換
         domain_user_id = UserId(value=user_id)
-        usecase = FindUserUseCase(user_repository)
+        usecase = FindUserUseCase(
+            get_user_repository(session),
+            single_flight=get_user_find_single_flight(),
+        )
         user = await usecase.execute(domain_user_id)
+        etag = make_entity_etag(
+            "users",
+            user.id.value,
+            user.email.value,
+            user.name.value,
+            user.role.value.value,
+            user.created_at.isoformat(),
+        )
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+        response.headers["ETag"] = etag
         return FindUserResponse(
             user=UserSchema(
                 id=user.id.value,
@@ -0,0 +1,73 @@
+"""ページネーションカーソルのエンコード・デコード。
+
+ドメインのカーソルを、クライアントが中身を意識しない不透明な文字列に変換する。
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.domain.pagination import PageCursor
+
+# カーソルのキーの型を表すタグ
+_DATETIME_TAG = "d"
+_FLOAT_TAG = "f"
+_STR_TAG = "s"
+
+
+def encode_cursor(cursor: PageCursor | None) -> str | None:
+    """カーソルを不透明な文字列にエンコードする。
+
+    Args:
+        cursor: エンコードするカーソル(Noneの場合はNoneを返す)
+
+    Returns:
+        URLセーフなBase64文字列
+
+    """
+    if cursor is None:
+        return None
+    if isinstance(cursor.key, datetime):
+        tag, key = _DATETIME_TAG, cursor.key.isoformat()
+    elif isinstance(cursor.key, float):
+        tag, key = _FLOAT_TAG, cursor.key
+    else:
+        tag, key = _STR_TAG, cursor.key
+    payload = json.dumps([tag, key, cursor.id, cursor.order], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None) -> PageCursor | None:
+    """エンコードされたカーソルをデコードする。
+
+    Args:
+        token: encode_cursorで生成した文字列(Noneの場合はNoneを返す)
+
+    Returns:
+        デコードしたカーソル
+
+    Raises:
+        ValueError: カーソルの形式が不正な場合
+
+    """
+    if token is None:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        tag, key, cursor_id, order = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {token}") from e
+
+    if isinstance(cursor_id, str) and isinstance(order, str):
+        if tag == _DATETIME_TAG and isinstance(key, str):
+            return PageCursor(
+                key=datetime.fromisoformat(key),
+                id=cursor_id,
+                order=order,
+            )
+        if tag == _FLOAT_TAG and isinstance(key, (int, float)):
+            return PageCursor(key=float(key), id=cursor_id, order=order)
+        if tag == _STR_TAG and isinstance(key, str):
+            return PageCursor(key=key, id=cursor_id, order=order)
+    raise ValueError(f"invalid cursor: {token}")
@@ -0,0 +1,37 @@
+"""一覧で返す項目の指定(fields)の解析。
+
+カンマ区切りの項目名を、ドメインの項目の集合に変換する。
+"""
+
+from enum import Enum
+
+
+def parse_fields[F: Enum](
+    value: str | None, field_type: type[F]
+) -> frozenset[F] | None:
+    """カンマ区切りの項目名を解析する。
+
+    Args:
+        value: カンマ区切りの項目名(Noneの場合はNoneを返す)
+        field_type: 項目を定義する列挙型
+
+    Returns:
+        指定された項目の集合
+
+    Raises:
+        ValueError: 項目が1つもない場合、または存在しない項目名を含む場合
+
+    """
+    if value is None:
+        return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if not names:
+        raise ValueError(f"no fields specified: {value}")
+    return frozenset(field_type(name) for name in names)
+
+
+def fields_key(fields: frozenset[Enum] | None) -> str | None:
+    """ETagの算出に使用する、指定の順序によらない項目の表現を返す。"""
+    if fields is None:
+        return None
+    return ",".join(sorted(field.value for field in fields))
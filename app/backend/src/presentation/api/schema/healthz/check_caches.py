@@ -0,0 +1,26 @@
+"""キャッシュの利用状況レスポンスのスキーマ。
+
+プロセス内のキャッシュの利用状況を確認する機能のレスポンス構造を定義する。
+"""
+
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    """キャッシュの利用状況の累計のスキーマ。"""
+
+    hits: int = Field(description="キャッシュから値を返した回数")
+    misses: int = Field(description="値がない、または古いため読み込んだ回数")
+    evictions: int = Field(
+        description="エントリ数の上限を超えたため破棄したエントリの数"
+    )
+    invalidations: int = Field(description="書き込みなどにより明示的に破棄した回数")
+
+
+class CheckCachesResponse(BaseModel):
+    """キャッシュの利用状況レスポンスのスキーマ。
+
+    値は応答したプロセスの起動からの累計で、プロセスごとに異なる。
+    """
+
+    caches: dict[str, CacheStats] = Field(description="キャッシュの名前ごとの利用状況")
@@ -0,0 +1,27 @@
+"""Todo一括更新リクエストのスキーマ。"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from src.domain.todo.bulk_update import MAX_BULK_UPDATE_SIZE, TodoBulkAction
+from src.presentation.api.schema.safe_str import SafeStr
+
+
+class BulkUpdateTodosRequest(BaseModel):
+    """Todo一括更新リクエストのスキーマ。"""
+
+    ids: Annotated[
+        list[Annotated[SafeStr, Field(min_length=1, max_length=255)]],
+        Field(
+            description="更新するTodoのID",
+            min_length=1,
+            max_length=MAX_BULK_UPDATE_SIZE,
+        ),
+    ]
+    action: Annotated[
+        TodoBulkAction,
+        Field(
+            description="complete: 完了にする, uncomplete: 未完了にする, toggle: 反転する"
+        ),
+    ]
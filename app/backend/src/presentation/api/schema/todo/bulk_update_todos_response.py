@@ -0,0 +1,12 @@
+"""Todo一括更新レスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+from src.presentation.api.schema.todo.todo import Todo
+
+
+class BulkUpdateTodosResponse(BaseModel):
+    """Todo一括更新レスポンスのスキーマ。"""
+
+    todos: list[Todo] = Field(description="更新したTodo")
+    not_found_ids: list[str] = Field(description="存在しなかったTodoのID")
@@ -0,0 +1,10 @@
+"""Todo件数取得レスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+
+class CountTodosResponse(BaseModel):
+    """Todo件数取得レスポンスのスキーマ。"""
+
+    count: int = Field(description="Todoの件数")
+    approximate: bool = Field(description="統計情報から推定した概算値の場合はtrue")
@@ -0,0 +1,11 @@
+"""Todo削除レスポンスのスキーマ。"""
+
+from pydantic import BaseModel
+
+from src.presentation.api.schema.todo.todo import Todo
+
+
+class DeleteTodoResponse(BaseModel):
+    """Todo削除レスポンスのスキーマ。"""
+
+    todo: Todo
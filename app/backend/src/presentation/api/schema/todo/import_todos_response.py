@@ -0,0 +1,20 @@
+"""Todo一括取り込みレスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+
+class ImportTodosError(BaseModel):
+    """取り込めなかった行のスキーマ。"""
+
+    line: int = Field(description="行番号(1始まり)")
+    message: str = Field(description="取り込めなかった理由")
+
+
+class ImportTodosResponse(BaseModel):
+    """Todo一括取り込みレスポンスのスキーマ。"""
+
+    imported: int = Field(description="取り込んだTodoの件数")
+    failed: int = Field(description="取り込めなかった行の件数")
+    errors: list[ImportTodosError] = Field(
+        description="取り込めなかった行(先頭から最大1000件)",
+    )
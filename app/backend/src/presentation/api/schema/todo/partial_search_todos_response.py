@@ -0,0 +1,28 @@
+"""一部の項目のみのTodo検索レスポンスのスキーマ。"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class PartialTodo(BaseModel):
+    """fieldsで指定した項目とIDのみのTodoのスキーマ。
+
+    指定されなかった項目はレスポンスに含めない。
+    """
+
+    id: str = Field(description="TodoID")
+    title: str | None = Field(default=None, description="タイトル")
+    completed: bool | None = Field(default=None, description="完了フラグ")
+    created_at: datetime | None = Field(default=None, description="作成日時")
+    updated_at: datetime | None = Field(default=None, description="更新日時")
+
+
+class PartialSearchTodosResponse(BaseModel):
+    """一部の項目のみのTodo検索レスポンスのスキーマ。"""
+
+    todos: list[PartialTodo]
+    next_cursor: str | None = Field(
+        default=None,
+        description="次のページを取得するためのカーソル(次のページがない場合はnull)",
+    )
@@ -1,6 +1,6 @@
 """Todo検索レスポンスのスキーマ。"""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.presentation.api.schema.todo.todo import Todo
 
@@ -9,3 +9,7 @@ class SearchTodosResponse(BaseModel):
     """Todo検索レスポンスのスキーマ。"""
 
     todos: list[Todo]
+    next_cursor: str | None = Field(
+        default=None,
+        description="次のページを取得するためのカーソル(次のページがない場合はnull)",
+    )
@@ -0,0 +1,9 @@
+"""Todoのタイトルの入力補完レスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+
+class SuggestTodoTitlesResponse(BaseModel):
+    """Todoのタイトルの入力補完レスポンスのスキーマ。"""
+
+    titles: list[str] = Field(description="入力中の文字列から始まるタイトルの候補")
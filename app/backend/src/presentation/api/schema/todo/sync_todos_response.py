@@ -0,0 +1,27 @@
+"""Todo差分同期レスポンスのスキーマ。"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from src.presentation.api.schema.todo.todo import Todo
+
+
+class DeletedTodo(BaseModel):
+    """削除されたTodoのスキーマ。"""
+
+    id: str = Field(description="TodoID")
+    deleted_at: datetime = Field(description="削除日時")
+
+
+class SyncTodosResponse(BaseModel):
+    """Todo差分同期レスポンスのスキーマ。"""
+
+    todos: list[Todo] = Field(description="追加・更新されたTodo")
+    deleted: list[DeletedTodo] = Field(description="削除されたTodo")
+    next_cursor: str = Field(
+        description="次回の同期でafterに指定するカーソル",
+    )
+    has_more: bool = Field(
+        description="続きの変更がある場合はtrue(next_cursorを指定して続けて取得する)",
+    )
@@ -0,0 +1,18 @@
+"""Todoの変更イベントのスキーマ。
+
+SSEのdataとして送る、Todoの変更イベントの構造を定義する。
+"""
+
+from pydantic import BaseModel, Field
+
+from src.domain.todo.event import TodoEventType
+from src.presentation.api.schema.todo.todo import Todo
+
+
+class TodoEvent(BaseModel):
+    """Todoの変更イベントのスキーマ。"""
+
+    type: TodoEventType = Field(description="変更の種類")
+    todo: Todo | None = Field(
+        description="変更後のTodo(importedの場合はnull)",
+    )
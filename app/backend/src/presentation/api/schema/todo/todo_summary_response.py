@@ -0,0 +1,14 @@
+"""Todoの件数の集計レスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+
+class TodoSummaryResponse(BaseModel):
+    """Todoの件数の集計レスポンスのスキーマ。"""
+
+    total: int = Field(description="Todoの件数")
+    completed: int = Field(description="完了済みのTodoの件数")
+    pending: int = Field(description="未完了のTodoの件数")
+    completion_rate: float = Field(
+        description="完了済みのTodoの割合(0.0〜1.0。Todoがない場合は0.0)",
+    )
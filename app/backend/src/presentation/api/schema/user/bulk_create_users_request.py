@@ -0,0 +1,34 @@
+"""ユーザー一括作成リクエストスキーマ。
+
+ユーザー一括作成APIのリクエストボディを定義する。
+"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from src.domain.user.bulk_create import MAX_BULK_CREATE_SIZE
+from src.presentation.api.schema.safe_str import SafeStr
+
+
+class BulkCreateUser(BaseModel):
+    """一括作成する1件のユーザー。
+
+    メールアドレスとユーザー名の検証は1件ごとに行い、不正な場合もリクエスト全体は拒否しない。
+    """
+
+    email: Annotated[SafeStr, Field(description="メールアドレス", max_length=255)]
+    name: Annotated[SafeStr, Field(description="ユーザー名", max_length=255)]
+
+
+class BulkCreateUsersRequest(BaseModel):
+    """ユーザー一括作成リクエスト。"""
+
+    users: Annotated[
+        list[BulkCreateUser],
+        Field(
+            description="作成するユーザー",
+            min_length=1,
+            max_length=MAX_BULK_CREATE_SIZE,
+        ),
+    ]
@@ -0,0 +1,25 @@
+"""ユーザー一括作成レスポンススキーマ。
+
+ユーザー一括作成APIのレスポンスボディを定義する。
+"""
+
+from pydantic import BaseModel, Field
+
+from src.presentation.api.schema.user.user import User
+
+
+class BulkCreateUsersError(BaseModel):
+    """作成できなかったユーザーのスキーマ。"""
+
+    index: int = Field(description="リクエストのusersでの位置(0始まり)")
+    code: str = Field(description="エラーコード")
+    message: str = Field(description="作成できなかった理由")
+
+
+class BulkCreateUsersResponse(BaseModel):
+    """ユーザー一括作成レスポンス。"""
+
+    users: list[User] = Field(description="作成したユーザー(リクエストの順)")
+    errors: list[BulkCreateUsersError] = Field(
+        description="作成できなかったユーザー(リクエストの順)",
+    )
@@ -0,0 +1,10 @@
+"""ユーザー件数取得レスポンスのスキーマ。"""
+
+from pydantic import BaseModel, Field
+
+
+class CountUsersResponse(BaseModel):
+    """ユーザー件数取得レスポンスのスキーマ。"""
+
+    count: int = Field(description="ユーザーの件数")
+    approximate: bool = Field(description="統計情報から推定した概算値の場合はtrue")
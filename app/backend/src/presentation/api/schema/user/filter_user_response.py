@@ -3,7 +3,7 @@
 ユーザー一覧取得APIのレスポンス構造を定義する。
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.presentation.api.schema.user.user import User
 
@@ -15,3 +15,7 @@ class FilterUserResponse(BaseModel):
     """
 
     users: list[User]
+    next_cursor: str | None = Field(
+        default=None,
+        description="次のページを取得するためのカーソル(次のページがない場合はnull)",
+    )
@@ -0,0 +1,24 @@
+"""ユーザー一括検索リクエストのスキーマ。
+
+ユーザー一括検索APIのリクエストボディを定義する。
+"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from src.domain.user.lookup import MAX_USER_LOOKUP_SIZE
+from src.presentation.api.schema.safe_str import SafeStr
+
+
+class FindUsersRequest(BaseModel):
+    """ユーザー一括検索リクエストのスキーマ。"""
+
+    ids: Annotated[
+        list[Annotated[SafeStr, Field(min_length=1, max_length=128)]],
+        Field(
+            description="取得するユーザーのID",
+            min_length=1,
+            max_length=MAX_USER_LOOKUP_SIZE,
+        ),
+    ]
@@ -0,0 +1,15 @@
+"""ユーザー一括検索レスポンスのスキーマ。
+
+ユーザー一括検索APIのレスポンス構造を定義する。
+"""
+
+from pydantic import BaseModel, Field
+
+from src.presentation.api.schema.user.user import User
+
+
+class FindUsersResponse(BaseModel):
+    """ユーザー一括検索レスポンスのスキーマ。"""
+
+    users: list[User] = Field(description="見つかったユーザー(指定したIDの順)")
+    not_found_ids: list[str] = Field(description="存在しなかったユーザーのID")
@@ -0,0 +1,37 @@
+"""一部の項目のみのユーザー一覧レスポンスのスキーマ。
+
+fieldsを指定したユーザー一覧取得APIのレスポンス構造を定義する。
+"""
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from src.presentation.api.schema.safe_str import SafeStr
+
+
+class PartialUser(BaseModel):
+    """fieldsで指定した項目とIDのみのユーザー情報のAPIスキーマ。
+
+    指定されなかった項目はレスポンスに含めない。
+    """
+
+    id: Annotated[SafeStr, Field(description="ユーザーID")]
+    email: Annotated[SafeStr | None, Field(description="メールアドレス")] = None
+    role: Annotated[
+        Literal["superadmin", "admin", "member"] | None,
+        Field(description="ロール"),
+    ] = None
+    name: Annotated[SafeStr | None, Field(description="ユーザー名")] = None
+    created_at: datetime | None = Field(default=None, description="作成日時")
+
+
+class PartialFilterUserResponse(BaseModel):
+    """一部の項目のみのユーザー一覧レスポンスのスキーマ。"""
+
+    users: list[PartialUser]
+    next_cursor: str | None = Field(
+        default=None,
+        description="次のページを取得するためのカーソル(次のページがない場合はnull)",
+    )
@@ -0,0 +1,61 @@
+"""Todo一括取り込みのCLI。
+
+NDJSONまたはCSVのファイルを読み込みながらTodoとして追加し、結果をJSONで出力する。
+APIと同じく1行が1件のTodoで、ファイルの大きさによらずメモリ使用量は一定となる。
+
+Usage:
+    uv run python -m src.presentation.cli.import_todos todos.ndjson
+    uv run python -m src.presentation.cli.import_todos todos.csv --import_format=csv
+"""
+
+import asyncio
+import json
+import sys
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from pathlib import Path
+
+import fire
+
+from src.dependencies import get_todo_repository, open_db_session
+from src.domain.todo.bulk_import import TodoImportFormat
+from src.infrastructure.config.database import close_db
+from src.usecase.todo.import_todos_usecase import ImportTodosUseCase
+
+# ファイルから一度に読み込むバイト数
+READ_CHUNK_BYTES = 1024 * 1024
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """ファイルをREAD_CHUNK_BYTESずつ読み込む。"""
+    with path.open("rb") as file:
+        while chunk := file.read(READ_CHUNK_BYTES):
+            yield chunk
+
+
+async def _run(path: Path, import_format: TodoImportFormat) -> None:
+    try:
+        async with open_db_session() as session:
+            usecase = ImportTodosUseCase(get_todo_repository(session))
+            result = await usecase.execute(_read_chunks(path), import_format)
+    finally:
+        await close_db()
+    sys.stdout.write(json.dumps(asdict(result), ensure_ascii=False, indent=2) + "\n")
+
+
+def main(path: str, import_format: str | None = None) -> None:
+    """ファイルのTodoを一括で取り込む。
+
+    Args:
+        path: 取り込むファイルのパス
+        import_format: ファイルの形式(ndjsonまたはcsv、省略時は拡張子から判定する)
+
+    """
+    file_path = Path(path)
+    if import_format is None:
+        import_format = "csv" if file_path.suffix.lower() == ".csv" else "ndjson"
+    asyncio.run(_run(file_path, TodoImportFormat(import_format)))
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
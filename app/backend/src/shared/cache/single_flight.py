@@ -0,0 +1,95 @@
+"""同じ読み込みの同時実行をまとめる仕組み(single-flight)。
+
+同じキーの読み込みが実行中の場合は新たに読み込まず、実行中の読み込みの結果を共有する。
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+from src.shared.cache.version_counter import VersionCounter
+
+
+@dataclass(slots=True)
+class _Call[V]:
+    """実行中の読み込み。"""
+
+    future: asyncio.Future[V]
+    # 読み込みを開始した時点の世代番号
+    version: int
+
+
+class SingleFlight[K: Hashable, V]:
+    """同じキーの読み込みの同時実行をまとめる。
+
+    最初の呼び出しのみがloaderを実行し、完了までに同じキーで呼び出された他の呼び出しは
+    その結果(または例外)を共有する。完了した結果は保持しないため、
+    結果の保持にはTtlLruCacheを併用する。
+
+    読み込みの開始後に世代番号が進んだ場合は、書き込みより前の結果を返さないよう
+    実行中の読み込みには合流せず、新たに読み込む。
+    最初の呼び出しがキャンセルされた場合は、待っていた呼び出しのうち1つが読み込み直す。
+    イベントループ上の単一スレッドで使用するため、排他制御は行わない。
+    """
+
+    def __init__(self, *, versions: VersionCounter) -> None:
+        """実行中の読み込みがない状態で初期化する。
+
+        Args:
+            versions: 読み込み対象のデータの世代番号
+
+        """
+        self._versions = versions
+        self._calls: dict[K, _Call[V]] = {}
+
+    def __len__(self) -> int:
+        """実行中の読み込みの数を返す。"""
+        return len(self._calls)
+
+    async def do(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """同じキーの読み込みが実行中であればその結果を待ち、なければ読み込む。
+
+        Args:
+            key: 読み込みのキー
+            loader: 値を読み込む関数
+
+        Returns:
+            実行中の読み込みまたはloaderから取得した値
+
+        """
+        while True:
+            call = self._calls.get(key)
+            if call is None or call.version != self._versions.value:
+                return await self._lead(key, loader)
+            try:
+                # 待っている呼び出しのキャンセルが実行中の読み込みに波及しないよう保護する
+                return await asyncio.shield(call.future)
+            except asyncio.CancelledError:
+                if not call.future.cancelled():
+                    raise
+                # 最初の呼び出しがキャンセルされたため、読み込みを引き継ぐ
+
+    async def _lead(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """loaderを実行し、結果を同じキーで待っている呼び出しに共有する。"""
+        call = _Call(
+            future=asyncio.get_running_loop().create_future(),
+            version=self._versions.value,
+        )
+        self._calls[key] = call
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except BaseException as e:
+            call.future.set_exception(e)
+            # 待っている呼び出しがない場合に、取得されなかった例外として警告されないようにする
+            call.future.exception()
+            raise
+        else:
+            call.future.set_result(value)
+            return value
+        finally:
+            # 世代番号が進んで別の読み込みに置き換わった場合は、そちらを残す
+            if self._calls.get(key) is call:
+                del self._calls[key]
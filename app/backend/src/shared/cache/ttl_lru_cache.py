@@ -0,0 +1,289 @@
+"""有効期限付きのLRUキャッシュ。
+
+読み込み結果をプロセス内に保持し、有効期限切れまたは世代番号の更新で無効化する。
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+from src.log.logger import logger
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.errors import ExpectedBusinessError, ExpectedTechnicalError
+
+
+def detached_refresh[R, V](
+    open_resource: Callable[[], AbstractAsyncContextManager[R]] | None,
+    load: Callable[[R], Awaitable[V]],
+) -> Callable[[], Awaitable[V]] | None:
+    """get_or_loadのrefreshに渡す、呼び出しごとに開いた資源で読み込む関数を作成する。
+
+    Args:
+        open_resource: 呼び出し元の資源(リクエストのセッションなど)とは別の資源を開く関数
+        load: 開いた資源で値を読み込む関数
+
+    Returns:
+        値を読み込む関数(open_resourceがNoneの場合はNone)
+
+    """
+    if open_resource is None:
+        return None
+
+    async def refresh() -> V:
+        async with open_resource() as resource:
+            return await load(resource)
+
+    return refresh
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """キャッシュの利用状況の累計。"""
+
+    # キャッシュから値を返した回数(再読み込み中の古い値を返した場合を含む)
+    hits: int = 0
+    # 値がない、または古いため読み込んだ回数
+    misses: int = 0
+    # エントリ数の上限を超えたため破棄したエントリの数
+    evictions: int = 0
+    # invalidate・invalidate_if・clearで破棄した回数
+    invalidations: int = 0
+
+
+@dataclass(slots=True)
+class _Entry[V]:
+    """キャッシュのエントリ。"""
+
+    value: V
+    # 読み込みを開始した時点の世代番号
+    version: int
+    expires_at: float
+    # 読み込みを依頼した呼び出し元が指定したデータの版
+    data_version: Hashable | None = None
+    # 再読み込み中の場合はTrue
+    refreshing: bool = False
+
+
+class TtlLruCache[K: Hashable, V]:
+    """有効期限付きのLRUキャッシュ。
+
+    エントリ数がmaxsizeを超えた場合は最も長く使われていないエントリを破棄する。
+    有効期限切れ、または世代番号が進んだエントリは古いものとして扱い、
+    最初に参照した呼び出しが再読み込みを行う。有効期限切れのみの場合は、再読み込みの
+    完了までは同時に参照した他の呼び出しに古い結果を返し(stale-while-revalidate)、
+    refreshを指定した呼び出しは再読み込みをバックグラウンドで開始し、完了を待たずに
+    古い結果を返す。世代番号が進んだ場合は書き込みより前の結果と分かっているため、
+    古い結果は返さず、同時に参照した呼び出しは書き込みの後に始めた同じ読み込みの完了を待つ。
+    呼び出し元がデータの版を指定した場合は、エントリを読み込んだ時点の版と異なれば
+    同様に古い結果は返さずに読み込み直すため、キーに版を含めずに済む。
+    ヒット・ミス・上限による破棄・明示的な破棄の回数を累計し、statsで参照できる。
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl: float,
+        versions: VersionCounter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """キャッシュを初期化する。
+
+        Args:
+            maxsize: 保持する最大エントリ数
+            ttl: エントリの有効期限(秒)
+            versions: キャッシュ対象のデータの世代番号
+                (Noneの場合は世代番号で無効化せず、有効期限とinvalidateのみで無効化する)
+            clock: 現在時刻(秒)を返す関数
+
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._versions = versions
+        self._clock = clock
+        # 呼び出しの中で行う同じキーと版の読み込みをまとめる
+        self._flights: SingleFlight[tuple[K, Hashable | None], V] = SingleFlight(
+            versions=versions or VersionCounter(),
+        )
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # invalidate・invalidate_if・clearを呼び出した回数
+        self._invalidations = 0
+        # バックグラウンドでの再読み込み(イベントループは弱参照のみを持つため、完了まで保持する)
+        self._refreshes: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """保持しているエントリ数を返す。"""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """キャッシュの利用状況の累計。"""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+    async def get_or_load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[V]],
+        *,
+        refresh: Callable[[], Awaitable[V]] | None = None,
+        data_version: Hashable | None = None,
+    ) -> V:
+        """キャッシュから値を取得し、ない場合や古い場合は読み込む。
+
+        Args:
+            key: キャッシュのキー
+            loader: 値を読み込む関数
+            refresh: 有効期限切れの値をバックグラウンドで読み込み直す関数
+                (呼び出し元の終了後も実行されるため、呼び出し元の資源を使わないこと。
+                Noneの場合はloaderで読み込み直し、完了を待つ)
+            data_version: 呼び出し元が取得したデータの版
+                (エントリを読み込んだ時点の版と異なる場合は、古い結果を返さずに読み込み直す)
+
+        Returns:
+            キャッシュまたはloaderから取得した値
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.data_version != data_version:
+            # 版が異なる結果は返さず、他の呼び出しの再読み込みとも独立に読み込む
+            entry = None
+        if entry is not None:
+            self._entries.move_to_end(key)
+            current = entry.version == self._current_version()
+            if current and self._clock() < entry.expires_at:
+                self._hits += 1
+                return entry.value
+            if entry.refreshing and current:
+                # 他の呼び出しが再読み込み中のため、完了するまでは古い結果を返す
+                self._hits += 1
+                return entry.value
+            if entry.refreshing:
+                # 世代番号が進んだため古い結果は返さず、書き込みの後に始めた読み込みに合流する
+                entry = None
+            else:
+                entry.refreshing = True
+                if current and refresh is not None:
+                    self._misses += 1
+                    self._refresh_in_background(key, entry, refresh)
+                    return entry.value
+
+        self._misses += 1
+        try:
+            return await self._flights.do(
+                (key, data_version),
+                lambda: self._load(key, loader, data_version),
+            )
+        finally:
+            if entry is not None:
+                entry.refreshing = False
+
+    def invalidate(self, key: K) -> None:
+        """keyのエントリを破棄する(エントリがない場合は何もしない)。
+
+        Args:
+            key: 破棄するエントリのキー
+
+        """
+        self._entries.pop(key, None)
+        self._invalidations += 1
+
+    def invalidate_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """predicateがTrueを返すエントリを破棄する。
+
+        キーが分からない値のエントリを破棄するためのもので、全エントリを走査する。
+
+        Args:
+            predicate: エントリのキーと値を受け取り、破棄する場合にTrueを返す関数
+
+        """
+        for key in [
+            key for key, entry in self._entries.items() if predicate(key, entry.value)
+        ]:
+            del self._entries[key]
+        self._invalidations += 1
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄する。"""
+        self._entries.clear()
+        self._invalidations += 1
+
+    async def wait_for_refreshes(self) -> None:
+        """実行中のバックグラウンドでの再読み込みが全て完了するまで待つ。"""
+        while self._refreshes:
+            await asyncio.wait(set(self._refreshes))
+
+    def _refresh_in_background(
+        self,
+        key: K,
+        entry: _Entry[V],
+        refresh: Callable[[], Awaitable[V]],
+    ) -> None:
+        """エントリの再読み込みをバックグラウンドで開始する。"""
+
+        async def run() -> None:
+            try:
+                await self._load(key, refresh, entry.data_version, replacing=entry)
+            except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+                # 古いエントリを残し、次の呼び出しが再読み込みする
+                logger.warning(
+                    "cache_refresh_failed",
+                    code=e.code,
+                    raw_message=e.raw_message,
+                )
+            finally:
+                entry.refreshing = False
+
+        task = asyncio.create_task(run())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    def _current_version(self) -> int:
+        """キャッシュ対象のデータの現在の世代番号を返す(世代番号がない場合は0)。"""
+        return 0 if self._versions is None else self._versions.value
+
+    async def _load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[V]],
+        data_version: Hashable | None,
+        *,
+        replacing: _Entry[V] | None = None,
+    ) -> V:
+        """値を読み込んでキャッシュに格納する。
+
+        replacingを指定した場合は、読み込み中にそのエントリが他の読み込みで
+        置き換えられていれば格納しない。
+        """
+        # 読み込み中に書き込みがあった場合に古い結果として扱うよう、開始時点の世代番号を記録する
+        version = self._current_version()
+        invalidations = self._invalidations
+        value = await loader()
+        if invalidations != self._invalidations:
+            # 読み込み中に破棄されたエントリは、破棄前の値の可能性があるため格納しない
+            return value
+        if replacing is not None and self._entries.get(key) is not replacing:
+            # 別の版などで読み込み直されたエントリを、古い再読み込みの結果で上書きしない
+            return value
+        self._entries[key] = _Entry(
+            value=value,
+            version=version,
+            expires_at=self._clock() + self._ttl,
+            data_version=data_version,
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return value
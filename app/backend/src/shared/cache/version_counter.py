@@ -0,0 +1,26 @@
+"""データの世代番号。
+
+キャッシュの無効化に使用する、書き込みのたびに増加する番号を定義する。
+"""
+
+
+class VersionCounter:
+    """書き込みのたびに増加する世代番号。
+
+    キャッシュは取得時の世代番号を保持し、現在の世代番号と異なる場合は
+    データが更新されたものとして扱う。
+    イベントループ上の単一スレッドで使用するため、排他制御は行わない。
+    """
+
+    def __init__(self) -> None:
+        """世代番号を0で初期化する。"""
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        """現在の世代番号。"""
+        return self._value
+
+    def bump(self) -> None:
+        """世代番号を進める。"""
+        self._value += 1
@@ -0,0 +1,101 @@
+"""プロセス内のイベント配信。
+
+1つのイベントを、プロセス内の全ての購読者に配信する仕組みを定義する。
+"""
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import cast
+
+# 購読者ごとに溜められる未読のイベントの最大件数
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+class SubscriptionOverflowError(Exception):
+    """購読者の未読のイベントが上限を超え、購読が打ち切られたことを表す例外。"""
+
+
+class Subscription[T]:
+    """Broadcasterの1つの購読。
+
+    イベントは購読ごとのキューに溜まり、getで古い順に取り出す。
+    キューのNoneは購読の打ち切りを表すため、Noneはイベントとして配信できない。
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """空のキューで購読を初期化する。"""
+        self._queue: asyncio.Queue[T | None] = asyncio.Queue(maxsize=maxsize)
+        self._overflowed = False
+
+    def offer(self, item: T) -> None:
+        """イベントを待たずにキューへ追加する。
+
+        キューが一杯の場合は、遅い購読者のために配信元が待たされたり
+        メモリが増え続けたりしないよう、溜まったイベントを破棄して購読を打ち切る。
+        """
+        if self._overflowed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            # 待機中のgetを起こし、打ち切りを伝える
+            self._queue.put_nowait(None)
+
+    async def get(self) -> T:
+        """次のイベントを取り出す。イベントがない場合は届くまで待つ。
+
+        Raises:
+            SubscriptionOverflowError: 未読のイベントが上限を超え、購読が打ち切られた場合
+
+        """
+        item = await self._queue.get()
+        if self._overflowed:
+            raise SubscriptionOverflowError
+        return cast("T", item)
+
+
+class Broadcaster[T]:
+    """イベントをプロセス内の全ての購読者に配信する。
+
+    publishは待たずに各購読者のキューへ追加するため、購読者の数や処理の速さに
+    よらず配信元が待たされることはない。
+    イベントループ上の単一スレッドで使用するため、排他制御は行わない。
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE) -> None:
+        """購読者のいない状態で初期化する。
+
+        Args:
+            queue_size: 購読者ごとに溜められる未読のイベントの最大件数
+
+        """
+        self._queue_size = queue_size
+        self._subscriptions: set[Subscription[T]] = set()
+
+    def __len__(self) -> int:
+        """現在の購読者の数を返す。"""
+        return len(self._subscriptions)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription[T]]:
+        """購読を開始し、ブロックを抜けると購読を終了する。
+
+        Yields:
+            購読開始後に配信されたイベントを受け取る購読
+
+        """
+        subscription: Subscription[T] = Subscription(self._queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, item: T) -> None:
+        """イベントを全ての購読者に配信する。"""
+        for subscription in self._subscriptions:
+            subscription.offer(item)
@@ -0,0 +1,50 @@
+"""Todo一括更新ユースケース。
+
+指定したIDのTodoの完了フラグを一括で更新する。
+"""
+
+from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class BulkUpdateTodosUseCase:
+    """Todo一括更新ユースケース。"""
+
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """ユースケースを初期化する。"""
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        todo_ids: list[TodoId],
+        action: TodoBulkAction,
+    ) -> TodoBulkUpdateResult:
+        """指定したIDのTodoの完了フラグを一括で更新する。
+
+        Args:
+            todo_ids: 更新するTodoのID
+            action: 更新の操作
+
+        Returns:
+            更新したTodoと、存在しなかったTodoのID
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            return await self.todo_repository.bulk_update(todo_ids, action)
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
@@ -0,0 +1,63 @@
+"""Todoの件数取得ユースケース。
+
+Todoの件数を、正確な値または統計情報から推定した概算値で取得する。
+"""
+
+from src.domain.count import Count
+from src.domain.todo.repository import TodoRepository
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class CountTodosUseCase:
+    """Todoの件数取得ユースケース。"""
+
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            todo_repository: Todoリポジトリ
+
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        *,
+        completed: bool | None = None,
+        approximate: bool = False,
+    ) -> Count:
+        """Todoの件数を取得する。
+
+        概算値は完了フラグで絞り込まない場合のみ求め、統計情報から推定できない場合や
+        完了フラグで絞り込む場合は正確な件数を返す。
+
+        Args:
+            completed: 完了フラグ(Noneの場合は絞り込まない)
+            approximate: 統計情報から推定した概算値でよい場合はTrue
+
+        Returns:
+            Todoの件数
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            if approximate and completed is None:
+                estimate = await self.todo_repository.estimate_count()
+                if estimate is not None:
+                    return Count(value=estimate, approximate=True)
+            count = await self.todo_repository.count(completed=completed)
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+        return Count(value=count, approximate=False)
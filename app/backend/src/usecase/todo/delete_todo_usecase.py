@@ -0,0 +1,45 @@
+"""Todo削除ユースケース。
+
+指定IDのTodoを論理削除する。
+"""
+
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.todo import Todo
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class DeleteTodoUseCase:
+    """Todo削除ユースケース。"""
+
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """ユースケースを初期化する。"""
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Todoを論理削除する。
+
+        Args:
+            todo_id: 削除するTodoのID
+
+        Returns:
+            削除されたTodo
+
+        Raises:
+            ExpectedUseCaseError: Todoが見つからない場合
+
+        """
+        try:
+            return await self.todo_repository.delete(todo_id)
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
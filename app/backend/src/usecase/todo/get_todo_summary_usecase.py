@@ -0,0 +1,46 @@
+"""Todoの件数の集計取得ユースケース。
+
+Todoの総数・完了・未完了の件数と完了率を取得する。
+"""
+
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.summary import TodoSummary
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class GetTodoSummaryUseCase:
+    """Todoの件数の集計取得ユースケース。"""
+
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            todo_repository: Todoリポジトリ
+
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self) -> TodoSummary:
+        """論理削除されていないTodoの、完了・未完了ごとの件数を取得する。
+
+        Returns:
+            Todoの件数の集計
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            return await self.todo_repository.summarize()
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
@@ -0,0 +1,69 @@
+"""Todoのデータの版の取得ユースケース。
+
+条件付き取得(ETag)の判定に使用する、Todo全体のデータの版を取得する。
+"""
+
+from src.domain.data_version import DataVersion
+from src.domain.todo.repository import TodoRepository, TodoRepositoryOpener
+from src.log.logger import logger
+from src.shared.cache.ttl_lru_cache import TtlLruCache, detached_refresh
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+# データの版のキャッシュのキー(Todo全体で1つの版を持つ)
+_CACHE_KEY = "todos"
+
+
+class GetTodosDataVersionUseCase:
+    """Todoのデータの版の取得ユースケース。"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        cache: TtlLruCache[str, DataVersion] | None = None,
+        open_repository: TodoRepositoryOpener | None = None,
+    ) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            todo_repository: Todoリポジトリ
+            cache: データの版のキャッシュ(Noneの場合はキャッシュしない)
+            open_repository: 有効期限切れの版をバックグラウンドで取得し直すための
+                リポジトリを開く関数(Noneの場合は呼び出しの中で取得し直す)
+
+        """
+        self.todo_repository = todo_repository
+        self.cache = cache
+        self.open_repository = open_repository
+
+    async def execute(self) -> DataVersion:
+        """Todo全体のデータの版を取得する。
+
+        Returns:
+            Todo全体のデータの版
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            if self.cache is None:
+                return await self.todo_repository.data_version()
+            return await self.cache.get_or_load(
+                _CACHE_KEY,
+                self.todo_repository.data_version,
+                refresh=detached_refresh(
+                    self.open_repository,
+                    lambda repository: repository.data_version(),
+                ),
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
@@ -0,0 +1,276 @@
+"""Todo一括取り込みユースケース。
+
+NDJSONまたはCSVのデータを1行ずつTodoエンティティとして検証し、チャンク単位で追加する。
+"""
+
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from src.domain.todo.bulk_import import (
+    MAX_REPORTED_IMPORT_ERRORS,
+    TodoImportError,
+    TodoImportFormat,
+    TodoImportResult,
+)
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.todo import Todo
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+# 1回の追加にまとめる行数
+IMPORT_CHUNK_SIZE = 5000
+
+# 1行の最大バイト数(改行のない巨大な入力でメモリが増え続けないよう制限する)
+MAX_IMPORT_LINE_BYTES = 64 * 1024
+
+# TodoIDの最大長(todosテーブルのidカラムの長さと一致させる)
+_MAX_TODO_ID_LENGTH = 255
+
+_TRUE_VALUES = frozenset({"true", "1"})
+_FALSE_VALUES = frozenset({"false", "0"})
+
+type _Record = dict[str, object]
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes | None]:
+    """バイト列のチャンクを行に分割する。
+
+    MAX_IMPORT_LINE_BYTESを超える行は読み捨て、代わりにNoneを返す。
+    """
+    buffer = b""
+    oversized = False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield None if oversized or len(line) > MAX_IMPORT_LINE_BYTES else line
+            oversized = False
+        if len(buffer) > MAX_IMPORT_LINE_BYTES:
+            buffer = b""
+            oversized = True
+    if oversized:
+        yield None
+    elif buffer:
+        yield buffer
+
+
+def _parse_ndjson(line: str) -> _Record | None:
+    """NDJSONの1行を解析する。空行の場合はNoneを返す。"""
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e.msg}") from e
+    if not isinstance(record, dict):
+        raise TypeError("record must be a JSON object")
+    return record
+
+
+class _CsvParser:
+    """CSVの行を1行目のヘッダーをキーとする辞書に変換する。"""
+
+    def __init__(self) -> None:
+        """パーサーを初期化する。"""
+        self._header: list[str] | None = None
+
+    def __call__(self, line: str) -> _Record | None:
+        """CSVの1行を解析する。ヘッダー行・空行の場合はNoneを返す。
+
+        値は1行で完結している必要がある(引用符内の改行には対応しない)。
+        """
+        if not line.strip():
+            return None
+        try:
+            values = next(csv.reader([line]))
+        except csv.Error as e:
+            raise ValueError(f"invalid CSV: {e}") from e
+        if self._header is None:
+            self._header = [name.strip() for name in values]
+            return None
+        if len(values) != len(self._header):
+            raise ValueError(
+                f"expected {len(self._header)} columns, got {len(values)}",
+            )
+        # 空の列は省略されたものとして扱う(タイトルは空でも検証させる)
+        return {
+            name: value
+            for name, value in zip(self._header, values, strict=True)
+            if value or name == "title"
+        }
+
+
+def _parse_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value.strip().lower() in _TRUE_VALUES:
+            return True
+        if value.strip().lower() in _FALSE_VALUES:
+            return False
+    raise ValueError(f"completed must be a boolean, completed: {value!r}")
+
+
+def _parse_datetime(name: str, value: object) -> datetime:
+    if not isinstance(value, str):
+        raise TypeError(f"{name} must be an ISO 8601 string, {name}: {value!r}")
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError(f"{name} must be an ISO 8601 string, {name}: {value!r}") from e
+    # タイムゾーンのない日時はUTCとみなす
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _to_todo(record: _Record) -> Todo:
+    """取り込む1件のデータをTodoエンティティに変換する。
+
+    Raises:
+        TypeError: 項目の型が不正な場合
+        ValueError: 項目の値がTodoとして不正な場合
+
+    """
+    title = record.get("title")
+    if not isinstance(title, str):
+        raise TypeError("title is required")
+    # 省略された項目のみエンティティの既定値で補う
+    fields: dict[str, Any] = {
+        "title": title,
+        "completed": _parse_bool(record.get("completed", False)),
+    }
+    if (todo_id := record.get("id")) is not None:
+        if (
+            not isinstance(todo_id, str)
+            or not todo_id
+            or len(todo_id) > _MAX_TODO_ID_LENGTH
+            or "\x00" in todo_id
+        ):
+            raise ValueError(
+                f"id must be a string of 1 to {_MAX_TODO_ID_LENGTH} characters"
+            )
+        fields["id"] = TodoId(value=todo_id)
+    if (created_at := record.get("created_at")) is not None:
+        fields["created_at"] = _parse_datetime("created_at", created_at)
+    # 更新日時は取り込んだ時刻とするため、updated_atは読み込まない(リポジトリが設定する)
+    return Todo(**fields)
+
+
+class _ImportReport:
+    """取り込みの件数と行ごとのエラーを集計する。"""
+
+    def __init__(self) -> None:
+        """集計を初期化する。"""
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[TodoImportError] = []
+
+    def fail(self, line: int, message: str) -> None:
+        """取り込めなかった行を記録する。"""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_IMPORT_ERRORS:
+            self.errors.append(TodoImportError(line=line, message=message))
+
+    def to_result(self) -> TodoImportResult:
+        """集計結果を返す。"""
+        return TodoImportResult(
+            imported=self.imported,
+            failed=self.failed,
+            errors=self.errors,
+        )
+
+
+class ImportTodosUseCase:
+    """Todo一括取り込みユースケース。"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> None:
+        """ユースケースを初期化する。"""
+        self.todo_repository = todo_repository
+        self.chunk_size = chunk_size
+
+    async def execute(
+        self,
+        chunks: AsyncIterable[bytes],
+        import_format: TodoImportFormat,
+    ) -> TodoImportResult:
+        """データを1行ずつ検証し、chunk_size件ずつTodoとして追加する。
+
+        不正な行は取り込まずにエラーとして記録し、残りの行の取り込みを続ける。
+        保持するのは1チャンク分の行のみのため、入力の大きさによらずメモリ使用量は一定となる。
+
+        Args:
+            chunks: UTF-8でエンコードされた入力データ(任意の位置で分割されていてよい)
+            import_format: 入力データの形式
+
+        Returns:
+            取り込んだ件数と、取り込めなかった行のエラー
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        parse: Callable[[str], _Record | None] = (
+            _CsvParser() if import_format == TodoImportFormat.CSV else _parse_ndjson
+        )
+        report = _ImportReport()
+        # 追加待ちのTodo(ID -> (行番号, Todo))
+        pending: dict[str, tuple[int, Todo]] = {}
+        line_number = 0
+        async for line in _iter_lines(chunks):
+            line_number += 1
+            if line is None:
+                report.fail(line_number, f"line exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+                continue
+            try:
+                record = parse(line.decode().removesuffix("\r"))
+                if record is None:
+                    continue
+                todo = _to_todo(record)
+            except (TypeError, ValueError) as e:
+                report.fail(line_number, str(e))
+                continue
+            if todo.id.value in pending:
+                report.fail(line_number, f"duplicate id, id: {todo.id.value}")
+                continue
+            pending[todo.id.value] = (line_number, todo)
+            if len(pending) >= self.chunk_size:
+                await self._flush(pending, report)
+                pending = {}
+        await self._flush(pending, report)
+        return report.to_result()
+
+    async def _flush(
+        self,
+        pending: dict[str, tuple[int, Todo]],
+        report: _ImportReport,
+    ) -> None:
+        """追加待ちのTodoをまとめて追加し、結果を集計する。"""
+        if not pending:
+            return
+        try:
+            result = await self.todo_repository.bulk_insert(
+                [todo for _, todo in pending.values()],
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+
+        report.imported += len(pending) - len(result.conflicted_ids)
+        for todo_id in result.conflicted_ids:
+            line, _ = pending[todo_id.value]
+            report.fail(line, f"id already exists, id: {todo_id.value}")
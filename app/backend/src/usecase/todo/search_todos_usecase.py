@@ -1,11 +1,188 @@
-from src.domain.todo.repository import TodoRepository
+"""Todo検索ユースケース。
+
+タイトルでTodoを検索する。
+"""
+
+from dataclasses import replace
+
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.repository import TodoRepository, TodoRepositoryOpener
+from src.domain.todo.search_condition import TodoSearchCondition, TodoSearchMode
 from src.domain.todo.todo import Todo
+from src.log.logger import logger
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.ttl_lru_cache import TtlLruCache, detached_refresh
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+def _normalize(condition: TodoSearchCondition) -> TodoSearchCondition:
+    """同じ検索結果となる検索条件を1つのキャッシュのキーにまとめるよう正規化する。
+
+    部分一致検索は大文字・小文字を区別しないため、クエリを小文字に揃える。
+    全文検索は大文字の"OR"を演算子として扱うため、クエリをそのまま使用する。
+    """
+    if condition.mode == TodoSearchMode.SUBSTRING:
+        return replace(condition, query=condition.query.lower())
+    return condition
+
+
+# 検索結果のキャッシュのキー(正規化した検索条件)
+# データの版はキーに含めず、エントリを検索した時点の版と比べて古いかを判定する
+type SearchTodosCacheKey = TodoSearchCondition
+
+# 一部の項目のみの検索結果のキャッシュのキー(正規化した検索条件と項目)
+type SearchTodoProjectionsCacheKey = tuple[TodoSearchCondition, frozenset[TodoField]]
 
 
 class SearchTodosUseCase:
+    """Todo検索ユースケース。"""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        todo_repository: TodoRepository,
+        *,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]] | None = None,
+        projection_cache: TtlLruCache[
+            SearchTodoProjectionsCacheKey,
+            Page[TodoProjection],
+        ]
+        | None = None,
+        single_flight: SingleFlight[SearchTodosCacheKey, Page[Todo]] | None = None,
+        projection_single_flight: SingleFlight[
+            SearchTodoProjectionsCacheKey,
+            Page[TodoProjection],
+        ]
+        | None = None,
+        open_repository: TodoRepositoryOpener | None = None,
+    ) -> None:
+        """ユースケースを初期化する。
 
-    def __init__(self, todo_repository: TodoRepository) -> None:
+        Args:
+            todo_repository: Todoリポジトリ
+            cache: 検索結果のキャッシュ(Noneの場合はキャッシュしない)
+            projection_cache: 一部の項目のみの検索結果のキャッシュ(Noneの場合はキャッシュしない)
+            single_flight: 同じ検索の同時実行をまとめる仕組み(Noneの場合はまとめない)
+            projection_single_flight: 一部の項目のみの同じ検索の同時実行をまとめる仕組み
+                (Noneの場合はまとめない)
+            open_repository: 有効期限切れの検索結果をバックグラウンドで再検索するための
+                リポジトリを開く関数(Noneの場合は呼び出しの中で再検索する)
+
+        """
         self.todo_repository = todo_repository
+        self.cache = cache
+        self.projection_cache = projection_cache
+        self.single_flight = single_flight
+        self.projection_single_flight = projection_single_flight
+        self.open_repository = open_repository
+
+    async def execute(
+        self,
+        condition: TodoSearchCondition,
+        version: DataVersion | None = None,
+    ) -> Page[Todo]:
+        """条件に一致するTodoを1ページ分検索する。
+
+        キャッシュが設定されている場合は、正規化した検索条件をキーとして検索結果を
+        キャッシュする。データの版を指定した場合は、別の版でキャッシュした検索結果は
+        返さずに再検索するため、版から求めたETagと結果が食い違わない。
+        書き込みのたびにキーが増えることはなく、条件ごとのエントリを置き換える。
+        同時実行をまとめる仕組みが設定されている場合は、キャッシュにない同じ検索が
+        同時に行われてもデータベースへの検索は1回のみとし、結果を共有する。
+        リポジトリを開く関数が設定されている場合は、有効期限切れの検索結果を返しつつ
+        バックグラウンドで再検索する(再検索も同時実行をまとめる仕組みを通す)。
+
+        Args:
+            condition: 検索条件
+            version: 検索の直前に取得したTodo全体のデータの版
+
+        Returns:
+            検索条件に一致したTodoのページ
+
+        Raises:
+            ExpectedUseCaseError: カーソルが不正な場合
+
+        """
+        normalized = _normalize(condition)
+        key = normalized
+
+        async def search(repository: TodoRepository) -> Page[Todo]:
+            if self.single_flight is None:
+                return await repository.search(normalized)
+            return await self.single_flight.do(
+                key,
+                lambda: repository.search(normalized),
+            )
+
+        try:
+            if self.cache is None:
+                return await search(self.todo_repository)
+            return await self.cache.get_or_load(
+                key,
+                lambda: search(self.todo_repository),
+                refresh=detached_refresh(self.open_repository, search),
+                data_version=version,
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+
+    async def execute_projection(
+        self,
+        condition: TodoSearchCondition,
+        fields: frozenset[TodoField],
+        version: DataVersion | None = None,
+    ) -> Page[TodoProjection]:
+        """条件に一致するTodoを1ページ分検索し、fieldsの項目とIDのみを返す。
+
+        キャッシュと同時実行のまとめは、正規化した検索条件と項目をキーとし、
+        データの版はexecuteと同様に古いかの判定に使用する。
+
+        Args:
+            condition: 検索条件
+            fields: 返す項目
+            version: 検索の直前に取得したTodo全体のデータの版
+
+        Returns:
+            検索条件に一致したTodoの一部の項目のページ
+
+        Raises:
+            ExpectedUseCaseError: カーソルが不正な場合
+
+        """
+        normalized = _normalize(condition)
+        key = (normalized, fields)
+
+        async def search(repository: TodoRepository) -> Page[TodoProjection]:
+            if self.projection_single_flight is None:
+                return await repository.search_projection(normalized, fields)
+            return await self.projection_single_flight.do(
+                key,
+                lambda: repository.search_projection(normalized, fields),
+            )
 
-    async def execute(self, query: str) -> list[Todo]:
-        return await self.todo_repository.search(query)
+        try:
+            if self.projection_cache is None:
+                return await search(self.todo_repository)
+            return await self.projection_cache.get_or_load(
+                key,
+                lambda: search(self.todo_repository),
+                refresh=detached_refresh(self.open_repository, search),
+                data_version=version,
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
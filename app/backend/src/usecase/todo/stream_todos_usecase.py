@@ -0,0 +1,49 @@
+"""Todoストリーミング取得ユースケース。
+
+条件に一致するTodoを全件、1件ずつ取得する。
+"""
+
+from collections.abc import AsyncIterator
+
+from src.domain.pagination import SortDirection
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import TodoSearchMode, TodoSortKey
+from src.domain.todo.todo import Todo
+
+
+class StreamTodosUseCase:
+    """Todoストリーミング取得ユースケース。"""
+
+    def __init__(self, todo_repository: TodoRepository) -> None:
+        """ユースケースを初期化する。"""
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        query: str,
+        mode: TodoSearchMode,
+        completed: bool | None = None,
+        sort: TodoSortKey | None = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> AsyncIterator[Todo]:
+        """条件に一致するTodoを全件、1件ずつ返す。
+
+        Args:
+            query: 検索クエリ(空の場合は全件)
+            mode: 検索方式
+            completed: 完了フラグによる絞り込み(Noneの場合は絞り込まない)
+            sort: 並び替えキー(Noneの場合は検索と同じ既定の並び順)
+            direction: 並び替えの向き
+
+        Yields:
+            検索と同じ順に並んだTodo
+
+        """
+        async for todo in self.todo_repository.stream(
+            query,
+            mode,
+            completed,
+            sort,
+            direction,
+        ):
+            yield todo
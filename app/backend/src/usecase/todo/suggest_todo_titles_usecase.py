@@ -0,0 +1,82 @@
+"""Todoのタイトルの入力補完ユースケース。
+
+入力中の文字列から始まるTodoのタイトルの候補を取得する。
+"""
+
+from src.domain.todo.repository import TodoRepository, TodoRepositoryOpener
+from src.domain.todo.search_text import normalize_search_text
+from src.domain.todo.title_suggestion import DEFAULT_TITLE_SUGGESTION_LIMIT
+from src.log.logger import logger
+from src.shared.cache.ttl_lru_cache import TtlLruCache, detached_refresh
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+# 候補のキャッシュのキー(正規化した入力中の文字列、候補の件数)
+type SuggestTodoTitlesCacheKey = tuple[str, int]
+
+
+class SuggestTodoTitlesUseCase:
+    """Todoのタイトルの入力補完ユースケース。"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        cache: TtlLruCache[SuggestTodoTitlesCacheKey, list[str]] | None = None,
+        open_repository: TodoRepositoryOpener | None = None,
+    ) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            todo_repository: Todoリポジトリ
+            cache: 候補のキャッシュ(Noneの場合はキャッシュしない)
+            open_repository: 有効期限切れの候補をバックグラウンドで取得し直すための
+                リポジトリを開く関数(Noneの場合は呼び出しの中で取得し直す)
+
+        """
+        self.todo_repository = todo_repository
+        self.cache = cache
+        self.open_repository = open_repository
+
+    async def execute(
+        self,
+        prefix: str,
+        limit: int = DEFAULT_TITLE_SUGGESTION_LIMIT,
+    ) -> list[str]:
+        """タイトルがprefixで始まるTodoのタイトルを、タイトル順にlimit件取得する。
+
+        入力のたびに呼び出され、同じ文字列が多くの利用者から繰り返し入力されるため、
+        キャッシュが設定されている場合は正規化した文字列と件数をキーとして候補をキャッシュする。
+
+        Args:
+            prefix: 入力中の文字列
+            limit: 候補の件数
+
+        Returns:
+            タイトルの候補(正規化すると同じになるタイトルは1件にまとめる)
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        normalized = normalize_search_text(prefix)
+        try:
+            if self.cache is None:
+                return await self.todo_repository.suggest_titles(normalized, limit)
+            return await self.cache.get_or_load(
+                (normalized, limit),
+                lambda: self.todo_repository.suggest_titles(normalized, limit),
+                refresh=detached_refresh(
+                    self.open_repository,
+                    lambda repository: repository.suggest_titles(normalized, limit),
+                ),
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
@@ -0,0 +1,86 @@
+"""Todo差分同期ユースケース。
+
+前回の同期以降に追加・更新・削除されたTodoのみを返す。
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from src.domain.pagination import PageCursor
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.sync import SYNC_ORDER, SYNC_SETTLE_INTERVAL, TodoChanges
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+def since_cursor(updated_since: datetime) -> PageCursor:
+    """指定日時以降の変更を取得するための同期の開始位置を返す。
+
+    IDは空文字より後ろに並ぶため、更新日時がupdated_since以降の全ての変更が対象となる。
+    """
+    return PageCursor(key=updated_since, id="", order=SYNC_ORDER)
+
+
+class SyncTodosUseCase:
+    """Todo差分同期ユースケース。"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """ユースケースを初期化する。"""
+        self.todo_repository = todo_repository
+        self.clock = clock
+
+    async def execute(self, after: PageCursor, limit: int) -> TodoChanges:
+        """afterより後に変更されたTodoを、更新日時順にlimit件まで返す。
+
+        続きの変更がある場合は最後に返した変更の位置を再開位置とする。
+        最後のページでは、更新日時がSYNC_SETTLE_INTERVALより新しい変更の手前を
+        再開位置とし、コミットが遅れた変更を次回の同期で取りこぼさないようにする
+        (その範囲の変更は次回も重複して返る)。
+
+        Args:
+            after: 同期の開始位置(前回の再開位置、またはsince_cursorで求めた位置)
+            limit: 1回に返す最大件数
+
+        Returns:
+            変更されたTodo(削除済みを含む)と次回の再開位置
+
+        Raises:
+            ExpectedUseCaseError: 開始位置が不正な場合、または技術エラーが発生した場合
+
+        """
+        try:
+            page = await self.todo_repository.changes(after, limit)
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+
+        if page.next_cursor is not None:
+            return TodoChanges(
+                items=page.items,
+                resume_cursor=page.next_cursor,
+                has_more=True,
+            )
+        resume = after
+        if page.items:
+            last = page.items[-1]
+            resume = PageCursor(
+                key=last.updated_at,
+                id=last.id.value,
+                order=SYNC_ORDER,
+            )
+        settled = since_cursor(self.clock() - SYNC_SETTLE_INTERVAL)
+        if (resume.key, resume.id) > (settled.key, settled.id):
+            resume = settled
+        return TodoChanges(items=page.items, resume_cursor=resume, has_more=False)
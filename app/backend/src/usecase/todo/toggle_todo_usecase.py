@@ -35,9 +35,7 @@ class ToggleTodoUseCase:
 
         """
         try:
-            todo = await self.todo_repository.find_by_id(todo_id)
-            todo.toggle()
-            return await self.todo_repository.save(todo)
+            return await self.todo_repository.toggle(todo_id)
         except (ExpectedBusinessError, ExpectedTechnicalError) as e:
             logger.info(
                 e.code,
@@ -0,0 +1,112 @@
+"""ユーザー一括作成ユースケース。
+
+入力ごとにユーザーを検証し、検証できたユーザーを1回の追加でまとめて作成する。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.user.bulk_create import (
+    UserBulkCreateError,
+    UserBulkCreateErrorReason,
+    UserBulkCreateResult,
+)
+from src.domain.user.email_address import EmailAddress
+from src.domain.user.name import UserName
+from src.domain.user.user import User
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.domain.user.repository import UserRepository
+    from src.presentation.api.schema.user.bulk_create_users_request import (
+        BulkCreateUser,
+    )
+
+
+class BulkCreateUsersUseCase:
+    """ユーザー一括作成ユースケース。
+
+    不正な値の入力とメールアドレスが既に存在する入力は作成せず、
+    入力の位置とともにエラーとして返す。
+    """
+
+    def __init__(self, user_repository: UserRepository) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            user_repository: ユーザーリポジトリ
+
+        """
+        self._user_repository = user_repository
+
+    async def execute(self, requests: Sequence[BulkCreateUser]) -> UserBulkCreateResult:
+        """ユーザーをまとめて作成する。
+
+        Args:
+            requests: 作成するユーザー
+
+        Returns:
+            作成したユーザーと、作成できなかった入力ごとのエラー(いずれも入力の順)
+
+        Raises:
+            ExpectedUseCaseError: 技術エラーが発生した場合
+
+        """
+        users: list[tuple[int, User]] = []
+        errors: list[UserBulkCreateError] = []
+        for index, request in enumerate(requests):
+            try:
+                user = User(
+                    email=EmailAddress(value=request.email),
+                    name=UserName(value=request.name),
+                )
+            except (ValueError, TypeError) as e:
+                errors.append(
+                    UserBulkCreateError(
+                        index=index,
+                        reason=UserBulkCreateErrorReason.INVALID_VALUE,
+                        message=str(e),
+                    ),
+                )
+            else:
+                users.append((index, user))
+
+        try:
+            duplicate_ids = set(
+                await self._user_repository.bulk_insert([user for _, user in users]),
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                "ユーザー一括作成に失敗しました",
+                error_code=e.code.value,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+
+        created: list[User] = []
+        for index, user in users:
+            if user.id in duplicate_ids:
+                errors.append(
+                    UserBulkCreateError(
+                        index=index,
+                        reason=UserBulkCreateErrorReason.EMAIL_ALREADY_EXISTS,
+                        message=f"email already exists, email: {user.email.value}",
+                    ),
+                )
+            else:
+                created.append(user)
+        errors.sort(key=lambda error: error.index)
+
+        logger.info(
+            "ユーザー一括作成完了",
+            created=len(created),
+            failed=len(errors),
+        )
+        return UserBulkCreateResult(created=created, errors=errors)
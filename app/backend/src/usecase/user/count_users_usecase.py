@@ -0,0 +1,56 @@
+"""ユーザーの件数取得ユースケース。
+
+ユーザーの件数を、正確な値または統計情報から推定した概算値で取得する。
+"""
+
+from src.domain.count import Count
+from src.domain.user.repository import UserRepository
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class CountUsersUseCase:
+    """ユーザーの件数取得ユースケース。"""
+
+    def __init__(self, user_repository: UserRepository) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            user_repository: ユーザーリポジトリ
+
+        """
+        self.user_repository = user_repository
+
+    async def execute(self, *, approximate: bool = False) -> Count:
+        """ユーザーの件数を取得する。
+
+        統計情報から推定できない場合は、approximateの指定によらず正確な件数を返す。
+
+        Args:
+            approximate: 統計情報から推定した概算値でよい場合はTrue
+
+        Returns:
+            ユーザーの件数
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            if approximate:
+                estimate = await self.user_repository.estimate_count()
+                if estimate is not None:
+                    return Count(value=estimate, approximate=True)
+            count = await self.user_repository.count()
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+        return Count(value=count, approximate=False)
@@ -39,6 +39,8 @@ class DeleteUserUseCase:
     ) -> None:
         """ユーザーを削除する。
 
+        存在の確認は削除と同時にリポジトリで行い、事前に検索しない。
+
         Args:
             user_id: 削除するユーザーID
 
@@ -47,8 +49,7 @@ class DeleteUserUseCase:
 
         """
         try:
-            user = await self.user_repository.find_by_id(user_id)
-            await self.user_repository.delete(user_id=user.id)
+            await self.user_repository.delete(user_id=user_id)
         except (ExpectedBusinessError, ExpectedTechnicalError) as e:
             logger.info(
                 e.code,
@@ -3,15 +3,24 @@
 すべてのユーザーを取得するビジネスロジックを実装する。
 """
 
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, PageCursor
+from src.domain.user.projection import UserField, UserProjection
 from src.domain.user.repository import UserRepository
 from src.domain.user.user import User
 from src.log.logger import logger
+from src.shared.cache.single_flight import SingleFlight
 from src.shared.errors.errors import (
     ExpectedBusinessError,
     ExpectedTechnicalError,
     ExpectedUseCaseError,
 )
 
+# 同時実行をまとめる一覧取得のキー(1ページの件数、直前のページのカーソル)
+type FilterUserKey = tuple[int, PageCursor | None]
+
+# 同時実行をまとめる一部の項目のみの一覧取得のキー(項目、1ページの件数、直前のページのカーソル)
+type FilterUserProjectionKey = tuple[frozenset[UserField], int, PageCursor | None]
+
 
 class FilterUserUseCase:
     """ユーザー一覧取得ユースケース。
@@ -19,27 +28,102 @@ class FilterUserUseCase:
     すべてのユーザーを取得するビジネスロジックを実装する。
     """
 
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        single_flight: SingleFlight[FilterUserKey, Page[User]] | None = None,
+        projection_single_flight: SingleFlight[
+            FilterUserProjectionKey,
+            Page[UserProjection],
+        ]
+        | None = None,
+    ) -> None:
         """ユースケースを初期化する。
 
         Args:
             user_repository: ユーザーリポジトリ
+            single_flight: 同じ一覧取得の同時実行をまとめる仕組み(Noneの場合はまとめない)
+            projection_single_flight: 一部の項目のみの同じ一覧取得の同時実行を
+                まとめる仕組み(Noneの場合はまとめない)
 
         """
         self.user_repository = user_repository
+        self.single_flight = single_flight
+        self.projection_single_flight = projection_single_flight
+
+    async def execute(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: PageCursor | None = None,
+    ) -> Page[User]:
+        """ユーザーを作成日時順に1ページ分取得する。
+
+        同時実行をまとめる仕組みが設定されている場合は、同じページの取得が
+        同時に行われてもデータベースからの取得は1回のみとし、結果を共有する。
+
+        Args:
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
+
+        Returns:
+            ユーザーのページ(ユーザーがいない場合は空のページ)
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            if self.single_flight is None:
+                page = await self.user_repository.filter(limit=limit, after=after)
+            else:
+                page = await self.single_flight.do(
+                    (limit, after),
+                    lambda: self.user_repository.filter(limit=limit, after=after),
+                )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
+        return page
 
-    async def execute(self) -> list[User]:
-        """すべてのユーザーを取得する。
+    async def execute_projection(
+        self,
+        fields: frozenset[UserField],
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: PageCursor | None = None,
+    ) -> Page[UserProjection]:
+        """ユーザーを作成日時順に1ページ分取得し、fieldsの項目とIDのみを返す。
+
+        Args:
+            fields: 返す項目
+            limit: 1ページの件数
+            after: 直前のページのカーソル(Noneの場合は先頭ページ)
 
         Returns:
-            ユーザーのリスト(ユーザーがいない場合は空リスト)
+            ユーザーの一部の項目のページ
 
         Raises:
             ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
 
         """
         try:
-            users = await self.user_repository.filter()
+            if self.projection_single_flight is None:
+                return await self.user_repository.filter_projection(
+                    fields,
+                    limit=limit,
+                    after=after,
+                )
+            return await self.projection_single_flight.do(
+                (fields, limit, after),
+                lambda: self.user_repository.filter_projection(
+                    fields,
+                    limit=limit,
+                    after=after,
+                ),
+            )
         except (ExpectedBusinessError, ExpectedTechnicalError) as e:
             logger.info(
                 e.code,
@@ -47,4 +131,3 @@ class FilterUserUseCase:
                 details=e.details,
             )
             raise ExpectedUseCaseError(code=e.code, details=e.details) from e
-        return users
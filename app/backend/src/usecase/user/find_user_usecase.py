@@ -7,6 +7,7 @@ from src.domain.user.id import UserId
 from src.domain.user.repository import UserRepository
 from src.domain.user.user import User
 from src.log.logger import logger
+from src.shared.cache.single_flight import SingleFlight
 from src.shared.errors.errors import (
     ExpectedBusinessError,
     ExpectedTechnicalError,
@@ -20,18 +21,28 @@ class FindUserUseCase:
     IDでユーザーを検索するビジネスロジックを実装する。
     """
 
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        single_flight: SingleFlight[UserId, User] | None = None,
+    ) -> None:
         """ユースケースを初期化する。
 
         Args:
             user_repository: ユーザーリポジトリ
+            single_flight: 同じユーザーの検索の同時実行をまとめる仕組み
+                (Noneの場合はまとめない)
 
         """
         self.user_repository = user_repository
+        self.single_flight = single_flight
 
     async def execute(self, user_id: UserId) -> User:
         """ユーザーを検索する。
 
+        同時実行をまとめる仕組みが設定されている場合は、同じユーザーの検索が
+        同時に行われてもデータベースの検索は1回のみとし、結果を共有する。
+
         Args:
             user_id: 検索するユーザーID
 
@@ -43,7 +54,12 @@ class FindUserUseCase:
 
         """
         try:
-            return await self.user_repository.find_by_id(user_id)
+            if self.single_flight is None:
+                return await self.user_repository.find_by_id(user_id)
+            return await self.single_flight.do(
+                user_id,
+                lambda: self.user_repository.find_by_id(user_id),
+            )
         except (ExpectedBusinessError, ExpectedTechnicalError) as e:
             logger.info(
                 e.code,
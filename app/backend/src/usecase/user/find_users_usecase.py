@@ -0,0 +1,50 @@
+"""ユーザー一括検索ユースケース。
+
+IDを指定して複数のユーザーをまとめて検索するビジネスロジックを実装する。
+"""
+
+from src.domain.user.id import UserId
+from src.domain.user.lookup import UserLookupResult
+from src.domain.user.repository import UserRepository
+from src.log.logger import logger
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+
+class FindUsersUseCase:
+    """ユーザー一括検索ユースケース。"""
+
+    def __init__(self, user_repository: UserRepository) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            user_repository: ユーザーリポジトリ
+
+        """
+        self.user_repository = user_repository
+
+    async def execute(self, user_ids: list[UserId]) -> UserLookupResult:
+        """指定したIDのユーザーを1回の検索でまとめて取得する。
+
+        Args:
+            user_ids: 検索するユーザーID
+
+        Returns:
+            見つかったユーザーと、存在しなかったユーザーのID
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            return await self.user_repository.find_by_ids(user_ids)
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
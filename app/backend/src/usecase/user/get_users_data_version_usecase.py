@@ -0,0 +1,69 @@
+"""ユーザーのデータの版の取得ユースケース。
+
+条件付き取得(ETag)の判定に使用する、ユーザー全体のデータの版を取得する。
+"""
+
+from src.domain.data_version import DataVersion
+from src.domain.user.repository import UserRepository, UserRepositoryOpener
+from src.log.logger import logger
+from src.shared.cache.ttl_lru_cache import TtlLruCache, detached_refresh
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+
+# データの版のキャッシュのキー(ユーザー全体で1つの版を持つ)
+_CACHE_KEY = "users"
+
+
+class GetUsersDataVersionUseCase:
+    """ユーザーのデータの版の取得ユースケース。"""
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        cache: TtlLruCache[str, DataVersion] | None = None,
+        open_repository: UserRepositoryOpener | None = None,
+    ) -> None:
+        """ユースケースを初期化する。
+
+        Args:
+            user_repository: ユーザーリポジトリ
+            cache: データの版のキャッシュ(Noneの場合はキャッシュしない)
+            open_repository: 有効期限切れの版をバックグラウンドで取得し直すための
+                リポジトリを開く関数(Noneの場合は呼び出しの中で取得し直す)
+
+        """
+        self.user_repository = user_repository
+        self.cache = cache
+        self.open_repository = open_repository
+
+    async def execute(self) -> DataVersion:
+        """ユーザー全体のデータの版を取得する。
+
+        Returns:
+            ユーザー全体のデータの版
+
+        Raises:
+            ExpectedUseCaseError: ビジネスエラーまたは技術エラーが発生した場合
+
+        """
+        try:
+            if self.cache is None:
+                return await self.user_repository.data_version()
+            return await self.cache.get_or_load(
+                _CACHE_KEY,
+                self.user_repository.data_version,
+                refresh=detached_refresh(
+                    self.open_repository,
+                    lambda repository: repository.data_version(),
+                ),
+            )
+        except (ExpectedBusinessError, ExpectedTechnicalError) as e:
+            logger.info(
+                e.code,
+                raw_message=e.raw_message,
+                details=e.details,
+            )
+            raise ExpectedUseCaseError(code=e.code, details=e.details) from e
@@ -0,0 +1,204 @@
+"""検索結果をキャッシュするユーザーリポジトリの統合テスト。
+
+データベースを直接更新し、キャッシュから返されたか、読み込み直されたかを区別する。
+"""
+
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.user.id import UserId
+from src.domain.user.name import UserName
+from src.domain.user.user import User
+from src.infrastructure.repository.user.caching_user_repository import (
+    CachingUserRepository,
+)
+from src.infrastructure.repository.user.user_repository_impl import (
+    UserRepositoryImpl,
+)
+from src.shared.cache.ttl_lru_cache import CacheStats, TtlLruCache
+from src.shared.errors.codes import UserErrorCode
+from src.shared.errors.errors import ExpectedBusinessError
+
+TTL_SECONDS = 60.0
+
+
+@pytest.fixture
+def repository(db_session: AsyncSession) -> CachingUserRepository:
+    return CachingUserRepository(
+        UserRepositoryImpl(session=db_session),
+        by_id=TtlLruCache(maxsize=16, ttl=TTL_SECONDS),
+        by_email=TtlLruCache(maxsize=16, ttl=TTL_SECONDS),
+    )
+
+
+async def _rename_directly(db_session: AsyncSession, user: User, name: str) -> None:
+    """リポジトリを通さずにユーザー名を更新する(他のプロセスの書き込みを模す)。"""
+    await db_session.execute(
+        text("UPDATE users SET name = :name WHERE id = :id"),
+        {"name": name, "id": user.id.value},
+    )
+
+
+class TestFind:
+    """IDとメールアドレスによる検索のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_2回目以降はキャッシュから返ること(
+        self,
+        repository: CachingUserRepository,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        user = await repository.save(User.random())
+        await repository.find_by_id(user.id)
+        await repository.find_by_email(user.email)
+        await _rename_directly(db_session, user, "renamed")
+
+        # act
+        by_id = await repository.find_by_id(user.id)
+        by_email = await repository.find_by_email(user.email)
+
+        # assert
+        assert by_id.name == user.name
+        assert by_email.name == user.name
+        assert repository.by_id.stats == CacheStats(hits=1, misses=1, invalidations=1)
+        assert repository.by_email.stats == CacheStats(
+            hits=1,
+            misses=1,
+            invalidations=1,
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_見つからなかった結果はキャッシュされないこと(
+        self,
+        repository: CachingUserRepository,
+    ) -> None:
+        # arrange
+        user = User.random()
+        with pytest.raises(ExpectedBusinessError) as e:
+            await repository.find_by_id(user.id)
+        assert e.value.code == UserErrorCode.NotFound
+        await repository.save(user)
+
+        # act
+        found = await repository.find_by_id(user.id)
+
+        # assert
+        assert found.id == user.id
+
+
+class TestWrite:
+    """保存・削除によるキャッシュの破棄のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_保存したユーザーは読み込み直されること(
+        self,
+        repository: CachingUserRepository,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        user = await repository.save(User.random())
+        await repository.find_by_id(user.id)
+        await repository.find_by_email(user.email)
+        # 他のプロセスが削除したユーザーを、同じIDとメールアドレスで登録し直す
+        await db_session.execute(
+            text("DELETE FROM users WHERE id = :id"),
+            {"id": user.id.value},
+        )
+
+        # act
+        await repository.save(replace(user, name=UserName(value="renamed")))
+        by_id = await repository.find_by_id(user.id)
+        by_email = await repository.find_by_email(user.email)
+
+        # assert
+        assert by_id.name == UserName(value="renamed")
+        assert by_email.name == UserName(value="renamed")
+
+    @pytest.mark.anyio
+    async def test_OK_一括で追加したユーザーは読み込み直されること(
+        self,
+        repository: CachingUserRepository,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        user = await repository.save(User.random())
+        await repository.find_by_id(user.id)
+        await db_session.execute(
+            text("DELETE FROM users WHERE id = :id"),
+            {"id": user.id.value},
+        )
+
+        # act
+        await repository.bulk_insert([replace(user, name=UserName(value="renamed"))])
+        found = await repository.find_by_id(user.id)
+
+        # assert
+        assert found.name == UserName(value="renamed")
+
+    @pytest.mark.anyio
+    async def test_OK_削除したユーザーは見つからないこと(
+        self,
+        repository: CachingUserRepository,
+    ) -> None:
+        # arrange
+        user = await repository.save(User.random())
+        await repository.find_by_id(user.id)
+        await repository.find_by_email(user.email)
+
+        # act
+        deleted = await repository.delete(user.id)
+
+        # assert
+        assert deleted == user.id
+        for find in (
+            lambda: repository.find_by_id(user.id),
+            lambda: repository.find_by_email(user.email),
+        ):
+            with pytest.raises(ExpectedBusinessError) as e:
+                await find()
+            assert e.value.code == UserErrorCode.NotFound
+
+    @pytest.mark.anyio
+    async def test_OK_削除したユーザーのメールアドレスのエントリのみ破棄されること(
+        self,
+        repository: CachingUserRepository,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        deleted = await repository.save(User.random())
+        other = await repository.save(User.random())
+        await repository.find_by_email(deleted.email)
+        await repository.find_by_email(other.email)
+        await _rename_directly(db_session, other, "renamed")
+
+        # act
+        await repository.delete(deleted.id)
+
+        # assert
+        assert len(repository.by_email) == 1
+        found = await repository.find_by_email(other.email)
+        assert found.name == other.name
+
+    @pytest.mark.anyio
+    async def test_OK_他のユーザーのキャッシュは破棄されないこと(
+        self,
+        repository: CachingUserRepository,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        user = await repository.save(User.random())
+        await repository.find_by_id(user.id)
+        await _rename_directly(db_session, user, "renamed")
+
+        # act
+        await repository.save(User.random())
+        with pytest.raises(ExpectedBusinessError):
+            await repository.delete(UserId())
+        found = await repository.find_by_id(user.id)
+
+        # assert
+        assert found.name == user.name
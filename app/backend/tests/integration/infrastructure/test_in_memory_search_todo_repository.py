@@ -0,0 +1,299 @@
+"""メモリ上のインデックスで検索するTodoリポジトリの統合テスト。
+
+データベースの部分一致検索と同じ結果を返すこと、書き込みと変更イベントが
+インデックスに反映されることをテストする。
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.pagination import SortDirection
+from src.domain.todo.event import TodoEvent, TodoEventType
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.todo import Todo
+from src.infrastructure.repository.todo.in_memory_search_todo_repository import (
+    InMemorySearchTodoRepository,
+)
+from src.infrastructure.repository.todo.todo_repository_impl import (
+    TodoRepositoryImpl,
+)
+from src.infrastructure.search.todo_ngram_index import TodoNgramIndex
+from src.infrastructure.search.todo_ngram_index_updater import TodoNgramIndexUpdater
+from src.shared.pubsub.broadcaster import Broadcaster
+
+# インデックスへの反映を待つ最大時間(秒)
+_APPLY_TIMEOUT_SECONDS = 5.0
+
+_TITLES = (
+    "weekly report",
+    "Report draft for the quarterly meeting",
+    "report",
+    "reporting tool",
+    "牛乳を買う",
+    "卵を買う",
+    "ﾚﾎﾟｰﾄ作成",
+    "buy milk",
+    "50% off",
+)
+
+
+@pytest.fixture
+def todo_repository(db_session: AsyncSession) -> TodoRepositoryImpl:
+    return TodoRepositoryImpl(session=db_session)
+
+
+@pytest.fixture
+def index() -> TodoNgramIndex:
+    return TodoNgramIndex()
+
+
+def _load(todo_repository: TodoRepositoryImpl) -> AsyncIterator[Todo]:
+    return todo_repository.stream("", TodoSearchMode.SUBSTRING)
+
+
+async def _insert_todos(todo_repository: TodoRepositoryImpl) -> list[Todo]:
+    """作成日時が1秒ずつ異なり、一部が完了済みのTodoを登録する。"""
+    start = datetime.now(UTC) - timedelta(minutes=1)
+    todos = [
+        Todo(
+            title=title,
+            completed=i % 3 == 0,
+            created_at=start + timedelta(seconds=i),
+        )
+        for i, title in enumerate(_TITLES)
+    ]
+    await todo_repository.bulk_insert(todos)
+    return todos
+
+
+async def _wait_until(condition: AsyncIterator[bool]) -> None:
+    """conditionがTrueを返すまで待つ。"""
+    async with asyncio.timeout(_APPLY_TIMEOUT_SECONDS):
+        async for satisfied in condition:
+            if satisfied:
+                return
+            await asyncio.sleep(0.01)
+
+
+class TestSearch:
+    """インデックスによる検索がデータベースの検索と一致することのテストクラス。"""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            TodoSearchCondition(query="report"),
+            TodoSearchCondition(query="REPORT", limit=2),
+            # ASCII以外の文字のトライグラムはデータベースのLC_CTYPEで変わるため、
+            # 類似度によらない並び順で比較する
+            TodoSearchCondition(query="買う", sort=TodoSortKey.CREATED_AT),
+            TodoSearchCondition(query="レポート", sort=TodoSortKey.CREATED_AT),
+            TodoSearchCondition(query="r"),
+            TodoSearchCondition(query="%"),
+            TodoSearchCondition(query="report", completed=False),
+            TodoSearchCondition(
+                query="re",
+                sort=TodoSortKey.CREATED_AT,
+                direction=SortDirection.DESC,
+            ),
+            TodoSearchCondition(query="re", sort=TodoSortKey.TITLE),
+        ],
+    )
+    async def test_OK_データベースの部分一致検索と同じ順でページを辿れること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+        condition: TodoSearchCondition,
+    ) -> None:
+        # arrange
+        await _insert_todos(todo_repository)
+        await index.load(_load(todo_repository))
+        repository = InMemorySearchTodoRepository(todo_repository, index)
+
+        # act
+        pages: list[tuple[list[str], list[str]]] = []
+        expected_condition = actual_condition = replace(condition, limit=2)
+        while True:
+            expected = await todo_repository.search(expected_condition)
+            actual = await repository.search(actual_condition)
+            pages.append(
+                (
+                    [todo.id.value for todo in expected.items],
+                    [todo.id.value for todo in actual.items],
+                ),
+            )
+            if expected.next_cursor is None or actual.next_cursor is None:
+                assert expected.next_cursor == actual.next_cursor
+                break
+            expected_condition = replace(condition, limit=2, after=expected.next_cursor)
+            actual_condition = replace(condition, limit=2, after=actual.next_cursor)
+
+        # assert
+        assert all(expected == actual for expected, actual in pages)
+        assert any(expected for expected, _ in pages)
+
+
+class TestWrite:
+    """リポジトリを通した書き込みがインデックスに反映されることのテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_書き込んだ内容がすぐに検索結果に反映されること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+    ) -> None:
+        # arrange
+        todos = await _insert_todos(todo_repository)
+        await index.load(_load(todo_repository))
+        repository = InMemorySearchTodoRepository(todo_repository, index)
+        renamed = replace(
+            todos[0],
+            title="monthly summary",
+            updated_at=datetime.now(UTC),
+        )
+
+        # act
+        await repository.save(renamed)
+        await repository.delete(todos[2].id)
+        await repository.bulk_insert([Todo(title="report card")])
+
+        # assert
+        titles = [
+            todo.title
+            for todo in (
+                await repository.search(TodoSearchCondition(query="report"))
+            ).items
+        ]
+        assert sorted(titles) == [
+            "Report draft for the quarterly meeting",
+            "report card",
+            "reporting tool",
+        ]
+        summary = await repository.search(TodoSearchCondition(query="summary"))
+        assert [todo.id for todo in summary.items] == [todos[0].id]
+
+    @pytest.mark.anyio
+    async def test_OK_一括追加したTodoは保存した更新日時でインデックスに反映されること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+    ) -> None:
+        # arrange
+        await index.load(_load(todo_repository))
+        repository = InMemorySearchTodoRepository(todo_repository, index)
+        todo = Todo(title="report card", updated_at=datetime(2000, 1, 1, tzinfo=UTC))
+
+        # act
+        await repository.bulk_insert([todo])
+
+        # assert
+        (indexed,) = index.search(TodoSearchCondition(query="report")).items
+        stored = await todo_repository.find_by_id(todo.id)
+        assert indexed.updated_at == stored.updated_at
+
+    @pytest.mark.anyio
+    async def test_OK_読み込み前と全文検索はデータベースで検索されること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+    ) -> None:
+        # arrange
+        await _insert_todos(todo_repository)
+        repository = InMemorySearchTodoRepository(todo_repository, index)
+
+        # act
+        before_load = await repository.search(TodoSearchCondition(query="report"))
+        await index.load(_load(todo_repository))
+        fulltext = await repository.search(
+            TodoSearchCondition(query="milk", mode=TodoSearchMode.FTS),
+        )
+
+        # assert
+        assert len(before_load.items) == len(
+            [title for title in _TITLES if "report" in title.lower()],
+        )
+        assert [todo.title for todo in fulltext.items] == ["buy milk"]
+
+
+class TestTodoNgramIndexUpdater:
+    """変更イベントによるインデックスの更新のテストクラス。"""
+
+    @pytest.fixture
+    def broadcaster(self) -> Broadcaster[TodoEvent]:
+        return Broadcaster()
+
+    @pytest.fixture
+    async def updater(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> AsyncGenerator[TodoNgramIndexUpdater]:
+        """全件の読み込みが完了した更新を提供する。"""
+        await _insert_todos(todo_repository)
+        updater = TodoNgramIndexUpdater(
+            index=index,
+            broadcaster=broadcaster,
+            load=lambda: _load(todo_repository),
+        )
+        await updater.start()
+        await asyncio.wait_for(
+            updater.wait_until_loaded(),
+            timeout=_APPLY_TIMEOUT_SECONDS,
+        )
+        yield updater
+        await updater.stop()
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("updater")
+    async def test_OK_変更イベントのTodoがインデックスに反映されること(
+        self,
+        index: TodoNgramIndex,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        todo = Todo(title="report card")
+
+        # act
+        broadcaster.publish(TodoEvent(type=TodoEventType.UPDATED, todo=todo))
+
+        # assert
+        async def applied() -> AsyncIterator[bool]:
+            while True:
+                page = index.search(TodoSearchCondition(query="card"))
+                yield [item.id for item in page.items] == [todo.id]
+
+        await _wait_until(applied())
+        assert len(index) == len(_TITLES) + 1
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("updater")
+    async def test_OK_一括取り込みのイベントで全件が読み込み直されること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+        index: TodoNgramIndex,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        await todo_repository.bulk_insert([Todo(title="imported report")])
+
+        # act
+        broadcaster.publish(TodoEvent(type=TodoEventType.IMPORTED))
+
+        # assert
+        async def reloaded() -> AsyncIterator[bool]:
+            while True:
+                yield len(index) == len(_TITLES) + 1
+
+        await _wait_until(reloaded())
+        page = index.search(TodoSearchCondition(query="imported"))
+        assert [todo.title for todo in page.items] == ["imported report"]
@@ -0,0 +1,176 @@
+"""PostgreSQLのLISTEN/NOTIFYによるTodoの変更イベントの配信の統合テスト。"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.todo.event import TodoEvent, TodoEventType
+from src.domain.todo.todo import Todo
+from src.infrastructure.event.pg_notify_todo_event_publisher import (
+    PgNotifyTodoEventPublisher,
+)
+from src.infrastructure.event.pg_todo_event_listener import PgTodoEventListener
+from src.infrastructure.repository.todo.todo_repository_impl import (
+    TodoRepositoryImpl,
+)
+from src.shared.pubsub.broadcaster import Broadcaster
+
+# イベントの受信を待つ最大時間(秒)
+_RECEIVE_TIMEOUT_SECONDS = 5.0
+
+
+@pytest.fixture
+def broadcaster() -> Broadcaster[TodoEvent]:
+    return Broadcaster()
+
+
+@pytest.fixture
+async def listener(
+    db_session: AsyncSession,
+    broadcaster: Broadcaster[TodoEvent],
+) -> AsyncGenerator[PgTodoEventListener]:
+    """テスト用データベースでLISTENを開始したリスナーを提供する。"""
+    assert db_session.bind is not None
+    listener = PgTodoEventListener(
+        database_url=db_session.bind.url.render_as_string(hide_password=False),
+        broadcaster=broadcaster,
+    )
+    await listener.start()
+    await asyncio.wait_for(
+        listener.wait_until_listening(),
+        timeout=_RECEIVE_TIMEOUT_SECONDS,
+    )
+    yield listener
+    await listener.stop()
+
+
+class TestPgTodoEventListener:
+    """NOTIFYで送ったイベントがLISTENで受信されることのテストクラス。"""
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("listener")
+    async def test_OK_NOTIFYで送ったイベントが購読者に配信されること(
+        self,
+        db_session: AsyncSession,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        todos = [Todo(title="buy milk", completed=True), Todo(title="buy eggs")]
+        publisher = PgNotifyTodoEventPublisher(session=db_session)
+
+        with broadcaster.subscribe() as subscription:
+            # act
+            await publisher.publish(
+                [TodoEvent(type=TodoEventType.TOGGLED, todo=todo) for todo in todos],
+            )
+            await db_session.commit()
+            received = [
+                await asyncio.wait_for(
+                    subscription.get(),
+                    timeout=_RECEIVE_TIMEOUT_SECONDS,
+                )
+                for _ in todos
+            ]
+
+        # assert
+        assert [event.type for event in received] == [TodoEventType.TOGGLED] * 2
+        assert [event.todo for event in received] == todos
+        first = received[0].todo
+        assert first is not None
+        assert (first.title, first.completed) == ("buy milk", True)
+        assert first.updated_at == todos[0].updated_at
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("listener")
+    async def test_OK_Todoを含まないイベントも配信されること(
+        self,
+        db_session: AsyncSession,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        publisher = PgNotifyTodoEventPublisher(session=db_session)
+
+        with broadcaster.subscribe() as subscription:
+            # act
+            await publisher.publish([TodoEvent(type=TodoEventType.IMPORTED)])
+            await db_session.commit()
+            received = await asyncio.wait_for(
+                subscription.get(),
+                timeout=_RECEIVE_TIMEOUT_SECONDS,
+            )
+
+        # assert
+        assert received == TodoEvent(type=TodoEventType.IMPORTED)
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("listener")
+    async def test_OK_コミットしなかった場合は配信されないこと(
+        self,
+        db_session: AsyncSession,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        publisher = PgNotifyTodoEventPublisher(session=db_session)
+
+        with broadcaster.subscribe() as subscription:
+            # act
+            await publisher.publish([TodoEvent(type=TodoEventType.IMPORTED)])
+            await db_session.rollback()
+
+            # assert
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(subscription.get(), timeout=0.2)
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("listener")
+    async def test_OK_リポジトリの書き込みのコミットで変更イベントが配信されること(
+        self,
+        db_session: AsyncSession,
+        broadcaster: Broadcaster[TodoEvent],
+    ) -> None:
+        # arrange
+        repository = TodoRepositoryImpl(
+            session=db_session,
+            event_publisher=PgNotifyTodoEventPublisher(session=db_session),
+        )
+        todo = Todo(title="buy milk")
+
+        with broadcaster.subscribe() as subscription:
+            # act
+            await repository.bulk_insert([todo])
+            toggled = await repository.toggle(todo.id)
+            received = [
+                await asyncio.wait_for(
+                    subscription.get(),
+                    timeout=_RECEIVE_TIMEOUT_SECONDS,
+                )
+                for _ in range(2)
+            ]
+
+        # assert
+        assert received == [
+            TodoEvent(type=TodoEventType.IMPORTED),
+            TodoEvent(type=TodoEventType.TOGGLED, todo=toggled),
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_停止後は受信しないこと(
+        self,
+        db_session: AsyncSession,
+        broadcaster: Broadcaster[TodoEvent],
+        listener: PgTodoEventListener,
+    ) -> None:
+        # arrange
+        publisher = PgNotifyTodoEventPublisher(session=db_session)
+        await listener.stop()
+
+        with broadcaster.subscribe() as subscription:
+            # act
+            await publisher.publish([TodoEvent(type=TodoEventType.IMPORTED)])
+            await db_session.commit()
+
+            # assert
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(subscription.get(), timeout=0.2)
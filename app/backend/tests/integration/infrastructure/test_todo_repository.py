@@ -0,0 +1,1543 @@
+"""Todoリポジトリの統合テスト。
+
+PostgreSQLを使用したTodoリポジトリの統合テストを行う。
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.pagination import PageCursor, SortDirection
+from src.domain.todo.bulk_update import TodoBulkAction
+from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.summary import TodoSummary
+from src.domain.todo.sync import SYNC_ORDER
+from src.domain.todo.todo import Todo
+from src.infrastructure.models.todo_model import TodoModel
+from src.infrastructure.repository.todo.todo_repository_impl import (
+    TodoRepositoryImpl,
+)
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import CommonErrorCode, TodoErrorCode
+from src.shared.errors.errors import ExpectedBusinessError
+
+
+@pytest.fixture
+def todo_repository(db_session: AsyncSession) -> TodoRepositoryImpl:
+    """テスト用のTodoリポジトリを提供する。
+
+    Args:
+        db_session: データベースセッション
+
+    Returns:
+        TodoRepositoryImpl: Todoリポジトリ
+
+    """
+    return TodoRepositoryImpl(session=db_session)
+
+
+async def _insert_todos(session: AsyncSession, *titles: str) -> list[str]:
+    """テスト用のTodoを登録し、IDのリストを返す。"""
+    now = datetime.now(UTC)
+    models = [
+        TodoModel(
+            id=TodoId().value,
+            title=title,
+            completed=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for title in titles
+    ]
+    session.add_all(models)
+    await session.commit()
+    return [model.id for model in models]
+
+
+async def _explain(session: AsyncSession, operation: Awaitable[object]) -> str:
+    """operationが最後に実行したSQLの実行計画を、同じパラメーターで取得する。
+
+    汎用プランでもインデックスが使われることを確認するため、プランのキャッシュを汎用プランに固定する。
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:  # noqa: ANN401
+        _conn, _cursor, statement, parameters, *_ = args
+        statements.append((statement, parameters))
+
+    engine = session.bind.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await operation
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = statements[-1]
+    connection = await session.connection()
+    await connection.exec_driver_sql("SET plan_cache_mode = force_generic_plan")
+    result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(row[0] for row in result)
+
+
+class TestSearch:
+    """Todo検索のテストクラス。
+
+    タイトルの部分一致検索と類似度順の並び替えをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_部分一致するTodoのみ返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "Buy milk", "Clean house", "buy bread")
+
+        # act
+        page = await todo_repository.search(TodoSearchCondition(query="BUY"))
+
+        # assert
+        assert {todo.title for todo in page.items} == {"Buy milk", "buy bread"}
+
+    @pytest.mark.anyio
+    async def test_OK_類似度の高い順に並ぶこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "report draft for the quarterly meeting",
+            "report",
+            "weekly report",
+        )
+
+        # act
+        page = await todo_repository.search(TodoSearchCondition(query="report"))
+
+        # assert
+        assert [todo.title for todo in page.items] == [
+            "report",
+            "weekly report",
+            "report draft for the quarterly meeting",
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_limitで上位k件に絞り込まれること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "task", "task two", "task three", "other")
+
+        # act
+        page = await todo_repository.search(
+            TodoSearchCondition(query="task", limit=2),
+        )
+
+        # assert
+        assert [todo.title for todo in page.items] == ["task", "task two"]
+        assert page.next_cursor is not None
+
+    @pytest.mark.anyio
+    async def test_OK_ワイルドカード文字がリテラルとして扱われること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "100% done", "1000 done", "a_b", "axb")
+
+        # act
+        percent = await todo_repository.search(TodoSearchCondition(query="100%"))
+        underscore = await todo_repository.search(TodoSearchCondition(query="a_b"))
+
+        # assert
+        assert [todo.title for todo in percent.items] == ["100% done"]
+        assert [todo.title for todo in underscore.items] == ["a_b"]
+
+    @pytest.mark.anyio
+    async def test_OK_全角半角や大文字小文字やひらがなカタカナを区別せず一致すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "ﾚﾎﾟｰﾄ作成",
+            "レポート提出",
+            "れぽーと",
+            "ＲＥＰＯＲＴ",  # noqa: RUF001
+            "other",
+        )
+
+        # act
+        kana = await todo_repository.search(TodoSearchCondition(query="レポート"))
+        latin = await todo_repository.search(TodoSearchCondition(query="Report"))
+
+        # assert
+        assert {todo.title for todo in kana.items} == {
+            "ﾚﾎﾟｰﾄ作成",
+            "レポート提出",
+            "れぽーと",
+        }
+        assert [todo.title for todo in latin.items] == ["ＲＥＰＯＲＴ"]  # noqa: RUF001
+
+    @pytest.mark.anyio
+    async def test_OK_1文字や2文字の日本語のクエリでも一致すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "牛乳を買う", "卵を買う", "掃除")
+
+        # act
+        single = await todo_repository.search(TodoSearchCondition(query="卵"))
+        double = await todo_repository.search(TodoSearchCondition(query="買う"))
+
+        # assert
+        assert [todo.title for todo in single.items] == ["卵を買う"]
+        assert {todo.title for todo in double.items} == {"牛乳を買う", "卵を買う"}
+
+    @pytest.mark.anyio
+    async def test_OK_部分一致検索がn_gramのインデックスで行われること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await todo_repository.bulk_insert(
+            [Todo(title=f"task {i}") for i in range(2000)],
+        )
+        await _insert_todos(db_session, "buy milk")
+        # 入力補完の部分インデックスは削除されていない全行の走査にも使えるため、
+        # シーケンシャルスキャンの代わりに選ばれないよう比較から除く
+        await db_session.execute(text("DROP INDEX ix_todos_title_search_prefix"))
+        await db_session.execute(text("ANALYZE todos"))
+        # 行数が少ないとシーケンシャルスキャンが選ばれるため、インデックスの選択のみを比較する
+        await db_session.execute(text("SET enable_seqscan = off"))
+
+        # act
+        plan = await _explain(
+            db_session,
+            todo_repository.search(TodoSearchCondition(query="milk")),
+        )
+
+        # assert
+        assert "ix_todos_title_ngrams" in plan
+
+    @pytest.mark.anyio
+    async def test_OK_クエリが空の場合は全件返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, "first", "second")
+
+        # act
+        page = await todo_repository.search(TodoSearchCondition())
+
+        # assert
+        assert {todo.id.value for todo in page.items} == set(ids)
+        assert page.next_cursor is None
+
+
+class TestSearchPagination:
+    """Todo検索のページネーションのテストクラス。
+
+    カーソルを使って全件を重複・欠落なく辿れることをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_作成日時が同じでもカーソルで全件を辿れること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # 作成日時が同一のため、IDによる並び替えで位置が一意に決まる
+        ids = await _insert_todos(db_session, "a", "b", "c", "d", "e")
+
+        # act
+        fetched: list[str] = []
+        after = None
+        while True:
+            page = await todo_repository.search(
+                TodoSearchCondition(limit=2, after=after),
+            )
+            fetched.extend(todo.id.value for todo in page.items)
+            if page.next_cursor is None:
+                break
+            after = page.next_cursor
+
+        # assert
+        assert fetched == sorted(ids)
+
+    @pytest.mark.anyio
+    async def test_OK_類似度順の検索結果をカーソルで辿れること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "report draft for the quarterly meeting",
+            "report",
+            "weekly report",
+            "other",
+        )
+
+        # act
+        first = await todo_repository.search(
+            TodoSearchCondition(query="report", limit=2),
+        )
+        second = await todo_repository.search(
+            TodoSearchCondition(query="report", limit=2, after=first.next_cursor),
+        )
+
+        # assert
+        assert [todo.title for todo in first.items] == ["report", "weekly report"]
+        assert [todo.title for todo in second.items] == [
+            "report draft for the quarterly meeting",
+        ]
+        assert second.next_cursor is None
+
+    @pytest.mark.anyio
+    async def test_NG_並び順と一致しないカーソルの場合ビジネス例外を返すこと(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # 作成日時順のカーソルを類似度順の検索に指定する
+        cursor = PageCursor(key=datetime.now(UTC), id=TodoId().value)
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            await todo_repository.search(
+                TodoSearchCondition(query="report", after=cursor),
+            )
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("sort", "direction"),
+        [
+            (TodoSortKey.UPDATED_AT, SortDirection.ASC),
+            (TodoSortKey.CREATED_AT, SortDirection.DESC),
+        ],
+    )
+    async def test_NG_並び替えキーか向きが異なるカーソルの場合ビジネス例外を返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+        sort: TodoSortKey,
+        direction: SortDirection,
+    ) -> None:
+        # arrange
+        # キーの型が同じ作成日時の昇順のカーソルを、別の並び順の検索に指定する
+        await _insert_todos(db_session, "a", "b")
+        page = await todo_repository.search(TodoSearchCondition(limit=1))
+        assert page.next_cursor is not None
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            await todo_repository.search(
+                TodoSearchCondition(
+                    after=page.next_cursor,
+                    sort=sort,
+                    direction=direction,
+                ),
+            )
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+
+class TestFullTextSearch:
+    """全文検索モードのテストクラス。
+
+    単語単位の一致と関連度順の並び替えをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_すべての単語を含むTodoのみ語順に関係なく返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "Write weekly report",
+            "report for weekly meeting",
+            "weekly review",
+            "reporting tool",
+        )
+
+        # act
+        page = await todo_repository.search(
+            TodoSearchCondition(query="report weekly", mode=TodoSearchMode.FTS),
+        )
+
+        # assert
+        assert {todo.title for todo in page.items} == {
+            "Write weekly report",
+            "report for weekly meeting",
+        }
+
+    @pytest.mark.anyio
+    async def test_OK_関連度の高い順に並ぶこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "deploy api", "deploy deploy api")
+
+        # act
+        page = await todo_repository.search(
+            TodoSearchCondition(query="deploy", mode=TodoSearchMode.FTS),
+        )
+
+        # assert
+        assert [todo.title for todo in page.items] == [
+            "deploy deploy api",
+            "deploy api",
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_カーソルで検索結果を辿れること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, "call a", "call b", "call c", "other")
+
+        # act
+        first = await todo_repository.search(
+            TodoSearchCondition(query="call", mode=TodoSearchMode.FTS, limit=2),
+        )
+        second = await todo_repository.search(
+            TodoSearchCondition(
+                query="call",
+                mode=TodoSearchMode.FTS,
+                limit=2,
+                after=first.next_cursor,
+            ),
+        )
+
+        # assert
+        fetched = [todo.id.value for todo in first.items + second.items]
+        assert sorted(fetched) == sorted(ids[:3])
+        assert second.next_cursor is None
+
+    @pytest.mark.anyio
+    async def test_OK_検索構文の記号を含むクエリでもエラーにならないこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "buy milk")
+
+        # act
+        page = await todo_repository.search(
+            TodoSearchCondition(query="milk & (|!", mode=TodoSearchMode.FTS),
+        )
+
+        # assert
+        assert [todo.title for todo in page.items] == ["buy milk"]
+
+
+class TestStream:
+    """Todoのストリーミング取得のテストクラス。
+
+    サーバーサイドカーソルから全件を検索と同じ順で取得できることをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_全件を作成日時順に返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, "a", "b", "c")
+
+        # act
+        todos = [
+            todo async for todo in todo_repository.stream("", TodoSearchMode.SUBSTRING)
+        ]
+
+        # assert
+        assert [todo.id.value for todo in todos] == sorted(ids)
+
+    @pytest.mark.anyio
+    async def test_OK_検索と同じ順に返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "report draft for the quarterly meeting",
+            "report",
+            "weekly report",
+            "other",
+        )
+
+        # act
+        todos = [
+            todo
+            async for todo in todo_repository.stream("report", TodoSearchMode.SUBSTRING)
+        ]
+        page = await todo_repository.search(TodoSearchCondition(query="report"))
+
+        # assert
+        assert todos == page.items
+
+
+class TestCompletedFilter:
+    """完了フラグによる絞り込みのテストクラス。
+
+    未完了のTodoの一覧が部分インデックスで取得されることもテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_完了フラグが一致するTodoのみ返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        done_id, pending_id = await _insert_todos(db_session, "buy milk", "buy eggs")
+        await todo_repository.toggle(TodoId(value=done_id))
+
+        # act
+        pending = await todo_repository.search(TodoSearchCondition(completed=False))
+        done = await todo_repository.search(
+            TodoSearchCondition(query="buy", completed=True),
+        )
+        streamed = [
+            todo
+            async for todo in todo_repository.stream(
+                "",
+                TodoSearchMode.SUBSTRING,
+                completed=False,
+            )
+        ]
+
+        # assert
+        assert [todo.id.value for todo in pending.items] == [pending_id]
+        assert [todo.id.value for todo in done.items] == [done_id]
+        assert streamed == pending.items
+
+    @pytest.mark.anyio
+    async def test_OK_未完了のTodoの一覧は部分インデックスから取得されること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # 大半が完了済みのTodoで、全件のインデックスより部分インデックスが小さくなるようにする
+        await todo_repository.bulk_insert(
+            [Todo(title=f"done {i}", completed=True) for i in range(2000)],
+        )
+        await _insert_todos(db_session, "pending 1", "pending 2")
+        await db_session.execute(text("ANALYZE todos"))
+        # 行数が少ないとシーケンシャルスキャンが選ばれるため、インデックスの選択のみを比較する
+        await db_session.execute(text("SET enable_seqscan = off"))
+
+        # act
+        plan = await _explain(
+            db_session,
+            todo_repository.search(TodoSearchCondition(completed=False)),
+        )
+
+        # assert
+        assert "ix_todos_pending_created_at_id" in plan
+
+
+class TestSort:
+    """並び替えキーを指定した検索のテストクラス。
+
+    並び替えとLIMITが複合インデックスの走査だけで行われることもテストする。
+    """
+
+    @staticmethod
+    async def _insert_sortable_todos(
+        session: AsyncSession,
+        count: int,
+    ) -> list[Todo]:
+        """作成日時・更新日時・タイトルの順序がそれぞれ異なるTodoを登録する。
+
+        一括追加は更新日時を追加した時刻とするため、モデルを直接登録する。
+        """
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        todos = [
+            Todo(
+                title=f"todo {(i * 7) % count:05d}",
+                created_at=base + timedelta(seconds=i),
+                updated_at=base + timedelta(seconds=(i * 3) % count),
+            )
+            for i in range(count)
+        ]
+        session.add_all(
+            TodoModel(
+                id=todo.id.value,
+                title=todo.title,
+                completed=todo.completed,
+                created_at=todo.created_at,
+                updated_at=todo.updated_at,
+            )
+            for todo in todos
+        )
+        await session.commit()
+        return todos
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("sort", list(TodoSortKey))
+    @pytest.mark.parametrize("direction", list(SortDirection))
+    async def test_OK_指定したキーと向きの順にページを辿れること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+        sort: TodoSortKey,
+        direction: SortDirection,
+    ) -> None:
+        # arrange
+        todos = await self._insert_sortable_todos(db_session, 7)
+        expected = sorted(
+            todos,
+            key=lambda todo: (getattr(todo, sort.value), todo.id.value),
+            reverse=direction == SortDirection.DESC,
+        )
+
+        # act
+        ids: list[str] = []
+        after = None
+        while True:
+            page = await todo_repository.search(
+                TodoSearchCondition(
+                    sort=sort, direction=direction, limit=3, after=after
+                ),
+            )
+            ids.extend(todo.id.value for todo in page.items)
+            if page.next_cursor is None:
+                break
+            after = page.next_cursor
+
+        # assert
+        assert ids == [todo.id.value for todo in expected]
+
+    @pytest.mark.anyio
+    async def test_OK_クエリがあってもsortのキーの順に並べること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "buy eggs", "buy", "sell milk", "buy milk")
+
+        # act
+        page = await todo_repository.search(
+            TodoSearchCondition(
+                query="buy",
+                sort=TodoSortKey.TITLE,
+                direction=SortDirection.DESC,
+            ),
+        )
+        streamed = [
+            todo
+            async for todo in todo_repository.stream(
+                "buy",
+                TodoSearchMode.SUBSTRING,
+                sort=TodoSortKey.TITLE,
+                direction=SortDirection.DESC,
+            )
+        ]
+
+        # assert
+        assert [todo.title for todo in page.items] == ["buy milk", "buy eggs", "buy"]
+        assert streamed == page.items
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("sort", "index"),
+        [
+            (TodoSortKey.CREATED_AT, "ix_todos_created_at_id"),
+            (TodoSortKey.UPDATED_AT, "ix_todos_updated_at_id"),
+            (TodoSortKey.TITLE, "ix_todos_title_id"),
+        ],
+    )
+    @pytest.mark.parametrize("direction", list(SortDirection))
+    async def test_OK_並び替えとLIMITがインデックスの走査のみで行われること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+        sort: TodoSortKey,
+        index: str,
+        direction: SortDirection,
+    ) -> None:
+        # arrange
+        todos = await self._insert_sortable_todos(db_session, 2000)
+        await db_session.execute(text("ANALYZE todos"))
+        last = todos[1000]
+
+        # act
+        plans = [
+            await _explain(
+                db_session,
+                todo_repository.search(
+                    TodoSearchCondition(
+                        sort=sort,
+                        direction=direction,
+                        limit=20,
+                        after=after,
+                    ),
+                ),
+            )
+            for after in (
+                None,
+                PageCursor(
+                    key=getattr(last, sort.value),
+                    id=last.id.value,
+                    order=TodoSearchCondition(sort=sort, direction=direction).order,
+                ),
+            )
+        ]
+
+        # assert
+        for plan in plans:
+            assert index in plan
+            assert "Sort" not in plan
+
+
+class TestSuggestTitles:
+    """タイトルの入力補完のテストクラス。
+
+    前方一致、表記の揺れの同一視と重複の除去、インデックスの使用をテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_前方一致するタイトルのみ正規化したタイトル順に返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(
+            db_session,
+            "reporting tool",
+            "weekly report",
+            "Report draft",
+            "report",
+            "ＲＥＰＯＲＴ",  # noqa: RUF001
+            "repair",
+        )
+
+        # act
+        titles = await todo_repository.suggest_titles("Rep", 10)
+
+        # assert
+        # 正規化すると同じになるタイトルは、データベースの照合順序で最初のものにまとめる
+        assert titles[0] == "repair"
+        assert titles[1] in {"report", "ＲＥＰＯＲＴ"}  # noqa: RUF001
+        assert titles[2:] == ["Report draft", "reporting tool"]
+
+    @pytest.mark.anyio
+    async def test_OK_ひらがなカタカナや半角カナを区別せず前方一致すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "ﾚﾎﾟｰﾄ作成", "れぽーと", "今日のレポート")
+
+        # act
+        titles = await todo_repository.suggest_titles("レポ", 10)
+
+        # assert
+        assert titles == ["れぽーと", "ﾚﾎﾟｰﾄ作成"]
+
+    @pytest.mark.anyio
+    async def test_OK_削除済みのTodoを除きlimit件に絞り込まれること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, "task a", "task b", "task c", "task d")
+        await todo_repository.delete(TodoId(value=ids[0]))
+
+        # act
+        titles = await todo_repository.suggest_titles("task", 2)
+
+        # assert
+        assert titles == ["task b", "task c"]
+
+    @pytest.mark.anyio
+    async def test_OK_ワイルドカード文字がリテラルとして扱われること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "100% done", "1000 done", "a_b", "axb")
+
+        # act
+        percent = await todo_repository.suggest_titles("100%", 10)
+        underscore = await todo_repository.suggest_titles("a_", 10)
+
+        # assert
+        assert percent == ["100% done"]
+        assert underscore == ["a_b"]
+
+    @pytest.mark.anyio
+    async def test_OK_前方一致と重複の除去がインデックスの範囲の走査のみで行われること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await todo_repository.bulk_insert(
+            [Todo(title=f"task {i}") for i in range(2000)],
+        )
+        await db_session.execute(text("ANALYZE todos"))
+
+        # act
+        plan = await _explain(db_session, todo_repository.suggest_titles("task 1", 10))
+
+        # assert
+        assert "ix_todos_title_search_prefix" in plan
+        assert "Sort" not in plan
+
+
+class TestSearchProjection:
+    """一部の項目のみのTodo検索のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_指定した項目とIDのみを検索と同じ順に返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "buy milk", "buy eggs", "sell milk")
+        condition = TodoSearchCondition(query="milk", limit=1)
+        fields = frozenset({TodoField.TITLE, TodoField.COMPLETED})
+
+        # act
+        first = await todo_repository.search_projection(condition, fields)
+        second = await todo_repository.search_projection(
+            replace(condition, after=first.next_cursor),
+            fields,
+        )
+        expected = [
+            *(await todo_repository.search(condition)).items,
+            *(
+                await todo_repository.search(
+                    replace(condition, after=first.next_cursor),
+                )
+            ).items,
+        ]
+
+        # assert
+        assert first.items + second.items == [
+            TodoProjection(id=todo.id, title=todo.title, completed=todo.completed)
+            for todo in expected
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_指定した項目のカラムのみをSELECTすること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await _insert_todos(db_session, "buy milk")
+        statements: list[str] = []
+
+        def capture(*args: Any) -> None:  # noqa: ANN401
+            statements.append(args[2])
+
+        engine = db_session.bind.engine
+        event.listen(engine, "before_cursor_execute", capture)
+
+        # act
+        try:
+            await todo_repository.search_projection(
+                TodoSearchCondition(),
+                frozenset({TodoField.TITLE}),
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        # assert
+        select_list = statements[-1].split(" FROM ")[0]
+        assert "todos.title" in select_list
+        assert "todos.completed" not in select_list
+        assert "todos.updated_at" not in select_list
+
+
+class TestSave:
+    """Todo保存のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_保存すると世代番号が進むこと(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        (todo_id,) = await _insert_todos(db_session, "buy milk")
+        todo = await todo_repository.find_by_id(TodoId(value=todo_id))
+        todo.toggle()
+
+        # act
+        await todo_repository.save(todo)
+
+        # assert
+        assert versions.value == 1
+        saved = await todo_repository.find_by_id(TodoId(value=todo_id))
+        assert saved.completed is True
+
+
+class TestToggle:
+    """完了フラグの反転のテストクラス。
+
+    UPDATE ... RETURNINGによる不可分な反転をテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_完了フラグを反転したTodoを返し永続化されること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        (todo_id,) = await _insert_todos(db_session, "buy milk")
+        before = await todo_repository.find_by_id(TodoId(value=todo_id))
+
+        # act
+        toggled = await todo_repository.toggle(TodoId(value=todo_id))
+
+        # assert
+        assert toggled.id.value == todo_id
+        assert toggled.title == "buy milk"
+        assert toggled.completed is True
+        assert toggled.updated_at > before.updated_at
+        assert versions.value == 1
+        saved = await todo_repository.find_by_id(TodoId(value=todo_id))
+        assert saved.completed is True
+
+    @pytest.mark.anyio
+    async def test_NG_Todoが存在しない場合ビジネス例外を返すこと(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        todo_id = TodoId()
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            await todo_repository.toggle(todo_id)
+        assert exc_info.value.code == TodoErrorCode.NotFound
+        assert exc_info.value.details == {"todo_id": todo_id.value}
+
+    @pytest.mark.anyio
+    async def test_OK_同時に反転しても更新が失われないこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # 奇数回反転すると完了になる
+        concurrency = 11
+        (todo_id,) = await _insert_todos(db_session, "buy milk")
+
+        async def toggle_in_new_session() -> bool:
+            async with AsyncSession(bind=db_session.bind) as session:
+                repository = TodoRepositoryImpl(session=session)
+                todo = await repository.toggle(TodoId(value=todo_id))
+                return todo.completed
+
+        # act
+        results = await asyncio.gather(
+            *(toggle_in_new_session() for _ in range(concurrency)),
+        )
+
+        # assert
+        # 各反転は直前の反転の結果に対して行われるため、完了と未完了が交互に返る
+        assert results.count(True) == concurrency // 2 + 1
+        todo = await todo_repository.find_by_id(TodoId(value=todo_id))
+        assert todo.completed is True
+
+
+class TestBulkUpdate:
+    """完了フラグの一括更新のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_completeで指定したTodoのみ完了になること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        first, second, other = await _insert_todos(db_session, "a", "b", "c")
+
+        # act
+        result = await todo_repository.bulk_update(
+            [TodoId(value=first), TodoId(value=second)],
+            TodoBulkAction.COMPLETE,
+        )
+
+        # assert
+        assert {todo.id.value for todo in result.updated} == {first, second}
+        assert all(todo.completed for todo in result.updated)
+        assert result.not_found_ids == []
+        assert versions.value == 1
+        untouched = await todo_repository.find_by_id(TodoId(value=other))
+        assert untouched.completed is False
+
+    @pytest.mark.anyio
+    async def test_OK_toggleでTodoごとに反転されること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        first, second = await _insert_todos(db_session, "a", "b")
+        await todo_repository.toggle(TodoId(value=first))
+
+        # act
+        result = await todo_repository.bulk_update(
+            [TodoId(value=first), TodoId(value=second)],
+            TodoBulkAction.TOGGLE,
+        )
+
+        # assert
+        completed = {todo.id.value: todo.completed for todo in result.updated}
+        assert completed == {first: False, second: True}
+
+    @pytest.mark.anyio
+    async def test_OK_存在しないIDは重複を除いて指定順に返ること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        missing = [TodoId(), TodoId()]
+
+        # act
+        result = await todo_repository.bulk_update(
+            [missing[0], missing[1], missing[0]],
+            TodoBulkAction.UNCOMPLETE,
+        )
+
+        # assert
+        assert result.updated == []
+        assert result.not_found_ids == missing
+        assert versions.value == 0
+
+    @pytest.mark.anyio
+    async def test_OK_数千件のIDを1回で更新できること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, *(f"todo {i}" for i in range(3000)))
+
+        # act
+        result = await todo_repository.bulk_update(
+            [TodoId(value=todo_id) for todo_id in ids],
+            TodoBulkAction.COMPLETE,
+        )
+
+        # assert
+        assert len(result.updated) == len(ids)
+        assert result.not_found_ids == []
+
+
+class TestBulkInsert:
+    """Todoの一括追加のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_Todoがまとめて追加されること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        todos = [
+            Todo(title="buy milk"),
+            Todo(title="掃除", completed=True, created_at=created_at),
+        ]
+
+        # act
+        result = await todo_repository.bulk_insert(todos)
+
+        # assert
+        assert result.conflicted_ids == []
+        assert [todo.id for todo in result.inserted] == [todo.id for todo in todos]
+        assert versions.value == 1
+        stored = await todo_repository.find_by_id(todos[1].id)
+        assert stored.title == "掃除"
+        assert stored.completed is True
+        assert stored.created_at == created_at
+        # タイトルから生成される全文検索用の列も作成されること
+        page = await todo_repository.search(
+            TodoSearchCondition(query="milk", mode=TodoSearchMode.FTS),
+        )
+        assert [todo.id for todo in page.items] == [todos[0].id]
+
+    @pytest.mark.anyio
+    async def test_OK_過去の日時で取り込んだTodoも次の差分同期で取得されること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        await todo_repository.bulk_insert([Todo(title="同期済み")])
+        page = await todo_repository.changes(
+            PageCursor(key=datetime(2000, 1, 1, tzinfo=UTC), id="", order=SYNC_ORDER),
+            limit=10,
+        )
+        last = page.items[-1]
+        cursor = PageCursor(key=last.updated_at, id=last.id.value, order=SYNC_ORDER)
+        back_dated_at = last.updated_at - timedelta(days=365)
+        imported = Todo(
+            title="過去の日時で取り込み",
+            created_at=back_dated_at,
+            updated_at=back_dated_at,
+        )
+
+        # act
+        result = await todo_repository.bulk_insert([imported])
+        delta = await todo_repository.changes(cursor, limit=10)
+
+        # assert
+        assert [todo.id for todo in delta.items] == [imported.id]
+        assert delta.items[0].created_at == back_dated_at
+        assert delta.items[0].updated_at > last.updated_at
+        # 追加したTodoは保存した更新日時で返る
+        assert result.inserted == delta.items
+
+    @pytest.mark.anyio
+    async def test_OK_既存のIDのTodoは追加されずにIDが返ること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        (existing_id,) = await _insert_todos(db_session, "既存")
+        existing = Todo(id=TodoId(value=existing_id), title="上書きしない")
+        new = Todo(title="新規")
+
+        # act
+        result = await todo_repository.bulk_insert([existing, new])
+
+        # assert
+        assert result.conflicted_ids == [existing.id]
+        assert [todo.id for todo in result.inserted] == [new.id]
+        stored = await todo_repository.find_by_id(existing.id)
+        assert stored.title == "既存"
+        assert (await todo_repository.find_by_id(new.id)).title == "新規"
+
+    @pytest.mark.anyio
+    async def test_OK_同じセッションで繰り返し追加できること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        first = [Todo(title="1回目")]
+        second = [Todo(title="2回目")]
+
+        # act
+        await todo_repository.bulk_insert(first)
+        result = await todo_repository.bulk_insert(second)
+
+        # assert
+        assert result.conflicted_ids == []
+        page = await todo_repository.search(TodoSearchCondition())
+        assert {todo.id for todo in page.items} == {first[0].id, second[0].id}
+
+
+class TestDataVersion:
+    """Todo全体のデータの版のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_Todoがない場合は0件となること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # act
+        version = await todo_repository.data_version()
+
+        # assert
+        assert version.count == 0
+        assert version.last_modified_at is None
+
+    @pytest.mark.anyio
+    async def test_OK_Todoの追加と更新で版が変化すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        (todo_id,) = await _insert_todos(db_session, "買い物")
+        inserted = await todo_repository.data_version()
+
+        # act
+        await todo_repository.toggle(TodoId(value=todo_id))
+        toggled = await todo_repository.data_version()
+
+        # assert
+        assert inserted.count == toggled.count == 1
+        assert inserted.last_modified_at is not None
+        assert toggled.last_modified_at is not None
+        assert toggled.last_modified_at > inserted.last_modified_at
+
+    @pytest.mark.anyio
+    async def test_OK_Todoの削除で版が変化すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        (todo_id,) = await _insert_todos(db_session, "買い物")
+        inserted = await todo_repository.data_version()
+
+        # act
+        await todo_repository.delete(TodoId(value=todo_id))
+        deleted = await todo_repository.data_version()
+
+        # assert
+        assert deleted != inserted
+
+
+class TestCount:
+    """Todoの件数のテストクラス。
+
+    トリガーで増減させている完了フラグごとの件数が、書き込みに追従することをテストする。
+    """
+
+    async def _counts(self, todo_repository: TodoRepositoryImpl) -> tuple[int, ...]:
+        """全体・未完了・完了のTodoの件数を返す。"""
+        return (
+            await todo_repository.count(),
+            await todo_repository.count(completed=False),
+            await todo_repository.count(completed=True),
+        )
+
+    @pytest.mark.anyio
+    async def test_OK_Todoがない場合は0件となること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # act
+        counts = await self._counts(todo_repository)
+
+        # assert
+        assert counts == (0, 0, 0)
+
+    @pytest.mark.anyio
+    async def test_OK_追加・更新・削除で完了フラグごとの件数が増減すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        first, second, third = await _insert_todos(db_session, "a", "b", "c")
+        await todo_repository.bulk_insert(
+            [Todo(title="d", completed=True), Todo(title="e")],
+        )
+        inserted = await self._counts(todo_repository)
+
+        # act
+        await todo_repository.toggle(TodoId(value=first))
+        await todo_repository.bulk_update(
+            [TodoId(value=second), TodoId(value=third)],
+            TodoBulkAction.COMPLETE,
+        )
+        updated = await self._counts(todo_repository)
+        await todo_repository.delete(TodoId(value=first))
+        deleted = await self._counts(todo_repository)
+
+        # assert
+        assert inserted == (5, 4, 1)
+        assert updated == (5, 1, 4)
+        assert deleted == (4, 1, 3)
+
+    @pytest.mark.anyio
+    async def test_OK_同時に書き込んでも件数が失われないこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, *(f"todo {i}" for i in range(10)))
+        bind = db_session.bind
+
+        async def toggle(todo_id: str) -> None:
+            async with AsyncSession(bind=bind) as session:
+                await TodoRepositoryImpl(session=session).toggle(TodoId(value=todo_id))
+
+        # act
+        await asyncio.gather(*(toggle(todo_id) for todo_id in ids))
+
+        # assert
+        assert await self._counts(todo_repository) == (10, 0, 10)
+
+
+class TestSummarize:
+    """Todoの件数の集計のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_Todoがない場合は0件で完了率が0となること(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # act
+        summary = await todo_repository.summarize()
+
+        # assert
+        assert summary == TodoSummary(completed=0, pending=0)
+        assert summary.completion_rate == 0.0
+
+    @pytest.mark.anyio
+    async def test_OK_削除済みを除いた完了・未完了ごとの件数を返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        first, second, _ = await _insert_todos(db_session, "a", "b", "c")
+        await todo_repository.bulk_insert([Todo(title="d", completed=True)])
+        await todo_repository.toggle(TodoId(value=first))
+        await todo_repository.delete(TodoId(value=second))
+
+        # act
+        summary = await todo_repository.summarize()
+
+        # assert
+        assert summary == TodoSummary(completed=2, pending=1)
+        assert summary.total == await todo_repository.count()
+
+    @pytest.mark.anyio
+    async def test_OK_ロールバックした書き込みは件数に反映されないこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        (todo_id,) = await _insert_todos(db_session, "a")
+        bind = db_session.bind
+
+        # act
+        async with AsyncSession(bind=bind) as session:
+            repository = TodoRepositoryImpl(session=session)
+            await session.execute(
+                update(TodoModel).where(TodoModel.id == todo_id).values(completed=True),
+            )
+            # 同じトランザクション内では、書き込みが集計に反映されている
+            in_transaction = await repository.summarize()
+            await session.rollback()
+
+        # assert
+        assert in_transaction == TodoSummary(completed=1, pending=0)
+        assert await todo_repository.summarize() == TodoSummary(completed=0, pending=1)
+
+
+class TestEstimateCount:
+    """統計情報によるTodoの件数の推定のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_統計情報がない場合はNoneを返すこと(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # act
+        estimate = await todo_repository.estimate_count()
+
+        # assert
+        assert estimate is None
+
+    @pytest.mark.anyio
+    async def test_OK_ANALYZE後は統計情報から件数を推定すること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        ids = await _insert_todos(db_session, *(f"todo {i}" for i in range(100)))
+        await db_session.execute(text("ANALYZE todos"))
+
+        # act
+        estimate = await todo_repository.estimate_count()
+
+        # assert
+        assert estimate == len(ids)
+
+
+class TestDelete:
+    """論理削除のテストクラス。
+
+    削除したTodoが通常の取得・更新の対象から外れることをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_削除日時を記録し検索結果から除外されること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        todo_repository = TodoRepositoryImpl(session=db_session, versions=versions)
+        deleted_id, kept_id = await _insert_todos(db_session, "buy milk", "buy eggs")
+
+        # act
+        deleted = await todo_repository.delete(TodoId(value=deleted_id))
+
+        # assert
+        assert deleted.deleted_at is not None
+        assert deleted.updated_at == deleted.deleted_at
+        assert versions.value == 1
+        page = await todo_repository.search(TodoSearchCondition(query="buy"))
+        assert [todo.id.value for todo in page.items] == [kept_id]
+        streamed = [
+            todo.id.value
+            async for todo in todo_repository.stream("", TodoSearchMode.SUBSTRING)
+        ]
+        assert streamed == [kept_id]
+
+    @pytest.mark.anyio
+    async def test_NG_削除済みのTodoは取得・更新できないこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        (todo_id,) = await _insert_todos(db_session, "buy milk")
+        await todo_repository.delete(TodoId(value=todo_id))
+
+        # act & assert
+        for operation in (
+            todo_repository.find_by_id,
+            todo_repository.toggle,
+            todo_repository.delete,
+        ):
+            with pytest.raises(ExpectedBusinessError) as exc_info:
+                await operation(TodoId(value=todo_id))
+            assert exc_info.value.code == TodoErrorCode.NotFound
+        result = await todo_repository.bulk_update(
+            [TodoId(value=todo_id)],
+            TodoBulkAction.COMPLETE,
+        )
+        assert result.not_found_ids == [TodoId(value=todo_id)]
+
+
+class TestChanges:
+    """差分同期の変更取得のテストクラス。
+
+    (updated_at, id)順のキーセットで変更を辿れることをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_指定位置より後の変更を削除済みを含めて更新日時順に返すこと(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        first_id, second_id = await _insert_todos(db_session, "buy milk", "buy eggs")
+        since = datetime.now(UTC)
+        toggled = await todo_repository.toggle(TodoId(value=second_id))
+        deleted = await todo_repository.delete(TodoId(value=first_id))
+
+        # act
+        page = await todo_repository.changes(
+            PageCursor(key=since, id="", order=SYNC_ORDER), limit=10
+        )
+
+        # assert
+        assert [todo.id for todo in page.items] == [toggled.id, deleted.id]
+        assert [todo.is_deleted for todo in page.items] == [False, True]
+        assert page.next_cursor is None
+
+    @pytest.mark.anyio
+    async def test_OK_更新日時が同じでもカーソルで全件を辿れること(
+        self,
+        db_session: AsyncSession,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # _insert_todosは同じ更新日時で登録する
+        ids = await _insert_todos(db_session, *(f"todo {i}" for i in range(5)))
+        cursor = PageCursor(
+            key=datetime(2000, 1, 1, tzinfo=UTC), id="", order=SYNC_ORDER
+        )
+
+        # act
+        fetched: list[str] = []
+        while True:
+            page = await todo_repository.changes(cursor, limit=2)
+            fetched.extend(todo.id.value for todo in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        # assert
+        assert fetched == sorted(ids)
+
+    @pytest.mark.anyio
+    async def test_NG_更新日時順でないカーソルの場合ビジネス例外を返すこと(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            await todo_repository.changes(PageCursor(key=0.5, id=""), limit=10)
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+    @pytest.mark.anyio
+    async def test_NG_検索のカーソルの場合ビジネス例外を返すこと(
+        self,
+        todo_repository: TodoRepositoryImpl,
+    ) -> None:
+        # arrange
+        # キーの型は同じ日時だが、更新日時順の検索で発行したカーソルを指定する
+        cursor = PageCursor(
+            key=datetime.now(UTC),
+            id="",
+            order=TodoSearchCondition(sort=TodoSortKey.UPDATED_AT).order,
+        )
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            await todo_repository.changes(cursor, limit=10)
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
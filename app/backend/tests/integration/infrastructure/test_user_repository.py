@@ -7,16 +7,20 @@ from dataclasses import replace
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.user.bulk_create import MAX_BULK_CREATE_SIZE
 from src.domain.user.email_address import EmailAddress
 from src.domain.user.id import UserId
 from src.domain.user.name import UserName
+from src.domain.user.projection import UserField, UserProjection
 from src.domain.user.role import Role, RoleEnum
 from src.domain.user.user import User
 from src.infrastructure.repository.user.user_repository_impl import (
     UserRepositoryImpl,
 )
+from src.shared.cache.version_counter import VersionCounter
 from src.shared.errors.codes import (
     UserErrorCode,
 )
@@ -62,14 +66,88 @@ class TestFilterUser:
             await mock_user_repository.save(user)
 
         # act
-        users = await mock_user_repository.filter()
+        page = await mock_user_repository.filter(limit=test_user_num)
 
         # assert
-        assert len(users) == test_user_num
+        assert len(page.items) == test_user_num
+        assert page.next_cursor is None
         test_user_ids = [test_user.id.value for test_user in test_users]
-        for user in users:
+        for user in page.items:
             assert user.id.value in test_user_ids
 
+    @pytest.mark.anyio
+    async def test_OK_カーソルで作成日時順に全件を辿れること(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        # 作成日時が同一のユーザーを含め、(created_at, id)順に並ぶことを確認する
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        test_users = [
+            User(
+                email=EmailAddress.random(),
+                role=Role(value=RoleEnum.MEMBER),
+                name=UserName(value="test_name"),
+                created_at=created_at,
+            )
+            for _ in range(5)
+        ]
+        for user in test_users:
+            await mock_user_repository.save(user)
+
+        # act
+        fetched: list[str] = []
+        after = None
+        while True:
+            page = await mock_user_repository.filter(limit=2, after=after)
+            fetched.extend(user.id.value for user in page.items)
+            if page.next_cursor is None:
+                break
+            after = page.next_cursor
+
+        # assert
+        assert fetched == sorted(user.id.value for user in test_users)
+
+
+class TestFilterUserProjection:
+    """一部の項目のみのユーザー一覧取得のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_指定した項目とIDのみを作成日時順に返すこと(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        test_users = [
+            User(
+                email=EmailAddress.random(),
+                role=Role(value=RoleEnum.ADMIN),
+                name=UserName(value=f"name {i}"),
+                created_at=created_at,
+            )
+            for i in range(3)
+        ]
+        for user in test_users:
+            await mock_user_repository.save(user)
+        fields = frozenset({UserField.NAME, UserField.ROLE})
+
+        # act
+        first = await mock_user_repository.filter_projection(fields, limit=2)
+        second = await mock_user_repository.filter_projection(
+            fields,
+            limit=2,
+            after=first.next_cursor,
+        )
+
+        # assert
+        expected = sorted(test_users, key=lambda user: user.id.value)
+        assert first.items + second.items == [
+            UserProjection(id=user.id, name=user.name, role=user.role)
+            for user in expected
+        ]
+        assert second.next_cursor is None
+
 
 class TestFindUser:
     """ユーザーID検索のテストクラス。
@@ -117,6 +195,42 @@ class TestFindUser:
         assert e.value.code == UserErrorCode.NotFound
 
 
+class TestFindByIdsUser:
+    """ID指定の一括検索のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_見つかったユーザーと存在しないIDが指定した順に返ること(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        first = await mock_user_repository.save(User.random())
+        second = await mock_user_repository.save(User.random())
+        missing = UserId()
+
+        # act
+        result = await mock_user_repository.find_by_ids(
+            [second.id, missing, first.id, second.id],
+        )
+
+        # assert
+        assert [user.id for user in result.found] == [second.id, first.id]
+        assert result.found[0] == second
+        assert result.not_found_ids == [missing]
+
+    @pytest.mark.anyio
+    async def test_OK_IDを指定しない場合は空の結果を返すこと(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # act
+        result = await mock_user_repository.find_by_ids([])
+
+        # assert
+        assert result.found == []
+        assert result.not_found_ids == []
+
+
 class TestFindByEmailUser:
     """メールアドレス検索のテストクラス。
 
@@ -210,6 +324,101 @@ class TestSaveUser:
         assert e.value.details == {"email": duplicate_user.email.value}
         assert e.value.code == UserErrorCode.EmailAlreadyExists
 
+    @pytest.mark.anyio
+    async def test_NG_Emailが重複した場合も既存のユーザーが変わらず続けて保存できること(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        user = await mock_user_repository.save(User.random())
+        duplicate_user = User.random(name=UserName(value="duplicate"))
+        duplicate_user.email = user.email
+        with pytest.raises(ExpectedBusinessError):
+            await mock_user_repository.save(duplicate_user)
+
+        # act
+        other = await mock_user_repository.save(User.random())
+
+        # assert
+        found = await mock_user_repository.find_by_email(user.email)
+        assert found.id == user.id
+        assert found.name == user.name
+        assert await mock_user_repository.find_by_id(other.id) == other
+        with pytest.raises(ExpectedBusinessError):
+            await mock_user_repository.find_by_id(duplicate_user.id)
+
+
+class TestBulkInsertUser:
+    """ユーザーの一括追加のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_メールアドレスが重複したユーザーのみ追加されないこと(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        existing = await mock_user_repository.save(User.random())
+        users = [User.random() for _ in range(3)]
+        # 既に存在するメールアドレスと、入力内で重複するメールアドレス
+        users[0].email = existing.email
+        users[2].email = users[1].email
+
+        # act
+        duplicate_ids = await mock_user_repository.bulk_insert(users)
+
+        # assert
+        assert duplicate_ids == [users[0].id, users[2].id]
+        assert await mock_user_repository.find_by_id(users[1].id) == users[1]
+        found = await mock_user_repository.find_by_email(existing.email)
+        assert found.id == existing.id
+        for user_id in duplicate_ids:
+            with pytest.raises(ExpectedBusinessError):
+                await mock_user_repository.find_by_id(user_id)
+
+    @pytest.mark.anyio
+    async def test_OK_追加した場合のみ世代番号が進むこと(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        repository = UserRepositoryImpl(session=db_session, versions=versions)
+        user = User.random()
+
+        # act
+        await repository.bulk_insert([])
+        empty_version = versions.value
+        await repository.bulk_insert([user])
+        inserted_version = versions.value
+        await repository.bulk_insert([replace(user, id=UserId())])
+
+        # assert
+        assert empty_version == 0
+        assert inserted_version == 1
+        assert versions.value == 1
+
+    @pytest.mark.anyio
+    async def test_OK_最大件数のユーザーを1回で追加できること(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        users = [User.random() for _ in range(MAX_BULK_CREATE_SIZE)]
+        users[-1].email = users[0].email
+
+        # act
+        duplicate_ids = await mock_user_repository.bulk_insert(users)
+
+        # assert
+        assert duplicate_ids == [users[-1].id]
+        count = await db_session.scalar(
+            text("SELECT count(*) FROM users WHERE id = ANY(:ids)"),
+            {"ids": [user.id.value for user in users]},
+        )
+        assert count == MAX_BULK_CREATE_SIZE - 1
+        assert await mock_user_repository.find_by_id(users[-2].id) == users[-2]
+
 
 class TestDeleteUser:
     """ユーザー削除のテストクラス。
@@ -253,3 +462,85 @@ class TestDeleteUser:
             await mock_user_repository.delete(user_id)
         assert e.value.details == {"user_id": user_id.value}
         assert e.value.code == UserErrorCode.NotFound
+
+
+class TestDataVersion:
+    """ユーザー全体のデータの版のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_ユーザーの作成と削除で版と世代番号が変化すること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        versions = VersionCounter()
+        user_repository = UserRepositoryImpl(session=db_session, versions=versions)
+        first = await user_repository.save(User.random())
+        second = await user_repository.save(User.random())
+        before = await user_repository.data_version()
+
+        # act
+        await user_repository.delete(first.id)
+        after = await user_repository.data_version()
+
+        # assert
+        assert before.last_modified_at == second.created_at
+        assert after.last_modified_at == second.created_at
+        assert (before.count, after.count) == (2, 1)
+        assert before != after
+        writes = 3  # 作成2回と削除1回
+        assert versions.value == writes
+
+    @pytest.mark.anyio
+    async def test_OK_一括で追加した件数のみ版の件数が増えること(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        users = [User.random() for _ in range(3)]
+        users[2].email = users[0].email
+
+        # act
+        await mock_user_repository.bulk_insert(users)
+        version = await mock_user_repository.data_version()
+
+        # assert
+        assert version.count == len(users) - 1
+
+
+class TestCount:
+    """ユーザーの件数のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_ユーザーの件数を返すこと(
+        self,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        users = [User.random(), User.random()]
+        for user in users:
+            await mock_user_repository.save(user)
+
+        # act
+        count = await mock_user_repository.count()
+
+        # assert
+        assert count == len(users)
+
+    @pytest.mark.anyio
+    async def test_OK_ANALYZE後は統計情報から件数を推定すること(
+        self,
+        db_session: AsyncSession,
+        mock_user_repository: UserRepositoryImpl,
+    ) -> None:
+        # arrange
+        await mock_user_repository.save(User.random())
+        before = await mock_user_repository.estimate_count()
+        await db_session.execute(text("ANALYZE users"))
+
+        # act
+        after = await mock_user_repository.estimate_count()
+
+        # assert
+        assert before is None
+        assert after == 1
@@ -0,0 +1,144 @@
+"""ユーザー削除ユースケースの統合テスト。
+
+PostgreSQLを使用したリポジトリを通して、削除の結果とエラーをテストする。
+"""
+
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import dependencies
+from src.domain.user.id import UserId
+from src.domain.user.user import User
+from src.infrastructure.repository.user.user_repository_impl import (
+    UserRepositoryImpl,
+)
+from src.shared.errors.codes import UserErrorCode
+from src.shared.errors.errors import ExpectedBusinessError, ExpectedUseCaseError
+from src.usecase.user.delete_user_usecase import DeleteUserUseCase
+
+
+@pytest.fixture
+async def user_references(db_session: AsyncSession) -> AsyncGenerator[None]:
+    """ユーザーを外部キーで参照するテーブルを作成する。
+
+    テスト後は、次のテストでusersテーブルを再作成できるよう削除する。
+    """
+    await db_session.execute(
+        text(
+            "CREATE TABLE user_references ("
+            "user_id VARCHAR PRIMARY KEY REFERENCES users (id))",
+        ),
+    )
+    await db_session.commit()
+    yield
+    await db_session.rollback()
+    await db_session.execute(text("DROP TABLE IF EXISTS user_references"))
+    await db_session.commit()
+
+
+@pytest.fixture
+def user_cache_enabled(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """USER_CACHE_ENABLEDを有効にし、テストの前後でプロセス内のキャッシュを空にする。"""
+    monkeypatch.setattr(dependencies, "USER_CACHE_ENABLED", True)
+    caches = (
+        dependencies._user_by_id_cache,  # noqa: SLF001
+        dependencies._user_by_email_cache,  # noqa: SLF001
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+class TestExecute:
+    """DeleteUserUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_削除したユーザーは見つからないこと(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        repository = UserRepositoryImpl(session=db_session)
+        user = await repository.save(User.random())
+
+        # act
+        await DeleteUserUseCase(repository).execute(user.id)
+
+        # assert
+        with pytest.raises(ExpectedBusinessError) as e:
+            await repository.find_by_id(user.id)
+        assert e.value.code == UserErrorCode.NotFound
+
+    @pytest.mark.anyio
+    async def test_NG_存在しないユーザーIDを指定した場合NotFoundのユースケースエラーを返すこと(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        repository = UserRepositoryImpl(session=db_session)
+        other = await repository.save(User.random())
+        user_id = UserId()
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as e:
+            await DeleteUserUseCase(repository).execute(user_id)
+        assert e.value.code == UserErrorCode.NotFound
+        assert e.value.details == {"user_id": user_id.value}
+        # 他のユーザーは削除されない
+        assert await repository.find_by_id(other.id) == other
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("user_references")
+    async def test_NG_参照されているユーザーを指定した場合UserDeleteErrorのユースケースエラーを返すこと(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        repository = UserRepositoryImpl(session=db_session)
+        user = await repository.save(User.random())
+        await db_session.execute(
+            text("INSERT INTO user_references (user_id) VALUES (:id)"),
+            {"id": user.id.value},
+        )
+        await db_session.commit()
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as e:
+            await DeleteUserUseCase(repository).execute(user.id)
+        assert e.value.code == UserErrorCode.UserDeleteError
+        assert e.value.details == {"user_id": user.id.value}
+        # ロールバックされ、ユーザーは残ったままセッションを続けて使用できる
+        assert await repository.find_by_id(user.id) == user
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("user_cache_enabled")
+    async def test_OK_キャッシュが有効な場合は削除したユーザーのエントリが破棄されること(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        # arrange
+        repository = dependencies.get_user_repository(db_session)
+        user = await repository.save(User.random())
+        other = await repository.save(User.random())
+        for cached in (user, other):
+            await repository.find_by_id(cached.id)
+            await repository.find_by_email(cached.email)
+
+        # act
+        await DeleteUserUseCase(repository).execute(user.id)
+
+        # assert
+        assert len(dependencies._user_by_id_cache) == 1  # noqa: SLF001
+        assert len(dependencies._user_by_email_cache) == 1  # noqa: SLF001
+        for find in (
+            lambda: repository.find_by_id(user.id),
+            lambda: repository.find_by_email(user.email),
+        ):
+            with pytest.raises(ExpectedBusinessError) as e:
+                await find()
+            assert e.value.code == UserErrorCode.NotFound
@@ -0,0 +1,35 @@
+"""検索用のテキストの正規化のユニットテスト。"""
+
+# 全角文字の正規化をテストするため、紛らわしい全角文字の警告を無効にする
+# ruff: noqa: RUF001
+
+import pytest
+
+from src.domain.todo.search_text import normalize_search_text
+
+
+class TestNormalizeSearchText:
+    """normalize_search_textのテストクラス。"""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("ＲｅＰｏｒｔ１２３", "report123"),
+            ("ﾚﾎﾟｰﾄ", "れぽーと"),
+            ("レポート", "れぽーと"),
+            ("れぽーと", "れぽーと"),
+            ("ヴァ", "ゔぁ"),
+            ("１００％", "100%"),
+            ("牛乳を買う", "牛乳を買う"),
+        ],
+    )
+    def test_OK_表記の揺れが同じ文字列に正規化されること(
+        self,
+        text: str,
+        expected: str,
+    ) -> None:
+        # act
+        normalized = normalize_search_text(text)
+
+        # assert
+        assert normalized == expected
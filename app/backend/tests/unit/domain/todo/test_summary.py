@@ -0,0 +1,31 @@
+"""TodoSummaryのユニットテスト。"""
+
+import pytest
+
+from src.domain.todo.summary import TodoSummary
+
+
+class TestCompletionRate:
+    """完了率のテストクラス。"""
+
+    @pytest.mark.parametrize(
+        ("completed", "pending", "expected"),
+        [
+            (0, 0, 0.0),
+            (0, 3, 0.0),
+            (1, 3, 0.25),
+            (4, 0, 1.0),
+        ],
+    )
+    def test_OK_完了済みの件数の割合となること(
+        self,
+        completed: int,
+        pending: int,
+        expected: float,
+    ) -> None:
+        # act
+        summary = TodoSummary(completed=completed, pending=pending)
+
+        # assert
+        assert summary.total == completed + pending
+        assert summary.completion_rate == expected
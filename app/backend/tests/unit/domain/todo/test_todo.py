@@ -2,8 +2,10 @@
 
 from datetime import datetime
 
+import pytest
+
 from src.domain.todo.id import TodoId
-from src.domain.todo.todo import Todo
+from src.domain.todo.todo import MAX_TODO_TITLE_LENGTH, Todo
 
 
 class TestInit:
@@ -17,6 +19,25 @@ class TestInit:
         assert isinstance(todo.created_at, datetime)
         assert isinstance(todo.updated_at, datetime)
 
+    def test_OK_最大長のタイトルで生成できること(self) -> None:
+        todo = Todo(title="a" * MAX_TODO_TITLE_LENGTH)
+
+        assert len(todo.title) == MAX_TODO_TITLE_LENGTH
+
+    @pytest.mark.parametrize(
+        "title",
+        [
+            pytest.param("", id="空文字"),
+            pytest.param("a" * (MAX_TODO_TITLE_LENGTH + 1), id="長すぎる"),
+            pytest.param("a\x00b", id="null文字を含む"),
+        ],
+    )
+    def test_NG_タイトルが不正な場合はValueErrorが投げられること(
+        self, title: str
+    ) -> None:
+        with pytest.raises(ValueError):
+            Todo(title=title)
+
 
 class TestToggle:
     def test_OK_falseからtrueに切り替わること(self) -> None:
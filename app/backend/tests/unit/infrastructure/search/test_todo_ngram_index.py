@@ -0,0 +1,366 @@
+"""TodoNgramIndexのユニットテスト。"""
+
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.domain.pagination import PageCursor, SortDirection
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.todo import Todo
+from src.infrastructure.search.todo_ngram_index import (
+    COMPACTION_MIN_DEAD_SLOTS,
+    TOMBSTONE_RETENTION,
+    TodoNgramIndex,
+)
+from src.shared.errors.codes import CommonErrorCode
+from src.shared.errors.errors import ExpectedBusinessError
+
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _todos(*titles: str) -> list[Todo]:
+    """作成日時が1秒ずつ異なるTodoを作成する。"""
+    return [
+        Todo(
+            title=title,
+            created_at=_NOW + timedelta(seconds=i),
+            updated_at=_NOW + timedelta(seconds=i),
+        )
+        for i, title in enumerate(titles)
+    ]
+
+
+async def _iterate(todos: Iterable[Todo]) -> AsyncIterator[Todo]:
+    for todo in todos:
+        yield todo
+
+
+async def _loaded_index(todos: Iterable[Todo]) -> TodoNgramIndex:
+    index = TodoNgramIndex()
+    await index.load(_iterate(todos))
+    return index
+
+
+def _titles(index: TodoNgramIndex, condition: TodoSearchCondition) -> list[str]:
+    return [todo.title for todo in index.search(condition).items]
+
+
+class TestLoad:
+    """全件の読み込みのテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_論理削除されたTodoは読み込まれないこと(self) -> None:
+        # arrange
+        todos = _todos("buy milk", "buy eggs")
+        todos[1].deleted_at = _NOW
+
+        # act
+        index = await _loaded_index(todos)
+
+        # assert
+        assert index.loaded
+        assert len(index) == 1
+        assert _titles(index, TodoSearchCondition(query="buy")) == ["buy milk"]
+
+    def test_OK_読み込み前は読み込み済みとならないこと(self) -> None:
+        # act
+        index = TodoNgramIndex()
+
+        # assert
+        assert not index.loaded
+        assert len(index) == 0
+
+
+class TestSearch:
+    """部分一致検索のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_大文字小文字を区別せず部分一致するTodoのみ返ること(
+        self,
+    ) -> None:
+        # arrange
+        index = await _loaded_index(_todos("Weekly REPORT", "report", "other"))
+
+        # act
+        titles = _titles(index, TodoSearchCondition(query="Report"))
+
+        # assert
+        assert sorted(titles) == ["Weekly REPORT", "report"]
+
+    @pytest.mark.anyio
+    async def test_OK_類似度の高い順に並ぶこと(self) -> None:
+        # arrange
+        index = await _loaded_index(
+            _todos("report draft for the quarterly meeting", "weekly report", "report"),
+        )
+
+        # act
+        titles = _titles(index, TodoSearchCondition(query="report"))
+
+        # assert
+        assert titles == [
+            "report",
+            "weekly report",
+            "report draft for the quarterly meeting",
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_データベースと同じく半角カナとひらがなカタカナを区別しないこと(
+        self,
+    ) -> None:
+        # arrange
+        index = await _loaded_index(_todos("ﾚﾎﾟｰﾄ作成", "れぽーと", "other"))
+
+        # act
+        titles = _titles(index, TodoSearchCondition(query="レポート"))
+
+        # assert
+        assert sorted(titles) == ["れぽーと", "ﾚﾎﾟｰﾄ作成"]
+
+    @pytest.mark.anyio
+    async def test_OK_nグラムより短いクエリや日本語のクエリでも検索できること(
+        self,
+    ) -> None:
+        # arrange
+        index = await _loaded_index(_todos("牛乳を買う", "卵を買う", "掃除"))
+
+        # act
+        short = _titles(index, TodoSearchCondition(query="卵"))
+        japanese = _titles(index, TodoSearchCondition(query="買う"))
+
+        # assert
+        assert short == ["卵を買う"]
+        assert sorted(japanese) == ["卵を買う", "牛乳を買う"]
+
+    @pytest.mark.anyio
+    async def test_OK_完了フラグで絞り込まれること(self) -> None:
+        # arrange
+        todos = _todos("buy milk", "buy eggs")
+        todos[0].completed = True
+        index = await _loaded_index(todos)
+
+        # act
+        completed = _titles(index, TodoSearchCondition(query="buy", completed=True))
+        pending = _titles(index, TodoSearchCondition(query="buy", completed=False))
+
+        # assert
+        assert completed == ["buy milk"]
+        assert pending == ["buy eggs"]
+
+    @pytest.mark.anyio
+    async def test_OK_指定したキーと向きの順にカーソルで全件を辿れること(
+        self,
+    ) -> None:
+        # arrange
+        index = await _loaded_index(_todos("task c", "task a", "task b", "task d"))
+
+        # act
+        fetched: list[str] = []
+        after = None
+        while True:
+            page = index.search(
+                TodoSearchCondition(
+                    query="task",
+                    limit=3,
+                    after=after,
+                    sort=TodoSortKey.CREATED_AT,
+                    direction=SortDirection.DESC,
+                ),
+            )
+            fetched.extend(todo.title for todo in page.items)
+            if page.next_cursor is None:
+                break
+            after = page.next_cursor
+
+        # assert
+        assert fetched == ["task d", "task b", "task a", "task c"]
+
+    @pytest.mark.anyio
+    async def test_OK_類似度順の検索結果をカーソルで辿れること(self) -> None:
+        # arrange
+        index = await _loaded_index(
+            _todos("report draft for the quarterly meeting", "report", "weekly report"),
+        )
+
+        # act
+        first = index.search(TodoSearchCondition(query="report", limit=2))
+        second = index.search(
+            TodoSearchCondition(query="report", limit=2, after=first.next_cursor),
+        )
+
+        # assert
+        assert [todo.title for todo in first.items] == ["report", "weekly report"]
+        assert [todo.title for todo in second.items] == [
+            "report draft for the quarterly meeting",
+        ]
+        assert second.next_cursor is None
+
+    @pytest.mark.anyio
+    async def test_NG_並び順と一致しないカーソルの場合ビジネス例外を返すこと(
+        self,
+    ) -> None:
+        # arrange
+        index = await _loaded_index(_todos("report"))
+        cursor = PageCursor(key=_NOW, id="id")
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            index.search(TodoSearchCondition(query="report", after=cursor))
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+    @pytest.mark.anyio
+    async def test_NG_並び替えキーが異なるカーソルの場合ビジネス例外を返すこと(
+        self,
+    ) -> None:
+        # arrange
+        # キーの型が同じ作成日時順のカーソルを、更新日時順の検索に指定する
+        index = await _loaded_index(_todos("task a", "task b"))
+        page = index.search(
+            TodoSearchCondition(query="task", limit=1, sort=TodoSortKey.CREATED_AT)
+        )
+        assert page.next_cursor is not None
+
+        # act & assert
+        with pytest.raises(ExpectedBusinessError) as exc_info:
+            index.search(
+                TodoSearchCondition(
+                    query="task",
+                    after=page.next_cursor,
+                    sort=TodoSortKey.UPDATED_AT,
+                ),
+            )
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+    @pytest.mark.anyio
+    async def test_NG_全文検索を指定した場合ValueErrorを返すこと(self) -> None:
+        # arrange
+        index = await _loaded_index(_todos("report"))
+
+        # act & assert
+        with pytest.raises(ValueError, match="unsupported search mode"):
+            index.search(
+                TodoSearchCondition(query="report", mode=TodoSearchMode.FTS),
+            )
+
+
+class TestApply:
+    """変更の反映のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_追加したTodoが検索されること(self) -> None:
+        # arrange
+        index = await _loaded_index(_todos("buy milk"))
+
+        # act
+        index.apply(Todo(title="buy eggs"))
+
+        # assert
+        assert sorted(_titles(index, TodoSearchCondition(query="buy"))) == [
+            "buy eggs",
+            "buy milk",
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_タイトルの変更後は新しいタイトルでのみ検索されること(
+        self,
+    ) -> None:
+        # arrange
+        (todo,) = _todos("buy milk")
+        index = await _loaded_index([todo])
+
+        # act
+        index.apply(
+            replace(todo, title="clean room", updated_at=_NOW + timedelta(hours=1)),
+        )
+
+        # assert
+        assert _titles(index, TodoSearchCondition(query="milk")) == []
+        assert _titles(index, TodoSearchCondition(query="room")) == ["clean room"]
+        assert len(index) == 1
+
+    @pytest.mark.anyio
+    async def test_OK_削除したTodoが検索されないこと(self) -> None:
+        # arrange
+        (todo,) = _todos("buy milk")
+        index = await _loaded_index([todo])
+        later = _NOW + timedelta(hours=1)
+
+        # act
+        index.apply(replace(todo, updated_at=later, deleted_at=later))
+
+        # assert
+        assert _titles(index, TodoSearchCondition(query="milk")) == []
+        assert len(index) == 0
+
+    @pytest.mark.anyio
+    async def test_OK_反映済みの変更より古い変更は無視されること(self) -> None:
+        # arrange
+        (todo,) = _todos("buy milk")
+        index = await _loaded_index([todo])
+        later = _NOW + timedelta(hours=1)
+        index.apply(replace(todo, completed=True, updated_at=later))
+        index.apply(replace(todo, updated_at=later, deleted_at=later))
+
+        # act
+        # 削除より前の変更が後から届いても、削除したTodoは復活しない
+        index.apply(replace(todo, title="buy eggs", updated_at=_NOW))
+
+        # assert
+        assert _titles(index, TodoSearchCondition(query="buy")) == []
+
+    @pytest.mark.anyio
+    async def test_OK_タイトルの変更を繰り返しても検索結果が変わらないこと(
+        self,
+    ) -> None:
+        # arrange
+        todos = _todos("buy milk", "buy eggs")
+        index = await _loaded_index(todos)
+
+        # act
+        # 無効なスロットが一定数を超えると、インデックスが作り直される
+        for i in range(COMPACTION_MIN_DEAD_SLOTS * 2):
+            index.apply(
+                replace(
+                    todos[0],
+                    title=f"buy milk {i}",
+                    updated_at=_NOW + timedelta(seconds=i + 10),
+                ),
+            )
+
+        # assert
+        assert len(index) == len(todos)
+        assert sorted(_titles(index, TodoSearchCondition(query="buy"))) == [
+            "buy eggs",
+            f"buy milk {COMPACTION_MIN_DEAD_SLOTS * 2 - 1}",
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_作り直した後は古い削除の記録のみ破棄されること(self) -> None:
+        # arrange
+        todos = _todos(*(f"buy {i}" for i in range(COMPACTION_MIN_DEAD_SLOTS)))
+        index = await _loaded_index(todos)
+        old_deleted_at = todos[-1].updated_at + timedelta(seconds=1)
+        deleted_at = old_deleted_at + TOMBSTONE_RETENTION * 2
+        # 最後の1件のみ、最も新しい削除からTOMBSTONE_RETENTION以内に削除する
+        for todo in todos[:-1]:
+            index.apply(
+                replace(todo, updated_at=old_deleted_at, deleted_at=old_deleted_at),
+            )
+        before = index.tombstone_count
+
+        # act
+        index.apply(replace(todos[-1], updated_at=deleted_at, deleted_at=deleted_at))
+        # 保持している削除より古い変更は、作り直した後も無視される
+        index.apply(replace(todos[-1], title="buy eggs", updated_at=old_deleted_at))
+
+        # assert
+        assert before == COMPACTION_MIN_DEAD_SLOTS - 1
+        assert index.tombstone_count == 1
+        assert len(index) == 0
+        assert _titles(index, TodoSearchCondition(query="buy")) == []
@@ -1,42 +1,200 @@
-"""GET /todos?q= と PATCH /todos/:id/toggle のテスト。
+"""GET /todos?q= と PATCH /todos/:id/toggle などのTodoエンドポイントのテスト。
 
 TestClientを使用し、正常系・異常系をカバーする。
 インメモリのフェイクリポジトリでDB依存なしで実行可能。
 """
 
+import asyncio
+import json
 import uuid
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page, PageCursor, SortDirection
+from src.domain.todo.bulk_import import TodoBulkInsertResult
+from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
+from src.domain.todo.event import TodoEvent, TodoEventType
 from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
 from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import (
+    TodoSearchCondition,
+    TodoSearchMode,
+    TodoSortKey,
+)
+from src.domain.todo.search_text import normalize_search_text
+from src.domain.todo.summary import TodoSummary
 from src.domain.todo.todo import Todo
 from src.main import app
-from src.shared.errors.codes import TodoErrorCode
+from src.presentation.api.routes.todo import (
+    EVENT_STREAM_MEDIA_TYPE,
+    _todo_event_stream,
+    stream_todo_events,
+)
+from src.presentation.api.schema.cursor import encode_cursor
+from src.shared.cache.ttl_lru_cache import TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import CommonErrorCode, TodoErrorCode
 from src.shared.errors.errors import ExpectedBusinessError
+from src.shared.pubsub.broadcaster import Broadcaster
 
 
 class FakeTodoRepository(TodoRepository):
     """テスト用のインメモリTodoリポジトリ。"""
 
     def __init__(self) -> None:
+        """空のリポジトリを作成する。"""
         self._store: dict[str, Todo] = {}
 
     def add(self, todo: Todo) -> None:
         self._store[todo.id.value] = todo
 
-    async def search(self, query: str) -> list[Todo]:
-        if not query:
-            return list(self._store.values())
-        q = query.lower()
-        return [t for t in self._store.values() if q in t.title.lower()]
+    def clear(self) -> None:
+        self._store.clear()
+
+    async def search(self, condition: TodoSearchCondition) -> Page[Todo]:
+        q = condition.query.lower()
+        sort = (condition.sort or TodoSortKey.CREATED_AT).value
+        descending = condition.direction == SortDirection.DESC
+
+        def position(t: Todo) -> tuple[datetime | str, str]:
+            return (getattr(t, sort), t.id.value)
+
+        todos = sorted(
+            (
+                t
+                for t in self._store.values()
+                if not t.is_deleted
+                and q in t.title.lower()
+                and condition.completed in {None, t.completed}
+            ),
+            key=position,
+            reverse=descending,
+        )
+        after = condition.after
+        if after is not None:
+            key_type = str if sort == TodoSortKey.TITLE else datetime
+            if not isinstance(after.key, key_type):
+                raise ExpectedBusinessError(code=CommonErrorCode.InvalidValue)
+            boundary = (after.key, after.id)
+            todos = [
+                t
+                for t in todos
+                if (position(t) < boundary if descending else position(t) > boundary)
+            ]
+        items = todos[: condition.limit]
+        if len(todos) <= condition.limit:
+            return Page(items=items)
+        last = items[-1]
+        return Page(
+            items=items,
+            next_cursor=PageCursor(key=getattr(last, sort), id=last.id.value),
+        )
+
+    async def search_projection(
+        self,
+        condition: TodoSearchCondition,
+        fields: frozenset[TodoField],
+    ) -> Page[TodoProjection]:
+        page = await self.search(condition)
+        return Page(
+            items=[
+                TodoProjection(
+                    id=t.id,
+                    **{
+                        f.value: getattr(t, f.value)
+                        for f in fields
+                        if f != TodoField.ID
+                    },
+                )
+                for t in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+
+    async def suggest_titles(self, prefix: str, limit: int) -> list[str]:
+        titles: dict[str, str] = {}
+        for t in sorted(self._store.values(), key=lambda t: t.title):
+            key = normalize_search_text(t.title)
+            if not t.is_deleted and key.startswith(normalize_search_text(prefix)):
+                titles.setdefault(key, t.title)
+        return [titles[key] for key in sorted(titles)][:limit]
+
+    async def stream(
+        self,
+        query: str,
+        mode: TodoSearchMode,
+        completed: bool | None = None,
+        sort: TodoSortKey | None = None,
+        direction: SortDirection = SortDirection.ASC,
+    ) -> AsyncIterator[Todo]:
+        page = await self.search(
+            TodoSearchCondition(
+                query=query,
+                mode=mode,
+                completed=completed,
+                sort=sort,
+                direction=direction,
+                limit=len(self._store),
+            ),
+        )
+        for todo in page.items:
+            yield todo
+
+    async def changes(self, after: PageCursor, limit: int) -> Page[Todo]:
+        if not isinstance(after.key, datetime):
+            raise ExpectedBusinessError(code=CommonErrorCode.InvalidValue)
+        todos = sorted(
+            (
+                t
+                for t in self._store.values()
+                if (t.updated_at, t.id.value) > (after.key, after.id)
+            ),
+            key=lambda t: (t.updated_at, t.id.value),
+        )
+        items = todos[:limit]
+        if len(todos) <= limit:
+            return Page(items=items)
+        last = items[-1]
+        return Page(
+            items=items,
+            next_cursor=PageCursor(key=last.updated_at, id=last.id.value),
+        )
+
+    async def data_version(self) -> DataVersion:
+        return DataVersion(
+            count=len(self._store),
+            last_modified_at=max(
+                (t.updated_at for t in self._store.values()),
+                default=None,
+            ),
+        )
+
+    async def count(self, completed: bool | None = None) -> int:
+        return sum(
+            1
+            for t in self._store.values()
+            if not t.is_deleted and completed in {None, t.completed}
+        )
+
+    async def summarize(self) -> TodoSummary:
+        todos = [t for t in self._store.values() if not t.is_deleted]
+        completed = sum(1 for t in todos if t.completed)
+        return TodoSummary(completed=completed, pending=len(todos) - completed)
+
+    async def estimate_count(self) -> int | None:
+        # 統計情報による推定のため、削除済みのTodoも含めて数える
+        return len(self._store) or None
 
     async def find_by_id(self, todo_id: TodoId) -> Todo:
         todo = self._store.get(todo_id.value)
-        if todo is None:
+        if todo is None or todo.is_deleted:
             raise ExpectedBusinessError(
                 code=TodoErrorCode.NotFound,
                 details={"todo_id": todo_id.value},
@@ -47,15 +205,62 @@ class FakeTodoRepository(TodoRepository):
         self._store[todo.id.value] = todo
         return todo
 
+    async def delete(self, todo_id: TodoId) -> Todo:
+        todo = await self.find_by_id(todo_id)
+        todo.deleted_at = todo.updated_at = datetime.now(UTC)
+        return todo
+
+    async def toggle(self, todo_id: TodoId) -> Todo:
+        todo = await self.find_by_id(todo_id)
+        todo.toggle()
+        return todo
+
+    async def bulk_update(
+        self,
+        todo_ids: list[TodoId],
+        action: TodoBulkAction,
+    ) -> TodoBulkUpdateResult:
+        updated: list[Todo] = []
+        not_found_ids: list[TodoId] = []
+        for todo_id in todo_ids:
+            todo = self._store.get(todo_id.value)
+            if todo is None:
+                not_found_ids.append(todo_id)
+                continue
+            if action == TodoBulkAction.TOGGLE:
+                todo.toggle()
+            else:
+                todo.completed = action == TodoBulkAction.COMPLETE
+                todo.updated_at = datetime.now(UTC)
+            updated.append(todo)
+        return TodoBulkUpdateResult(updated=updated, not_found_ids=not_found_ids)
+
+    async def bulk_insert(self, todos: Sequence[Todo]) -> TodoBulkInsertResult:
+        result = TodoBulkInsertResult()
+        for todo in todos:
+            if todo.id.value in self._store:
+                result.conflicted_ids.append(todo.id)
+            else:
+                # 実装と同じく、更新日時は追加した時刻とする
+                inserted = replace(todo, updated_at=datetime.now(UTC))
+                self._store[todo.id.value] = inserted
+                result.inserted.append(inserted)
+        return result
+
 
 _fake_repo = FakeTodoRepository()
 
 
-def _fake_get_todo_repository(_session):
+def _fake_get_todo_repository(_session: object) -> FakeTodoRepository:
     return _fake_repo
 
 
-def _make_todo(title: str, completed: bool = False) -> Todo:
+def _make_todo(
+    title: str,
+    *,
+    completed: bool = False,
+    updated_at: datetime | None = None,
+) -> Todo:
     """テスト用Todoを作成してリポジトリに追加し、返す。"""
     now = datetime.now(UTC)
     todo = Todo(
@@ -63,19 +268,39 @@ def _make_todo(title: str, completed: bool = False) -> Todo:
         title=title,
         completed=completed,
         created_at=now,
-        updated_at=now,
+        updated_at=updated_at or now,
     )
     _fake_repo.add(todo)
     return todo
 
 
 @pytest.fixture(autouse=True)
-def _setup():
-    """各テスト前にリポジトリをクリアし、依存性をパッチする。"""
-    _fake_repo._store.clear()
-    with patch(
-        "src.presentation.api.routes.todo.get_todo_repository",
-        _fake_get_todo_repository,
+def _setup() -> Iterator[None]:
+    """各テスト前にリポジトリをクリアし、依存性をパッチする。
+
+    検索結果のキャッシュはテストごとに新しく作成し、テスト間で共有しない。
+    偽のリポジトリは世代番号を進めないため、データの版はキャッシュしない。
+    """
+    _fake_repo.clear()
+    cache = TtlLruCache(maxsize=8, ttl=60.0, versions=VersionCounter())
+    suggestion_cache = TtlLruCache(maxsize=8, ttl=60.0, versions=VersionCounter())
+    with (
+        patch(
+            "src.presentation.api.routes.todo.get_todo_repository",
+            _fake_get_todo_repository,
+        ),
+        patch(
+            "src.presentation.api.routes.todo.get_todo_search_cache",
+            lambda: cache,
+        ),
+        patch(
+            "src.presentation.api.routes.todo.get_todo_title_suggestion_cache",
+            lambda: suggestion_cache,
+        ),
+        patch(
+            "src.presentation.api.routes.todo.get_todo_data_version_cache",
+            lambda: None,
+        ),
     ):
         yield
 
@@ -154,6 +379,224 @@ class TestSearchTodos:
         completed = [t for t in data["todos"] if t["completed"]]
         assert len(completed) == 1
 
+    def test_completed_filters_todos(self):
+        """completedパラメータで完了フラグが一致するTodoのみを返す。"""
+        _make_todo("完了済み", completed=True)
+        _make_todo("未完了1")
+        _make_todo("未完了2")
+
+        pending = client.get("/todos", params={"completed": "false"}).json()
+        done = client.get("/todos", params={"completed": "true"}).json()
+
+        assert sorted(t["title"] for t in pending["todos"]) == ["未完了1", "未完了2"]
+        assert [t["title"] for t in done["todos"]] == ["完了済み"]
+
+    def test_completed_applies_to_ndjson(self):
+        """NDJSONでもcompletedパラメータで絞り込む。"""
+        _make_todo("完了済み", completed=True)
+        _make_todo("未完了")
+
+        response = client.get(
+            "/todos",
+            params={"completed": "false"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        titles = [json.loads(line)["title"] for line in response.text.splitlines()]
+        assert titles == ["未完了"]
+
+    def test_sort_orders_todos(self):
+        """sortとdirectionで指定したキー・向きの順に返す。"""
+        now = datetime.now(UTC)
+        _make_todo("b", updated_at=now - timedelta(minutes=1))
+        _make_todo("c", updated_at=now - timedelta(minutes=2))
+        _make_todo("a", updated_at=now)
+
+        by_title = client.get("/todos", params={"sort": "title", "direction": "desc"})
+        by_updated_at = client.get("/todos", params={"sort": "updated_at"})
+
+        assert [t["title"] for t in by_title.json()["todos"]] == ["c", "b", "a"]
+        assert [t["title"] for t in by_updated_at.json()["todos"]] == ["c", "b", "a"]
+
+    def test_sort_paginates_with_next_cursor(self):
+        """並び替えたページもnext_cursorで続きを取得できる。"""
+        for title in ("d", "b", "a", "c"):
+            _make_todo(title)
+        params = {"sort": "title", "limit": 3}
+
+        first = client.get("/todos", params=params).json()
+        second = client.get(
+            "/todos",
+            params={**params, "after": first["next_cursor"]},
+        ).json()
+
+        assert [t["title"] for t in first["todos"]] == ["a", "b", "c"]
+        assert [t["title"] for t in second["todos"]] == ["d"]
+        assert second["next_cursor"] is None
+
+    def test_sort_applies_to_ndjson(self):
+        """NDJSONでもsortの順に返す。"""
+        _make_todo("b")
+        _make_todo("a")
+
+        response = client.get(
+            "/todos",
+            params={"sort": "title"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        titles = [json.loads(line)["title"] for line in response.text.splitlines()]
+        assert titles == ["a", "b"]
+
+    def test_cursor_of_other_sort_returns_400(self):
+        """並び替えキーの型と一致しないカーソルの場合は400を返す。"""
+        _make_todo("買い物")
+        cursor = encode_cursor(PageCursor(key=datetime.now(UTC), id="x"))
+
+        response = client.get("/todos", params={"sort": "title", "after": cursor})
+        assert response.status_code == 400
+
+    def test_fields_returns_only_requested_fields(self):
+        """fieldsで指定した項目とidのみを返す。"""
+        todo = _make_todo("買い物", completed=True)
+
+        response = client.get("/todos", params={"fields": "title, completed"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "todos": [{"id": todo.id.value, "title": "買い物", "completed": True}],
+            "next_cursor": None,
+        }
+        assert "ETag" in response.headers
+
+    def test_fields_paginates_with_next_cursor(self):
+        """fieldsを指定したページもnext_cursorで続きを取得できる。"""
+        for title in ("a", "b", "c"):
+            _make_todo(title)
+        params = {"fields": "id", "sort": "title", "limit": 2}
+
+        first = client.get("/todos", params=params).json()
+        second = client.get(
+            "/todos",
+            params={**params, "after": first["next_cursor"]},
+        ).json()
+
+        assert all(set(t) == {"id"} for t in first["todos"] + second["todos"])
+        assert len(first["todos"] + second["todos"]) == 3
+        assert second["next_cursor"] is None
+
+    @pytest.mark.parametrize("fields", ["", "title,owner"])
+    def test_invalid_fields_returns_400(self, fields: str):
+        """項目がない場合や存在しない項目名を含む場合は400を返す。"""
+        response = client.get("/todos", params={"fields": fields})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "INVALID_VALUE"
+
+    def test_fields_with_ndjson_returns_400(self):
+        """NDJSONでは項目を指定できない。"""
+        response = client.get(
+            "/todos",
+            params={"fields": "title"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 400
+
+    def test_invalid_sort_returns_422(self):
+        """sortまたはdirectionが不正な場合は422を返す。"""
+        assert client.get("/todos", params={"sort": "id"}).status_code == 422
+        assert client.get("/todos", params={"direction": "up"}).status_code == 422
+
+    def test_limit_restricts_number_of_results(self):
+        """limitパラメータで返却件数を制限する。"""
+        _make_todo("買い物1")
+        _make_todo("買い物2")
+        _make_todo("買い物3")
+
+        response = client.get("/todos", params={"q": "買い物", "limit": 2})
+        assert response.status_code == 200
+        assert len(response.json()["todos"]) == 2
+
+    def test_limit_out_of_range_returns_422(self):
+        """limitが範囲外の場合は422を返す。"""
+        response = client.get("/todos", params={"limit": 0})
+        assert response.status_code == 422
+
+    def test_fts_mode_is_accepted(self):
+        """mode=ftsを指定できる。"""
+        _make_todo("買い物")
+
+        response = client.get("/todos", params={"q": "買い物", "mode": "fts"})
+        assert response.status_code == 200
+        assert len(response.json()["todos"]) == 1
+
+    def test_unknown_mode_returns_422(self):
+        """未定義のmodeの場合は422を返す。"""
+        response = client.get("/todos", params={"q": "買い物", "mode": "regex"})
+        assert response.status_code == 422
+
+    def test_next_cursor_is_null_on_last_page(self):
+        """最後のページではnext_cursorがnullになる。"""
+        _make_todo("買い物")
+
+        response = client.get("/todos")
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+
+    def test_after_returns_next_page(self):
+        """next_cursorをafterに指定すると次のページを返す。"""
+        titles = [_make_todo(f"タスク{i}").title for i in range(3)]
+
+        first = client.get("/todos", params={"limit": 2}).json()
+        second = client.get(
+            "/todos",
+            params={"limit": 2, "after": first["next_cursor"]},
+        ).json()
+
+        fetched = [t["title"] for t in first["todos"] + second["todos"]]
+        assert sorted(fetched) == sorted(titles)
+        assert second["next_cursor"] is None
+
+    def test_malformed_cursor_returns_400(self):
+        """デコードできないカーソルの場合は400を返す。"""
+        response = client.get("/todos", params={"after": "not-a-cursor"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "INVALID_VALUE"
+
+    def test_cursor_of_other_order_returns_400(self):
+        """並び順と一致しないカーソルの場合は400を返す。"""
+        cursor = encode_cursor(PageCursor(key=0.5, id=str(uuid.uuid4())))
+
+        response = client.get("/todos", params={"after": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "INVALID_VALUE"
+
+    def test_ndjson_streams_all_todos_line_by_line(self):
+        """NDJSONを要求すると、limitによらず全件を1行1件で返す。"""
+        titles = [_make_todo(f"タスク{i}").title for i in range(3)]
+
+        response = client.get(
+            "/todos",
+            params={"limit": 1},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert sorted(json.loads(line)["title"] for line in lines) == sorted(titles)
+
+    def test_ndjson_applies_query(self):
+        """NDJSONでもqパラメータで絞り込む。"""
+        _make_todo("買い物")
+        _make_todo("掃除")
+
+        response = client.get(
+            "/todos",
+            params={"q": "買い物"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        todos = [json.loads(line) for line in response.text.splitlines()]
+        assert [t["title"] for t in todos] == ["買い物"]
+        assert set(todos[0]) == {"id", "title", "completed", "created_at", "updated_at"}
+
     def test_todo_response_schema(self):
         """レスポンスのスキーマが正しい。"""
         _make_todo("スキーマ確認")
@@ -238,3 +681,570 @@ class TestToggleTodo:
         assert "completed" in resp_todo
         assert "created_at" in resp_todo
         assert "updated_at" in resp_todo
+
+
+# ======================================================================
+# GET /todos (条件付き取得)
+# ======================================================================
+
+
+class TestSearchTodosConditional:
+    """GET /todos のETag・If-None-Matchのテスト。"""
+
+    def test_returns_etag(self):
+        """レスポンスにETagを含める。"""
+        _make_todo("買い物")
+
+        response = client.get("/todos")
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+
+    def test_matching_if_none_match_returns_304(self):
+        """If-None-MatchがETagに一致する場合は本文なしで304を返す。"""
+        _make_todo("買い物")
+        etag = client.get("/todos").headers["ETag"]
+
+        response = client.get("/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_weak_and_listed_etags_match(self):
+        """弱いETagや複数のETagの指定でも一致を判定する。"""
+        _make_todo("買い物")
+        etag = client.get("/todos").headers["ETag"]
+
+        response = client.get(
+            "/todos",
+            headers={"If-None-Match": f'"other", W/{etag}'},
+        )
+        assert response.status_code == 304
+
+    def test_different_query_has_different_etag(self):
+        """クエリパラメーターが異なる場合はETagも異なる。"""
+        _make_todo("買い物")
+        etag = client.get("/todos").headers["ETag"]
+
+        response = client.get(
+            "/todos",
+            params={"q": "買い物"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_different_sort_has_different_etag(self):
+        """並び順や返す項目が異なる場合はETagも異なる。"""
+        _make_todo("買い物")
+        etag = client.get("/todos", params={"sort": "title"}).headers["ETag"]
+
+        for params in (
+            {"sort": "title", "direction": "desc"},
+            {"sort": "title", "fields": "title"},
+        ):
+            response = client.get(
+                "/todos",
+                params=params,
+                headers={"If-None-Match": etag},
+            )
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+
+    def test_same_fields_in_other_order_has_same_etag(self):
+        """返す項目の指定順が異なるだけの場合は同じETagとなる。"""
+        _make_todo("買い物")
+        etag = client.get("/todos", params={"fields": "title,completed"}).headers[
+            "ETag"
+        ]
+
+        response = client.get(
+            "/todos",
+            params={"fields": "completed,title"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    def test_write_changes_etag(self):
+        """Todoが更新された場合は200で最新の結果を返す。"""
+        todo = _make_todo("買い物")
+        etag = client.get("/todos").headers["ETag"]
+        client.patch(f"/todos/{todo.id.value}/toggle")
+
+        response = client.get("/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["todos"][0]["completed"] is True
+        assert response.headers["ETag"] != etag
+
+
+# ======================================================================
+# GET /todos/count (件数取得)
+# ======================================================================
+
+
+class TestCountTodos:
+    """GET /todos/count のテスト。"""
+
+    def test_returns_exact_count_excluding_deleted(self):
+        """削除済みを除いた正確な件数を返す。"""
+        _make_todo("買い物")
+        _make_todo("掃除", completed=True)
+        _make_todo("削除済み").deleted_at = datetime.now(UTC)
+        response = client.get("/todos/count")
+        assert response.status_code == 200
+        assert response.json() == {"count": 2, "approximate": False}
+
+    def test_completed_filters_count(self):
+        """completedで絞り込んだ件数を返す。"""
+        _make_todo("買い物")
+        _make_todo("掃除", completed=True)
+        _make_todo("洗濯", completed=True)
+        response = client.get("/todos/count", params={"completed": "false"})
+        assert response.json() == {"count": 1, "approximate": False}
+
+    def test_approximate_returns_estimate(self):
+        """approximate=trueの場合、推定した件数を返す。"""
+        _make_todo("買い物")
+        _make_todo("削除済み").deleted_at = datetime.now(UTC)
+        response = client.get("/todos/count", params={"approximate": "true"})
+        assert response.json() == {"count": 2, "approximate": True}
+
+    def test_approximate_with_completed_returns_exact_count(self):
+        """completedを指定した場合、approximate=trueでも正確な件数を返す。"""
+        _make_todo("買い物")
+        _make_todo("掃除", completed=True)
+        response = client.get(
+            "/todos/count",
+            params={"approximate": "true", "completed": "true"},
+        )
+        assert response.json() == {"count": 1, "approximate": False}
+
+    def test_approximate_without_statistics_returns_exact_count(self):
+        """推定できない場合、approximate=trueでも正確な件数を返す。"""
+        response = client.get("/todos/count", params={"approximate": "true"})
+        assert response.json() == {"count": 0, "approximate": False}
+
+
+# ======================================================================
+# GET /todos/summary (件数の集計)
+# ======================================================================
+
+
+class TestTodoSummary:
+    """GET /todos/summary のテスト。"""
+
+    def test_returns_counts_and_completion_rate(self):
+        """削除済みを除いた件数と完了率を返す。"""
+        _make_todo("買い物", completed=True)
+        _make_todo("掃除")
+        _make_todo("洗濯")
+        _make_todo("料理")
+        _make_todo("削除済み", completed=True).deleted_at = datetime.now(UTC)
+        response = client.get("/todos/summary")
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 4,
+            "completed": 1,
+            "pending": 3,
+            "completion_rate": 0.25,
+        }
+
+    def test_returns_zero_rate_without_todos(self):
+        """Todoがない場合、完了率は0を返す。"""
+        response = client.get("/todos/summary")
+        assert response.json() == {
+            "total": 0,
+            "completed": 0,
+            "pending": 0,
+            "completion_rate": 0.0,
+        }
+
+
+# ======================================================================
+# GET /todos/suggest (タイトルの入力補完)
+# ======================================================================
+
+
+class TestSuggestTodoTitles:
+    """GET /todos/suggest のテスト。"""
+
+    def test_returns_titles_starting_with_prefix(self):
+        """prefixで始まるタイトルを、正規化したタイトル順に返す。"""
+        _make_todo("レポート提出")
+        _make_todo("れぽーと")
+        _make_todo("週次レポート")
+        response = client.get("/todos/suggest", params={"prefix": "ﾚﾎﾟ"})
+        assert response.status_code == 200
+        assert response.json() == {"titles": ["れぽーと", "レポート提出"]}
+
+    def test_limit_restricts_titles(self):
+        """limit件までの候補を返す。"""
+        for title in ("task a", "task b", "task c"):
+            _make_todo(title)
+        response = client.get("/todos/suggest", params={"prefix": "task", "limit": 2})
+        assert response.json() == {"titles": ["task a", "task b"]}
+
+    def test_same_prefix_is_served_from_cache(self):
+        """同じprefixの候補は、キャッシュの有効期限内は再取得しない。"""
+        _make_todo("task a")
+        client.get("/todos/suggest", params={"prefix": "task"})
+        _make_todo("task b")
+        response = client.get("/todos/suggest", params={"prefix": "TASK"})
+        assert response.json() == {"titles": ["task a"]}
+
+    @pytest.mark.parametrize(
+        "params",
+        [{}, {"prefix": ""}, {"prefix": "a", "limit": 0}, {"prefix": "a", "limit": 51}],
+    )
+    def test_invalid_params_returns_422(self, params: dict[str, str | int]):
+        """prefixが空、またはlimitが範囲外の場合は422を返す。"""
+        response = client.get("/todos/suggest", params=params)
+        assert response.status_code == 422
+
+
+# ======================================================================
+# GET /todos?updated_since= (差分同期)
+# ======================================================================
+
+
+class TestSyncTodos:
+    """GET /todos?updated_since= のテスト。"""
+
+    def test_returns_only_todos_changed_since(self):
+        """updated_since以降に更新されたTodoのみを更新日時順に返す。"""
+        since = datetime.now(UTC) - timedelta(hours=1)
+        _make_todo("古い", updated_at=since - timedelta(minutes=1))
+        later = _make_todo("後", updated_at=since + timedelta(minutes=2))
+        earlier = _make_todo("先", updated_at=since + timedelta(minutes=1))
+
+        response = client.get("/todos", params={"updated_since": since.isoformat()})
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["id"] for t in data["todos"]] == [earlier.id.value, later.id.value]
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+
+    def test_deleted_todos_are_returned_as_tombstones(self):
+        """削除されたTodoはdeletedとして返す。"""
+        since = datetime.now(UTC) - timedelta(hours=1)
+        todo = _make_todo("削除", updated_at=since - timedelta(minutes=1))
+        client.delete(f"/todos/{todo.id.value}")
+
+        response = client.get("/todos", params={"updated_since": since.isoformat()})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["todos"] == []
+        assert [t["id"] for t in data["deleted"]] == [todo.id.value]
+
+    def test_next_cursor_resumes_after_last_change(self):
+        """next_cursorをafterに指定すると、続きの変更から返す。"""
+        since = datetime.now(UTC) - timedelta(hours=1)
+        titles = [
+            _make_todo(f"変更{i}", updated_at=since + timedelta(minutes=i)).title
+            for i in range(3)
+        ]
+
+        first = client.get(
+            "/todos",
+            params={"updated_since": since.isoformat(), "limit": 2},
+        ).json()
+        second = client.get(
+            "/todos",
+            params={
+                "updated_since": since.isoformat(),
+                "limit": 2,
+                "after": first["next_cursor"],
+            },
+        ).json()
+        third = client.get(
+            "/todos",
+            params={"updated_since": since.isoformat(), "after": second["next_cursor"]},
+        ).json()
+
+        assert first["has_more"] is True
+        assert second["has_more"] is False
+        fetched = [t["title"] for t in first["todos"] + second["todos"]]
+        assert fetched == titles
+        assert third["todos"] == []
+
+    def test_recent_changes_are_returned_again(self):
+        """コミットの遅れを考慮し、直近の変更は次回の同期でも返す。"""
+        since = datetime.now(UTC) - timedelta(hours=1)
+        todo = _make_todo("直近")
+
+        first = client.get("/todos", params={"updated_since": since.isoformat()}).json()
+        second = client.get(
+            "/todos",
+            params={"updated_since": since.isoformat(), "after": first["next_cursor"]},
+        ).json()
+
+        assert [t["id"] for t in second["todos"]] == [todo.id.value]
+
+    @pytest.mark.parametrize(
+        "search_param",
+        [
+            {"q": "買い物"},
+            {"completed": "false"},
+            {"sort": "title"},
+            {"fields": "title"},
+        ],
+    )
+    def test_search_params_with_updated_since_returns_400(
+        self,
+        search_param: dict[str, str],
+    ):
+        """検索条件と同時に指定した場合は400を返す。"""
+        response = client.get(
+            "/todos",
+            params={**search_param, "updated_since": "2024-01-01T00:00:00Z"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "INVALID_VALUE"
+
+    def test_cursor_of_other_order_returns_400(self):
+        """更新日時順でないカーソルの場合は400を返す。"""
+        cursor = encode_cursor(PageCursor(key=0.5, id=str(uuid.uuid4())))
+
+        response = client.get(
+            "/todos",
+            params={"updated_since": "2024-01-01T00:00:00Z", "after": cursor},
+        )
+        assert response.status_code == 400
+
+    def test_invalid_updated_since_returns_422(self):
+        """日時として解釈できない場合は422を返す。"""
+        response = client.get("/todos", params={"updated_since": "yesterday"})
+        assert response.status_code == 422
+
+
+# ======================================================================
+# GET /todos/events (変更イベントのSSE)
+# ======================================================================
+
+
+class TestTodoEvents:
+    """GET /todos/events のテスト。"""
+
+    @pytest.mark.anyio
+    async def test_response_is_event_stream(self):
+        """レスポンスはバッファリングされないSSEで返す。"""
+        response = await stream_todo_events()
+
+        assert response.media_type == EVENT_STREAM_MEDIA_TYPE
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    @pytest.mark.anyio
+    async def test_stream_sends_broadcast_events(self):
+        """購読の開始後に配信されたイベントをSSEのメッセージとして送る。"""
+        broadcaster: Broadcaster[TodoEvent] = Broadcaster()
+        todo = Todo(title="トグル", completed=True)
+        stream = _todo_event_stream(broadcaster)
+
+        assert await anext(stream) == ": connected\n\n"
+        broadcaster.publish(TodoEvent(type=TodoEventType.TOGGLED, todo=todo))
+        message = await anext(stream)
+        await stream.aclose()
+
+        event_line, data_line, *_ = message.split("\n")
+        assert event_line == "event: toggled"
+        data = json.loads(data_line.removeprefix("data: "))
+        assert data["type"] == "toggled"
+        assert data["todo"]["id"] == todo.id.value
+        assert data["todo"]["completed"] is True
+        assert len(broadcaster) == 0
+
+    @pytest.mark.anyio
+    async def test_stream_sends_keepalive_while_idle(self):
+        """イベントがない間は接続を維持するコメントを送る。"""
+        broadcaster: Broadcaster[TodoEvent] = Broadcaster()
+        stream = _todo_event_stream(broadcaster)
+        await anext(stream)
+
+        with patch("src.presentation.api.routes.todo.SSE_KEEPALIVE_SECONDS", 0.01):
+            message = await asyncio.wait_for(anext(stream), timeout=1)
+        await stream.aclose()
+
+        assert message == ": keep-alive\n\n"
+
+
+# ======================================================================
+# DELETE /todos/:id (削除エンドポイント)
+# ======================================================================
+
+
+class TestDeleteTodo:
+    """DELETE /todos/:id のテスト。"""
+
+    def test_deleted_todo_is_excluded_from_search(self):
+        """削除したTodoは検索結果に含まれない。"""
+        todo = _make_todo("削除")
+        _make_todo("残す")
+
+        response = client.delete(f"/todos/{todo.id.value}")
+        assert response.status_code == 200
+        assert response.json()["todo"]["id"] == todo.id.value
+        titles = [t["title"] for t in client.get("/todos").json()["todos"]]
+        assert titles == ["残す"]
+
+    def test_delete_twice_returns_404(self):
+        """削除済みのTodoを削除すると404を返す。"""
+        todo = _make_todo("削除")
+        client.delete(f"/todos/{todo.id.value}")
+
+        response = client.delete(f"/todos/{todo.id.value}")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "TODO_NOT_FOUND"
+
+
+# ======================================================================
+# PATCH /todos/bulk (一括更新エンドポイント)
+# ======================================================================
+
+
+class TestBulkUpdateTodos:
+    """PATCH /todos/bulk のテスト。"""
+
+    def test_complete_marks_all_todos_completed(self):
+        """action=completeで指定したTodoをすべて完了にする。"""
+        todos = [_make_todo("一括1"), _make_todo("一括2", completed=True)]
+
+        response = client.patch(
+            "/todos/bulk",
+            json={"ids": [t.id.value for t in todos], "action": "complete"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["completed"] for t in data["todos"]] == [True, True]
+        assert data["not_found_ids"] == []
+
+    def test_uncomplete_marks_all_todos_uncompleted(self):
+        """action=uncompleteで指定したTodoをすべて未完了にする。"""
+        todo = _make_todo("一括", completed=True)
+
+        response = client.patch(
+            "/todos/bulk",
+            json={"ids": [todo.id.value], "action": "uncomplete"},
+        )
+        assert response.status_code == 200
+        assert response.json()["todos"][0]["completed"] is False
+
+    def test_toggle_inverts_each_todo(self):
+        """action=toggleでTodoごとに完了フラグを反転する。"""
+        done = _make_todo("完了済み", completed=True)
+        undone = _make_todo("未完了")
+
+        response = client.patch(
+            "/todos/bulk",
+            json={"ids": [done.id.value, undone.id.value], "action": "toggle"},
+        )
+        assert response.status_code == 200
+        completed = {t["id"]: t["completed"] for t in response.json()["todos"]}
+        assert completed == {done.id.value: False, undone.id.value: True}
+
+    def test_returns_not_found_ids(self):
+        """存在しないIDはnot_found_idsとして返す。"""
+        todo = _make_todo("一括")
+        fake_id = str(uuid.uuid4())
+
+        response = client.patch(
+            "/todos/bulk",
+            json={"ids": [todo.id.value, fake_id], "action": "complete"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["id"] for t in data["todos"]] == [todo.id.value]
+        assert data["not_found_ids"] == [fake_id]
+
+    def test_empty_ids_returns_422(self):
+        """IDが空の場合は422を返す。"""
+        response = client.patch("/todos/bulk", json={"ids": [], "action": "complete"})
+        assert response.status_code == 422
+
+    def test_too_many_ids_returns_422(self):
+        """IDが上限を超える場合は422を返す。"""
+        ids = [str(uuid.uuid4()) for _ in range(5001)]
+
+        response = client.patch("/todos/bulk", json={"ids": ids, "action": "complete"})
+        assert response.status_code == 422
+
+    def test_unknown_action_returns_422(self):
+        """未定義のactionの場合は422を返す。"""
+        todo = _make_todo("一括")
+
+        response = client.patch(
+            "/todos/bulk",
+            json={"ids": [todo.id.value], "action": "delete"},
+        )
+        assert response.status_code == 422
+
+
+# ======================================================================
+# POST /todos/import (一括取り込みエンドポイント)
+# ======================================================================
+
+
+class TestImportTodos:
+    """POST /todos/import のテスト。"""
+
+    def test_ndjson_imports_todos(self):
+        """NDJSONの各行をTodoとして取り込む。"""
+        body = "\n".join(
+            [
+                json.dumps({"title": "取り込み1"}),
+                json.dumps({"title": "取り込み2", "completed": True}),
+            ]
+        )
+
+        response = client.post(
+            "/todos/import",
+            content=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"imported": 2, "failed": 0, "errors": []}
+        titles = {todo["title"] for todo in client.get("/todos").json()["todos"]}
+        assert titles == {"取り込み1", "取り込み2"}
+
+    def test_csv_imports_todos(self):
+        """CSVの1行目をヘッダーとして取り込む。"""
+        response = client.post(
+            "/todos/import",
+            content="title,completed\n取り込み,true\n".encode(),
+            headers={"Content-Type": "text/csv; charset=utf-8"},
+        )
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+        (todo,) = client.get("/todos").json()["todos"]
+        assert todo["completed"] is True
+
+    def test_reports_invalid_rows(self):
+        """不正な行とIDが既存の行は行番号とともに返し、残りを取り込む。"""
+        existing = _make_todo("既存")
+        body = "\n".join(
+            [
+                json.dumps({"title": ""}),
+                json.dumps({"id": existing.id.value, "title": "重複"}),
+                json.dumps({"title": "有効"}),
+            ]
+        )
+
+        response = client.post(
+            "/todos/import",
+            content=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["failed"] == 2
+        assert sorted(error["line"] for error in data["errors"]) == [1, 2]
+        titles = {todo["title"] for todo in client.get("/todos").json()["todos"]}
+        assert titles == {"既存", "有効"}
+
+    def test_unsupported_content_type_returns_415(self):
+        """対応していないContent-Typeの場合は415を返す。"""
+        response = client.post(
+            "/todos/import",
+            json=[{"title": "取り込み"}],
+        )
+        assert response.status_code == 415
+        assert response.json()["detail"] == CommonErrorCode.InvalidValue.value
@@ -0,0 +1,187 @@
+"""SingleFlightのユニットテスト。"""
+
+import asyncio
+
+import pytest
+
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.version_counter import VersionCounter
+
+
+class BlockingLoader:
+    """releaseがセットされるまで完了せず、呼び出し回数を値として返すローダー。"""
+
+    def __init__(self) -> None:
+        """呼び出し回数を0で初期化する。"""
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        calls = self.calls
+        await self.release.wait()
+        return f"v{calls}"
+
+
+@pytest.fixture
+def versions() -> VersionCounter:
+    return VersionCounter()
+
+
+@pytest.fixture
+def single_flight(versions: VersionCounter) -> SingleFlight[str, str]:
+    return SingleFlight(versions=versions)
+
+
+async def _start(
+    single_flight: SingleFlight[str, str],
+    key: str,
+    loader: BlockingLoader,
+) -> asyncio.Task[str]:
+    """読み込みを開始し、loaderの実行またはその待機に入るまで進める。"""
+    task = asyncio.create_task(single_flight.do(key, loader))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestDo:
+    """同時実行のまとめのテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_同じキーの同時の呼び出しは1回の読み込みの結果を共有すること(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        tasks = [await _start(single_flight, "key", loader) for _ in range(10)]
+
+        # act
+        loader.release.set()
+        results = await asyncio.gather(*tasks)
+
+        # assert
+        assert results == ["v1"] * 10
+        assert loader.calls == 1
+        assert len(single_flight) == 0
+
+    @pytest.mark.anyio
+    async def test_OK_異なるキーは別々に読み込むこと(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        first = await _start(single_flight, "a", loader)
+        second = await _start(single_flight, "b", loader)
+
+        # act
+        loader.release.set()
+        results = await asyncio.gather(first, second)
+
+        # assert
+        assert results == ["v1", "v2"]
+
+    @pytest.mark.anyio
+    async def test_OK_完了後の呼び出しは再び読み込むこと(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        loader.release.set()
+        await single_flight.do("key", loader)
+
+        # act
+        result = await single_flight.do("key", loader)
+
+        # assert
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_読み込み中に世代番号が進んだ場合は合流せずに読み込むこと(
+        self,
+        single_flight: SingleFlight[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        before_write = await _start(single_flight, "key", loader)
+        versions.bump()
+
+        # act
+        after_write = await _start(single_flight, "key", loader)
+        joined = await _start(single_flight, "key", loader)
+        loader.release.set()
+        results = await asyncio.gather(before_write, after_write, joined)
+
+        # assert
+        assert results == ["v1", "v2", "v2"]
+        assert len(single_flight) == 0
+
+    @pytest.mark.anyio
+    async def test_NG_読み込みの例外は待っていた呼び出しにも返ること(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        release = asyncio.Event()
+
+        async def failing_loader() -> str:
+            await release.wait()
+            raise RuntimeError
+
+        tasks = [
+            asyncio.create_task(single_flight.do("key", failing_loader))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # act
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # assert
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(single_flight) == 0
+
+    @pytest.mark.anyio
+    async def test_NG_最初の呼び出しがキャンセルされた場合は待っていた呼び出しが読み込み直すこと(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        leader = await _start(single_flight, "key", loader)
+        follower = await _start(single_flight, "key", loader)
+
+        # act
+        leader.cancel()
+        await asyncio.sleep(0)
+        loader.release.set()
+        result = await follower
+
+        # assert
+        assert leader.cancelled()
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_NG_待っていた呼び出しのキャンセルは読み込みに影響しないこと(
+        self,
+        single_flight: SingleFlight[str, str],
+    ) -> None:
+        # arrange
+        loader = BlockingLoader()
+        leader = await _start(single_flight, "key", loader)
+        follower = await _start(single_flight, "key", loader)
+
+        # act
+        follower.cancel()
+        await asyncio.sleep(0)
+        loader.release.set()
+        result = await leader
+
+        # assert
+        assert follower.cancelled()
+        assert result == "v1"
+        assert loader.calls == 1
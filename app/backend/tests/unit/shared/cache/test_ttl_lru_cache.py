@@ -0,0 +1,509 @@
+"""TtlLruCacheのユニットテスト。"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from src.shared.cache.ttl_lru_cache import CacheStats, TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import ExpectedTechnicalError
+
+TTL_SECONDS = 10.0
+
+
+class FakeClock:
+    """テスト用の手動で進める時計。"""
+
+    def __init__(self) -> None:
+        """時計を0秒で初期化する。"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    """呼び出し回数を記録し、何回目の読み込みかを値として返すローダー。"""
+
+    def __init__(self) -> None:
+        """呼び出し回数を0で初期化する。"""
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        return f"v{self.calls}"
+
+
+@pytest.fixture
+def versions() -> VersionCounter:
+    return VersionCounter()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(versions: VersionCounter, clock: FakeClock) -> TtlLruCache[str, str]:
+    return TtlLruCache(maxsize=2, ttl=TTL_SECONDS, versions=versions, clock=clock)
+
+
+class TestGetOrLoad:
+    """キャッシュからの取得と読み込みのテストクラス。
+
+    有効期限・世代番号による無効化、LRUによる破棄、stale-while-revalidateをテストする。
+    """
+
+    @pytest.mark.anyio
+    async def test_OK_有効期限内は読み込まずにキャッシュを返すこと(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+        clock.now = TTL_SECONDS - 1
+
+        # act
+        result = await cache.get_or_load("key", loader)
+
+        # assert
+        assert result == "v1"
+        assert loader.calls == 1
+
+    @pytest.mark.anyio
+    async def test_OK_有効期限切れの場合は再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+        clock.now = TTL_SECONDS
+
+        # act
+        result = await cache.get_or_load("key", loader)
+
+        # assert
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_世代番号が進んだ場合は再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+        versions.bump()
+
+        # act
+        result = await cache.get_or_load("key", loader)
+
+        # assert
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_読み込み中に書き込みがあった場合は次回再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+
+        async def load_during_write() -> str:
+            versions.bump()
+            return await loader()
+
+        await cache.get_or_load("key", load_during_write)
+
+        # act
+        result = await cache.get_or_load("key", loader)
+
+        # assert
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_最大件数を超えた場合は最も長く使われていないキーを破棄すること(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        loaders = {key: CountingLoader() for key in ("a", "b", "c")}
+        await cache.get_or_load("a", loaders["a"])
+        await cache.get_or_load("b", loaders["b"])
+        # aを参照してbを最も長く使われていないキーにする
+        await cache.get_or_load("a", loaders["a"])
+
+        # act
+        await cache.get_or_load("c", loaders["c"])
+        a = await cache.get_or_load("a", loaders["a"])
+        b = await cache.get_or_load("b", loaders["b"])
+
+        # assert
+        assert a == "v1"
+        assert b == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_有効期限切れの再読み込み中は他の呼び出しに古い結果を返すこと(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        clock.now += TTL_SECONDS
+        release = asyncio.Event()
+
+        async def slow_loader() -> str:
+            await release.wait()
+            return "new"
+
+        refreshing = asyncio.create_task(cache.get_or_load("key", slow_loader))
+        await asyncio.sleep(0)
+
+        # act
+        stale = await cache.get_or_load("key", _constant("unused"))
+        release.set()
+        refreshed = await refreshing
+        cached = await cache.get_or_load("key", _constant("unused"))
+
+        # assert
+        assert stale == "old"
+        assert refreshed == "new"
+        assert cached == "new"
+
+    @pytest.mark.anyio
+    async def test_OK_世代番号が進んだ後の再読み込み中は他の呼び出しも完了を待つこと(
+        self,
+        cache: TtlLruCache[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        versions.bump()
+        release = asyncio.Event()
+        loader = CountingLoader()
+
+        async def slow_loader() -> str:
+            await release.wait()
+            return await loader()
+
+        refreshing = asyncio.create_task(cache.get_or_load("key", slow_loader))
+        await asyncio.sleep(0)
+
+        # act
+        waiting = asyncio.create_task(cache.get_or_load("key", slow_loader))
+        await asyncio.sleep(0)
+        release.set()
+        refreshed = await refreshing
+        waited = await waiting
+
+        # assert
+        assert refreshed == "v1"
+        assert waited == "v1"
+        assert loader.calls == 1
+
+    @pytest.mark.anyio
+    async def test_NG_再読み込みに失敗した場合は次の呼び出しが再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        versions.bump()
+
+        async def failing_loader() -> str:
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("key", failing_loader)
+
+        # act
+        result = await cache.get_or_load("key", _constant("new"))
+
+        # assert
+        assert result == "new"
+
+
+class TestDataVersion:
+    """呼び出し元が指定したデータの版による判定のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_版が同じ場合はキャッシュを返し異なる場合は読み込み直すこと(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader, data_version=1)
+
+        # act
+        cached = await cache.get_or_load("key", loader, data_version=1)
+        changed = await cache.get_or_load("key", loader, data_version=2)
+
+        # assert
+        assert cached == "v1"
+        assert changed == "v2"
+        assert len(cache) == 1
+
+    @pytest.mark.anyio
+    async def test_OK_版が異なる場合は再読み込み中でも古い結果を返さないこと(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"), data_version=1)
+        clock.now += TTL_SECONDS
+        release = asyncio.Event()
+
+        async def slow_refresh() -> str:
+            await release.wait()
+            return "refreshed"
+
+        await cache.get_or_load(
+            "key",
+            _constant("unused"),
+            refresh=slow_refresh,
+            data_version=1,
+        )
+
+        # act
+        result = await cache.get_or_load("key", _constant("new"), data_version=2)
+        release.set()
+        await cache.wait_for_refreshes()
+        cached = await cache.get_or_load("key", _constant("unused"), data_version=2)
+
+        # assert
+        assert result == "new"
+        assert cached == "new"
+
+
+class TestBackgroundRefresh:
+    """有効期限切れのエントリのバックグラウンドでの再読み込みのテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_有効期限切れの場合は古い結果を返しバックグラウンドで再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        clock.now += TTL_SECONDS
+        release = asyncio.Event()
+        refresh = CountingLoader()
+
+        async def slow_refresh() -> str:
+            await release.wait()
+            return await refresh()
+
+        # act
+        stale = await cache.get_or_load(
+            "key",
+            _constant("unused"),
+            refresh=slow_refresh,
+        )
+        during = await cache.get_or_load(
+            "key",
+            _constant("unused"),
+            refresh=slow_refresh,
+        )
+        release.set()
+        await cache.wait_for_refreshes()
+        refreshed = await cache.get_or_load("key", _constant("unused"))
+
+        # assert
+        assert stale == "old"
+        assert during == "old"
+        assert refreshed == "v1"
+        assert refresh.calls == 1
+
+    @pytest.mark.anyio
+    async def test_OK_世代番号が進んだ場合は再読み込みの完了を待つこと(
+        self,
+        cache: TtlLruCache[str, str],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        versions.bump()
+
+        # act
+        result = await cache.get_or_load(
+            "key",
+            _constant("new"),
+            refresh=_constant("unused"),
+        )
+
+        # assert
+        assert result == "new"
+
+    @pytest.mark.anyio
+    async def test_NG_再読み込みに失敗した場合は古い結果を残し次の呼び出しが再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        await cache.get_or_load("key", _constant("old"))
+        clock.now += TTL_SECONDS
+
+        async def failing_refresh() -> str:
+            raise ExpectedTechnicalError(
+                code=TechnicalErrorCode.DatabaseOperationFailed
+            )
+
+        await cache.get_or_load("key", _constant("unused"), refresh=failing_refresh)
+        await cache.wait_for_refreshes()
+
+        # act
+        stale = await cache.get_or_load(
+            "key", _constant("unused"), refresh=_constant("new")
+        )
+        await cache.wait_for_refreshes()
+        refreshed = await cache.get_or_load("key", _constant("unused"))
+
+        # assert
+        assert stale == "old"
+        assert refreshed == "new"
+
+
+class TestInvalidate:
+    """エントリの破棄のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_破棄したキーのみ再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        loaders = {key: CountingLoader() for key in ("a", "b")}
+        await cache.get_or_load("a", loaders["a"])
+        await cache.get_or_load("b", loaders["b"])
+
+        # act
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        a = await cache.get_or_load("a", loaders["a"])
+        b = await cache.get_or_load("b", loaders["b"])
+
+        # assert
+        assert a == "v2"
+        assert b == "v1"
+
+    @pytest.mark.anyio
+    async def test_OK_読み込み中に破棄された場合は読み込んだ値を格納しないこと(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+
+        async def load_during_invalidate() -> str:
+            cache.invalidate("key")
+            return await loader()
+
+        loaded = await cache.get_or_load("key", load_during_invalidate)
+
+        # act
+        result = await cache.get_or_load("key", loader)
+
+        # assert
+        assert loaded == "v1"
+        assert result == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_世代番号がない場合は有効期限と破棄のみで無効化されること(
+        self,
+        clock: FakeClock,
+    ) -> None:
+        # arrange
+        cache: TtlLruCache[str, str] = TtlLruCache(
+            maxsize=2,
+            ttl=TTL_SECONDS,
+            clock=clock,
+        )
+        loader = CountingLoader()
+        await cache.get_or_load("key", loader)
+
+        # act
+        cached = await cache.get_or_load("key", loader)
+        clock.now += TTL_SECONDS
+        expired = await cache.get_or_load("key", loader)
+
+        # assert
+        assert cached == "v1"
+        assert expired == "v2"
+
+    @pytest.mark.anyio
+    async def test_OK_条件に一致する値のエントリのみ再読み込みすること(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        await cache.get_or_load("a", _constant("drop"))
+        await cache.get_or_load("b", _constant("keep"))
+
+        # act
+        cache.invalidate_if(lambda _, value: value == "drop")
+        a = await cache.get_or_load("a", _constant("reloaded"))
+        b = await cache.get_or_load("b", _constant("reloaded"))
+
+        # assert
+        assert a == "reloaded"
+        assert b == "keep"
+
+
+class TestStats:
+    """利用状況の累計のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_ヒット・ミス・破棄の回数が累計されること(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        loader = CountingLoader()
+
+        # act
+        for key in ("a", "a", "b", "a", "c", "b"):
+            await cache.get_or_load(key, loader)
+
+        # assert
+        # 上限2件のため、cの格納でb、bの再読み込みでaが破棄される
+        assert cache.stats == CacheStats(hits=2, misses=4, evictions=2)
+
+    @pytest.mark.anyio
+    async def test_OK_明示的な破棄の回数が累計されること(
+        self,
+        cache: TtlLruCache[str, str],
+    ) -> None:
+        # arrange
+        await cache.get_or_load("a", _constant("a"))
+
+        # act
+        cache.invalidate("a")
+        cache.invalidate_if(lambda _, __: True)
+        cache.clear()
+
+        # assert
+        assert cache.stats == CacheStats(hits=0, misses=1, invalidations=3)
+
+
+def _constant(value: str) -> Callable[[], Awaitable[str]]:
+    """常に同じ値を返すローダーを作成する。"""
+
+    async def loader() -> str:
+        return value
+
+    return loader
@@ -0,0 +1,26 @@
+"""VersionCounterのユニットテスト。"""
+
+from src.shared.cache.version_counter import VersionCounter
+
+
+class TestBump:
+    """世代番号の更新のテストクラス。"""
+
+    def test_OK_初期値が0であること(self) -> None:
+        # act
+        versions = VersionCounter()
+
+        # assert
+        assert versions.value == 0
+
+    def test_OK_bumpのたびに世代番号が進むこと(self) -> None:
+        # arrange
+        versions = VersionCounter()
+        bump_count = 2
+
+        # act
+        for _ in range(bump_count):
+            versions.bump()
+
+        # assert
+        assert versions.value == bump_count
@@ -0,0 +1,72 @@
+"""Broadcasterのユニットテスト。"""
+
+import asyncio
+
+import pytest
+
+from src.shared.pubsub.broadcaster import Broadcaster, SubscriptionOverflowError
+
+
+class TestBroadcaster:
+    """Broadcasterの配信のテストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_全ての購読者に配信されること(self) -> None:
+        # arrange
+        broadcaster: Broadcaster[str] = Broadcaster()
+
+        # act
+        with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            broadcaster.publish("a")
+            broadcaster.publish("b")
+
+            # assert
+            assert [await first.get(), await first.get()] == ["a", "b"]
+            assert [await second.get(), await second.get()] == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_OK_待機中の購読者に配信されること(self) -> None:
+        # arrange
+        broadcaster: Broadcaster[str] = Broadcaster()
+
+        with broadcaster.subscribe() as subscription:
+            waiting = asyncio.create_task(subscription.get())
+            await asyncio.sleep(0)
+
+            # act
+            broadcaster.publish("a")
+
+            # assert
+            assert await waiting == "a"
+
+    def test_OK_ブロックを抜けると購読が終了すること(self) -> None:
+        # arrange
+        broadcaster: Broadcaster[str] = Broadcaster()
+
+        # act
+        with broadcaster.subscribe():
+            subscribed = len(broadcaster)
+
+        # assert
+        assert subscribed == 1
+        assert len(broadcaster) == 0
+
+    @pytest.mark.anyio
+    async def test_NG_未読が上限を超えた購読は打ち切られ他の購読者には配信されること(
+        self,
+    ) -> None:
+        # arrange
+        queue_size = 2
+        broadcaster: Broadcaster[int] = Broadcaster(queue_size=queue_size)
+
+        with broadcaster.subscribe() as slow, broadcaster.subscribe() as fast:
+            # act
+            for i in range(queue_size):
+                broadcaster.publish(i)
+                assert await fast.get() == i
+            broadcaster.publish(queue_size)
+
+            # assert
+            assert await fast.get() == queue_size
+            with pytest.raises(SubscriptionOverflowError):
+                await slow.get()
@@ -0,0 +1,64 @@
+"""BulkUpdateTodosUseCaseのユニットテスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.todo.bulk_update import TodoBulkAction, TodoBulkUpdateResult
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.todo import Todo
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import (
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+from src.usecase.todo.bulk_update_todos_usecase import BulkUpdateTodosUseCase
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    return AsyncMock(spec=TodoRepository)
+
+
+class TestExecute:
+    """BulkUpdateTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_リポジトリの一括更新の結果を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        todo = Todo(title="テストタスク", completed=True)
+        missing_id = TodoId()
+        expected = TodoBulkUpdateResult(updated=[todo], not_found_ids=[missing_id])
+        mock_todo_repository.bulk_update.return_value = expected
+        usecase = BulkUpdateTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act
+        result = await usecase.execute([todo.id, missing_id], TodoBulkAction.COMPLETE)
+
+        # assert
+        assert result == expected
+        mock_todo_repository.bulk_update.assert_called_once_with(
+            [todo.id, missing_id],
+            TodoBulkAction.COMPLETE,
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.bulk_update.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseOperationFailed,
+        )
+        usecase = BulkUpdateTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute([TodoId()], TodoBulkAction.TOGGLE)
+
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseOperationFailed
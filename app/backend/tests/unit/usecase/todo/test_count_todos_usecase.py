@@ -0,0 +1,104 @@
+"""CountTodosUseCaseのユニットテスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.count import Count
+from src.domain.todo.repository import TodoRepository
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import (
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+from src.usecase.todo.count_todos_usecase import CountTodosUseCase
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    repository = AsyncMock(spec=TodoRepository)
+    repository.count.return_value = 3
+    repository.estimate_count.return_value = 5
+    return repository
+
+
+class TestExecute:
+    """CountTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_完了フラグで絞り込んだ正確な件数を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = CountTodosUseCase(mock_todo_repository)
+
+        # act
+        result = await usecase.execute(completed=False)
+
+        # assert
+        assert result == Count(value=3, approximate=False)
+        mock_todo_repository.count.assert_called_once_with(completed=False)
+        mock_todo_repository.estimate_count.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_OK_approximateの場合は推定した件数を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = CountTodosUseCase(mock_todo_repository)
+
+        # act
+        result = await usecase.execute(approximate=True)
+
+        # assert
+        assert result == Count(value=5, approximate=True)
+        mock_todo_repository.count.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_OK_完了フラグで絞り込む場合はapproximateでも正確な件数を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = CountTodosUseCase(mock_todo_repository)
+
+        # act
+        result = await usecase.execute(completed=True, approximate=True)
+
+        # assert
+        assert result == Count(value=3, approximate=False)
+        mock_todo_repository.estimate_count.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_OK_推定できない場合は正確な件数を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.estimate_count.return_value = None
+        usecase = CountTodosUseCase(mock_todo_repository)
+
+        # act
+        result = await usecase.execute(approximate=True)
+
+        # assert
+        assert result == Count(value=3, approximate=False)
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.count.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseQueryFailed,
+        )
+        usecase = CountTodosUseCase(mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseQueryFailed
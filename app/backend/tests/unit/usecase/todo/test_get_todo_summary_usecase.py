@@ -0,0 +1,53 @@
+"""GetTodoSummaryUseCaseのユニットテスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.summary import TodoSummary
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import ExpectedTechnicalError, ExpectedUseCaseError
+from src.usecase.todo.get_todo_summary_usecase import GetTodoSummaryUseCase
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    return AsyncMock(spec=TodoRepository)
+
+
+class TestExecute:
+    """GetTodoSummaryUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_リポジトリの集計を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        summary = TodoSummary(completed=1, pending=3)
+        mock_todo_repository.summarize.return_value = summary
+        usecase = GetTodoSummaryUseCase(mock_todo_repository)
+
+        # act
+        result = await usecase.execute()
+
+        # assert
+        assert result == summary
+        mock_todo_repository.summarize.assert_called_once_with()
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.summarize.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseConnectionFailed,
+        )
+        usecase = GetTodoSummaryUseCase(mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute()
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseConnectionFailed
@@ -0,0 +1,267 @@
+"""ImportTodosUseCaseのユニットテスト。"""
+
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.todo.bulk_import import (
+    MAX_REPORTED_IMPORT_ERRORS,
+    TodoBulkInsertResult,
+    TodoImportError,
+    TodoImportFormat,
+)
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.todo import Todo
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import (
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+from src.usecase.todo.import_todos_usecase import (
+    MAX_IMPORT_LINE_BYTES,
+    ImportTodosUseCase,
+)
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    repository = AsyncMock(spec=TodoRepository)
+    repository.bulk_insert.return_value = TodoBulkInsertResult()
+    return repository
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _ndjson(*records: object) -> bytes:
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+def _inserted(mock_todo_repository: AsyncMock) -> list[Todo]:
+    """bulk_insertに渡されたTodoを呼び出し順に連結して返す。"""
+    todos: list[Todo] = []
+    for call in mock_todo_repository.bulk_insert.call_args_list:
+        batch: Sequence[Todo] = call.args[0]
+        todos.extend(batch)
+    return todos
+
+
+class TestExecute:
+    """ImportTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_NDJSONの各行がTodoとして追加されること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        body = _ndjson(
+            {"title": "買い物"},
+            {
+                "id": "imported-id",
+                "title": "掃除",
+                "completed": True,
+                "created_at": "2024-01-02T03:04:05+00:00",
+                # 更新日時は取り込んだ時刻とするため、不正な値でも検証しない
+                "updated_at": "ignored",
+            },
+        )
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.NDJSON)
+
+        # assert
+        assert result.imported == len(_inserted(mock_todo_repository))
+        assert result.failed == 0
+        first, second = _inserted(mock_todo_repository)
+        assert (first.title, first.completed) == ("買い物", False)
+        assert second.id == TodoId(value="imported-id")
+        assert (second.title, second.completed) == ("掃除", True)
+        expected_created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert second.created_at == expected_created_at
+
+    @pytest.mark.anyio
+    async def test_OK_CSVの1行目をヘッダーとして読み込むこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        body = 'title,completed\n"買い物, 卵",true\r\n掃除,\n'.encode()
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.CSV)
+
+        # assert
+        assert result.failed == 0
+        todos = _inserted(mock_todo_repository)
+        assert [(todo.title, todo.completed) for todo in todos] == [
+            ("買い物, 卵", True),
+            ("掃除", False),
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_任意の位置で分割された入力を行に復元すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        body = _ndjson({"title": "買い物"}, {"title": "掃除"})
+        # マルチバイト文字の途中を含め1バイトずつに分割する
+        chunks = [body[i : i + 1] for i in range(len(body))]
+
+        # act
+        await usecase.execute(_chunks(*chunks), TodoImportFormat.NDJSON)
+
+        # assert
+        todos = _inserted(mock_todo_repository)
+        assert [todo.title for todo in todos] == ["買い物", "掃除"]
+
+    @pytest.mark.anyio
+    async def test_OK_chunk_size件ずつまとめて追加されること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        chunk_size = 2
+        usecase = ImportTodosUseCase(
+            todo_repository=mock_todo_repository,
+            chunk_size=chunk_size,
+        )
+        body = _ndjson(*({"title": f"todo {i}"} for i in range(5)))
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.NDJSON)
+
+        # assert
+        batch_sizes = [
+            len(call.args[0])
+            for call in mock_todo_repository.bulk_insert.call_args_list
+        ]
+        assert batch_sizes == [chunk_size, chunk_size, 1]
+        assert result.imported == sum(batch_sizes)
+
+    @pytest.mark.anyio
+    async def test_OK_不正な行を行番号とともに報告し残りの行を取り込むこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        lines = [
+            json.dumps({"title": "ok"}),
+            "not json",
+            json.dumps(["title"]),
+            json.dumps({"completed": True}),
+            json.dumps({"title": ""}),
+            json.dumps({"title": "a", "completed": "maybe"}),
+            json.dumps({"title": "a", "created_at": "yesterday"}),
+            "",
+            json.dumps({"title": "ok too"}),
+        ]
+        body = ("\n".join(lines) + "\n").encode() + b'{"title": "\xff"}\n'
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.NDJSON)
+
+        # assert
+        assert [todo.title for todo in _inserted(mock_todo_repository)] == [
+            "ok",
+            "ok too",
+        ]
+        assert result.failed == len(result.errors)
+        assert [error.line for error in result.errors] == [2, 3, 4, 5, 6, 7, 10]
+
+    @pytest.mark.anyio
+    async def test_OK_長すぎる行は読み捨ててエラーとして報告すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        oversized = b"x" * (MAX_IMPORT_LINE_BYTES + 1)
+        half = len(oversized) // 2
+
+        # act
+        result = await usecase.execute(
+            _chunks(
+                oversized[:half], oversized[half:] + b"\n", _ndjson({"title": "ok"})
+            ),
+            TodoImportFormat.NDJSON,
+        )
+
+        # assert
+        assert [error.line for error in result.errors] == [1]
+        assert [todo.title for todo in _inserted(mock_todo_repository)] == ["ok"]
+
+    @pytest.mark.anyio
+    async def test_OK_重複したIDと既存のIDの行をエラーとして報告すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.bulk_insert.return_value = TodoBulkInsertResult(
+            conflicted_ids=[TodoId(value="existing")],
+        )
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        body = _ndjson(
+            {"id": "existing", "title": "既存"},
+            {"id": "new", "title": "新規"},
+            {"id": "new", "title": "重複"},
+        )
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.NDJSON)
+
+        # assert
+        assert result.imported == 1
+        assert sorted(error.line for error in result.errors) == [1, 3]
+
+    @pytest.mark.anyio
+    async def test_OK_報告するエラーは上限件数までとなること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+        failed = MAX_REPORTED_IMPORT_ERRORS + 1
+        body = b"not json\n" * failed
+
+        # act
+        result = await usecase.execute(_chunks(body), TodoImportFormat.NDJSON)
+
+        # assert
+        assert result.failed == failed
+        assert len(result.errors) == MAX_REPORTED_IMPORT_ERRORS
+        assert result.errors[0] == TodoImportError(
+            line=1,
+            message="invalid JSON: Expecting value",
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.bulk_insert.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseOperationFailed,
+        )
+        usecase = ImportTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute(
+                _chunks(_ndjson({"title": "a"})),
+                TodoImportFormat.NDJSON,
+            )
+
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseOperationFailed
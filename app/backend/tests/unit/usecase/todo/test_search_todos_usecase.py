@@ -0,0 +1,407 @@
+"""SearchTodosUseCaseのユニットテスト。"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.data_version import DataVersion
+from src.domain.pagination import Page
+from src.domain.todo.id import TodoId
+from src.domain.todo.projection import TodoField, TodoProjection
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.search_condition import TodoSearchCondition, TodoSearchMode
+from src.domain.todo.todo import Todo
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.ttl_lru_cache import TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import CommonErrorCode
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedUseCaseError,
+)
+from src.usecase.todo.search_todos_usecase import (
+    SearchTodoProjectionsCacheKey,
+    SearchTodosCacheKey,
+    SearchTodosUseCase,
+)
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    return AsyncMock(spec=TodoRepository)
+
+
+@pytest.fixture
+def versions() -> VersionCounter:
+    return VersionCounter()
+
+
+@pytest.fixture
+def cache(versions: VersionCounter) -> TtlLruCache[SearchTodosCacheKey, Page[Todo]]:
+    return TtlLruCache(maxsize=8, ttl=60.0, versions=versions)
+
+
+class TestExecute:
+    """SearchTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_リポジトリの検索結果を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        page = Page(items=[Todo(title="買い物")])
+        mock_todo_repository.search.return_value = page
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act
+        result = await usecase.execute(TodoSearchCondition(query="買い物"))
+
+        # assert
+        assert result == page
+        mock_todo_repository.search.assert_called_once_with(
+            TodoSearchCondition(query="買い物"),
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedBusinessErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.side_effect = ExpectedBusinessError(
+            code=CommonErrorCode.InvalidValue,
+            details={"after": "cursor does not match the sort order"},
+        )
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute(TodoSearchCondition(query="買い物"))
+
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
+
+
+class TestExecuteWithCache:
+    """キャッシュを設定したSearchTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_同じ条件の検索はキャッシュから返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.return_value = Page(items=[Todo(title="買い物")])
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+        await usecase.execute(TodoSearchCondition())
+
+        # act
+        result = await usecase.execute(TodoSearchCondition())
+
+        # assert
+        assert [todo.title for todo in result.items] == ["買い物"]
+        mock_todo_repository.search.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_OK_大文字小文字のみ異なる部分一致検索は同じキャッシュを使うこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.return_value = Page()
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+
+        # act
+        await usecase.execute(TodoSearchCondition(query="Buy"))
+        await usecase.execute(TodoSearchCondition(query="BUY"))
+
+        # assert
+        mock_todo_repository.search.assert_called_once_with(
+            TodoSearchCondition(query="buy"),
+        )
+
+    @pytest.mark.anyio
+    async def test_OK_全文検索のクエリは演算子を保つため正規化しないこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.return_value = Page()
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+        condition = TodoSearchCondition(query="milk OR bread", mode=TodoSearchMode.FTS)
+
+        # act
+        await usecase.execute(condition)
+
+        # assert
+        mock_todo_repository.search.assert_called_once_with(condition)
+
+    @pytest.mark.anyio
+    async def test_OK_書き込みで世代番号が進んだ場合は再検索すること(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.side_effect = [
+            Page(items=[Todo(title="更新前")]),
+            Page(items=[Todo(title="更新後")]),
+        ]
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+        await usecase.execute(TodoSearchCondition())
+        versions.bump()
+
+        # act
+        result = await usecase.execute(TodoSearchCondition())
+
+        # assert
+        assert [todo.title for todo in result.items] == ["更新後"]
+
+    @pytest.mark.anyio
+    async def test_OK_有効期限切れの結果を返し別に開いたリポジトリで再検索すること(
+        self,
+        mock_todo_repository: AsyncMock,
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        now = [0.0]
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]] = TtlLruCache(
+            maxsize=8,
+            ttl=60.0,
+            versions=versions,
+            clock=lambda: now[0],
+        )
+        mock_todo_repository.search.return_value = Page(items=[Todo(title="更新前")])
+        refresh_repository = AsyncMock(spec=TodoRepository)
+        refresh_repository.search.return_value = Page(items=[Todo(title="更新後")])
+
+        @asynccontextmanager
+        async def open_repository() -> AsyncIterator[TodoRepository]:
+            yield refresh_repository
+
+        usecase = SearchTodosUseCase(
+            todo_repository=mock_todo_repository,
+            cache=cache,
+            single_flight=SingleFlight(versions=versions),
+            open_repository=open_repository,
+        )
+        await usecase.execute(TodoSearchCondition())
+        now[0] += 60.0
+
+        # act
+        stale = await usecase.execute(TodoSearchCondition())
+        await cache.wait_for_refreshes()
+        refreshed = await usecase.execute(TodoSearchCondition())
+
+        # assert
+        assert [todo.title for todo in stale.items] == ["更新前"]
+        assert [todo.title for todo in refreshed.items] == ["更新後"]
+        mock_todo_repository.search.assert_called_once()
+        refresh_repository.search.assert_called_once_with(TodoSearchCondition())
+
+    @pytest.mark.anyio
+    async def test_OK_データの版が異なる場合は再検索すること(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.side_effect = [
+            Page(items=[Todo(title="更新前")]),
+            Page(items=[Todo(title="更新後")]),
+        ]
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+        now = datetime.now(UTC)
+        await usecase.execute(
+            TodoSearchCondition(),
+            DataVersion(count=1, last_modified_at=now),
+        )
+
+        # act
+        result = await usecase.execute(
+            TodoSearchCondition(),
+            DataVersion(count=2, last_modified_at=now),
+        )
+        cached = await usecase.execute(
+            TodoSearchCondition(),
+            DataVersion(count=2, last_modified_at=now),
+        )
+
+        # assert
+        assert [todo.title for todo in result.items] == ["更新後"]
+        assert cached is result
+        # 版ごとにエントリを増やさず、同じ条件のエントリを置き換える
+        assert len(cache) == 1
+
+    @pytest.mark.anyio
+    async def test_NG_エラーはキャッシュせずExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.search.side_effect = ExpectedBusinessError(
+            code=CommonErrorCode.InvalidValue,
+        )
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository, cache=cache)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError):
+            await usecase.execute(TodoSearchCondition())
+        assert len(cache) == 0
+
+
+class TestExecuteWithSingleFlight:
+    """同時実行をまとめる仕組みを設定したSearchTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_キャッシュにない同じ検索の同時実行は1回のみ検索すること(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SearchTodosCacheKey, Page[Todo]],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        release = asyncio.Event()
+
+        async def search(_: TodoSearchCondition) -> Page[Todo]:
+            await release.wait()
+            return Page(items=[Todo(title="買い物")])
+
+        mock_todo_repository.search.side_effect = search
+        usecase = SearchTodosUseCase(
+            todo_repository=mock_todo_repository,
+            cache=cache,
+            single_flight=SingleFlight(versions=versions),
+        )
+        tasks = [
+            asyncio.create_task(usecase.execute(TodoSearchCondition(query=query)))
+            for query in ("Buy", "buy", "BUY")
+        ]
+        await asyncio.sleep(0)
+
+        # act
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # assert
+        assert all(result is results[0] for result in results)
+        mock_todo_repository.search.assert_called_once_with(
+            TodoSearchCondition(query="buy"),
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_同時実行した検索のエラーはそれぞれExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        release = asyncio.Event()
+
+        async def search(_: TodoSearchCondition) -> Page[Todo]:
+            await release.wait()
+            raise ExpectedBusinessError(code=CommonErrorCode.InvalidValue)
+
+        mock_todo_repository.search.side_effect = search
+        usecase = SearchTodosUseCase(
+            todo_repository=mock_todo_repository,
+            single_flight=SingleFlight(versions=versions),
+        )
+        tasks = [
+            asyncio.create_task(usecase.execute(TodoSearchCondition()))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        # act
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # assert
+        assert all(isinstance(result, ExpectedUseCaseError) for result in results)
+        mock_todo_repository.search.assert_called_once()
+
+
+class TestExecuteProjection:
+    """一部の項目のみを返すSearchTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_正規化した検索条件と項目でリポジトリを検索すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        page = Page(items=[TodoProjection(id=TodoId(value="id"), title="買い物")])
+        mock_todo_repository.search_projection.return_value = page
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository)
+        fields = frozenset({TodoField.TITLE})
+
+        # act
+        result = await usecase.execute_projection(
+            TodoSearchCondition(query="Buy"),
+            fields,
+        )
+
+        # assert
+        assert result == page
+        mock_todo_repository.search_projection.assert_called_once_with(
+            TodoSearchCondition(query="buy"),
+            fields,
+        )
+
+    @pytest.mark.anyio
+    async def test_OK_項目が異なる検索は別々にキャッシュすること(
+        self,
+        mock_todo_repository: AsyncMock,
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        projection_cache: TtlLruCache[
+            SearchTodoProjectionsCacheKey,
+            Page[TodoProjection],
+        ] = TtlLruCache(maxsize=8, ttl=60.0, versions=versions)
+        mock_todo_repository.search_projection.return_value = Page()
+        usecase = SearchTodosUseCase(
+            todo_repository=mock_todo_repository,
+            projection_cache=projection_cache,
+        )
+        title = frozenset({TodoField.TITLE})
+        completed = frozenset({TodoField.COMPLETED})
+
+        # act
+        for fields in (title, completed, title):
+            await usecase.execute_projection(TodoSearchCondition(), fields)
+
+        # assert
+        assert mock_todo_repository.search_projection.call_count == len(
+            {title, completed},
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedBusinessErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.search_projection.side_effect = ExpectedBusinessError(
+            code=CommonErrorCode.InvalidValue,
+        )
+        usecase = SearchTodosUseCase(todo_repository=mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute_projection(
+                TodoSearchCondition(),
+                frozenset({TodoField.TITLE}),
+            )
+
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
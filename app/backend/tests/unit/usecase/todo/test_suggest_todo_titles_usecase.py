@@ -0,0 +1,111 @@
+"""SuggestTodoTitlesUseCaseのユニットテスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.todo.repository import TodoRepository
+from src.shared.cache.ttl_lru_cache import TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import ExpectedTechnicalError, ExpectedUseCaseError
+from src.usecase.todo.suggest_todo_titles_usecase import (
+    SuggestTodoTitlesCacheKey,
+    SuggestTodoTitlesUseCase,
+)
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    return AsyncMock(spec=TodoRepository)
+
+
+@pytest.fixture
+def versions() -> VersionCounter:
+    return VersionCounter()
+
+
+@pytest.fixture
+def cache(
+    versions: VersionCounter,
+) -> TtlLruCache[SuggestTodoTitlesCacheKey, list[str]]:
+    return TtlLruCache(maxsize=8, ttl=60.0, versions=versions)
+
+
+class TestExecute:
+    """SuggestTodoTitlesUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_正規化した文字列でリポジトリの候補を返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.suggest_titles.return_value = ["れぽーと"]
+        usecase = SuggestTodoTitlesUseCase(todo_repository=mock_todo_repository)
+
+        # act
+        result = await usecase.execute("ﾚﾎﾟ", 5)
+
+        # assert
+        assert result == ["れぽーと"]
+        mock_todo_repository.suggest_titles.assert_called_once_with("れぽ", 5)
+
+    @pytest.mark.anyio
+    async def test_OK_表記のみ異なる文字列は同じキャッシュを使うこと(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SuggestTodoTitlesCacheKey, list[str]],
+    ) -> None:
+        # arrange
+        mock_todo_repository.suggest_titles.return_value = ["Report"]
+        usecase = SuggestTodoTitlesUseCase(
+            todo_repository=mock_todo_repository,
+            cache=cache,
+        )
+
+        # act
+        await usecase.execute("Rep")
+        result = await usecase.execute("REP")
+
+        # assert
+        assert result == ["Report"]
+        mock_todo_repository.suggest_titles.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_OK_書き込みで世代番号が進んだ場合は再取得すること(
+        self,
+        mock_todo_repository: AsyncMock,
+        cache: TtlLruCache[SuggestTodoTitlesCacheKey, list[str]],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        mock_todo_repository.suggest_titles.side_effect = [["更新前"], ["更新後"]]
+        usecase = SuggestTodoTitlesUseCase(
+            todo_repository=mock_todo_repository,
+            cache=cache,
+        )
+        await usecase.execute("更")
+        versions.bump()
+
+        # act
+        result = await usecase.execute("更")
+
+        # assert
+        assert result == ["更新後"]
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.suggest_titles.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseConnectionFailed,
+        )
+        usecase = SuggestTodoTitlesUseCase(todo_repository=mock_todo_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute("task")
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseConnectionFailed
@@ -0,0 +1,128 @@
+"""SyncTodosUseCaseのユニットテスト。"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.pagination import Page, PageCursor
+from src.domain.todo.id import TodoId
+from src.domain.todo.repository import TodoRepository
+from src.domain.todo.sync import SYNC_ORDER, SYNC_SETTLE_INTERVAL
+from src.domain.todo.todo import Todo
+from src.shared.errors.codes import CommonErrorCode
+from src.shared.errors.errors import (
+    ExpectedBusinessError,
+    ExpectedUseCaseError,
+)
+from src.usecase.todo.sync_todos_usecase import SyncTodosUseCase, since_cursor
+
+_NOW = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def mock_todo_repository() -> AsyncMock:
+    return AsyncMock(spec=TodoRepository)
+
+
+def _todo(todo_id: str, updated_at: datetime) -> Todo:
+    return Todo(id=TodoId(value=todo_id), title="テストタスク", updated_at=updated_at)
+
+
+class TestExecute:
+    """SyncTodosUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_続きがある場合は最後の変更の位置から再開すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        todo = _todo("a", _NOW)
+        next_cursor = PageCursor(key=todo.updated_at, id=todo.id.value)
+        mock_todo_repository.changes.return_value = Page(
+            items=[todo],
+            next_cursor=next_cursor,
+        )
+        usecase = SyncTodosUseCase(mock_todo_repository, clock=lambda: _NOW)
+        after = since_cursor(_NOW - timedelta(hours=1))
+
+        # act
+        changes = await usecase.execute(after, limit=1)
+
+        # assert
+        assert changes.items == [todo]
+        assert changes.resume_cursor == next_cursor
+        assert changes.has_more is True
+        mock_todo_repository.changes.assert_called_once_with(after, 1)
+
+    @pytest.mark.anyio
+    async def test_OK_最後のページでは確定した変更の位置から再開すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        settled = _todo("a", _NOW - SYNC_SETTLE_INTERVAL * 2)
+        mock_todo_repository.changes.return_value = Page(items=[settled])
+        usecase = SyncTodosUseCase(mock_todo_repository, clock=lambda: _NOW)
+
+        # act
+        changes = await usecase.execute(since_cursor(_NOW - timedelta(hours=1)), 10)
+
+        # assert
+        assert changes.resume_cursor == PageCursor(
+            key=settled.updated_at,
+            id=settled.id.value,
+            order=SYNC_ORDER,
+        )
+        assert changes.has_more is False
+
+    @pytest.mark.anyio
+    async def test_OK_直近の変更は次回も返るよう再開位置を進めないこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        recent = _todo("a", _NOW - SYNC_SETTLE_INTERVAL / 2)
+        mock_todo_repository.changes.return_value = Page(items=[recent])
+        usecase = SyncTodosUseCase(mock_todo_repository, clock=lambda: _NOW)
+
+        # act
+        changes = await usecase.execute(since_cursor(_NOW - timedelta(hours=1)), 10)
+
+        # assert
+        assert changes.resume_cursor == since_cursor(_NOW - SYNC_SETTLE_INTERVAL)
+
+    @pytest.mark.anyio
+    async def test_OK_変更がない場合は開始位置から再開すること(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.changes.return_value = Page(items=[])
+        usecase = SyncTodosUseCase(mock_todo_repository, clock=lambda: _NOW)
+        after = since_cursor(_NOW - timedelta(hours=1))
+
+        # act
+        changes = await usecase.execute(after, 10)
+
+        # assert
+        assert changes.items == []
+        assert changes.resume_cursor == after
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedBusinessErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_todo_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_todo_repository.changes.side_effect = ExpectedBusinessError(
+            code=CommonErrorCode.InvalidValue,
+        )
+        usecase = SyncTodosUseCase(mock_todo_repository, clock=lambda: _NOW)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute(PageCursor(key=0.5, id=""), 10)
+
+        assert exc_info.value.code == CommonErrorCode.InvalidValue
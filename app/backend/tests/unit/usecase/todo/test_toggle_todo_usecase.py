@@ -23,15 +23,14 @@ def mock_todo_repository() -> AsyncMock:
 
 class TestExecute:
     @pytest.mark.anyio
-    async def test_OK_completedがfalseからtrueにトグルされること(
+    async def test_OK_リポジトリで完了フラグを反転したTodoを返すこと(
         self,
         mock_todo_repository: AsyncMock,
     ) -> None:
         # arrange
         todo_id = str(uuid4())
-        todo = Todo(id=TodoId(value=todo_id), title="テストタスク", completed=False)
-        mock_todo_repository.find_by_id.return_value = todo
-        mock_todo_repository.save.return_value = todo
+        toggled = Todo(id=TodoId(value=todo_id), title="テストタスク", completed=True)
+        mock_todo_repository.toggle.return_value = toggled
         usecase = ToggleTodoUseCase(todo_repository=mock_todo_repository)
 
         # act
@@ -39,26 +38,27 @@ class TestExecute:
 
         # assert
         assert result.completed is True
-        mock_todo_repository.find_by_id.assert_called_once_with(TodoId(value=todo_id))
-        mock_todo_repository.save.assert_called_once()
+        mock_todo_repository.toggle.assert_called_once_with(TodoId(value=todo_id))
 
     @pytest.mark.anyio
-    async def test_OK_completedがtrueからfalseにトグルされること(
+    async def test_OK_取得と保存を個別に行わないこと(
         self,
         mock_todo_repository: AsyncMock,
     ) -> None:
         # arrange
         todo_id = str(uuid4())
-        todo = Todo(id=TodoId(value=todo_id), title="テストタスク", completed=True)
-        mock_todo_repository.find_by_id.return_value = todo
-        mock_todo_repository.save.return_value = todo
+        mock_todo_repository.toggle.return_value = Todo(
+            id=TodoId(value=todo_id),
+            title="テストタスク",
+        )
         usecase = ToggleTodoUseCase(todo_repository=mock_todo_repository)
 
         # act
-        result = await usecase.execute(TodoId(value=todo_id))
+        await usecase.execute(TodoId(value=todo_id))
 
         # assert
-        assert result.completed is False
+        mock_todo_repository.find_by_id.assert_not_called()
+        mock_todo_repository.save.assert_not_called()
 
     @pytest.mark.anyio
     async def test_NG_Todoが存在しない場合はExpectedUseCaseErrorを返すこと(
@@ -67,7 +67,7 @@ class TestExecute:
     ) -> None:
         # arrange
         todo_id = str(uuid4())
-        mock_todo_repository.find_by_id.side_effect = ExpectedBusinessError(
+        mock_todo_repository.toggle.side_effect = ExpectedBusinessError(
             code=TodoErrorCode.NotFound,
             details={"todo_id": todo_id},
         )
@@ -0,0 +1,113 @@
+"""BulkCreateUsersUseCaseのユニットテスト。
+
+ユーザー一括作成ユースケースの動作をテストする。
+"""
+
+from collections.abc import Sequence
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.user.bulk_create import UserBulkCreateErrorReason
+from src.domain.user.id import UserId
+from src.domain.user.repository import UserRepository
+from src.domain.user.user import User
+from src.presentation.api.schema.user.bulk_create_users_request import BulkCreateUser
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import ExpectedTechnicalError, ExpectedUseCaseError
+from src.usecase.user.bulk_create_users_usecase import BulkCreateUsersUseCase
+
+
+@pytest.fixture
+def mock_user_repository() -> AsyncMock:
+    return AsyncMock(spec=UserRepository)
+
+
+def _request(email: str, name: str = "Test User") -> BulkCreateUser:
+    return BulkCreateUser(email=email, name=name)
+
+
+class TestExecute:
+    """BulkCreateUsersUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_検証できたユーザーのみを1回でまとめて追加すること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.bulk_insert.return_value = []
+        usecase = BulkCreateUsersUseCase(user_repository=mock_user_repository)
+
+        # act
+        result = await usecase.execute(
+            [
+                _request("a@example.com"),
+                _request("invalid"),
+                _request("b@example.com", name=""),
+                _request("c@example.com"),
+            ],
+        )
+
+        # assert
+        mock_user_repository.bulk_insert.assert_awaited_once()
+        (inserted,) = mock_user_repository.bulk_insert.await_args.args
+        assert [user.email.value for user in inserted] == [
+            "a@example.com",
+            "c@example.com",
+        ]
+        assert [user.email.value for user in result.created] == [
+            "a@example.com",
+            "c@example.com",
+        ]
+        assert [(error.index, error.reason) for error in result.errors] == [
+            (1, UserBulkCreateErrorReason.INVALID_VALUE),
+            (2, UserBulkCreateErrorReason.INVALID_VALUE),
+        ]
+
+    @pytest.mark.anyio
+    async def test_OK_メールアドレスが既に存在するユーザーは入力の順にエラーとなること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        async def bulk_insert(users: Sequence[User]) -> list[UserId]:
+            # 1件目と3件目のメールアドレスが既に存在する
+            return [users[0].id, users[1].id]
+
+        mock_user_repository.bulk_insert.side_effect = bulk_insert
+        usecase = BulkCreateUsersUseCase(user_repository=mock_user_repository)
+
+        # act
+        result = await usecase.execute(
+            [
+                _request("dup1@example.com"),
+                _request("invalid"),
+                _request("dup2@example.com"),
+                _request("new@example.com"),
+            ],
+        )
+
+        # assert
+        assert [user.email.value for user in result.created] == ["new@example.com"]
+        assert [(error.index, error.reason) for error in result.errors] == [
+            (0, UserBulkCreateErrorReason.EMAIL_ALREADY_EXISTS),
+            (1, UserBulkCreateErrorReason.INVALID_VALUE),
+            (2, UserBulkCreateErrorReason.EMAIL_ALREADY_EXISTS),
+        ]
+
+    @pytest.mark.anyio
+    async def test_NG_追加に失敗した場合ExpectedUseCaseErrorが返ること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.bulk_insert.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseOperationFailed,
+        )
+        usecase = BulkCreateUsersUseCase(user_repository=mock_user_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as e:
+            await usecase.execute([_request("a@example.com")])
+        assert e.value.code == TechnicalErrorCode.DatabaseOperationFailed
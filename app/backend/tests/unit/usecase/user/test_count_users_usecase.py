@@ -0,0 +1,88 @@
+"""CountUsersUseCaseのユニットテスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.count import Count
+from src.domain.user.repository import UserRepository
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import (
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+from src.usecase.user.count_users_usecase import CountUsersUseCase
+
+
+@pytest.fixture
+def mock_user_repository() -> AsyncMock:
+    repository = AsyncMock(spec=UserRepository)
+    repository.count.return_value = 3
+    repository.estimate_count.return_value = 5
+    return repository
+
+
+class TestExecute:
+    """CountUsersUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_正確な件数を返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = CountUsersUseCase(mock_user_repository)
+
+        # act
+        result = await usecase.execute()
+
+        # assert
+        assert result == Count(value=3, approximate=False)
+        mock_user_repository.estimate_count.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_OK_approximateの場合は推定した件数を返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        usecase = CountUsersUseCase(mock_user_repository)
+
+        # act
+        result = await usecase.execute(approximate=True)
+
+        # assert
+        assert result == Count(value=5, approximate=True)
+        mock_user_repository.count.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_OK_推定できない場合は正確な件数を返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.estimate_count.return_value = None
+        usecase = CountUsersUseCase(mock_user_repository)
+
+        # act
+        result = await usecase.execute(approximate=True)
+
+        # assert
+        assert result == Count(value=3, approximate=False)
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.count.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseQueryFailed,
+        )
+        usecase = CountUsersUseCase(mock_user_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseQueryFailed
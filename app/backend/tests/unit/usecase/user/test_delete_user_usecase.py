@@ -42,7 +42,9 @@ class TestExecute:
         await deleteuserusecase.execute(user_id=user.id)
 
         # assert
-        assert True
+        mock_user_repository.delete.assert_awaited_once_with(user_id=user.id)
+        # 存在の確認は削除と同時に行うため、事前に検索しない
+        mock_user_repository.find_by_id.assert_not_awaited()
 
     @pytest.mark.anyio
     async def test_NG_存在しないユーザIDを指定した場合ExpectedUseCaseErrorが返ること(
@@ -3,15 +3,21 @@
 ユーザー一覧取得ユースケースの動作をテストする。
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
+from src.domain.pagination import Page, PageCursor
 from src.domain.user.email_address import EmailAddress
+from src.domain.user.id import UserId
 from src.domain.user.name import UserName
+from src.domain.user.projection import UserField, UserProjection
 from src.domain.user.repository import UserRepository
 from src.domain.user.role import Role, RoleEnum
 from src.domain.user.user import User
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.version_counter import VersionCounter
 from src.shared.errors.codes import TechnicalErrorCode, UserErrorCode
 from src.shared.errors.errors import (
     ExpectedBusinessError,
@@ -43,32 +49,80 @@ class TestExecute:
             )
             for _ in range(3)
         ]
-        mock_user_repository.filter.return_value = test_users
+        mock_user_repository.filter.return_value = Page(items=test_users)
         filter_user_usecase = FilterUserUseCase(user_repository=mock_user_repository)
 
         # act
         result = await filter_user_usecase.execute()
 
         # assert
-        assert result == test_users
+        assert result.items == test_users
         mock_user_repository.filter.assert_called_once()
-        for res in result:
+        for res in result.items:
             assert isinstance(res, User)
 
+    @pytest.mark.anyio
+    async def test_OK_limitとカーソルをリポジトリに渡すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        cursor = PageCursor(key="key", id="id")
+        mock_user_repository.filter.return_value = Page()
+        filter_user_usecase = FilterUserUseCase(user_repository=mock_user_repository)
+
+        # act
+        await filter_user_usecase.execute(limit=10, after=cursor)
+
+        # assert
+        mock_user_repository.filter.assert_called_once_with(limit=10, after=cursor)
+
+    @pytest.mark.anyio
+    async def test_OK_同じページの同時の取得は1回のみリポジトリから取得すること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        release = asyncio.Event()
+        page: Page[User] = Page()
+
+        async def filter_users(**_: object) -> Page[User]:
+            await release.wait()
+            return page
+
+        mock_user_repository.filter.side_effect = filter_users
+        filter_user_usecase = FilterUserUseCase(
+            user_repository=mock_user_repository,
+            single_flight=SingleFlight(versions=VersionCounter()),
+        )
+        tasks = [
+            asyncio.create_task(filter_user_usecase.execute(limit=10)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # act
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # assert
+        assert all(result is page for result in results)
+        mock_user_repository.filter.assert_called_once_with(limit=10, after=None)
+
     @pytest.mark.anyio
     async def test_NG_ユーザが取得できなかった場合は空配列を返すこと(
         self,
         mock_user_repository: AsyncMock,
     ) -> None:
         # arrange
-        mock_user_repository.filter.return_value = []
+        mock_user_repository.filter.return_value = Page()
         filter_user_usecase = FilterUserUseCase(user_repository=mock_user_repository)
 
         # act
         result = await filter_user_usecase.execute()
 
         # assert
-        assert result == []
+        assert result.items == []
+        assert result.next_cursor is None
         mock_user_repository.filter.assert_called_once()
 
     @pytest.mark.anyio
@@ -114,3 +168,54 @@ class TestExecute:
         assert exc_info.value.code == TechnicalErrorCode.DatabaseConnectionFailed
         assert exc_info.value.details == {"error": "connection failed"}
         mock_user_repository.filter.assert_called_once()
+
+
+class TestExecuteProjection:
+    """一部の項目のみを返すFilterUserUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_項目とlimitとカーソルをリポジトリに渡すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        page = Page(
+            items=[UserProjection(id=UserId(value="id"), name=UserName.random())],
+        )
+        mock_user_repository.filter_projection.return_value = page
+        filter_user_usecase = FilterUserUseCase(user_repository=mock_user_repository)
+        fields = frozenset({UserField.NAME})
+        cursor = PageCursor(key="key", id="id")
+
+        # act
+        result = await filter_user_usecase.execute_projection(
+            fields,
+            limit=10,
+            after=cursor,
+        )
+
+        # assert
+        assert result == page
+        mock_user_repository.filter_projection.assert_called_once_with(
+            fields,
+            limit=10,
+            after=cursor,
+        )
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedBusinessErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.filter_projection.side_effect = ExpectedBusinessError(
+            code=UserErrorCode.NotFound,
+            details={"key": "value"},
+        )
+        filter_user_usecase = FilterUserUseCase(user_repository=mock_user_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await filter_user_usecase.execute_projection(frozenset({UserField.NAME}))
+
+        assert exc_info.value.code == UserErrorCode.NotFound
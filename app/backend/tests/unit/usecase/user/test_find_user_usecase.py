@@ -3,6 +3,7 @@
 ユーザー検索ユースケースの動作をテストする。
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -14,6 +15,8 @@ from src.domain.user.name import UserName
 from src.domain.user.repository import UserRepository
 from src.domain.user.role import Role, RoleEnum
 from src.domain.user.user import User
+from src.shared.cache.single_flight import SingleFlight
+from src.shared.cache.version_counter import VersionCounter
 from src.shared.errors.codes import TechnicalErrorCode, UserErrorCode
 from src.shared.errors.errors import (
     ExpectedBusinessError,
@@ -55,6 +58,44 @@ class TestExecute:
         assert result == test_user
         mock_user_repository.find_by_id.assert_called_once_with(UserId(value=user_id))
 
+    @pytest.mark.anyio
+    async def test_OK_同じユーザーの同時の検索は1回のみリポジトリで検索すること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        release = asyncio.Event()
+        test_user = User(
+            email=EmailAddress.random(),
+            role=Role(value=RoleEnum.MEMBER),
+            name=UserName.random(),
+        )
+
+        async def find_by_id(_: UserId) -> User:
+            await release.wait()
+            return test_user
+
+        mock_user_repository.find_by_id.side_effect = find_by_id
+        find_user_usecase = FindUserUseCase(
+            user_repository=mock_user_repository,
+            single_flight=SingleFlight(versions=VersionCounter()),
+        )
+        tasks = [
+            asyncio.create_task(
+                find_user_usecase.execute(UserId(value=test_user.id.value))
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # act
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # assert
+        assert results == [test_user] * 3
+        mock_user_repository.find_by_id.assert_called_once_with(test_user.id)
+
     @pytest.mark.anyio
     async def test_NG_ユーザーが存在しない場合はExpectedUseCaseErrorを返すこと(
         self,
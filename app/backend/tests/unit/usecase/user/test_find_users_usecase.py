@@ -0,0 +1,61 @@
+"""FindUsersUseCaseのユニットテスト。
+
+ユーザー一括検索ユースケースの動作をテストする。
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.user.id import UserId
+from src.domain.user.lookup import UserLookupResult
+from src.domain.user.repository import UserRepository
+from src.domain.user.user import User
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import ExpectedTechnicalError, ExpectedUseCaseError
+from src.usecase.user.find_users_usecase import FindUsersUseCase
+
+
+@pytest.fixture
+def mock_user_repository() -> AsyncMock:
+    return AsyncMock(spec=UserRepository)
+
+
+class TestExecute:
+    """FindUsersUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_1回の検索でまとめて取得すること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        user = User.random()
+        missing = UserId()
+        expected = UserLookupResult(found=[user], not_found_ids=[missing])
+        mock_user_repository.find_by_ids.return_value = expected
+        usecase = FindUsersUseCase(user_repository=mock_user_repository)
+
+        # act
+        result = await usecase.execute([user.id, missing])
+
+        # assert
+        assert result == expected
+        mock_user_repository.find_by_ids.assert_awaited_once_with([user.id, missing])
+        mock_user_repository.find_by_id.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_NG_検索に失敗した場合ExpectedUseCaseErrorが返ること(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.find_by_ids.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseQueryFailed,
+        )
+        usecase = FindUsersUseCase(user_repository=mock_user_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as e:
+            await usecase.execute([UserId()])
+        assert e.value.code == TechnicalErrorCode.DatabaseQueryFailed
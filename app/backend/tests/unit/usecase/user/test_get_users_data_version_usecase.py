@@ -0,0 +1,98 @@
+"""GetUsersDataVersionUseCaseのユニットテスト。"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.data_version import DataVersion
+from src.domain.user.repository import UserRepository
+from src.shared.cache.ttl_lru_cache import TtlLruCache
+from src.shared.cache.version_counter import VersionCounter
+from src.shared.errors.codes import TechnicalErrorCode
+from src.shared.errors.errors import (
+    ExpectedTechnicalError,
+    ExpectedUseCaseError,
+)
+from src.usecase.user.get_users_data_version_usecase import (
+    GetUsersDataVersionUseCase,
+)
+
+
+@pytest.fixture
+def mock_user_repository() -> AsyncMock:
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def versions() -> VersionCounter:
+    return VersionCounter()
+
+
+@pytest.fixture
+def cache(versions: VersionCounter) -> TtlLruCache[str, DataVersion]:
+    return TtlLruCache(maxsize=1, ttl=60.0, versions=versions)
+
+
+def _version(count: int) -> DataVersion:
+    return DataVersion(count=count, last_modified_at=datetime.now(UTC))
+
+
+class TestExecute:
+    """GetUsersDataVersionUseCaseの実行テストクラス。"""
+
+    @pytest.mark.anyio
+    async def test_OK_キャッシュした版を返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+        cache: TtlLruCache[str, DataVersion],
+    ) -> None:
+        # arrange
+        expected = _version(1)
+        mock_user_repository.data_version.return_value = expected
+        usecase = GetUsersDataVersionUseCase(mock_user_repository, cache=cache)
+        await usecase.execute()
+
+        # act
+        result = await usecase.execute()
+
+        # assert
+        assert result == expected
+        mock_user_repository.data_version.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_OK_書き込みで世代番号が進んだ場合は版を取得し直すこと(
+        self,
+        mock_user_repository: AsyncMock,
+        cache: TtlLruCache[str, DataVersion],
+        versions: VersionCounter,
+    ) -> None:
+        # arrange
+        before, after = _version(1), _version(2)
+        mock_user_repository.data_version.side_effect = [before, after]
+        usecase = GetUsersDataVersionUseCase(mock_user_repository, cache=cache)
+        await usecase.execute()
+        versions.bump()
+
+        # act
+        result = await usecase.execute()
+
+        # assert
+        assert result == after
+
+    @pytest.mark.anyio
+    async def test_NG_ExpectedTechnicalErrorが発生した場合ExpectedUseCaseErrorを返すこと(
+        self,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        # arrange
+        mock_user_repository.data_version.side_effect = ExpectedTechnicalError(
+            code=TechnicalErrorCode.DatabaseQueryFailed,
+        )
+        usecase = GetUsersDataVersionUseCase(mock_user_repository)
+
+        # act & assert
+        with pytest.raises(ExpectedUseCaseError) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.code == TechnicalErrorCode.DatabaseQueryFailed